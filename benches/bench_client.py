@@ -0,0 +1,56 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect import flow, task
+from prefect.settings import (
+    PREFECT_API_URL,
+    PREFECT_CLIENT_EPHEMERAL_IN_PROCESS,
+    temporary_settings,
+)
+
+
+def noop_function():
+    pass
+
+
+@pytest.fixture(params=[False, True], ids=["http", "in_process"])
+def ephemeral_in_process(request):
+    if PREFECT_API_URL.value():
+        pytest.skip("The in-process client is only used with an ephemeral API")
+
+    with temporary_settings({PREFECT_CLIENT_EPHEMERAL_IN_PROCESS: request.param}):
+        yield request.param
+
+
+def bench_flow_run(benchmark: BenchmarkFixture, ephemeral_in_process: bool):
+    noop_flow = flow(noop_function)
+
+    benchmark(noop_flow)
+
+
+@pytest.mark.parametrize("num_task_runs", [10, 50])
+def bench_flow_run_with_sequential_tasks(
+    benchmark: BenchmarkFixture, ephemeral_in_process: bool, num_task_runs: int
+):
+    noop_task = task(noop_function)
+
+    @flow
+    def benchmark_flow():
+        for _ in range(num_task_runs):
+            noop_task()
+
+    benchmark.pedantic(benchmark_flow)
+
+
+@pytest.mark.parametrize("num_task_runs", [10, 50])
+def bench_flow_run_with_submitted_tasks(
+    benchmark: BenchmarkFixture, ephemeral_in_process: bool, num_task_runs: int
+):
+    noop_task = task(noop_function)
+
+    @flow
+    def benchmark_flow():
+        for future in [noop_task.submit() for _ in range(num_task_runs)]:
+            future.wait()
+
+    benchmark.pedantic(benchmark_flow)
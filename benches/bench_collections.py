@@ -0,0 +1,44 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.engine import find_upstreams
+from prefect.utilities.collections import iter_collection, visit_collection
+
+
+def make_parameters(size: int):
+    return {
+        "matrix": [list(range(size)) for _ in range(size)],
+        "records": [{"id": i, "tags": [str(i), i]} for i in range(size * 10)],
+    }
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def bench_visit_collection(benchmark: BenchmarkFixture, size: int):
+    benchmark(
+        visit_collection,
+        make_parameters(size),
+        visit_fn=lambda expr, context: expr,
+        return_data=False,
+        context={},
+    )
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def bench_visit_collection_return_data(benchmark: BenchmarkFixture, size: int):
+    benchmark(
+        visit_collection,
+        make_parameters(size),
+        visit_fn=lambda expr: expr,
+        return_data=True,
+    )
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def bench_iter_collection(benchmark: BenchmarkFixture, size: int):
+    parameters = make_parameters(size)
+    benchmark(lambda: list(iter_collection(parameters)))
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def bench_find_upstreams(benchmark: BenchmarkFixture, size: int):
+    benchmark(find_upstreams, make_parameters(size))
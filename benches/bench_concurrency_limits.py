@@ -0,0 +1,68 @@
+import uuid
+
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect import flow, task
+from prefect.client.orchestration import get_client
+from prefect.states import Completed, Pending, Running
+
+
+def noop_function():
+    pass
+
+
+async def create_task_runs(tag: str, num_task_runs: int):
+    noop_task = task(noop_function)
+
+    async with get_client() as client:
+        flow_run = await client.create_flow_run(flow(noop_function))
+        return [
+            (
+                await client.create_task_run(
+                    noop_task,
+                    flow_run_id=flow_run.id,
+                    dynamic_key=str(i),
+                    extra_tags=[tag],
+                    state=Pending(),
+                )
+            ).id
+            for i in range(num_task_runs)
+        ]
+
+
+@pytest.mark.parametrize("concurrency_limit", [10, 1000])
+@pytest.mark.parametrize("num_task_runs", [50, 200])
+def bench_task_run_concurrency_slots(
+    benchmark: BenchmarkFixture, num_task_runs: int, concurrency_limit: int
+):
+    # Every task run tries to enter a running state at once against the same tag;
+    # runs that secure a slot complete and release it
+    tag = f"bench-{uuid.uuid4()}"
+
+    async def create_limit():
+        async with get_client() as client:
+            await client.create_concurrency_limit(tag, concurrency_limit)
+
+    anyio.run(create_limit)
+
+    def setup():
+        return (anyio.run(create_task_runs, tag, num_task_runs),), {}
+
+    async def run_and_complete(client, task_run_id):
+        result = await client.set_task_run_state(task_run_id, Running())
+        if result.state.is_running():
+            await client.set_task_run_state(task_run_id, Completed())
+
+    async def run_task_runs(task_run_ids):
+        async with get_client() as client:
+            async with anyio.create_task_group() as tg:
+                for task_run_id in task_run_ids:
+                    tg.start_soon(run_and_complete, client, task_run_id)
+
+    benchmark.pedantic(
+        lambda task_run_ids: anyio.run(run_task_runs, task_run_ids),
+        setup=setup,
+        rounds=3,
+    )
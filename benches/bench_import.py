@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# The maximum mean time, in seconds, to import Prefect in a new process
+IMPORT_TIME_BUDGET = 1.5
+
+
+@pytest.mark.parametrize(
+    "statement", ["import prefect", "from prefect import flow, task"]
+)
+def bench_import_prefect(benchmark: BenchmarkFixture, statement: str):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs=dict(check=True),
+        rounds=5,
+    )
+    assert benchmark.stats.stats.mean < IMPORT_TIME_BUDGET
@@ -0,0 +1,49 @@
+import uuid
+
+import anyio
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.client.orchestration import get_client
+from prefect.server.schemas.actions import LogCreate
+
+
+def make_logs(num_logs: int):
+    flow_run_id = uuid.uuid4()
+    return [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log message {i}",
+            timestamp=pendulum.now("UTC"),
+            flow_run_id=flow_run_id,
+        ).dict(json_compatible=True)
+        for i in range(num_logs)
+    ]
+
+
+@pytest.mark.parametrize("num_logs", [1000, 10000])
+def bench_log_ingest(benchmark: BenchmarkFixture, num_logs: int):
+    logs = make_logs(num_logs)
+
+    async def create_logs():
+        async with get_client() as client:
+            await client.create_logs(logs)
+
+    benchmark(anyio.run, create_logs)
+
+
+@pytest.mark.parametrize("num_requests", [10, 50])
+def bench_log_ingest_concurrent_requests(
+    benchmark: BenchmarkFixture, num_requests: int
+):
+    logs = make_logs(100)
+
+    async def create_logs():
+        async with get_client() as client:
+            async with anyio.create_task_group() as tg:
+                for _ in range(num_requests):
+                    tg.start_soon(client.create_logs, logs)
+
+    benchmark(anyio.run, create_logs)
@@ -0,0 +1,73 @@
+"""
+Benchmarks for orchestrating state transitions in the server.
+
+These run against the database configured by `PREFECT_API_DATABASE_CONNECTION_URL`, so
+they can be compared across SQLite and PostgreSQL.
+"""
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.orchestration.core_policy import CoreTaskPolicy
+
+
+async def create_task_runs(num_task_runs: int):
+    db = provide_database_interface()
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name="bench-orchestration")
+        )
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Running()
+            ),
+        )
+        task_runs = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="bench",
+                    dynamic_key=str(i),
+                    state=schemas.states.Pending(),
+                )
+                for i in range(num_task_runs)
+            ],
+        )
+        return [task_run.id for task_run in task_runs]
+
+
+@pytest.mark.parametrize("num_task_runs", [50])
+def bench_task_run_state_transitions(benchmark: BenchmarkFixture, num_task_runs: int):
+    # Each task run moves from PENDING to RUNNING to COMPLETED under the core task
+    # policy, with a transaction per transition as the API uses
+    db = provide_database_interface()
+    anyio.run(db.create_db)
+
+    def setup():
+        return (anyio.run(create_task_runs, num_task_runs),), {}
+
+    async def set_state(task_run_id, state):
+        async with db.session_context(begin_transaction=True) as session:
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=task_run_id,
+                state=state,
+                task_policy=CoreTaskPolicy,
+            )
+
+    async def run_task_runs(task_run_ids):
+        for task_run_id in task_run_ids:
+            await set_state(task_run_id, schemas.states.Running())
+            await set_state(task_run_id, schemas.states.Completed())
+
+    def run(task_run_ids):
+        anyio.run(run_task_runs, task_run_ids)
+
+    benchmark.pedantic(run, setup=setup, rounds=3)
+    benchmark.extra_info["transitions_per_second"] = (
+        2 * num_task_runs / benchmark.stats["mean"]
+    )
@@ -0,0 +1,42 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.serializers import ArrowSerializer, CompressedPickleSerializer
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+def make_table(num_rows: int):
+    return pyarrow.table(
+        {
+            "id": pyarrow.array(range(num_rows), type=pyarrow.int64()),
+            "value": pyarrow.array([i * 0.5 for i in range(num_rows)]),
+            "label": pyarrow.array([f"label-{i % 100}" for i in range(num_rows)]),
+        }
+    )
+
+
+SERIALIZERS = {
+    "compressed/pickle": CompressedPickleSerializer(),
+    "arrow": ArrowSerializer(),
+    "arrow/zstd": ArrowSerializer(compression="zstd"),
+}
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS.keys())
+@pytest.mark.parametrize("num_rows", [10_000, 100_000])
+def bench_serializer_dumps_table(
+    benchmark: BenchmarkFixture, serializer: str, num_rows: int
+):
+    table = make_table(num_rows)
+    blob = benchmark(SERIALIZERS[serializer].dumps, table)
+    benchmark.extra_info["size"] = len(blob)
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS.keys())
+@pytest.mark.parametrize("num_rows", [10_000, 100_000])
+def bench_serializer_loads_table(
+    benchmark: BenchmarkFixture, serializer: str, num_rows: int
+):
+    blob = SERIALIZERS[serializer].dumps(make_table(num_rows))
+    benchmark(SERIALIZERS[serializer].loads, blob)
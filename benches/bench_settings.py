@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect import flow, task
+from prefect.context import SettingsContext
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_HOME,
+    PREFECT_LOGGING_LEVEL,
+    PREFECT_UI_API_URL,
+    temporary_settings,
+)
+
+
+def noop_function():
+    pass
+
+
+@pytest.mark.parametrize(
+    "setting",
+    [
+        PREFECT_LOGGING_LEVEL,
+        PREFECT_HOME,
+        PREFECT_UI_API_URL,
+        PREFECT_API_DATABASE_CONNECTION_URL,
+    ],
+    ids=lambda setting: setting.name,
+)
+def bench_setting_value(benchmark: BenchmarkFixture, setting):
+    benchmark(setting.value)
+
+
+@pytest.mark.parametrize("copy", [False, True], ids=["shared", "copy"])
+def bench_settings_context_compare(benchmark: BenchmarkFixture, copy: bool):
+    # Each task run compares the settings context it was submitted with to the
+    # current settings context
+    settings_context = SettingsContext.get()
+    other = settings_context.copy() if copy else settings_context
+    benchmark(settings_context.__ne__, other)
+
+
+def bench_settings_context_pickle(benchmark: BenchmarkFixture):
+    # Settings contexts are serialized with task runs sent to remote workers
+    with SettingsContext.get().copy() as settings_context:
+        benchmark(pickle.dumps, settings_context)
+
+
+@pytest.mark.parametrize("num_task_runs", [100, 250])
+def bench_task_submit_in_settings_context(
+    benchmark: BenchmarkFixture, num_task_runs: int
+):
+    noop_task = task(noop_function)
+
+    @flow
+    def benchmark_flow():
+        benchmark.pedantic(noop_task.submit, rounds=num_task_runs)
+
+    # Submit within a settings context other than the global context
+    with temporary_settings({PREFECT_LOGGING_LEVEL: "INFO"}):
+        benchmark_flow()
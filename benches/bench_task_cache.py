@@ -0,0 +1,89 @@
+import anyio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect import flow, task
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.settings import (
+    PREFECT_API_TASK_CACHE_SIZE,
+    PREFECT_TASKS_CACHE_LOOKUP_ENABLED,
+    PREFECT_TASKS_LOCAL_CACHE_SIZE,
+    temporary_settings,
+)
+from prefect.task_cache import get_local_task_cache
+
+
+async def cached_task_run(session):
+    flow = await models.flows.create_flow(
+        session=session, flow=schemas.core.Flow(name="bench-task-cache")
+    )
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session, flow_run=schemas.core.FlowRun(flow_id=flow.id)
+    )
+    task_run = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_run.id, task_key="bench", dynamic_key="0"
+        ),
+    )
+    result = await models.task_runs.set_task_run_state(
+        session=session,
+        task_run_id=task_run.id,
+        state=schemas.states.Completed(),
+        force=True,
+    )
+    await models.task_run_state_cache.cache_state(
+        session=session,
+        cache_key="bench-key",
+        cache_expiration=None,
+        state=result.state,
+    )
+
+
+@pytest.mark.parametrize("cache_size", [0, 1000])
+def bench_read_cached_state(benchmark: BenchmarkFixture, cache_size: int):
+    db = provide_database_interface()
+
+    async def setup():
+        async with db.session_context(begin_transaction=True) as session:
+            await cached_task_run(session)
+
+    async def read_cached_state():
+        async with db.session_context(begin_transaction=True) as session:
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="bench-key"
+            )
+
+    with temporary_settings({PREFECT_API_TASK_CACHE_SIZE: cache_size}):
+        anyio.run(db.create_db)
+        anyio.run(setup)
+        benchmark(anyio.run, read_cached_state)
+
+
+@pytest.mark.parametrize(
+    "cache_lookup,local_cache_size", [(False, 0), (True, 0), (True, 1000)]
+)
+def bench_rerun_cached_tasks(
+    benchmark: BenchmarkFixture, cache_lookup: bool, local_cache_size: int
+):
+    @task(cache_key_fn=lambda context, parameters: f"bench-{parameters['x']}")
+    def cached_task(x):
+        return x
+
+    @flow
+    def benchmark_flow():
+        return [future.wait() for future in cached_task.map(range(50))]
+
+    with temporary_settings(
+        {
+            PREFECT_TASKS_CACHE_LOOKUP_ENABLED: cache_lookup,
+            PREFECT_TASKS_LOCAL_CACHE_SIZE: local_cache_size,
+        }
+    ):
+        # populate the cache
+        benchmark_flow()
+        benchmark(benchmark_flow)
+
+    if get_local_task_cache():
+        get_local_task_cache().clear()
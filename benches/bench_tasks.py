@@ -1,13 +1,21 @@
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
 
-from prefect import flow, task
+from prefect import flow, task, unmapped
+from prefect.settings import (
+    PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED,
+    temporary_settings,
+)
 
 
 def noop_function():
     pass
 
 
+def noop_function_with_parameters(x, y):
+    pass
+
+
 def bench_task_decorator(benchmark: BenchmarkFixture):
     benchmark(task, noop_function)
 
@@ -22,8 +30,11 @@ def bench_task_call(benchmark: BenchmarkFixture):
     benchmark_flow()
 
 
-@pytest.mark.parametrize("num_task_runs", [100, 250])
-def bench_task_submit(benchmark: BenchmarkFixture, num_task_runs: int):
+@pytest.mark.parametrize("batch_creation", [False, True])
+@pytest.mark.parametrize("num_task_runs", [100, 250, 1000])
+def bench_task_submit(
+    benchmark: BenchmarkFixture, num_task_runs: int, batch_creation: bool
+):
     noop_task = task(noop_function)
 
     # The benchmark occurs within the flow to measure _submission_ time without
@@ -33,4 +44,40 @@ def bench_task_submit(benchmark: BenchmarkFixture, num_task_runs: int):
     def benchmark_flow():
         benchmark.pedantic(noop_task.submit, rounds=num_task_runs)
 
-    benchmark_flow()
+    with temporary_settings(
+        {PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED: batch_creation}
+    ):
+        benchmark_flow()
+
+
+@pytest.mark.parametrize("batch_creation", [False, True])
+@pytest.mark.parametrize("num_task_runs", [100, 250, 1000])
+def bench_task_submit_and_wait(
+    benchmark: BenchmarkFixture, num_task_runs: int, batch_creation: bool
+):
+    noop_task = task(noop_function)
+
+    # Unlike `bench_task_submit`, this includes creation of the task runs which
+    # happens in the background after submission
+
+    @flow
+    def benchmark_flow():
+        for future in [noop_task.submit() for _ in range(num_task_runs)]:
+            future.wait()
+
+    with temporary_settings(
+        {PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED: batch_creation}
+    ):
+        benchmark.pedantic(benchmark_flow)
+
+
+@pytest.mark.parametrize("num_task_runs", [100, 1000])
+def bench_task_map(benchmark: BenchmarkFixture, num_task_runs: int):
+    noop_task = task(noop_function_with_parameters)
+
+    @flow
+    def benchmark_flow():
+        for future in noop_task.map(unmapped(1), range(num_task_runs)):
+            future.wait()
+
+    benchmark.pedantic(benchmark_flow)
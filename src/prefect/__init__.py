@@ -7,6 +7,7 @@ import importlib
 import pathlib
 import warnings
 import sys
+from typing import TYPE_CHECKING
 
 __version_info__ = _version.get_versions()
 __version__ = __version_info__["version"]
@@ -30,21 +31,27 @@ from prefect.context import tags
 from prefect.manifests import Manifest
 from prefect.utilities.annotations import unmapped, allow_failure
 from prefect.results import BaseResult
-from prefect.engine import pause_flow_run, resume_flow_run
 from prefect.client.orchestration import get_client, PrefectClient
-from prefect.client.cloud import get_cloud_client, CloudClient
 import prefect.runtime
 
-# Import modules that register types
-import prefect.serializers
-import prefect.deprecated.data_documents
-import prefect.packaging
-import prefect.blocks.kubernetes
-import prefect.blocks.notifications
-import prefect.blocks.system
-import prefect.infrastructure.process
-import prefect.infrastructure.kubernetes
-import prefect.infrastructure.docker
+# Import modules that register types when a registry is first used instead of at import
+# time; importing infrastructure, packaging and collections is slow and most processes
+# never need them
+import prefect.plugins
+from prefect.utilities.dispatch import register_deferred_import
+
+for _module in (
+    "prefect.packaging",
+    "prefect.blocks.kubernetes",
+    "prefect.infrastructure.process",
+    "prefect.infrastructure.kubernetes",
+    "prefect.infrastructure.docker",
+    # Ensure collections have the opportunity to register types
+    prefect.plugins.load_prefect_collections,
+):
+    register_deferred_import(_module)
+
+del _module, register_deferred_import
 
 # Initialize the process-wide profile and registry at import time
 import prefect.context
@@ -53,6 +60,7 @@ prefect.context.initialize_object_registry()
 
 # Perform any forward-ref updates needed for Pydantic models
 import prefect.client.schemas
+import prefect.deprecated.data_documents
 
 prefect.context.FlowRunContext.update_forward_refs(Flow=Flow)
 prefect.context.TaskRunContext.update_forward_refs(Task=Task)
@@ -60,10 +68,6 @@ prefect.client.schemas.State.update_forward_refs(
     BaseResult=BaseResult, DataDocument=prefect.deprecated.data_documents.DataDocument
 )
 
-# Ensure collections are imported and have the opportunity to register types
-import prefect.plugins
-
-prefect.plugins.load_prefect_collections()
 prefect.plugins.load_extra_entrypoints()
 
 # Configure logging
@@ -129,7 +133,41 @@ if not hasattr(sys, "frozen"):
     sys.meta_path.insert(0, Prefect1ImportInterceptor())
 
 
+# Import the remaining user-facing API and submodules that are slow to import when they
+# are first accessed
+
+_LAZY_ATTRIBUTES = {
+    "pause_flow_run": "prefect.engine",
+    "resume_flow_run": "prefect.engine",
+    "get_cloud_client": "prefect.client.cloud",
+    "CloudClient": "prefect.client.cloud",
+}
+
+_LAZY_SUBMODULES = {
+    "deployments",
+    "docker",
+    "engine",
+    "infrastructure",
+    "packaging",
+    "software",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        return getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Declare API for type-checkers
+if TYPE_CHECKING:
+    from prefect.client.cloud import get_cloud_client, CloudClient
+    from prefect.engine import pause_flow_run, resume_flow_run
+
 __all__ = [
     "allow_failure",
     "flow",
@@ -54,6 +54,14 @@ class Event:
     def is_set(self):
         return self._value
 
+    def __getstate__(self):
+        # Waiters belong to event loops in this process and the lock cannot be pickled
+        return {"_value": self._value}
+
+    def __setstate__(self, state: dict):
+        self.__init__()
+        self._value = state["_value"]
+
     async def wait(self) -> Literal[True]:
         """
         Block until the internal flag is true.
@@ -172,10 +172,17 @@ class PrefectAgent:
             self._work_queue_cache.append(work_queue)
             yield work_queue
 
-    async def get_and_submit_flow_runs(self) -> List[FlowRun]:
+    async def get_and_submit_flow_runs(
+        self, wait_seconds: Optional[float] = None
+    ) -> List[FlowRun]:
         """
         The principle method on agents. Queries for scheduled flow runs and submits
         them for execution in parallel.
+
+        Args:
+            wait_seconds: When polling a work pool, if no flow runs are scheduled, the
+                number of seconds to wait for a flow run to be scheduled before
+                returning.
         """
         if not self.started:
             raise RuntimeError(
@@ -195,6 +202,7 @@ class PrefectAgent:
                 work_pool_name=self.work_pool_name,
                 work_queue_names=[wq.name async for wq in self.get_work_queues()],
                 scheduled_before=before,
+                wait_seconds=wait_seconds,
             )
             submittable_runs.extend([response.flow_run for response in responses])
 
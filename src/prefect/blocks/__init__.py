@@ -1,7 +1,19 @@
-# ensure core blocks are registered
+# ensure core blocks are registered before a block registry is first used
 
-import prefect.blocks.notifications
-import prefect.blocks.system
-import prefect.blocks.webhook
+import importlib
+
+from prefect.utilities.dispatch import register_deferred_import
 
 __all__ = ["notifications", "system", "webhook"]
+
+for _module in __all__:
+    register_deferred_import(f"{__name__}.{_module}")
+
+del _module
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -187,14 +187,23 @@ async def start(
                 )
 
         async with anyio.create_task_group() as tg:
+            # when polling a work pool, each poll waits for up to an interval for a
+            # flow run to be scheduled, and the time waited counts towards the
+            # interval between polls
             tg.start_soon(
                 partial(
                     critical_service_loop,
-                    agent.get_and_submit_flow_runs,
+                    partial(
+                        agent.get_and_submit_flow_runs,
+                        wait_seconds=(
+                            None if run_once else PREFECT_AGENT_QUERY_INTERVAL.value()
+                        ),
+                    ),
                     PREFECT_AGENT_QUERY_INTERVAL.value(),
                     printer=app.console.print,
                     run_once=run_once,
                     jitter_range=0.3,
+                    include_workload_time=bool(work_pool_name),
                 )
             )
 
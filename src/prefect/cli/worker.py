@@ -89,14 +89,22 @@ async def start(
         async with anyio.create_task_group() as tg:
             # wait for an initial heartbeat to configure the worker
             await worker.sync_with_backend()
-            # schedule the scheduled flow run polling loop
+            # schedule the scheduled flow run polling loop; each poll waits for up to
+            # an interval for a flow run to be scheduled, and the time waited counts
+            # towards the interval between polls
             tg.start_soon(
                 partial(
                     critical_service_loop,
-                    workload=worker.get_and_submit_flow_runs,
+                    workload=partial(
+                        worker.get_and_submit_flow_runs,
+                        wait_seconds=(
+                            None if run_once else PREFECT_WORKER_QUERY_SECONDS.value()
+                        ),
+                    ),
                     interval=PREFECT_WORKER_QUERY_SECONDS.value(),
                     run_once=run_once,
                     printer=app.console.print,
+                    include_workload_time=True,
                 )
             )
             # schedule the sync loop
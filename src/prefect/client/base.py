@@ -4,13 +4,13 @@ import threading
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from functools import partial
-from typing import Callable, ContextManager, Dict, Set, Tuple, Type
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, Set, Tuple, Type
 
 import anyio
 import httpx
 from asgi_lifespan import LifespanManager
-from fastapi import FastAPI, status
 from httpx import HTTPStatusError, Response
+from starlette import status
 from typing_extensions import Self
 
 from prefect.exceptions import PrefectHTTPStatusError
@@ -18,6 +18,9 @@ from prefect.logging import get_logger
 from prefect.settings import PREFECT_CLIENT_RETRY_JITTER_FACTOR
 from prefect.utilities.math import bounded_poisson_interval, clamped_poisson_interval
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 # Datastores for lifespan management, keys should be a tuple of thread and app identities.
 APP_LIFESPANS: Dict[Tuple[int, int], LifespanManager] = {}
 APP_LIFESPANS_REF_COUNTS: Dict[Tuple[int, int], int] = {}
@@ -29,7 +32,7 @@ logger = get_logger("client")
 
 
 @asynccontextmanager
-async def app_lifespan_context(app: FastAPI) -> ContextManager[None]:
+async def app_lifespan_context(app: "FastAPI") -> ContextManager[None]:
     """
     A context manager that calls startup/shutdown hooks for the given application.
 
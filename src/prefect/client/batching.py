@@ -0,0 +1,370 @@
+"""
+Utilities for coalescing many client requests into fewer API calls.
+"""
+import asyncio
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import anyio.abc
+import httpx
+
+import prefect.states
+from prefect.client.orchestration import (
+    PrefectClient,
+    task_run_create_from_task,
+    task_run_set_state_from_state,
+)
+from prefect.client.schemas import OrchestrationResult, TaskRun
+from prefect.server import schemas
+from prefect.settings import (
+    PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL,
+    PREFECT_TASK_RUN_CREATION_BATCH_SIZE,
+)
+
+if TYPE_CHECKING:
+    from prefect.tasks import Task
+
+
+class TaskRunCreationBatcher:
+    """
+    Coalesces task run creation requests into bulk API calls.
+
+    Requests are buffered until either `batch_size` requests are pending or
+    `batch_interval` seconds have passed since the first pending request, then all of
+    the pending task runs are created with a single call to
+    `PrefectClient.create_task_runs`.
+
+    The batcher must only be used from the event loop that the task group belongs to.
+
+    Args:
+        client: The client to create task runs with
+        task_group: A task group used to run the requests in the background
+        batch_size: The maximum number of task runs to create in a single request.
+            Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_SIZE`.
+        batch_interval: The maximum number of seconds to wait before sending a
+            partial batch. Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL`.
+    """
+
+    def __init__(
+        self,
+        client: PrefectClient,
+        task_group: anyio.abc.TaskGroup,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+    ) -> None:
+        self.client = client
+        self.batch_size = batch_size or PREFECT_TASK_RUN_CREATION_BATCH_SIZE.value()
+        self.batch_interval = (
+            batch_interval
+            if batch_interval is not None
+            else PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL.value()
+        )
+        self._task_group = task_group
+        self._pending: List[Tuple[schemas.actions.TaskRunCreate, asyncio.Future]] = []
+        self._flush_scheduled = False
+
+    async def create_task_run(
+        self,
+        task: "Task",
+        flow_run_id: UUID,
+        dynamic_key: str,
+        name: str = None,
+        extra_tags: Iterable[str] = None,
+        state: prefect.states.State = None,
+        task_inputs: Dict[str, List[schemas.core.TaskRunInput]] = None,
+    ) -> TaskRun:
+        """
+        Create a task run as part of the next batch.
+
+        Accepts the same arguments as `PrefectClient.create_task_run` and returns once
+        the batch containing the task run has been created.
+        """
+        task_run_data = task_run_create_from_task(
+            task=task,
+            flow_run_id=flow_run_id,
+            dynamic_key=dynamic_key,
+            name=name,
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
+        )
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((task_run_data, future))
+
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._task_group.start_soon(self._flush_after_interval)
+
+        return await future
+
+    def flush(self) -> None:
+        """
+        Send all pending task runs for creation without waiting for a full batch.
+        """
+        batch, self._pending = self._pending, []
+        if batch:
+            self._task_group.start_soon(self._send, batch)
+
+    async def _flush_after_interval(self) -> None:
+        await anyio.sleep(self.batch_interval)
+        self._flush_scheduled = False
+        self.flush()
+
+    async def _send(
+        self, batch: List[Tuple[schemas.actions.TaskRunCreate, asyncio.Future]]
+    ) -> None:
+        try:
+            task_runs = await self.client.create_task_runs(
+                [task_run_data for task_run_data, _ in batch]
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        except BaseException:
+            for _, future in batch:
+                future.cancel()
+            raise
+        else:
+            for (_, future), task_run in zip(batch, task_runs):
+                if not future.done():
+                    future.set_result(task_run)
+
+
+class TaskRunStateBatcher:
+    """
+    Coalesces proposals of task run states into batched API calls.
+
+    Proposals are buffered until either `batch_size` proposals are pending or
+    `batch_interval` seconds have passed since the first pending proposal, then all of
+    the pending states are set with a single call to
+    `PrefectClient.set_task_run_states`. If the API rejects the batch with a client
+    error, for example because it does not support batched transitions or one of the
+    transitions cannot be orchestrated, none of the states were set and each state in
+    the batch is set with a separate call to `PrefectClient.set_task_run_state`
+    instead so that errors are only raised for the proposals that caused them. Other
+    errors, such as timeouts, are raised for every proposal in the batch since the
+    states may have been set.
+
+    The batcher must only be used from the event loop that the task group belongs to.
+
+    Args:
+        client: The client to set task run states with
+        task_group: A task group used to run the requests in the background
+        batch_size: The maximum number of states to set in a single request.
+            Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_SIZE`.
+        batch_interval: The maximum number of seconds to wait before sending a
+            partial batch. Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL`.
+    """
+
+    def __init__(
+        self,
+        client: PrefectClient,
+        task_group: anyio.abc.TaskGroup,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+    ) -> None:
+        self.client = client
+        self.batch_size = batch_size or PREFECT_TASK_RUN_CREATION_BATCH_SIZE.value()
+        self.batch_interval = (
+            batch_interval
+            if batch_interval is not None
+            else PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL.value()
+        )
+        self._task_group = task_group
+        self._pending: List[Tuple[UUID, prefect.states.State, bool, asyncio.Future]] = (
+            []
+        )
+        self._flush_scheduled = False
+
+    async def set_task_run_state(
+        self,
+        task_run_id: UUID,
+        state: prefect.states.State,
+        force: bool = False,
+    ) -> OrchestrationResult:
+        """
+        Set the state of a task run as part of the next batch.
+
+        Accepts the same arguments as `PrefectClient.set_task_run_state` and returns
+        once the batch containing the state has been set.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((task_run_id, state, force, future))
+
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._task_group.start_soon(self._flush_after_interval)
+
+        return await future
+
+    def flush(self) -> None:
+        """
+        Send all pending proposals without waiting for a full batch.
+        """
+        batch, self._pending = self._pending, []
+        if batch:
+            self._task_group.start_soon(self._send, batch)
+
+    async def _flush_after_interval(self) -> None:
+        await anyio.sleep(self.batch_interval)
+        self._flush_scheduled = False
+        self.flush()
+
+    async def _send(
+        self, batch: List[Tuple[UUID, prefect.states.State, bool, asyncio.Future]]
+    ) -> None:
+        try:
+            results = await self.client.set_task_run_states(
+                [
+                    task_run_set_state_from_state(task_run_id, state, force=force)
+                    for task_run_id, state, force, _ in batch
+                ]
+            )
+        except httpx.HTTPStatusError as exc:
+            if not exc.response.is_client_error:
+                self._set_exception(batch, exc)
+                return
+
+            # the API rejected the batch, so none of the states were set; set each
+            # state alone to isolate any errors
+            async with anyio.create_task_group() as tg:
+                for item in batch:
+                    tg.start_soon(self._send_one, *item)
+        except Exception as exc:
+            # the batch may have been applied, e.g. if the connection failed after the
+            # request was sent, so the states cannot safely be proposed again
+            self._set_exception(batch, exc)
+        except BaseException:
+            for *_, future in batch:
+                future.cancel()
+            raise
+        else:
+            for (*_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    @staticmethod
+    def _set_exception(
+        batch: List[Tuple[UUID, prefect.states.State, bool, asyncio.Future]],
+        exc: Exception,
+    ) -> None:
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _send_one(
+        self,
+        task_run_id: UUID,
+        state: prefect.states.State,
+        force: bool,
+        future: asyncio.Future,
+    ) -> None:
+        try:
+            result = await self.client.set_task_run_state(
+                task_run_id, state, force=force
+            )
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+class CachedTaskRunStateBatcher:
+    """
+    Coalesces lookups of cached task run states into bulk API calls.
+
+    Lookups are buffered until either `batch_size` cache keys are pending or
+    `batch_interval` seconds have passed since the first pending lookup, then the
+    states cached with all of the pending keys are read with a single call to
+    `PrefectClient.read_cached_task_run_states`. Concurrent lookups of the same key
+    share a single entry in the batch.
+
+    The batcher must only be used from the event loop that the task group belongs to.
+
+    Args:
+        client: The client to read cached states with
+        task_group: A task group used to run the requests in the background
+        batch_size: The maximum number of cache keys to look up in a single request.
+            Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_SIZE`.
+        batch_interval: The maximum number of seconds to wait before sending a
+            partial batch. Defaults to `PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL`.
+    """
+
+    def __init__(
+        self,
+        client: PrefectClient,
+        task_group: anyio.abc.TaskGroup,
+        batch_size: Optional[int] = None,
+        batch_interval: Optional[float] = None,
+    ) -> None:
+        self.client = client
+        self.batch_size = batch_size or PREFECT_TASK_RUN_CREATION_BATCH_SIZE.value()
+        self.batch_interval = (
+            batch_interval
+            if batch_interval is not None
+            else PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL.value()
+        )
+        self._task_group = task_group
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_scheduled = False
+
+    async def read_cached_state(self, cache_key: str) -> Optional[prefect.states.State]:
+        """
+        Look up the state cached with a key as part of the next batch.
+
+        Returns once the batch containing the key has been read, with `None` if there
+        is no state cached with the key.
+        """
+        future = self._pending.get(cache_key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[cache_key] = future
+
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                self._task_group.start_soon(self._flush_after_interval)
+
+        # shield the shared future from cancellation of a single caller
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """
+        Send all pending lookups without waiting for a full batch.
+        """
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._task_group.start_soon(self._send, batch)
+
+    async def _flush_after_interval(self) -> None:
+        await anyio.sleep(self.batch_interval)
+        self._flush_scheduled = False
+        self.flush()
+
+    async def _send(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            cached_states = await self.client.read_cached_task_run_states(batch)
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+        except BaseException:
+            for future in batch.values():
+                future.cancel()
+            raise
+        else:
+            for cache_key, future in batch.items():
+                if not future.done():
+                    future.set_result(cached_states.get(cache_key))
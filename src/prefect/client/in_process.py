@@ -0,0 +1,384 @@
+"""
+An in-process transport for clients of an ephemeral Prefect API.
+
+When no API URL is configured, `PrefectClient` talks to an ephemeral application
+running in the same process. Requests to the ephemeral application still build HTTP
+requests, pass through routing and encode and decode JSON in both directions. The
+`InProcessClient` instead calls the server's model and orchestration functions directly
+with schema objects, and is used by `PrefectClient` for the requests made for every
+flow and task run when `PREFECT_CLIENT_EPHEMERAL_IN_PROCESS` is enabled.
+
+Errors are reported as the ephemeral application would report them, so callers of
+`PrefectClient` see the same exceptions with either transport.
+"""
+import asyncio
+import math
+import sys
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+import anyio
+import httpx
+import sqlalchemy as sa
+from fastapi import status
+
+import prefect.server.models as models
+import prefect.server.schemas as schemas
+import prefect.states
+from prefect.client.base import PrefectHttpxClient
+from prefect.client.schemas import FlowRun, OrchestrationResult, TaskRun
+from prefect.exceptions import PrefectHTTPStatusError
+from prefect.logging import get_logger
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.utilities.database import get_dialect
+from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_CLIENT_RETRY_JITTER_FACTOR,
+)
+from prefect.utilities.math import clamped_poisson_interval
+
+T = TypeVar("T")
+
+logger = get_logger("client")
+
+# the base url of requests reported in errors, matching the ephemeral application
+EPHEMERAL_BASE_URL = "http://ephemeral-prefect/api"
+
+
+class InProcessClient:
+    """
+    Calls the Prefect REST API's models and orchestration functions directly, for
+    clients of an ephemeral API in the same process.
+
+    Only the requests made for every flow and task run are supported; `PrefectClient`
+    sends all other requests to the ephemeral application.
+
+    Args:
+        api_version: The API version of the client, passed to orchestration as the
+            ephemeral application would receive it from the request headers
+    """
+
+    def __init__(self, api_version: Optional[str] = None) -> None:
+        from prefect.server.api.dependencies import provide_request_api_version
+
+        self._api_version = provide_request_api_version(api_version)
+        self._limiters: WeakKeyDictionary = WeakKeyDictionary()
+        # match the limit on concurrent requests to an ephemeral application
+        self._limit = (
+            100
+            if get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value()).name == "sqlite"
+            else math.inf
+        )
+
+    async def create_flow_from_name(self, flow_name: str) -> UUID:
+        flow = schemas.core.Flow(name=flow_name)
+
+        async def create_flow(session):
+            model = await models.flows.create_flow(session=session, flow=flow)
+            return model.id
+
+        return await self._call("POST", "/flows/", create_flow)
+
+    async def create_flow_run(
+        self, flow_run_create: schemas.actions.FlowRunCreate
+    ) -> FlowRun:
+        flow_run = schemas.core.FlowRun(**self._as_request(flow_run_create).dict())
+        if not flow_run.state:
+            flow_run.state = schemas.states.Pending()
+
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_flow_orchestration_parameters()
+        )
+        orchestration_parameters.update({"api-version": self._api_version})
+
+        async def create_flow_run(session):
+            model = await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=flow_run,
+                orchestration_parameters=orchestration_parameters,
+            )
+            return FlowRun.from_orm(model)
+
+        return await self._call("POST", "/flow_runs/", create_flow_run)
+
+    async def read_flow_run(self, flow_run_id: UUID) -> FlowRun:
+        async def read_flow_run(session):
+            model = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+            if not model:
+                raise ObjectNotFoundError("Flow run not found")
+            return FlowRun.from_orm(model)
+
+        return await self._call(
+            "GET",
+            f"/flow_runs/{flow_run_id}",
+            read_flow_run,
+            begin_transaction=False,
+        )
+
+    async def set_flow_run_state(
+        self, flow_run_id: UUID, state_create: schemas.actions.StateCreate, force: bool
+    ) -> OrchestrationResult:
+        state = schemas.states.State.parse_obj(self._as_request(state_create))
+        flow_policy = await orchestration_dependencies.provide_flow_policy()
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_flow_orchestration_parameters()
+        )
+        orchestration_parameters.update({"api-version": self._api_version})
+
+        async def set_flow_run_state(session):
+            result = await models.flow_runs.set_flow_run_state(
+                session=session,
+                flow_run_id=flow_run_id,
+                state=state,
+                force=force,
+                flow_policy=flow_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+            return OrchestrationResult.parse_obj(result.dict(shallow=True))
+
+        return await self._call(
+            "POST", f"/flow_runs/{flow_run_id}/set_state", set_flow_run_state
+        )
+
+    async def create_task_run(
+        self, task_run_create: schemas.actions.TaskRunCreate
+    ) -> TaskRun:
+        task_run = self._task_run_from_create(task_run_create)
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_task_orchestration_parameters()
+        )
+
+        async def create_task_run(session):
+            model = await models.task_runs.create_task_run(
+                session=session,
+                task_run=task_run,
+                orchestration_parameters=orchestration_parameters,
+            )
+            return TaskRun.from_orm(model)
+
+        return await self._call("POST", "/task_runs/", create_task_run)
+
+    async def create_task_runs(
+        self, task_run_creates: Iterable[schemas.actions.TaskRunCreate]
+    ) -> List[TaskRun]:
+        task_runs = [
+            self._task_run_from_create(task_run_create)
+            for task_run_create in task_run_creates
+        ]
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_task_orchestration_parameters()
+        )
+
+        async def create_task_runs(session):
+            created = await models.task_runs.create_task_runs(
+                session=session,
+                task_runs=task_runs,
+                orchestration_parameters=orchestration_parameters,
+            )
+            return [TaskRun.from_orm(model) for model in created]
+
+        return await self._call("POST", "/task_runs/bulk", create_task_runs)
+
+    async def read_task_run(self, task_run_id: UUID) -> TaskRun:
+        async def read_task_run(session):
+            model = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_id
+            )
+            if not model:
+                raise ObjectNotFoundError("Task not found")
+            return TaskRun.from_orm(model)
+
+        return await self._call(
+            "GET",
+            f"/task_runs/{task_run_id}",
+            read_task_run,
+            begin_transaction=False,
+        )
+
+    async def set_task_run_state(
+        self, task_run_id: UUID, state_create: schemas.actions.StateCreate, force: bool
+    ) -> OrchestrationResult:
+        state = schemas.states.State.parse_obj(self._as_request(state_create))
+        task_policy = await orchestration_dependencies.provide_task_policy()
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_task_orchestration_parameters()
+        )
+
+        async def set_task_run_state(session):
+            result = await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=task_run_id,
+                state=state,
+                force=force,
+                task_policy=task_policy,
+                orchestration_parameters=orchestration_parameters,
+            )
+            return OrchestrationResult.parse_obj(result.dict(shallow=True))
+
+        return await self._call(
+            "POST", f"/task_runs/{task_run_id}/set_state", set_task_run_state
+        )
+
+    async def set_task_run_states(
+        self, transitions: Iterable[schemas.actions.TaskRunSetState]
+    ) -> List[OrchestrationResult]:
+        transitions = [
+            (
+                transition.task_run_id,
+                schemas.states.State.parse_obj(self._as_request(transition.state)),
+                transition.force,
+            )
+            for transition in transitions
+        ]
+        task_policy = await orchestration_dependencies.provide_task_policy()
+        orchestration_parameters = (
+            await orchestration_dependencies.provide_task_orchestration_parameters()
+        )
+
+        async def set_task_run_states(session):
+            results = []
+            for task_run_id, state, force in transitions:
+                result = await models.task_runs.set_task_run_state(
+                    session=session,
+                    task_run_id=task_run_id,
+                    state=state,
+                    force=force,
+                    task_policy=task_policy,
+                    orchestration_parameters=orchestration_parameters.copy(),
+                )
+                results.append(OrchestrationResult.parse_obj(result.dict(shallow=True)))
+            return results
+
+        return await self._call(
+            "POST", "/task_runs/set_state/batch", set_task_run_states
+        )
+
+    async def read_cached_task_run_states(
+        self, cache_keys: List[str]
+    ) -> Dict[str, prefect.states.State]:
+        async def read_cached_task_run_states(session):
+            cached_states = await models.task_run_state_cache.read_cached_states(
+                session=session, cache_keys=cache_keys
+            )
+            return {
+                cache_key: prefect.states.State.parse_obj(state.dict(shallow=True))
+                for cache_key, state in cached_states.items()
+            }
+
+        return await self._call(
+            "POST", "/task_runs/cached_states", read_cached_task_run_states
+        )
+
+    def _task_run_from_create(
+        self, task_run_create: schemas.actions.TaskRunCreate
+    ) -> schemas.core.TaskRun:
+        task_run = schemas.core.TaskRun(**self._as_request(task_run_create).dict())
+        if not task_run.state:
+            task_run.state = schemas.states.Pending()
+        return task_run
+
+    @staticmethod
+    def _as_request(model: PrefectBaseModel) -> PrefectBaseModel:
+        """
+        Returns a copy of a request model as the API would receive it.
+
+        Values such as parameters and state data are converted to JSON compatible
+        objects, as they would be when sent to the API, so they can be stored in JSON
+        columns.
+        """
+        return type(model).parse_obj(model.dict(json_compatible=True))
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        fn: Callable[[sa.orm.Session], Awaitable[T]],
+        begin_transaction: bool = True,
+    ) -> T:
+        """
+        Calls a function with a database session, retrying when the database is busy.
+
+        Errors are raised as the `PrefectClient` would raise them for the same request
+        to the ephemeral application.
+        """
+        db = provide_database_interface()
+        try_count = 0
+
+        while True:
+            try_count += 1
+            try:
+                async with self._limiter():
+                    async with db.session_context(
+                        begin_transaction=begin_transaction
+                    ) as session:
+                        return await fn(session)
+            except ObjectNotFoundError as exc:
+                raise self._status_error(
+                    method, path, status.HTTP_404_NOT_FOUND, str(exc)
+                ) from exc
+            except sa.exc.IntegrityError as exc:
+                raise self._status_error(
+                    method, path, status.HTTP_409_CONFLICT, "Data integrity conflict."
+                ) from exc
+            except sa.exc.OperationalError as exc:
+                if (
+                    not _is_database_busy(exc)
+                    or try_count > PrefectHttpxClient.RETRY_MAX
+                ):
+                    raise
+
+                retry_seconds = clamped_poisson_interval(
+                    2**try_count, PREFECT_CLIENT_RETRY_JITTER_FACTOR.value()
+                )
+                logger.debug(
+                    (
+                        "Encountered a busy database. Another attempt will be made in"
+                        f" {retry_seconds}s. This is attempt"
+                        f" {try_count}/{PrefectHttpxClient.RETRY_MAX + 1}."
+                    ),
+                    exc_info=sys.exc_info(),
+                )
+                await anyio.sleep(retry_seconds)
+
+    def _limiter(self) -> anyio.CapacityLimiter:
+        """
+        Returns the limiter for concurrent calls in the running event loop.
+        """
+        # limiters are bound to the event loop they are used in
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = anyio.CapacityLimiter(self._limit)
+        return limiter
+
+    @staticmethod
+    def _status_error(
+        method: str, path: str, status_code: int, detail: str
+    ) -> PrefectHTTPStatusError:
+        request = httpx.Request(method, EPHEMERAL_BASE_URL + path)
+        response = httpx.Response(
+            status_code,
+            json={"exception_message": detail},
+            request=request,
+        )
+        return PrefectHTTPStatusError(
+            (
+                f"Client error '{response.status_code} {response.reason_phrase}' for"
+                f" url '{request.url}'\nResponse: {response.json()}"
+            ),
+            request=request,
+            response=response,
+        )
+
+
+def _is_database_busy(exc: sa.exc.OperationalError) -> bool:
+    return (
+        getattr(exc.orig, "sqlite_errorname", None) == "SQLITE_BUSY"
+        and getattr(exc.orig, "sqlite_errorcode", None) == 5
+    )
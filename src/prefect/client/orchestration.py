@@ -1,4 +1,6 @@
 import datetime
+import gzip
+import json
 import warnings
 from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
@@ -9,7 +11,7 @@ import httpx
 import pendulum
 import pydantic
 from asgi_lifespan import LifespanManager
-from fastapi import FastAPI, status
+from starlette import status
 
 import prefect
 import prefect.exceptions
@@ -20,6 +22,7 @@ from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect.client.schemas import FlowRun, OrchestrationResult, TaskRun
 from prefect.deprecated.data_documents import DataDocument
 from prefect.logging import get_logger
+from prefect.server import SERVER_API_VERSION
 from prefect.server.schemas.actions import (
     FlowRunNotificationPolicyCreate,
     LogCreate,
@@ -50,11 +53,15 @@ from prefect.settings import (
     PREFECT_API_REQUEST_TIMEOUT,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
+    PREFECT_CLIENT_EPHEMERAL_IN_PROCESS,
     PREFECT_CLOUD_API_URL,
 )
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from prefect.client.in_process import InProcessClient
     from prefect.flows import Flow
     from prefect.tasks import Task
 
@@ -93,6 +100,66 @@ def get_client(httpx_settings: dict = None) -> "PrefectClient":
     )
 
 
+def task_run_create_from_task(
+    task: "Task",
+    flow_run_id: UUID,
+    dynamic_key: str,
+    name: str = None,
+    extra_tags: Iterable[str] = None,
+    state: prefect.states.State = None,
+    task_inputs: Dict[
+        str,
+        List[
+            Union[
+                schemas.core.TaskRunResult,
+                schemas.core.Parameter,
+                schemas.core.Constant,
+            ]
+        ],
+    ] = None,
+) -> schemas.actions.TaskRunCreate:
+    """
+    Build the data required to create a task run for a task.
+
+    See `PrefectClient.create_task_run` for a description of the arguments.
+    """
+    tags = set(task.tags).union(extra_tags or [])
+
+    if state is None:
+        state = prefect.states.Pending()
+
+    return schemas.actions.TaskRunCreate(
+        name=name,
+        flow_run_id=flow_run_id,
+        task_key=task.task_key,
+        dynamic_key=dynamic_key,
+        tags=list(tags),
+        task_version=task.version,
+        empirical_policy=schemas.core.TaskRunPolicy(
+            retries=task.retries,
+            retry_delay=task.retry_delay_seconds,
+            retry_jitter_factor=task.retry_jitter_factor,
+        ),
+        state=state.to_state_create(),
+        task_inputs=task_inputs or {},
+    )
+
+
+def task_run_set_state_from_state(
+    task_run_id: UUID, state: prefect.states.State, force: bool = False
+) -> schemas.actions.TaskRunSetState:
+    """
+    Build the data required to set the state of a task run in a batch.
+
+    See `PrefectClient.set_task_run_state` for a description of the arguments.
+    """
+    state_create = state.to_state_create()
+    state_create.state_details.task_run_id = task_run_id
+    return schemas.actions.TaskRunSetState(
+        task_run_id=task_run_id, state=state_create, force=force
+    )
+
+
 class PrefectClient:
     """
     An asynchronous client for interacting with the [Prefect REST API](/api-ref/rest-api/).
@@ -121,7 +188,7 @@ class PrefectClient:
 
     def __init__(
         self,
-        api: Union[str, FastAPI],
+        api: Union[str, "FastAPI"],
         *,
         api_key: str = None,
         api_version: str = None,
@@ -134,9 +201,6 @@ class PrefectClient:
             httpx_settings.setdefault("verify", False)
 
         if api_version is None:
-            # deferred import to avoid importing the entire server unless needed
-            from prefect.server.api.server import SERVER_API_VERSION
-
             api_version = SERVER_API_VERSION
         httpx_settings["headers"].setdefault("X-PREFECT-API-VERSION", api_version)
         if api_key:
@@ -144,7 +208,8 @@ class PrefectClient:
 
         # Context management
         self._exit_stack = AsyncExitStack()
-        self._ephemeral_app: Optional[FastAPI] = None
+        self._ephemeral_app: Optional["FastAPI"] = None
+        self._in_process: Optional["InProcessClient"] = None
         self.manage_lifespan = True
         self.server_type: ServerType
 
@@ -154,6 +219,10 @@ class PrefectClient:
         self._closed = False
         self._started = False
 
+        if not isinstance(api, str):
+            # deferred import to avoid importing FastAPI unless an application is given
+            from fastapi import FastAPI
+
         # Connect to an external application
         if isinstance(api, str):
             if httpx_settings.get("app"):
@@ -198,6 +267,14 @@ class PrefectClient:
             httpx_settings.setdefault("app", self._ephemeral_app)
             httpx_settings.setdefault("base_url", "http://ephemeral-prefect/api")
 
+            if PREFECT_CLIENT_EPHEMERAL_IN_PROCESS.value():
+                # deferred import to avoid importing the server models unless needed
+                import prefect.client.in_process
+
+                self._in_process = prefect.client.in_process.InProcessClient(
+                    api_version=api_version
+                )
+
         else:
             raise TypeError(
                 f"Unexpected type {type(api).__name__!r} for argument `api`. Expected"
@@ -298,6 +375,9 @@ class PrefectClient:
         Returns:
             the ID of the flow in the backend
         """
+        if self._in_process:
+            return await self._in_process.create_flow_from_name(flow_name)
+
         flow_data = schemas.actions.FlowCreate(name=flow_name)
         response = await self._client.post(
             "/flows/", json=flow_data.dict(json_compatible=True)
@@ -514,9 +594,12 @@ class PrefectClient:
             ),
         )
 
-        flow_run_create_json = flow_run_create.dict(json_compatible=True)
-        response = await self._client.post("/flow_runs/", json=flow_run_create_json)
-        flow_run = FlowRun.parse_obj(response.json())
+        if self._in_process:
+            flow_run = await self._in_process.create_flow_run(flow_run_create)
+        else:
+            flow_run_create_json = flow_run_create.dict(json_compatible=True)
+            response = await self._client.post("/flow_runs/", json=flow_run_create_json)
+            flow_run = FlowRun.parse_obj(response.json())
 
         # Restore the parameters to the local objects to retain expectations about
         # Python objects
@@ -726,6 +809,30 @@ class PrefectClient:
             else:
                 raise
 
+    async def wait_for_concurrency_slot(self, tag: str, timeout: float) -> bool:
+        """
+        Wait for a slot on the concurrency limit set on a specific tag to be released.
+
+        The slot is not reserved; a task run must still secure it by proposing a
+        `Running` state.
+
+        Args:
+            tag: a tag the concurrency limit is applied to
+            timeout: the maximum number of seconds to wait
+
+        Returns:
+            bool: whether or not a slot was available before the timeout
+
+        Raises:
+            httpx.RequestError: If request fails
+        """
+        response = await self._client.post(
+            f"/concurrency_limits/tag/{tag}/wait",
+            json=dict(timeout_seconds=timeout),
+            timeout=timeout + PREFECT_API_REQUEST_TIMEOUT.value(),
+        )
+        return response.json()
+
     async def delete_concurrency_limit_by_tag(
         self,
         tag: str,
@@ -1597,6 +1704,8 @@ class PrefectClient:
             a Flow Run model representation of the flow run
         """
         try:
+            if self._in_process:
+                return await self._in_process.read_flow_run(flow_run_id)
             response = await self._client.get(f"/flow_runs/{flow_run_id}")
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -1706,6 +1815,10 @@ class PrefectClient:
         state_create = state.to_state_create()
         state_create.state_details.flow_run_id = flow_run_id
         try:
+            if self._in_process:
+                return await self._in_process.set_flow_run_state(
+                    flow_run_id, state_create, force=force
+                )
             response = await self._client.post(
                 f"/flow_runs/{flow_run_id}/set_state",
                 json=dict(state=state_create.dict(json_compatible=True), force=force),
@@ -1779,32 +1892,66 @@ class PrefectClient:
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        task_run_data = schemas.actions.TaskRunCreate(
-            name=name,
+        task_run_data = task_run_create_from_task(
+            task=task,
             flow_run_id=flow_run_id,
-            task_key=task.task_key,
             dynamic_key=dynamic_key,
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=schemas.core.TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=task.retry_delay_seconds,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=state.to_state_create(),
-            task_inputs=task_inputs or {},
+            name=name,
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
 
+        if self._in_process:
+            return await self._in_process.create_task_run(task_run_data)
+
         response = await self._client.post(
             "/task_runs/", json=task_run_data.dict(json_compatible=True)
         )
         return TaskRun.parse_obj(response.json())
 
+    async def create_task_runs(
+        self, task_runs: Iterable[schemas.actions.TaskRunCreate]
+    ) -> List[TaskRun]:
+        """
+        Create many task runs in a single request.
+
+        If the API does not support bulk creation of task runs, each task run will be
+        created with a separate request instead.
+
+        Args:
+            task_runs: An iterable of `TaskRunCreate` objects; see
+                `task_run_create_from_task` for creating these from a `Task`
+
+        Returns:
+            The created task runs, in the order they were provided.
+        """
+        if self._in_process:
+            return await self._in_process.create_task_runs(task_runs)
+
+        serialized_task_runs = [
+            task_run.dict(json_compatible=True) for task_run in task_runs
+        ]
+
+        try:
+            response = await self._client.post(
+                "/task_runs/bulk", json=serialized_task_runs
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (
+                status.HTTP_404_NOT_FOUND,
+                status.HTTP_405_METHOD_NOT_ALLOWED,
+            ):
+                raise
+        else:
+            return pydantic.parse_obj_as(List[TaskRun], response.json())
+
+        task_runs = []
+        for task_run_data in serialized_task_runs:
+            response = await self._client.post("/task_runs/", json=task_run_data)
+            task_runs.append(TaskRun.parse_obj(response.json()))
+        return task_runs
+
     async def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -1815,6 +1962,9 @@ class PrefectClient:
         Returns:
             a Task Run model representation of the task run
         """
+        if self._in_process:
+            return await self._in_process.read_task_run(task_run_id)
+
         response = await self._client.get(f"/task_runs/{task_run_id}")
         return TaskRun.parse_obj(response.json())
 
@@ -1886,12 +2036,76 @@ class PrefectClient:
         """
         state_create = state.to_state_create()
         state_create.state_details.task_run_id = task_run_id
+        if self._in_process:
+            return await self._in_process.set_task_run_state(
+                task_run_id, state_create, force=force
+            )
+
         response = await self._client.post(
             f"/task_runs/{task_run_id}/set_state",
             json=dict(state=state_create.dict(json_compatible=True), force=force),
         )
         return OrchestrationResult.parse_obj(response.json())
 
+    async def set_task_run_states(
+        self, transitions: Iterable[schemas.actions.TaskRunSetState]
+    ) -> List[OrchestrationResult]:
+        """
+        Set the states of many task runs in a single request.
+
+        Each transition is orchestrated as it would be by `set_task_run_state`, but
+        all of the states are set in a single transaction; if any transition cannot be
+        orchestrated, an error is raised and none of the states are set.
+
+        Args:
+            transitions: An iterable of `TaskRunSetState` objects; see
+                `task_run_set_state_from_state` for creating these from a `State`
+
+        Returns:
+            The OrchestrationResult of each transition, in the order they were provided
+        """
+        transitions = list(transitions)
+        if self._in_process:
+            return await self._in_process.set_task_run_states(transitions)
+
+        response = await self._client.post(
+            "/task_runs/set_state/batch",
+            json=[transition.dict(json_compatible=True) for transition in transitions],
+        )
+        return pydantic.parse_obj_as(List[OrchestrationResult], response.json())
+
+    async def read_cached_task_run_states(
+        self, cache_keys: Iterable[str]
+    ) -> Dict[str, prefect.states.State]:
+        """
+        Query for the latest unexpired state cached with each of a list of cache keys.
+
+        If the API does not support looking up cached states, no states are returned.
+
+        Args:
+            cache_keys: the cache keys to look up
+
+        Returns:
+            a dictionary of cached states by cache key; keys without a cached state
+                are omitted
+        """
+        cache_keys = list(cache_keys)
+        if self._in_process:
+            return await self._in_process.read_cached_task_run_states(cache_keys)
+
+        try:
+            response = await self._client.post(
+                "/task_runs/cached_states", json=dict(cache_keys=cache_keys)
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (
+                status.HTTP_404_NOT_FOUND,
+                status.HTTP_405_METHOD_NOT_ALLOWED,
+            ):
+                return {}
+            raise
+        return pydantic.parse_obj_as(Dict[str, prefect.states.State], response.json())
+
     async def read_task_run_states(
         self, task_run_id: UUID
     ) -> List[prefect.states.State]:
@@ -1909,18 +2123,34 @@ class PrefectClient:
         )
         return pydantic.parse_obj_as(List[prefect.states.State], response.json())
 
-    async def create_logs(self, logs: Iterable[Union[LogCreate, dict]]) -> None:
+    async def create_logs(
+        self, logs: Iterable[Union[LogCreate, dict]], compress: bool = False
+    ) -> None:
         """
         Create logs for a flow or task run
 
         Args:
             logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            compress: If set, the request body is gzip compressed. The API must
+                support gzip encoded request bodies.
         """
         serialized_logs = [
             log.dict(json_compatible=True) if isinstance(log, LogCreate) else log
             for log in logs
         ]
-        await self._client.post(f"/logs/", json=serialized_logs)
+        if compress:
+            await self._client.post(
+                f"/logs/",
+                content=gzip.compress(
+                    json.dumps(serialized_logs).encode(), compresslevel=1
+                ),
+                headers={
+                    "Content-Encoding": "gzip",
+                    "Content-Type": "application/json",
+                },
+            )
+        else:
+            await self._client.post(f"/logs/", json=serialized_logs)
 
     async def create_flow_run_notification_policy(
         self,
@@ -2240,6 +2470,7 @@ class PrefectClient:
         work_pool_name: str,
         work_queue_names: Optional[List[str]] = None,
         scheduled_before: Optional[datetime.datetime] = None,
+        wait_seconds: Optional[float] = None,
     ) -> List[WorkerFlowRunResponse]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -2251,6 +2482,10 @@ class PrefectClient:
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            wait_seconds: If no flow runs are scheduled, the number of seconds the
+                server may wait for a flow run to be scheduled before returning.
+                While waiting, `scheduled_before` moves forward with time. Servers
+                that do not support waiting return immediately.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -2262,9 +2497,17 @@ class PrefectClient:
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
 
+        request_kwargs = {}
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
+            request_kwargs["timeout"] = (
+                wait_seconds + PREFECT_API_REQUEST_TIMEOUT.value()
+            )
+
         response = await self._client.post(
             f"/work_pools/{work_pool_name}/get_scheduled_flow_runs",
             json=body,
+            **request_kwargs,
         )
 
         return pydantic.parse_obj_as(List[WorkerFlowRunResponse], response.json())
@@ -32,6 +32,11 @@ from pydantic import BaseModel, Field, PrivateAttr
 import prefect.logging
 import prefect.logging.configuration
 import prefect.settings
+from prefect.client.batching import (
+    CachedTaskRunStateBatcher,
+    TaskRunCreationBatcher,
+    TaskRunStateBatcher,
+)
 from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas import FlowRun, TaskRun
 from prefect.events.worker import EventsWorker
@@ -110,6 +115,12 @@ class ContextModel(BaseModel):
         new._token = None
         return new
 
+    def __getstate__(self):
+        # Remove the token when serializing; it is only valid in the current context
+        state = super().__getstate__()
+        state["__private_attribute_values__"]["_token"] = None
+        return state
+
 
 class PrefectObjectRegistry(ContextModel):
     """
@@ -218,6 +229,12 @@ class FlowRunContext(RunContext):
         flow_run_states: A list of states for flow runs created within this flow run
         sync_portal: A blocking portal for sync task/flow runs in an async flow
         timeout_scope: The cancellation scope for flow level timeouts
+        task_run_creation_batcher: If set, used to coalesce the creation of task runs
+            submitted by this flow run into bulk requests
+        cached_task_run_state_batcher: If set, used to coalesce the lookups of cached
+            states for task runs submitted by this flow run into bulk requests
+        task_run_state_batcher: If set, used to coalesce the states proposed for task
+            runs submitted by this flow run into batched requests
     """
 
     flow: "Flow"
@@ -249,6 +266,15 @@ class FlowRunContext(RunContext):
     # Task group that can be used for background tasks during the flow run
     background_tasks: anyio.abc.TaskGroup
 
+    # Batches task run creation requests when enabled
+    task_run_creation_batcher: Optional[TaskRunCreationBatcher] = None
+
+    # Batches lookups of cached task run states when enabled
+    cached_task_run_state_batcher: Optional[CachedTaskRunStateBatcher] = None
+
+    # Batches task run state proposals when enabled
+    task_run_state_batcher: Optional[TaskRunStateBatcher] = None
+
     # Events worker to emit events to Prefect Cloud
     events: Optional[EventsWorker] = None
 
@@ -300,6 +326,9 @@ class SettingsContext(ContextModel):
 
     This allows for safe concurrent access and modification of settings.
 
+    Settings contexts are immutable and may be shared, e.g. with every task run
+    submitted by a flow run; enter a copy of a context that may already be entered.
+
     Attributes:
         profile: The profile that is in use.
         settings: The complete settings model.
@@ -313,6 +342,14 @@ class SettingsContext(ContextModel):
     def __hash__(self) -> int:
         return hash(self.settings)
 
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, SettingsContext):
+            # Compare values directly instead of converting both contexts to dicts
+            return self.__dict__ == other.__dict__
+        return super().__eq__(other)
+
     def __enter__(self):
         """
         Upon entrance, we ensure the home directory for the profile exists.
@@ -22,12 +22,26 @@ import signal
 import sys
 from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from functools import partial
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import anyio
+import httpx
 import pendulum
 from anyio import start_blocking_portal
+from starlette import status
 from typing_extensions import Literal
 
 import prefect
@@ -35,7 +49,16 @@ import prefect.context
 from prefect._internal.concurrency.api import create_call, from_async, from_sync
 from prefect._internal.concurrency.calls import get_current_call
 from prefect._internal.concurrency.threads import wait_for_global_loop_exit
-from prefect.client.orchestration import PrefectClient, get_client
+from prefect.client.batching import (
+    CachedTaskRunStateBatcher,
+    TaskRunCreationBatcher,
+    TaskRunStateBatcher,
+)
+from prefect.client.orchestration import (
+    PrefectClient,
+    get_client,
+    task_run_create_from_task,
+)
 from prefect.client.schemas import FlowRun, OrchestrationResult, TaskRun
 from prefect.client.utilities import inject_client
 from prefect.context import (
@@ -76,6 +99,10 @@ from prefect.server.schemas.states import StateDetails, StateType
 from prefect.settings import (
     PREFECT_DEBUG_MODE,
     PREFECT_LOGGING_LOG_PRINTS,
+    PREFECT_TASK_RUN_CREATION_BATCH_SIZE,
+    PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED,
+    PREFECT_TASK_RUN_STATE_BATCHING_ENABLED,
+    PREFECT_TASKS_CACHE_LOOKUP_ENABLED,
     PREFECT_TASKS_REFRESH_CACHE,
 )
 from prefect.states import (
@@ -88,13 +115,14 @@ from prefect.states import (
     get_state_exception,
     return_value_to_state,
 )
+from prefect.task_cache import get_local_task_cache
 from prefect.task_runners import (
     CONCURRENCY_MESSAGES,
     BaseTaskRunner,
     TaskConcurrencyType,
 )
 from prefect.tasks import Task
-from prefect.utilities.annotations import allow_failure, quote, unmapped
+from prefect.utilities.annotations import BaseAnnotation, allow_failure, quote, unmapped
 from prefect.utilities.asyncutils import (
     gather,
     is_async_fn,
@@ -107,7 +135,13 @@ from prefect.utilities.callables import (
     get_parameter_defaults,
     parameters_to_args_kwargs,
 )
-from prefect.utilities.collections import StopVisiting, isiterable, visit_collection
+from prefect.utilities.collections import (
+    StopVisiting,
+    batched_iterable,
+    isiterable,
+    iter_collection,
+    visit_collection,
+)
 from prefect.utilities.pydantic import PartialModel
 
 R = TypeVar("R")
@@ -361,9 +395,8 @@ async def begin_flow_run(
         )
 
         # Create a task group for background tasks
-        flow_run_context.background_tasks = await stack.enter_async_context(
-            anyio.create_task_group()
-        )
+        background_tasks = await stack.enter_async_context(anyio.create_task_group())
+        flow_run_context.background_tasks = background_tasks
 
         # If the flow is async, we need to provide a portal so sync tasks can run
         flow_run_context.sync_portal = (
@@ -374,8 +407,16 @@ async def begin_flow_run(
             f"Starting {type(flow.task_runner).__name__!r}; submitted tasks "
             f"will be run {CONCURRENCY_MESSAGES[flow.task_runner.concurrency_type]}..."
         )
-        flow_run_context.task_runner = await stack.enter_async_context(
-            flow.task_runner.start()
+        task_runner = await stack.enter_async_context(flow.task_runner.start())
+        flow_run_context.task_runner = task_runner
+        flow_run_context.task_run_creation_batcher = _task_run_creation_batcher(
+            client, task_runner=task_runner, task_group=background_tasks
+        )
+        flow_run_context.cached_task_run_state_batcher = _cached_task_run_state_batcher(
+            client, task_runner=task_runner, task_group=background_tasks
+        )
+        flow_run_context.task_run_state_batcher = _task_run_state_batcher(
+            client, task_runner=task_runner, task_group=background_tasks
         )
 
         flow_run_context.result_factory = await ResultFactory.from_flow(
@@ -547,6 +588,21 @@ async def create_and_begin_subflow_run(
                     background_tasks=parent_flow_run_context.background_tasks,
                     result_factory=result_factory,
                     log_prints=log_prints,
+                    task_run_creation_batcher=_task_run_creation_batcher(
+                        client,
+                        task_runner=task_runner,
+                        task_group=parent_flow_run_context.background_tasks,
+                    ),
+                    cached_task_run_state_batcher=_cached_task_run_state_batcher(
+                        client,
+                        task_runner=task_runner,
+                        task_group=parent_flow_run_context.background_tasks,
+                    ),
+                    task_run_state_batcher=_task_run_state_batcher(
+                        client,
+                        task_runner=task_runner,
+                        task_group=parent_flow_run_context.background_tasks,
+                    ),
                 ),
             )
 
@@ -1029,14 +1085,16 @@ async def begin_task_map(
 
     map_length = list(lengths)[0]
 
-    task_runs = []
+    # Default values for parameters are skipped earlier since they should not be
+    # mapped over; like the static parameters, they are shared by every child
+    parameter_defaults = get_parameter_defaults(task.fn)
+
+    mapped_parameters = []
     for i in range(map_length):
         call_parameters = {key: value[i] for key, value in iterable_parameters.items()}
-        call_parameters.update({key: value for key, value in static_parameters.items()})
+        call_parameters.update(static_parameters)
 
-        # Add default values for parameters; these are skipped earlier since they should
-        # not be mapped over
-        for key, value in get_parameter_defaults(task.fn).items():
+        for key, value in parameter_defaults.items():
             call_parameters.setdefault(key, value)
 
         # Re-apply annotations to each key again
@@ -1046,20 +1104,192 @@ async def begin_task_map(
         # Collapse any previously exploded kwargs
         call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
 
-        task_runs.append(
-            partial(
-                get_task_call_return_value,
+        mapped_parameters.append(call_parameters)
+
+    futures = await create_mapped_task_run_futures(
+        task=task,
+        flow_run_context=flow_run_context,
+        mapped_parameters=mapped_parameters,
+        static_keys=set(static_parameters).union(parameter_defaults),
+        wait_for=wait_for,
+        task_runner=task_runner,
+        extra_task_inputs=task_inputs,
+    )
+
+    if return_type == "future":
+        return futures
+    elif return_type == "state":
+        return [await future._wait() for future in futures]
+    elif return_type == "result":
+        return [await future._result() for future in futures]
+    else:
+        raise ValueError(f"Invalid return type for task engine {return_type!r}.")
+
+
+async def create_mapped_task_run_futures(
+    task: Task,
+    flow_run_context: FlowRunContext,
+    mapped_parameters: List[Dict[str, Any]],
+    static_keys: Set[str],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: Optional[BaseTaskRunner],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> List[PrefectFuture]:
+    """
+    Create a future for each child of a mapped task call.
+
+    Unlike `create_task_run_future`, the task runs for all of the children are created
+    and submitted together by a single background task.
+    """
+    # Default to the flow run's task runner
+    task_runner = task_runner or flow_run_context.task_runner
+
+    futures = []
+    dynamic_keys = []
+    for _ in mapped_parameters:
+        dynamic_key = _dynamic_key_for_task_run(flow_run_context, task)
+        futures.append(
+            PrefectFuture(
+                name=f"{task.name}-{dynamic_key}",
+                key=uuid4(),
+                task_runner=task_runner,
+                asynchronous=task.isasync and flow_run_context.flow.isasync,
+            )
+        )
+        dynamic_keys.append(dynamic_key)
+
+    # Create and submit the task runs in the background
+    flow_run_context.background_tasks.start_soon(
+        partial(
+            create_mapped_task_runs_then_submit,
+            task=task,
+            futures=futures,
+            dynamic_keys=dynamic_keys,
+            flow_run_context=flow_run_context,
+            mapped_parameters=mapped_parameters,
+            static_keys=static_keys,
+            wait_for=wait_for,
+            task_runner=task_runner,
+            extra_task_inputs=extra_task_inputs,
+        )
+    )
+
+    # Track the task run futures in the flow run context
+    flow_run_context.task_run_futures.extend(futures)
+
+    if task_runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
+        for future in futures:
+            await future._wait()
+
+    # Return the futures without waiting for task run creation or submission
+    return futures
+
+
+async def create_mapped_task_runs_then_submit(
+    task: Task,
+    futures: List[PrefectFuture],
+    dynamic_keys: List[str],
+    flow_run_context: FlowRunContext,
+    mapped_parameters: List[Dict[str, Any]],
+    static_keys: Set[str],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: BaseTaskRunner,
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> None:
+    logger = get_run_logger(flow_run_context)
+
+    # Everything that does not depend on the mapped values is only computed once
+    wait_for_inputs = await collect_task_run_inputs(wait_for) if wait_for else None
+    static_task_inputs: Dict[str, Set[TaskRunInput]] = {}
+    extra_tags = TagsContext.get().current_tags
+    result_factory = await ResultFactory.from_task(task, client=flow_run_context.client)
+    settings = prefect.context.SettingsContext.get()
+
+    for batch in batched_iterable(
+        zip(futures, dynamic_keys, mapped_parameters),
+        PREFECT_TASK_RUN_CREATION_BATCH_SIZE.value(),
+    ):
+        task_run_data = []
+        for future, dynamic_key, parameters in batch:
+            task_inputs = {}
+            for key, value in parameters.items():
+                if key in static_keys:
+                    if key not in static_task_inputs:
+                        static_task_inputs[key] = await collect_task_run_inputs(value)
+                    task_inputs[key] = static_task_inputs[key]
+                else:
+                    task_inputs[key] = await collect_task_run_inputs(value)
+
+            if wait_for_inputs is not None:
+                task_inputs["wait_for"] = wait_for_inputs
+
+            # Join extra task inputs
+            for k, extras in extra_task_inputs.items():
+                task_inputs[k] = task_inputs[k].union(extras)
+
+            task_run_data.append(
+                task_run_create_from_task(
+                    task=task,
+                    flow_run_id=flow_run_context.flow_run.id,
+                    dynamic_key=dynamic_key,
+                    name=future.name,
+                    extra_tags=extra_tags,
+                    state=Pending(),
+                    task_inputs=task_inputs,
+                )
+            )
+
+        task_runs = await flow_run_context.client.create_task_runs(task_run_data)
+
+        for task_run in task_runs:
+            logger.info(f"Created task run {task_run.name!r} for task {task.name!r}")
+
+        # Look up the cached states of the batch concurrently so the lookups can be
+        # coalesced into bulk requests
+        cached_states: List[Optional[State]] = [None] * len(task_runs)
+        if PREFECT_TASKS_CACHE_LOOKUP_ENABLED and task.cache_key_fn:
+
+            async def propose_cached_state(index, task_run, parameters):
+                cached_states[index] = await propose_cached_task_run_state(
+                    task=task,
+                    task_run=task_run,
+                    flow_run_context=flow_run_context,
+                    parameters=parameters,
+                    wait_for=wait_for,
+                    result_factory=result_factory,
+                )
+
+            async with anyio.create_task_group() as tg:
+                for index, ((_, _, parameters), task_run) in enumerate(
+                    zip(batch, task_runs)
+                ):
+                    tg.start_soon(propose_cached_state, index, task_run, parameters)
+
+        for (future, _, parameters), task_run, cached_state in zip(
+            batch, task_runs, cached_states
+        ):
+            # Attach the task run to the future to support `get_state` operations
+            future.task_run = task_run
+
+            if cached_state:
+                # The task run does not need to be submitted for execution
+                future._final_state = cached_state
+                future._submitted.set()
+                continue
+
+            await submit_task_run(
                 task=task,
+                future=future,
                 flow_run_context=flow_run_context,
-                parameters=call_parameters,
+                parameters=parameters,
+                task_run=task_run,
                 wait_for=wait_for,
-                return_type=return_type,
                 task_runner=task_runner,
-                extra_task_inputs=task_inputs,
+                result_factory=result_factory,
+                settings=settings,
             )
-        )
 
-    return await gather(*task_runs)
+            future._submitted.set()
 
 
 async def collect_task_run_inputs(expr: Any, max_depth: int = -1) -> Set[TaskRunInput]:
@@ -1078,25 +1308,13 @@ async def collect_task_run_inputs(expr: Any, max_depth: int = -1) -> Set[TaskRun
     inputs = set()
     futures = set()
 
-    def add_futures_and_states_to_inputs(obj):
-        if isinstance(obj, PrefectFuture):
+    for upstream, _ in find_upstreams(expr, max_depth=max_depth):
+        if isinstance(upstream, PrefectFuture):
             # We need to wait for futures to be submitted before we can get the task
             # run id but we want to do so asynchronously
-            futures.add(obj)
-        elif isinstance(obj, State):
-            if obj.state_details.task_run_id:
-                inputs.add(TaskRunResult(id=obj.state_details.task_run_id))
-        else:
-            state = get_state_for_result(obj)
-            if state and state.state_details.task_run_id:
-                inputs.add(TaskRunResult(id=state.state_details.task_run_id))
-
-    visit_collection(
-        expr,
-        visit_fn=add_futures_and_states_to_inputs,
-        return_data=False,
-        max_depth=max_depth,
-    )
+            futures.add(upstream)
+        elif upstream.state_details.task_run_id:
+            inputs.add(TaskRunResult(id=upstream.state_details.task_run_id))
 
     await asyncio.gather(*[future._wait_for_submission() for future in futures])
     for future in futures:
@@ -1105,6 +1323,47 @@ async def collect_task_run_inputs(expr: Any, max_depth: int = -1) -> Set[TaskRun
     return inputs
 
 
+def find_upstreams(
+    expr: Any,
+    max_depth: int = -1,
+    skip_quoted: bool = False,
+    include_results: bool = True,
+) -> List[Tuple[Union[PrefectFuture, State], Optional[BaseAnnotation]]]:
+    """
+    Find the futures and states in an expression, and the states linked to any task
+    run results it contains, in a single traversal.
+
+    Args:
+        expr: The expression to search.
+        max_depth: The maximum depth to search, as in `visit_collection`.
+        skip_quoted: If set, expressions inside `quote` annotations are not searched.
+        include_results: If set, the states of task run results found in the
+            expression are included. See `link_state_to_result`.
+
+    Returns:
+        A list of each future or state found and the innermost annotation containing
+        it, if any.
+    """
+    task_run_results = None
+    if include_results:
+        flow_run_context = FlowRunContext.get()
+        if flow_run_context:
+            task_run_results = flow_run_context.task_run_results
+
+    upstreams = []
+    for obj, annotation in iter_collection(
+        expr, max_depth=max_depth, skip_annotations=(quote,) if skip_quoted else ()
+    ):
+        if isinstance(obj, (PrefectFuture, State)):
+            upstreams.append((obj, annotation))
+        elif task_run_results:
+            state = task_run_results.get(id(obj))
+            if state:
+                upstreams.append((state, annotation))
+
+    return upstreams
+
+
 async def get_task_call_return_value(
     task: Task,
     flow_run_context: FlowRunContext,
@@ -1157,6 +1416,10 @@ async def create_task_run_future(
         asynchronous=task.isasync and flow_run_context.flow.isasync,
     )
 
+    # Wait for the task runner to accept the call before creating the task run so
+    # that backpressure from the task runner reaches the caller
+    await task_runner._reserve(future.key)
+
     # Create and submit the task run in the background
     flow_run_context.background_tasks.start_soon(
         partial(
@@ -1194,28 +1457,53 @@ async def create_task_run_then_submit(
     task_runner: BaseTaskRunner,
     extra_task_inputs: Dict[str, Set[TaskRunInput]],
 ) -> None:
-    task_run = await create_task_run(
-        task=task,
-        name=task_run_name,
-        flow_run_context=flow_run_context,
-        parameters=parameters,
-        dynamic_key=task_run_dynamic_key,
-        wait_for=wait_for,
-        extra_task_inputs=extra_task_inputs,
-    )
+    try:
+        task_run = await create_task_run(
+            task=task,
+            name=task_run_name,
+            flow_run_context=flow_run_context,
+            parameters=parameters,
+            dynamic_key=task_run_dynamic_key,
+            wait_for=wait_for,
+            extra_task_inputs=extra_task_inputs,
+        )
 
-    # Attach the task run to the future to support `get_state` operations
-    future.task_run = task_run
+        # Attach the task run to the future to support `get_state` operations
+        future.task_run = task_run
 
-    await submit_task_run(
-        task=task,
-        future=future,
-        flow_run_context=flow_run_context,
-        parameters=parameters,
-        task_run=task_run,
-        wait_for=wait_for,
-        task_runner=task_runner,
-    )
+        result_factory = None
+        if PREFECT_TASKS_CACHE_LOOKUP_ENABLED and task.cache_key_fn:
+            result_factory = await ResultFactory.from_task(
+                task, client=flow_run_context.client
+            )
+            cached_state = await propose_cached_task_run_state(
+                task=task,
+                task_run=task_run,
+                flow_run_context=flow_run_context,
+                parameters=parameters,
+                wait_for=wait_for,
+                result_factory=result_factory,
+            )
+            if cached_state:
+                # The task run does not need to be submitted for execution
+                future._final_state = cached_state
+                future._submitted.set()
+                return
+
+        await submit_task_run(
+            task=task,
+            future=future,
+            flow_run_context=flow_run_context,
+            parameters=parameters,
+            task_run=task_run,
+            wait_for=wait_for,
+            task_runner=task_runner,
+            result_factory=result_factory,
+        )
+    finally:
+        # Release the reservation taken by `create_task_run_future` if the task run
+        # was not submitted
+        task_runner._release_reservation(future.key)
 
     future._submitted.set()
 
@@ -1239,7 +1527,12 @@ async def create_task_run(
 
     logger = get_run_logger(flow_run_context)
 
-    task_run = await flow_run_context.client.create_task_run(
+    if flow_run_context.task_run_creation_batcher:
+        create_task_run = flow_run_context.task_run_creation_batcher.create_task_run
+    else:
+        create_task_run = flow_run_context.client.create_task_run
+
+    task_run = await create_task_run(
         task=task,
         name=name,
         flow_run_id=flow_run_context.flow_run.id,
@@ -1254,6 +1547,97 @@ async def create_task_run(
     return task_run
 
 
+async def propose_cached_task_run_state(
+    task: Task,
+    task_run: TaskRun,
+    flow_run_context: FlowRunContext,
+    parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    result_factory: ResultFactory,
+) -> Optional[State]:
+    """
+    Move a pending task run into the state cached with its cache key, if any.
+
+    The cache key is computed as it would be when the task run is orchestrated, then
+    looked up in the states remembered by this process and, if it is not found there,
+    from the API. If a cached state is found, it is proposed for the task run.
+
+    Returns:
+        The cached state of the task run, or `None` if the task run should be
+        submitted for execution.
+    """
+    refresh_cache = (
+        task.refresh_cache
+        if task.refresh_cache is not None
+        else PREFECT_TASKS_REFRESH_CACHE.value()
+    )
+    if refresh_cache or not task_run.state or not task_run.state.is_pending():
+        return None
+
+    logger = task_run_logger(task_run, task=task)
+
+    try:
+        resolved_parameters = await resolve_inputs(parameters)
+        await resolve_inputs(wait_for, return_data=False)
+
+        cache_key = task.cache_key_fn(
+            TaskRunContext(
+                task_run=task_run,
+                task=task,
+                client=flow_run_context.client,
+                result_factory=result_factory,
+                log_prints=should_log_prints(task),
+                parameters=resolved_parameters,
+            ),
+            resolved_parameters,
+        )
+    except Exception:
+        # Upstream failures and errors computing the cache key are reported when the
+        # task run is orchestrated
+        logger.debug("Failed to compute the cache key before submission", exc_info=True)
+        return None
+
+    if not cache_key:
+        return None
+
+    local_cache = get_local_task_cache()
+    cached_state = local_cache.get(cache_key) if local_cache else None
+    if cached_state is None:
+        batcher = flow_run_context.cached_task_run_state_batcher
+        if batcher:
+            cached_state = await batcher.read_cached_state(cache_key)
+        else:
+            cached_states = await flow_run_context.client.read_cached_task_run_states(
+                [cache_key]
+            )
+            cached_state = cached_states.get(cache_key)
+
+        if cached_state is None:
+            return None
+        if local_cache:
+            local_cache.put(cache_key, cached_state)
+
+    # Propose the cached state as the API does when rejecting a `RUNNING` state for a
+    # cached task run; the cache key is dropped so the state is not cached again
+    state = cached_state.copy(
+        reset_fields=True,
+        update={
+            "name": "Cached",
+            "state_details": cached_state.state_details.copy(
+                update={"cache_key": None, "task_run_id": None, "flow_run_id": None}
+            ),
+        },
+    )
+    state = await propose_state(flow_run_context.client, state, task_run_id=task_run.id)
+    if not state.is_completed():
+        return None
+
+    display_state = repr(state) if PREFECT_DEBUG_MODE else str(state)
+    logger.info(f"Finished in state {display_state}")
+
+    return state
+
+
 async def submit_task_run(
     task: Task,
     future: PrefectFuture,
@@ -1262,6 +1646,8 @@ async def submit_task_run(
     task_run: TaskRun,
     wait_for: Optional[Iterable[PrefectFuture]],
     task_runner: BaseTaskRunner,
+    result_factory: Optional[ResultFactory] = None,
+    settings: Optional[prefect.context.SettingsContext] = None,
 ) -> PrefectFuture:
     logger = get_run_logger(flow_run_context)
 
@@ -1276,11 +1662,11 @@ async def submit_task_run(
             task_run=task_run,
             parameters=parameters,
             wait_for=wait_for,
-            result_factory=await ResultFactory.from_task(
-                task, client=flow_run_context.client
-            ),
+            result_factory=result_factory
+            or await ResultFactory.from_task(task, client=flow_run_context.client),
             log_prints=should_log_prints(task),
-            settings=prefect.context.SettingsContext.get().copy(),
+            settings=settings or prefect.context.SettingsContext.get(),
+            thread_limiter=task_runner.thread_limiter,
         ),
     )
 
@@ -1298,6 +1684,7 @@ async def begin_task_run(
     result_factory: ResultFactory,
     log_prints: bool,
     settings: prefect.context.SettingsContext,
+    thread_limiter: Optional[anyio.CapacityLimiter] = None,
 ):
     """
     Entrypoint for task run execution.
@@ -1332,7 +1719,8 @@ async def begin_task_run(
         # The settings context may be null on a remote worker so we use the safe `.get`
         # method and compare it to the settings required for this task run
         if prefect.context.SettingsContext.get() != settings:
-            stack.enter_context(settings)
+            # The settings context is shared between task runs, so enter a copy
+            stack.enter_context(settings.copy())
             setup_logging()
 
         if maybe_flow_run_context:
@@ -1375,6 +1763,7 @@ async def begin_task_run(
                 log_prints=log_prints,
                 interruptible=interruptible,
                 client=client,
+                thread_limiter=thread_limiter,
             )
 
             if not maybe_flow_run_context:
@@ -1417,6 +1806,7 @@ async def orchestrate_task_run(
     log_prints: bool,
     interruptible: bool,
     client: PrefectClient,
+    thread_limiter: Optional[anyio.CapacityLimiter] = None,
 ) -> State:
     """
     Execute a task run
@@ -1544,10 +1934,18 @@ async def orchestrate_task_run(
                             f"Beginning execution...", extra={"state_message": True}
                         )
 
-                        call = from_async.call_soon_in_new_thread(
-                            create_call(task.fn, *args, **kwargs)
-                        )
-                        result = await call.aresult()
+                        if thread_limiter is None:
+                            call = from_async.call_soon_in_new_thread(
+                                create_call(task.fn, *args, **kwargs)
+                            )
+                            result = await call.aresult()
+                        else:
+                            # Wait for one of the threads owned by the task runner
+                            async with thread_limiter:
+                                call = from_async.call_soon_in_new_thread(
+                                    create_call(task.fn, *args, **kwargs)
+                                )
+                                result = await call.aresult()
 
             except Exception as exc:
                 name = message = None
@@ -1617,6 +2015,11 @@ async def orchestrate_task_run(
                 # Attempt to enter a running state again
                 state = await propose_state(client, Running(), task_run_id=task_run.id)
 
+    if cache_key and PREFECT_TASKS_CACHE_LOOKUP_ENABLED:
+        local_cache = get_local_task_cache()
+        if local_cache:
+            local_cache.put(cache_key, state)
+
     # If debugging, use the more complete `repr` than the usual `str` description
     display_state = repr(state) if PREFECT_DEBUG_MODE else str(state)
 
@@ -1780,42 +2183,59 @@ async def resolve_inputs(
     states = set()
     result_by_state = {}
 
-    def collect_futures_and_states(expr, context):
-        # Expressions inside quotes should not be traversed
-        if isinstance(context.get("annotation"), quote):
-            raise StopVisiting()
-
-        if isinstance(expr, PrefectFuture):
-            futures.add(expr)
-        if isinstance(expr, State):
-            states.add(expr)
-
-        return expr
-
-    visit_collection(
-        parameters,
-        visit_fn=collect_futures_and_states,
-        return_data=False,
-        max_depth=max_depth,
-        context={},
+    # Expressions inside quotes should not be traversed
+    upstreams = find_upstreams(
+        parameters, max_depth=max_depth, skip_quoted=True, include_results=False
     )
+    for upstream, _ in upstreams:
+        if isinstance(upstream, PrefectFuture):
+            futures.add(upstream)
+        else:
+            states.add(upstream)
 
     # Wait for all futures so we do not block when we retrieve the state in `resolve_input`
     states.update(await asyncio.gather(*[future._wait() for future in futures]))
 
+    def check_upstream_state(state: State, annotation: Optional[BaseAnnotation]):
+        # Do not allow uncompleted upstreams except failures when `allow_failure` has
+        # been used
+        if not state.is_completed() and not (
+            # TODO: Note that the contextual annotation here is only at the current level
+            #       if `allow_failure` is used then another annotation is used, this will
+            #       incorrectly evaulate to false — to resolve this, we must track all
+            #       annotations wrapping the current expression but this is not yet
+            #       implemented.
+            isinstance(annotation, allow_failure)
+            and state.is_failed()
+        ):
+            raise UpstreamTaskError(
+                f"Upstream task run '{state.state_details.task_run_id}' did not reach a"
+                " 'COMPLETED' state."
+            )
+
+    if not return_data:
+        # The upstreams only need to be checked, which does not require another
+        # traversal of the parameters
+        for upstream, annotation in upstreams:
+            check_upstream_state(
+                (
+                    upstream._final_state
+                    if isinstance(upstream, PrefectFuture)
+                    else upstream
+                ),
+                annotation,
+            )
+        return None
+
     # Only retrieve the result if requested as it may be expensive
-    if return_data:
-        finished_states = [state for state in states if state.is_final()]
-
-        state_results = await asyncio.gather(
-            *[
-                state.result(raise_on_failure=False, fetch=True)
-                for state in finished_states
-            ]
-        )
+    finished_states = [state for state in states if state.is_final()]
 
-        for state, result in zip(finished_states, state_results):
-            result_by_state[state] = result
+    state_results = await asyncio.gather(
+        *[state.result(raise_on_failure=False, fetch=True) for state in finished_states]
+    )
+
+    for state, result in zip(finished_states, state_results):
+        result_by_state[state] = result
 
     def resolve_input(expr, context):
         state = None
@@ -1831,21 +2251,7 @@ async def resolve_inputs(
         else:
             return expr
 
-        # Do not allow uncompleted upstreams except failures when `allow_failure` has
-        # been used
-        if not state.is_completed() and not (
-            # TODO: Note that the contextual annotation here is only at the current level
-            #       if `allow_failure` is used then another annotation is used, this will
-            #       incorrectly evaulate to false — to resolve this, we must track all
-            #       annotations wrapping the current expression but this is not yet
-            #       implemented.
-            isinstance(context.get("annotation"), allow_failure)
-            and state.is_failed()
-        ):
-            raise UpstreamTaskError(
-                f"Upstream task run '{state.state_details.task_run_id}' did not reach a"
-                " 'COMPLETED' state."
-            )
+        check_upstream_state(state, context.get("annotation"))
 
         return result_by_state.get(state)
 
@@ -1876,11 +2282,17 @@ async def propose_state(
     returned.
 
     If the proposed state results in a WAIT instruction from the Prefect API, the
-    function will sleep and attempt to propose the state again.
+    function will sleep and attempt to propose the state again. If the transition is
+    waiting for a concurrency slot, the function waits for a slot to be released
+    instead of sleeping for the full delay.
 
     If the proposed state results in an ABORT instruction from the Prefect API, an
     error will be raised.
 
+    If the flow run has a task run state batcher, states proposed for its task runs
+    are coalesced with concurrent proposals from the same flow run into a single API
+    call.
+
     Args:
         state: a new state for the task or flow run
         task_run_id: an optional task run id, used when proposing task run states
@@ -1920,13 +2332,22 @@ async def propose_state(
                 f"Received wait instruction for {response.details.delay_seconds}s: "
                 f"{response.details.reason}"
             )
-            await anyio.sleep(response.details.delay_seconds)
+            if response.details.concurrency_limit_tag:
+                await _wait_for_concurrency_slot(
+                    client,
+                    response.details.concurrency_limit_tag,
+                    response.details.delay_seconds,
+                )
+            else:
+                await anyio.sleep(response.details.delay_seconds)
             response = await set_state_func()
         return response
 
     # Attempt to set the state
     if task_run_id:
-        set_state = partial(client.set_task_run_state, task_run_id, state, force=force)
+        set_state = partial(
+            _set_task_run_state_function(client), task_run_id, state, force=force
+        )
         response = await set_state_and_handle_waits(set_state)
     elif flow_run_id:
         set_state = partial(client.set_flow_run_state, flow_run_id, state, force=force)
@@ -1958,6 +2379,97 @@ async def propose_state(
         )
 
 
+async def _wait_for_concurrency_slot(
+    client: PrefectClient, tag: str, delay_seconds: float
+) -> None:
+    """
+    Wait for a slot on the concurrency limit for a tag to be released, for at most
+    `delay_seconds`. Sleeps for the full delay if the API does not support waiting
+    for slots.
+    """
+    try:
+        await client.wait_for_concurrency_slot(tag, timeout=delay_seconds)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+        await anyio.sleep(delay_seconds)
+
+
+def _task_run_creation_batcher(
+    client: PrefectClient,
+    task_runner: BaseTaskRunner,
+    task_group: anyio.abc.TaskGroup,
+) -> Optional[TaskRunCreationBatcher]:
+    """
+    Retrieve a batcher for the task runs of a flow run if batching is enabled.
+
+    Task runs submitted to a sequential task runner are waited for immediately, so
+    there is nothing to gain from waiting to batch them.
+    """
+    if (
+        PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED
+        and task_runner.concurrency_type != TaskConcurrencyType.SEQUENTIAL
+    ):
+        return TaskRunCreationBatcher(client, task_group=task_group)
+    return None
+
+
+def _cached_task_run_state_batcher(
+    client: PrefectClient,
+    task_runner: BaseTaskRunner,
+    task_group: anyio.abc.TaskGroup,
+) -> Optional[CachedTaskRunStateBatcher]:
+    """
+    Retrieve a batcher for the cache lookups of a flow run if lookups are enabled.
+
+    Task runs submitted to a sequential task runner are waited for immediately, so
+    there is nothing to gain from waiting to batch their lookups.
+    """
+    if (
+        PREFECT_TASKS_CACHE_LOOKUP_ENABLED
+        and task_runner.concurrency_type != TaskConcurrencyType.SEQUENTIAL
+    ):
+        return CachedTaskRunStateBatcher(client, task_group=task_group)
+    return None
+
+
+def _task_run_state_batcher(
+    client: PrefectClient,
+    task_runner: BaseTaskRunner,
+    task_group: anyio.abc.TaskGroup,
+) -> Optional[TaskRunStateBatcher]:
+    """
+    Retrieve a batcher for the task run states of a flow run if batching is enabled.
+
+    Task runs submitted to a sequential task runner are run one at a time, so there
+    are never concurrent proposals to batch.
+    """
+    if (
+        PREFECT_TASK_RUN_STATE_BATCHING_ENABLED
+        and task_runner.concurrency_type != TaskConcurrencyType.SEQUENTIAL
+    ):
+        return TaskRunStateBatcher(client, task_group=task_group)
+    return None
+
+
+def _set_task_run_state_function(
+    client: PrefectClient,
+) -> Callable[..., Awaitable[OrchestrationResult]]:
+    """
+    Retrieve the function used to set task run states with a client.
+
+    Proposals are coalesced with the others from the same flow run when the flow run
+    has a state batcher for the client; otherwise each state is set with its own
+    request.
+    """
+    flow_run_context = FlowRunContext.get()
+    batcher = flow_run_context.task_run_state_batcher if flow_run_context else None
+    # the batcher is bound to the client and event loop of the flow run
+    if batcher is not None and batcher.client is client:
+        return batcher.set_task_run_state
+    return client.set_task_run_state
+
+
 def _dynamic_key_for_task_run(context: FlowRunContext, task: Task) -> int:
     if task.task_key not in context.task_run_dynamic_keys:
         context.task_run_dynamic_keys[task.task_key] = 0
@@ -29,7 +29,6 @@ from typing import (
 )
 
 import pydantic
-from fastapi.encoders import jsonable_encoder
 from pydantic.decorator import ValidatedFunction
 from typing_extensions import Literal, ParamSpec
 
@@ -366,6 +365,9 @@ class Flow(Generic[P, R]):
         converting everything directly to a string. This maintains basic types like
         integers during API roundtrips.
         """
+        # FastAPI is not imported until parameters are serialized for a run
+        from fastapi.encoders import jsonable_encoder
+
         serialized_parameters = {}
         for key, value in parameters.items():
             try:
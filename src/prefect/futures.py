@@ -20,9 +20,8 @@ from typing import (
 )
 from uuid import UUID
 
-import anyio
-
 from prefect._internal.concurrency.api import create_call, from_sync
+from prefect._internal.concurrency.primitives import Event
 from prefect.client.orchestration import PrefectClient
 from prefect.client.utilities import inject_client
 from prefect.states import State
@@ -122,7 +121,7 @@ class PrefectFuture(Generic[R, A]):
         self._final_state = _final_state
         self._exception: Optional[Exception] = None
         self._task_runner = task_runner
-        self._submitted = anyio.Event()
+        self._submitted = Event()
 
         self._loop = asyncio.get_running_loop()
 
@@ -277,16 +276,10 @@ class PrefectFuture(Generic[R, A]):
         return task_run.state
 
     async def _wait_for_submission(self):
-        import asyncio
-
-        # TODO: This spin lock is not performant but is necessary for cases where a
-        #       future is created in a separate event loop i.e. when a sync task is
-        #       called in an async flow
-        if not asyncio.get_running_loop() == self._loop:
-            while not self.task_run:
-                await anyio.sleep(0)
-        else:
-            await self._submitted.wait()
+        # The event is thread-safe so this may be called from an event loop other than
+        # the one the future was created in i.e. when a sync task is called in an async
+        # flow
+        await self._submitted.wait()
 
     def __hash__(self) -> int:
         return hash(self.key)
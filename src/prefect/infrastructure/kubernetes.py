@@ -1,8 +1,10 @@
+import asyncio
 import copy
 import enum
 import json
 import math
 import os
+import threading
 import time
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
@@ -16,6 +18,8 @@ from prefect.blocks.kubernetes import KubernetesClusterConfig
 from prefect.docker import get_prefect_image_name
 from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFound
 from prefect.infrastructure.base import Infrastructure, InfrastructureResult
+from prefect.logging import get_logger
+from prefect.settings import PREFECT_KUBERNETES_JOB_WATCHER_ENABLED
 from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.hashing import stable_hash
 from prefect.utilities.importtools import lazy_import
@@ -27,10 +31,13 @@ if TYPE_CHECKING:
     import kubernetes.client
     import kubernetes.client.exceptions
     import kubernetes.config
-    from kubernetes.client import BatchV1Api, CoreV1Api, V1Job, V1Pod
+    from kubernetes.client import BatchV1Api, Configuration, CoreV1Api, V1Job, V1Pod
 else:
     kubernetes = lazy_import("kubernetes")
 
+# the label added to the jobs of flow runs
+FLOW_RUN_ID_LABEL = "prefect.io/flow-run-id"
+
 
 class KubernetesImagePullPolicy(enum.Enum):
     IF_NOT_PRESENT = "IfNotPresent"
@@ -296,6 +303,9 @@ class KubernetesJob(Infrastructure):
             raise ValueError("Kubernetes job cannot be run with empty command.")
 
         self._configure_kubernetes_library_client()
+        # Capture the configuration for this job's cluster, since other jobs may
+        # configure the client for a different cluster while this job runs
+        configuration = kubernetes.client.Configuration.get_default_copy()
         manifest = self.build_job()
         job = await run_sync_in_worker_thread(self._create_job, manifest)
 
@@ -305,9 +315,12 @@ class KubernetesJob(Infrastructure):
             task_status.started(pid)
 
         # Monitor the job until completion
-        status_code = await run_sync_in_worker_thread(
-            self._watch_job, job.metadata.name
-        )
+        if PREFECT_KUBERNETES_JOB_WATCHER_ENABLED.value():
+            status_code = await self._wait_for_job(job, configuration)
+        else:
+            status_code = await run_sync_in_worker_thread(
+                self._watch_job, job.metadata.name
+            )
         return KubernetesJobResult(identifier=pid, status_code=status_code)
 
     async def kill(self, infrastructure_pid: str, grace_seconds: int = 30):
@@ -613,35 +626,7 @@ class KubernetesJob(Infrastructure):
         )
 
         if self.stream_output:
-            with self.get_client() as client:
-                logs = client.read_namespaced_pod_log(
-                    pod.metadata.name,
-                    self.namespace,
-                    follow=True,
-                    _preload_content=False,
-                    container="prefect-job",
-                )
-                try:
-                    for log in logs.stream():
-                        print(log.decode().rstrip())
-
-                        # Check if we have passed the deadline and should stop streaming
-                        # logs
-                        remaining_time = (
-                            deadline - time.monotonic() if deadline else None
-                        )
-                        if deadline and remaining_time <= 0:
-                            break
-
-                except Exception:
-                    self.logger.warning(
-                        (
-                            "Error occurred while streaming logs - "
-                            "Job will continue to run but logs will "
-                            "no longer be streamed to stdout."
-                        ),
-                        exc_info=True,
-                    )
+            self._stream_job_logs(pod, deadline)
 
         with self.get_batch_client() as batch_client:
             # Check if the job is completed before beginning a watch
@@ -691,6 +676,112 @@ class KubernetesJob(Infrastructure):
 
         return first_container_status.state.terminated.exit_code
 
+    def _stream_job_logs(self, pod: "V1Pod", deadline: Optional[float]) -> None:
+        """
+        Stream the output of a job's pod to local standard output until the pod exits
+        or the deadline passes.
+        """
+        with self.get_client() as client:
+            logs = client.read_namespaced_pod_log(
+                pod.metadata.name,
+                self.namespace,
+                follow=True,
+                _preload_content=False,
+                container="prefect-job",
+            )
+            try:
+                for log in logs.stream():
+                    print(log.decode().rstrip())
+
+                    # Check if we have passed the deadline and should stop streaming
+                    # logs
+                    remaining_time = deadline - time.monotonic() if deadline else None
+                    if deadline and remaining_time <= 0:
+                        break
+
+            except Exception:
+                self.logger.warning(
+                    (
+                        "Error occurred while streaming logs - "
+                        "Job will continue to run but logs will "
+                        "no longer be streamed to stdout."
+                    ),
+                    exc_info=True,
+                )
+
+    async def _wait_for_job(self, job: "V1Job", configuration: "Configuration") -> int:
+        """
+        Wait for a job using the process-wide job watcher for its namespace of the
+        cluster described by `configuration`.
+
+        As in `_watch_job`, the job's pod must start within
+        `pod_watch_timeout_seconds`. Unlike `_watch_job`, no thread is held while
+        waiting for the job to finish unless output is streamed. Returns the final
+        status code of the first container.
+        """
+        job_name = job.metadata.name
+        self.logger.debug(f"Job {job_name!r}: Monitoring job...")
+
+        pod = await run_sync_in_worker_thread(self._get_job_pod, job_name)
+        if not pod:
+            return -1
+
+        # Calculate the deadline before streaming output
+        deadline = (
+            (time.monotonic() + self.job_watch_timeout_seconds)
+            if self.job_watch_timeout_seconds is not None
+            else None
+        )
+
+        if self.stream_output:
+            await run_sync_in_worker_thread(self._stream_job_logs, pod, deadline)
+
+        # watch the jobs for flow runs if this is one, rather than all jobs
+        labels = job.metadata.labels or {}
+        watcher = get_job_watcher(
+            self.namespace,
+            label_selector=(FLOW_RUN_ID_LABEL if FLOW_RUN_ID_LABEL in labels else None),
+            configuration=configuration,
+        )
+        finished_job = await watcher.wait_for_job(
+            job_name, timeout=(deadline - time.monotonic()) if deadline else None
+        )
+
+        if finished_job is None:
+            if deadline and time.monotonic() >= deadline:
+                self.logger.error(
+                    f"Job {job_name!r}: Job did not complete within "
+                    f"timeout of {self.job_watch_timeout_seconds}s."
+                )
+            else:
+                self.logger.error(f"Job {job_name!r} was removed.")
+            return -1
+
+        if not finished_job.status.succeeded:
+            self.logger.error(f"Job {job_name!r}: Job failed.")
+
+        return await run_sync_in_worker_thread(self._get_job_exit_code, job_name)
+
+    def _get_job_exit_code(self, job_name: str) -> int:
+        """
+        Get the exit code of the first container of the latest pod of a finished job.
+        """
+        with self.get_client() as client:
+            pods = client.list_namespaced_pod(
+                namespace=self.namespace, label_selector=f"job-name={job_name}"
+            ).items
+
+        for pod in sorted(
+            pods, key=lambda pod: pod.metadata.creation_timestamp, reverse=True
+        ):
+            if pod.status.container_statuses:
+                terminated = pod.status.container_statuses[0].state.terminated
+                if terminated:
+                    return terminated.exit_code
+
+        self.logger.error(f"Job {job_name!r}: Pod never started.")
+        return -1
+
     def _create_job(self, job_manifest: KubernetesManifest) -> "V1Job":
         """
         Given a Kubernetes Job Manifest, create the Job on the configured Kubernetes
@@ -824,3 +915,205 @@ class KubernetesJob(Infrastructure):
 
         # Drop null values allowing users to "unset" variables
         return {key: value for key, value in env.items() if value is not None}
+
+
+class KubernetesJobWatcher:
+    """
+    Watches the jobs in a namespace with a single connection and dispatches their
+    completion to the callers waiting for them.
+
+    The watcher follows the informer pattern: jobs are listed to populate a local
+    store, then changes are watched from the listed resource version. The list is
+    repeated whenever the watch ends or fails. Callers waiting for a job are resolved
+    as soon as the job is finished or removed, from any event loop.
+
+    A single background thread is used while there are callers waiting, regardless of
+    the number of jobs being waited for.
+
+    Args:
+        namespace: The namespace to watch jobs in
+        label_selector: An optional label selector limiting the jobs that are watched
+        configuration: The client configuration for the cluster to watch. If not
+            provided, the default configuration at the time of each list is used.
+    """
+
+    # the number of seconds the API server keeps each watch open for
+    WATCH_TIMEOUT_SECONDS = 60
+    # the number of seconds to wait before listing jobs again after an error
+    RETRY_DELAY_SECONDS = 5
+
+    def __init__(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        configuration: Optional["Configuration"] = None,
+    ) -> None:
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.configuration = configuration
+        self._jobs: Dict[str, "V1Job"] = {}
+        self._waiters: Dict[
+            str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+        ] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._logger = get_logger("prefect.infrastructure.kubernetes-job")
+
+    async def wait_for_job(
+        self, job_name: str, timeout: Optional[float] = None
+    ) -> Optional["V1Job"]:
+        """
+        Wait for a job to finish.
+
+        Returns the finished job, or `None` if the job was removed or did not finish
+        within `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+
+        with self._lock:
+            job = self._jobs.get(job_name)
+            if job is not None and _job_is_finished(job):
+                return job
+            self._waiters.setdefault(job_name, []).append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"KubernetesJobWatcher-{self.namespace}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        try:
+            with anyio.move_on_after(timeout):
+                return await future
+            return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(job_name, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(job_name, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+
+            try:
+                with kubernetes.client.ApiClient(self.configuration) as client:
+                    try:
+                        self._list_then_watch(kubernetes.client.BatchV1Api(client))
+                    finally:
+                        client.rest_client.pool_manager.clear()
+            except Exception:
+                self._logger.warning(
+                    (
+                        f"Error watching jobs in namespace {self.namespace!r}. Jobs"
+                        f" will be listed again in {self.RETRY_DELAY_SECONDS}s."
+                    ),
+                    exc_info=True,
+                )
+                time.sleep(self.RETRY_DELAY_SECONDS)
+
+    def _list_then_watch(self, batch_client: "BatchV1Api") -> None:
+        selector = (
+            {"label_selector": self.label_selector} if self.label_selector else {}
+        )
+
+        job_list = batch_client.list_namespaced_job(self.namespace, **selector)
+        with self._lock:
+            self._jobs = {job.metadata.name: job for job in job_list.items}
+            # resolve any waiters for jobs that finished or were removed while we
+            # were not watching; jobs are created before they are waited for, so a
+            # job missing from the list has been removed
+            for job_name in list(self._waiters):
+                job = self._jobs.get(job_name)
+                if job is None or _job_is_finished(job):
+                    self._resolve(job_name, job)
+
+            if not self._waiters:
+                return
+
+        watch = kubernetes.watch.Watch()
+        for event in watch.stream(
+            func=batch_client.list_namespaced_job,
+            namespace=self.namespace,
+            resource_version=job_list.metadata.resource_version,
+            timeout_seconds=self.WATCH_TIMEOUT_SECONDS,
+            **selector,
+        ):
+            job = event["object"]
+            job_name = job.metadata.name
+            with self._lock:
+                if event["type"] == "DELETED":
+                    self._jobs.pop(job_name, None)
+                    self._resolve(job_name, None)
+                else:
+                    self._jobs[job_name] = job
+                    if _job_is_finished(job):
+                        self._resolve(job_name, job)
+
+                if not self._waiters:
+                    watch.stop()
+
+    def _resolve(self, job_name: str, job: Optional["V1Job"]) -> None:
+        """
+        Resolve the callers waiting for a job. Must be called with the lock held.
+        """
+        for loop, future in self._waiters.pop(job_name, []):
+            try:
+                loop.call_soon_threadsafe(_set_future_result, future, job)
+            except RuntimeError:
+                # the waiter's event loop is closed
+                pass
+
+
+def _job_is_finished(job: "V1Job") -> bool:
+    if job.status is None:
+        return False
+    if job.status.completion_time is not None:
+        return True
+    # failed jobs are not given a completion time
+    return any(
+        condition.type == "Failed" and condition.status == "True"
+        for condition in job.status.conditions or []
+    )
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+_JOB_WATCHERS: Dict[Tuple[str, str, Optional[str]], KubernetesJobWatcher] = {}
+_JOB_WATCHERS_LOCK = threading.Lock()
+
+
+def get_job_watcher(
+    namespace: str,
+    label_selector: Optional[str] = None,
+    configuration: Optional["Configuration"] = None,
+) -> KubernetesJobWatcher:
+    """
+    Get the process-wide job watcher for a namespace of the cluster described by
+    `configuration`, defaulting to the currently configured cluster.
+    """
+    if configuration is None:
+        configuration = kubernetes.client.Configuration.get_default_copy()
+
+    key = (configuration.host, namespace, label_selector)
+    with _JOB_WATCHERS_LOCK:
+        watcher = _JOB_WATCHERS.get(key)
+        if watcher is None:
+            watcher = _JOB_WATCHERS[key] = KubernetesJobWatcher(
+                namespace, label_selector=label_selector, configuration=configuration
+            )
+        else:
+            # Use the most recent configuration so refreshed credentials are used
+            watcher.configuration = configuration
+        return watcher
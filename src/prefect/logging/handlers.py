@@ -1,15 +1,15 @@
+import asyncio
 import atexit
 import json
 import logging
-import queue
 import sys
 import threading
 import time
 import traceback
 import warnings
-from typing import Any, Dict, List, Tuple, Union
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple, Union
 
-import anyio
 import pendulum
 from rich.console import Console
 from rich.highlighter import Highlighter, NullHighlighter
@@ -25,22 +25,38 @@ from prefect.settings import (
     PREFECT_LOGGING_COLORS,
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
+    PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESSION_ENABLED,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
 )
 
+if TYPE_CHECKING:
+    from prefect.client.orchestration import PrefectClient
+
 
 class APILogWorker:
     """
     Manages the submission of logs to the API in a background thread.
+
+    Logs are held in a bounded ring buffer until they are sent. If logs are enqueued
+    faster than they can be sent and the buffer fills, the oldest logs are dropped
+    instead of blocking the caller.
     """
 
     def __init__(self, profile_context: prefect.context.SettingsContext) -> None:
         self.profile_context = profile_context.copy()
 
-        self._queue: queue.Queue[Tuple[Dict[str, Any], int]] = queue.Queue()
+        self._queue: Deque[Tuple[Dict[str, Any], int]] = deque(
+            maxlen=PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE.value_from(
+                self.profile_context.settings
+            )
+        )
+        self._queue_lock = threading.Lock()
+        self._queue_size = 0
 
         self._send_thread = threading.Thread(
             target=self._send_logs_loop,
@@ -54,12 +70,19 @@ class APILogWorker:
         self._started = False
         self._stopped = False  # Cannot be started again after stopped
 
+        # A client that is kept open while the background thread is running
+        self._client: Optional["PrefectClient"] = None
+
         # Tracks logs that have been pulled from the queue but not sent successfully
         self._pending_logs: List[dict] = []
         self._pending_size: int = 0
         self._retries = 0
         self._max_retries = 3
 
+        # Counters for inspection of the worker
+        self._sent_logs = 0
+        self._dropped_logs = 0
+
         # Ensure stop is called at exit
         if sys.version_info < (3, 9):
             atexit.register(self.stop)
@@ -73,6 +96,16 @@ class APILogWorker:
 
             _register_atexit(self.stop)
 
+    @property
+    def sent_logs(self) -> int:
+        """The number of logs sent to the API."""
+        return self._sent_logs
+
+    @property
+    def dropped_logs(self) -> int:
+        """The number of logs dropped because the queue was full or sending failed."""
+        return self._dropped_logs
+
     def _send_logs_loop(self):
         """
         Should only be the target of the `send_thread` as it creates a new event loop.
@@ -82,14 +115,40 @@ class APILogWorker:
         # Initialize prefect in this new thread, but do not reconfigure logging
         try:
             with self.profile_context:
+                # Reuse a single event loop and client for the life of the thread so
+                # connections are pooled across batches
+                loop = asyncio.new_event_loop()
+                try:
+                    loop.run_until_complete(self._run_with_client())
+                finally:
+                    loop.close()
+
+        except Exception:
+            if logging.raiseExceptions and sys.stderr:
+                sys.stderr.write("--- Error logging to API ---\n")
+                sys.stderr.write("The log worker encountered a fatal error.\n")
+                traceback.print_exc(file=sys.stderr)
+                sys.stderr.write(self.worker_info())
+
+        finally:
+            # Set the finished event so anyone waiting on worker completion does not
+            # continue to block if an exception is encountered
+            self._send_logs_finished_event.set()
+
+    async def _run_with_client(self) -> None:
+        async with self._get_client() as client:
+            self._client = client
+            try:
                 while not self._stop_event.is_set():
-                    # Wait until flush is called or the batch interval is reached
+                    # Wait until flush is called or the batch interval is reached.
+                    # Nothing else runs on this loop, so the wait blocks it directly
+                    # rather than spawning a thread which is not possible at exit.
                     self._flush_event.wait(
                         PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
                     )
                     self._flush_event.clear()
 
-                    anyio.run(self.send_logs)
+                    await self.send_logs()
 
                     # Notify watchers that logs were sent
                     self._send_logs_finished_event.set()
@@ -97,19 +156,15 @@ class APILogWorker:
 
                 # After the stop event, we are exiting...
                 # Try to send any remaining logs
-                anyio.run(self.send_logs, True)
-
-        except Exception:
-            if logging.raiseExceptions and sys.stderr:
-                sys.stderr.write("--- Error logging to API ---\n")
-                sys.stderr.write("The log worker encountered a fatal error.\n")
-                traceback.print_exc(file=sys.stderr)
-                sys.stderr.write(self.worker_info())
+                await self.send_logs(True)
+            finally:
+                self._client = None
 
-        finally:
-            # Set the finished event so anyone waiting on worker completion does not
-            # continue to block if an exception is encountered
-            self._send_logs_finished_event.set()
+    @staticmethod
+    def _get_client() -> "PrefectClient":
+        client = get_client()
+        client.manage_lifespan = False
+        return client
 
     async def send_logs(self, exiting: bool = False) -> None:
         """
@@ -118,10 +173,16 @@ class APILogWorker:
         If a client error is encountered, the logs pulled from the queue are retained
         and will be sent on the next call.
 
-        Note that if there is a single bad log in the queue, this will repeatedly
-        fail as we do not ever drop logs. We may want to adjust this behavior in the
-        future if there are issues.
+        Uses the client of the background thread if it is running, otherwise a new
+        client is created for this call.
         """
+        if self._client is not None:
+            await self._send_batches(self._client, exiting)
+        else:
+            async with self._get_client() as client:
+                await self._send_batches(client, exiting)
+
+    async def _send_batches(self, client: "PrefectClient", exiting: bool) -> None:
         done = False
 
         # Determine the batch size by removing the max size of a single log to avoid
@@ -132,78 +193,106 @@ class APILogWorker:
             - PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
             PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
         )
+        max_batch_logs = PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS.value()
+        compress = PREFECT_LOGGING_TO_API_COMPRESSION_ENABLED.value()
 
         # Loop until the queue is empty or we encounter an error
         while not done:
-            # Pull logs from the queue until it is empty or we reach the batch size
-            try:
-                while self._pending_size < max_batch_size:
-                    log, log_size = self._queue.get_nowait()
+            # Pull logs from the queue until it is empty or we reach the batch limits
+            with self._queue_lock:
+                while (
+                    self._queue
+                    and self._pending_size < max_batch_size
+                    and len(self._pending_logs) < max_batch_logs
+                ):
+                    log, log_size = self._queue.popleft()
+                    self._queue_size -= log_size
                     self._pending_logs.append(log)
                     self._pending_size += log_size
 
-            except queue.Empty:
-                done = True
+                done = not self._queue
 
             if not self._pending_logs:
                 continue
 
-            client = get_client()
-            client.manage_lifespan = False
-            async with client:
-                try:
-                    await client.create_logs(self._pending_logs)
+            try:
+                await client.create_logs(self._pending_logs, compress=compress)
+                self._sent_logs += len(self._pending_logs)
+                self._pending_logs = []
+                self._pending_size = 0
+                self._retries = 0
+            except Exception:
+                # Attempt to send these logs on the next call instead
+                done = True
+                self._retries += 1
+
+                # Roughly replicate the behavior of the stdlib logger error handling
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write("--- Error logging to API ---\n")
+                    traceback.print_exc(file=sys.stderr)
+                    sys.stderr.write(self.worker_info())
+                    if exiting:
+                        sys.stderr.write(
+                            "The log worker is stopping and these logs will not be"
+                            " sent.\n"
+                        )
+                    elif self._retries > self._max_retries:
+                        sys.stderr.write(
+                            "The log worker has tried to send these logs "
+                            f"{self._retries} times and will now drop them."
+                        )
+                    else:
+                        sys.stderr.write(
+                            "The log worker will attempt to send these logs"
+                            " again in "
+                            f"{PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()}s\n"
+                        )
+
+                if self._retries > self._max_retries:
+                    # Drop this batch of logs
+                    self._dropped_logs += len(self._pending_logs)
                     self._pending_logs = []
                     self._pending_size = 0
                     self._retries = 0
-                except Exception:
-                    # Attempt to send these logs on the next call instead
-                    done = True
-                    self._retries += 1
-
-                    # Roughly replicate the behavior of the stdlib logger error handling
-                    if logging.raiseExceptions and sys.stderr:
-                        sys.stderr.write("--- Error logging to API ---\n")
-                        traceback.print_exc(file=sys.stderr)
-                        sys.stderr.write(self.worker_info())
-                        if exiting:
-                            sys.stderr.write(
-                                "The log worker is stopping and these logs will not be"
-                                " sent.\n"
-                            )
-                        elif self._retries > self._max_retries:
-                            sys.stderr.write(
-                                "The log worker has tried to send these logs "
-                                f"{self._retries} times and will now drop them."
-                            )
-                        else:
-                            sys.stderr.write(
-                                "The log worker will attempt to send these logs"
-                                " again in "
-                                f"{PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()}s\n"
-                            )
-
-                    if self._retries > self._max_retries:
-                        # Drop this batch of logs
-                        self._pending_logs = []
-                        self._pending_size = 0
-                        self._retries = 0
 
     def worker_info(self) -> str:
         """Returns a debugging string with worker log stats"""
         return (
             "Worker information:\n"
-            f"    Approximate queue length: {self._queue.qsize()}\n"
+            f"    Approximate queue length: {len(self._queue)}\n"
             f"    Pending log batch length: {len(self._pending_logs)}\n"
             f"    Pending log batch size: {self._pending_size}\n"
+            f"    Sent logs: {self._sent_logs}\n"
+            f"    Dropped logs: {self._dropped_logs}\n"
         )
 
     def enqueue(self, log: Dict[str, Any], log_size: int):
+        """
+        Add a log to the queue without blocking.
+
+        If the queue is full, the oldest log is dropped. If the queue holds enough logs
+        to fill a batch, the background thread is woken to send them.
+        """
         if self._stopped:
             raise RuntimeError(
                 "Logs cannot be enqueued after the API log worker is stopped."
             )
-        self._queue.put((log, log_size))
+
+        with self._queue_lock:
+            if len(self._queue) == self._queue.maxlen:
+                _, dropped_size = self._queue.popleft()
+                self._queue_size -= dropped_size
+                self._dropped_logs += 1
+
+            self._queue.append((log, log_size))
+            self._queue_size += log_size
+            batch_ready = (
+                self._queue_size >= PREFECT_LOGGING_TO_API_BATCH_SIZE.value()
+                or len(self._queue) >= PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS.value()
+            )
+
+        if batch_ready:
+            self._flush_event.set()
 
     def flush(self, block: bool = False) -> None:
         with self._lock:
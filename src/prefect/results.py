@@ -1,11 +1,18 @@
 import abc
+import hashlib
+import json
+import struct
+import threading
 import uuid
+from collections import OrderedDict
 from functools import partial
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Generic,
+    List,
     Optional,
     Tuple,
     Type,
@@ -25,11 +32,14 @@ from prefect.logging import get_logger
 from prefect.serializers import Serializer
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
+    PREFECT_RESULTS_BINARY_FORMAT_ENABLED,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
+    PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES,
+    PREFECT_RESULTS_LOCAL_CACHE_SPILL_PATH,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
 )
 from prefect.utilities.annotations import NotSet
-from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.pydantic import add_type_dispatch
 
 if TYPE_CHECKING:
@@ -42,6 +52,11 @@ ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES = {type(None), bool}
 DEFAULT_STORAGE_KEY_FN = lambda: uuid.uuid4().hex
 
+# Persisted result blobs are framed as this prefix, the length of a JSON header, the
+# header, and then the raw serialized data
+RESULT_BLOB_MAGIC = b"PFRBLOB1"
+_RESULT_BLOB_HEADER_LENGTH = struct.Struct(">I")
+
 logger = get_logger("results")
 
 # from prefect.server.schemas.states import State
@@ -69,6 +84,183 @@ def get_default_persist_setting() -> bool:
     return PREFECT_RESULTS_PERSIST_BY_DEFAULT.value()
 
 
+class LocalResultCache:
+    """
+    A process-wide cache for reading persisted results without a round trip to the API
+    and result storage.
+
+    The content of persisted results is kept in memory in least-recently-used order
+    until the total size exceeds `max_bytes`. If a `spill_path` is given, evicted content
+    is written to that directory and read from there before falling back to storage.
+    Storage blocks are cached by ID so the block document does not need to be read
+    again.
+
+    This cache is thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        spill_path: Optional[Path] = None,
+        max_storage_blocks: int = 128,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+        self.max_storage_blocks = max_storage_blocks
+        self._contents: "OrderedDict[Tuple[uuid.UUID, str], bytes]" = OrderedDict()
+        self._storage_blocks: "OrderedDict[uuid.UUID, ReadableFileSystem]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the content held in memory, in bytes.
+        """
+        return self._size
+
+    def get_content(self, storage_block_id: uuid.UUID, key: str) -> Optional[bytes]:
+        """
+        Retrieve cached content, returning `None` if it is not cached.
+        """
+        cache_key = (storage_block_id, key)
+        with self._lock:
+            content = self._contents.get(cache_key)
+            if content is not None:
+                self._contents.move_to_end(cache_key)
+                return content
+
+        if self.spill_path is None:
+            return None
+
+        try:
+            content = self._get_spill_path(storage_block_id, key).read_bytes()
+        except OSError:
+            return None
+
+        self.put_content(storage_block_id, key, content)
+        return content
+
+    def put_content(
+        self, storage_block_id: uuid.UUID, key: str, content: bytes
+    ) -> None:
+        """
+        Add content to the cache, evicting the least recently used content if the
+        cache is full.
+        """
+        cache_key = (storage_block_id, key)
+        evicted: List[Tuple[Tuple[uuid.UUID, str], bytes]] = []
+
+        with self._lock:
+            previous = self._contents.pop(cache_key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            if len(content) <= self.max_bytes:
+                self._contents[cache_key] = content
+                self._size += len(content)
+            else:
+                # Content that is too large to cache in memory goes straight to disk
+                evicted.append((cache_key, content))
+
+            while self._size > self.max_bytes:
+                evicted_key, evicted_content = self._contents.popitem(last=False)
+                self._size -= len(evicted_content)
+                evicted.append((evicted_key, evicted_content))
+
+        # Write to disk outside of the lock
+        if self.spill_path is not None:
+            for (evicted_block_id, evicted_key), evicted_content in evicted:
+                self._spill(evicted_block_id, evicted_key, evicted_content)
+
+    def get_storage_block(
+        self, storage_block_id: uuid.UUID
+    ) -> Optional[ReadableFileSystem]:
+        """
+        Retrieve a cached storage block, returning `None` if it is not cached.
+        """
+        with self._lock:
+            storage_block = self._storage_blocks.get(storage_block_id)
+            if storage_block is not None:
+                self._storage_blocks.move_to_end(storage_block_id)
+            return storage_block
+
+    def put_storage_block(
+        self, storage_block_id: uuid.UUID, storage_block: ReadableFileSystem
+    ) -> None:
+        """
+        Add a storage block to the cache.
+        """
+        with self._lock:
+            self._storage_blocks[storage_block_id] = storage_block
+            self._storage_blocks.move_to_end(storage_block_id)
+            while len(self._storage_blocks) > self.max_storage_blocks:
+                self._storage_blocks.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from memory. Content written to the spill path is retained.
+        """
+        with self._lock:
+            self._contents.clear()
+            self._storage_blocks.clear()
+            self._size = 0
+
+    def _get_spill_path(self, storage_block_id: uuid.UUID, key: str) -> Path:
+        # Storage keys may contain path separators so they are hashed
+        return (
+            self.spill_path
+            / str(storage_block_id)
+            / hashlib.sha256(key.encode()).hexdigest()
+        )
+
+    def _spill(self, storage_block_id: uuid.UUID, key: str, content: bytes) -> None:
+        path = self._get_spill_path(storage_block_id, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial content
+            tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(path)
+        except OSError:
+            logger.debug(
+                "Failed to write result content to the local cache spill path %s",
+                path,
+                exc_info=True,
+            )
+
+
+_LOCAL_RESULT_CACHE: Optional[LocalResultCache] = None
+
+
+def get_local_result_cache() -> Optional[LocalResultCache]:
+    """
+    Get the process-wide result cache configured by the current settings.
+
+    Returns `None` if the cache is disabled.
+    """
+    global _LOCAL_RESULT_CACHE
+
+    max_bytes = PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES.value()
+    if not max_bytes:
+        return None
+
+    spill_path = PREFECT_RESULTS_LOCAL_CACHE_SPILL_PATH.value()
+    cache = _LOCAL_RESULT_CACHE
+    if (
+        cache is None
+        or cache.max_bytes != max_bytes
+        or cache.spill_path != (Path(spill_path) if spill_path is not None else None)
+    ):
+        cache = _LOCAL_RESULT_CACHE = LocalResultCache(
+            max_bytes=max_bytes, spill_path=spill_path
+        )
+
+    return cache
+
+
 def flow_features_require_result_persistence(flow: "Flow") -> bool:
     """
     Returns `True` if the given flow uses features that require its result to be
@@ -484,10 +676,41 @@ class PersistedResult(BaseResult):
 
     @inject_client
     async def _read_blob(self, client: "PrefectClient") -> "PersistedResultBlob":
-        block_document = await client.read_block_document(self.storage_block_id)
-        storage_block: ReadableFileSystem = Block._from_block_document(block_document)
-        content = await storage_block.read_path(self.storage_key)
-        blob = PersistedResultBlob.parse_raw(content)
+        cache = get_local_result_cache()
+        content = (
+            cache.get_content(self.storage_block_id, self.storage_key)
+            if cache
+            else None
+        )
+
+        if content is None:
+            storage_block = (
+                cache.get_storage_block(self.storage_block_id) if cache else None
+            )
+            if storage_block is None:
+                block_document = await client.read_block_document(self.storage_block_id)
+                storage_block: ReadableFileSystem = Block._from_block_document(
+                    block_document
+                )
+                if cache:
+                    cache.put_storage_block(self.storage_block_id, storage_block)
+
+            cache_content = cache is not None and self._should_cache_object
+            # subclasses may override `read_path`, so only the local file system
+            # itself is read directly
+            if type(storage_block) is LocalFileSystem and not cache_content:
+                # Stream the blob from disk to avoid holding the content twice
+                return await run_sync_in_worker_thread(
+                    PersistedResultBlob.read_file,
+                    storage_block._resolve_path(self.storage_key),
+                )
+
+            content = await storage_block.read_path(self.storage_key)
+
+            if cache_content:
+                cache.put_content(self.storage_block_id, self.storage_key, content)
+
+        blob = PersistedResultBlob.from_bytes(content)
         return blob
 
     @staticmethod
@@ -528,7 +751,22 @@ class PersistedResult(BaseResult):
                 f"Expected type 'str' for result storage key; got value {key!r}"
             )
 
-        await storage_block.write_path(key, content=blob.to_bytes())
+        cache = get_local_result_cache()
+        # subclasses may override `write_path`, so only the local file system itself
+        # is written directly
+        if type(storage_block) is LocalFileSystem and not (cache and cache_object):
+            # Stream the blob to disk to avoid copying the data into a single buffer
+            await run_sync_in_worker_thread(
+                blob.write_file, storage_block._resolve_path(key)
+            )
+        else:
+            content = blob.to_bytes()
+            await storage_block.write_path(key, content=content)
+
+        if cache:
+            cache.put_storage_block(storage_block_id, storage_block)
+            if cache_object:
+                cache.put_content(storage_block_id, key, content)
 
         description = f"Result of type `{type(obj).__name__}`"
         uri = cls._infer_path(storage_block, key)
@@ -561,12 +799,91 @@ class PersistedResultBlob(pydantic.BaseModel):
     """
     The format of the content stored by a persisted result.
 
-    Typically, this is written to a file as bytes.
+    Typically, this is written to a file as bytes. By default, the content is a single
+    JSON document, which all versions of Prefect can read. If
+    `PREFECT_RESULTS_BINARY_FORMAT_ENABLED` is set, the content instead starts with
+    `RESULT_BLOB_MAGIC` and the length of a JSON header describing the serializer and
+    Prefect version, followed by the header and the raw serialized data. Content in
+    either format can be read.
     """
 
     serializer: Serializer
-    data: bytes
+    data: Union[bytes, memoryview]
     prefect_version: str = pydantic.Field(default=prefect.__version__)
 
+    class Config:
+        # Blobs read from bytes hold a view of the data instead of a copy
+        arbitrary_types_allowed = True
+        json_encoders = {memoryview: lambda data: bytes(data).decode()}
+
+    def header_bytes(self) -> bytes:
+        """
+        Returns the framing that precedes the serialized data.
+        """
+        header = self.json(exclude={"data"}).encode()
+        return RESULT_BLOB_MAGIC + _RESULT_BLOB_HEADER_LENGTH.pack(len(header)) + header
+
     def to_bytes(self) -> bytes:
-        return self.json().encode()
+        if not PREFECT_RESULTS_BINARY_FORMAT_ENABLED.value():
+            return self.json().encode()
+        return self.header_bytes() + self.data
+
+    def write_file(self, path: Path) -> None:
+        """
+        Write the blob to a local file. In the binary format, the header and data are
+        written without joining them.
+        """
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        if path.exists() and not path.is_file():
+            raise ValueError(f"Path {path} already exists and is not a file.")
+
+        with open(path, mode="wb") as f:
+            if PREFECT_RESULTS_BINARY_FORMAT_ENABLED.value():
+                f.write(self.header_bytes())
+                f.write(self.data)
+            else:
+                f.write(self.json().encode())
+
+    @classmethod
+    def from_bytes(cls, content: bytes) -> "PersistedResultBlob":
+        if not content.startswith(RESULT_BLOB_MAGIC):
+            return cls.parse_raw(content)
+
+        view = memoryview(content)
+        offset = len(RESULT_BLOB_MAGIC)
+        (header_length,) = _RESULT_BLOB_HEADER_LENGTH.unpack_from(view, offset)
+        offset += _RESULT_BLOB_HEADER_LENGTH.size
+        header = view[offset : offset + header_length]
+        return cls._from_header(header, view[offset + header_length :])
+
+    @classmethod
+    def read_file(cls, path: Path) -> "PersistedResultBlob":
+        """
+        Read a blob from a local file, reading the data directly after the header.
+        """
+        path = Path(path)
+        if not path.exists():
+            raise ValueError(f"Path {path} does not exist.")
+        if not path.is_file():
+            raise ValueError(f"Path {path} is not a file.")
+
+        with open(path, mode="rb") as f:
+            prefix = f.read(len(RESULT_BLOB_MAGIC))
+            if prefix != RESULT_BLOB_MAGIC:
+                return cls.parse_raw(prefix + f.read())
+
+            (header_length,) = _RESULT_BLOB_HEADER_LENGTH.unpack(
+                f.read(_RESULT_BLOB_HEADER_LENGTH.size)
+            )
+            header = f.read(header_length)
+            data = f.read()
+
+        return cls._from_header(header, data)
+
+    @classmethod
+    def _from_header(
+        cls, header: bytes, data: Union[bytes, memoryview]
+    ) -> "PersistedResultBlob":
+        return cls(**json.loads(bytes(header)), data=data)
@@ -12,6 +12,7 @@ bytes to an object respectively.
 """
 import abc
 import base64
+import sys
 import warnings
 from typing import Any, Generic, Optional, TypeVar
 
@@ -20,11 +21,21 @@ from pydantic import BaseModel
 from pydantic.json import pydantic_encoder
 from typing_extensions import Literal
 
-from prefect.utilities.importtools import from_qualified_name, to_qualified_name
+from prefect.utilities.importtools import (
+    from_qualified_name,
+    lazy_import,
+    to_qualified_name,
+)
 from prefect.utilities.pydantic import add_type_dispatch
 
 D = TypeVar("D")
 
+# Single byte prefixes identifying the payload type of `ArrowSerializer` output
+ARROW_FALLBACK_TAG = b"F"
+ARROW_TABLE_TAG = b"T"
+ARROW_RECORD_BATCH_TAG = b"B"
+ARROW_PANDAS_TAG = b"P"
+
 
 def prefect_json_object_encoder(obj: Any) -> Any:
     """
@@ -222,7 +233,7 @@ class JSONSerializer(Serializer):
         kwargs = self.loads_kwargs.copy()
         if self.object_decoder:
             kwargs["object_hook"] = from_qualified_name(self.object_decoder)
-        return json.loads(blob.decode(), **kwargs)
+        return json.loads(str(blob, "utf-8"), **kwargs)
 
 
 class CompressedSerializer(Serializer):
@@ -300,3 +311,90 @@ class CompressedJSONSerializer(CompressedSerializer):
 
     type: Literal["compressed/json"] = "compressed/json"
     serializer: Serializer = pydantic.Field(default_factory=JSONSerializer)
+
+
+class ArrowSerializer(Serializer):
+    """
+    Serializes tabular data using the Arrow IPC stream format.
+
+    - Supports `pyarrow.Table`, `pyarrow.RecordBatch`, and `pandas.DataFrame` objects.
+    - Uses `fallback_serializer` for all other objects, pickle by default.
+    - Requires `pyarrow` to be installed to serialize or deserialize tabular data.
+
+    Unlike the other serializers, the output is not wrapped in base64.
+
+    Attributes:
+        compression: If not null, the Arrow IPC buffer compression codec to use.
+            One of "zstd" or "lz4".
+        fallback_serializer: The serializer to use for objects that are not tabular.
+    """
+
+    type: Literal["arrow"] = "arrow"
+
+    compression: Optional[Literal["zstd", "lz4"]] = None
+    fallback_serializer: Serializer = pydantic.Field(default_factory=PickleSerializer)
+
+    @pydantic.validator("fallback_serializer", pre=True)
+    def cast_type_names_to_serializers(cls, value):
+        if isinstance(value, str):
+            return Serializer(type=value)
+        return value
+
+    def dumps(self, obj: Any) -> bytes:
+        kind, data = self._to_arrow(obj)
+        if kind is None:
+            return ARROW_FALLBACK_TAG + self.fallback_serializer.dumps(obj)
+
+        pa = self._import_pyarrow()
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, data.schema, options=options) as writer:
+            writer.write(data)
+
+        return kind + sink.getvalue().to_pybytes()
+
+    def loads(self, blob: bytes) -> Any:
+        kind, payload = blob[:1], memoryview(blob)[1:]
+        if kind == ARROW_FALLBACK_TAG:
+            return self.fallback_serializer.loads(bytes(payload))
+
+        pa = self._import_pyarrow()
+        reader = pa.ipc.open_stream(pa.py_buffer(payload))
+        if kind == ARROW_TABLE_TAG:
+            return reader.read_all()
+        elif kind == ARROW_RECORD_BATCH_TAG:
+            return reader.read_next_batch()
+        elif kind == ARROW_PANDAS_TAG:
+            return reader.read_pandas()
+        else:
+            raise ValueError(f"Unknown Arrow serializer payload type {kind!r}.")
+
+    @staticmethod
+    def _import_pyarrow():
+        return lazy_import(
+            "pyarrow",
+            error_on_import=True,
+            help_message="The Arrow serializer requires `pyarrow` to be installed.",
+        )
+
+    @classmethod
+    def _to_arrow(cls, obj: Any):
+        """
+        Returns the payload type tag and the Arrow data to write for tabular objects
+        or `(None, None)` if the object is not tabular.
+
+        Modules are only checked if already imported, as objects of their types
+        cannot exist otherwise.
+        """
+        pyarrow = sys.modules.get("pyarrow")
+        if pyarrow is not None:
+            if isinstance(obj, pyarrow.Table):
+                return ARROW_TABLE_TAG, obj
+            if isinstance(obj, pyarrow.RecordBatch):
+                return ARROW_RECORD_BATCH_TAG, obj
+
+        pandas = sys.modules.get("pandas")
+        if pandas is not None and isinstance(obj, pandas.DataFrame):
+            return ARROW_PANDAS_TAG, cls._import_pyarrow().Table.from_pandas(obj)
+
+        return None, None
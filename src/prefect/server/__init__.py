@@ -1,4 +1,16 @@
-from . import models
-from . import schemas
-from . import services
-from . import orchestration
+import importlib
+
+# The version of the REST API; defined here so that clients can send it without
+# importing the server
+SERVER_API_VERSION = "0.8.4"
+
+# submodules are imported when first accessed so that clients importing schemas do not
+# import the server's models, services and orchestration
+_SUBMODULES = {"models", "schemas", "services", "orchestration"}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
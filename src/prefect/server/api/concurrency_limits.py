@@ -12,7 +12,10 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.orchestration.concurrency_waiters import (
+    get_concurrency_slot_waiters,
+)
+from prefect.server.utilities.server import PrefectRouter, request_limit_released
 
 router = PrefectRouter(prefix="/concurrency_limits", tags=["Concurrency Limits"])
 
@@ -30,6 +33,10 @@ async def create_concurrency_limit(
         model = await models.concurrency_limits.create_concurrency_limit(
             session=session, concurrency_limit=concurrency_limit_model
         )
+        # the limit may have been raised
+        get_concurrency_slot_waiters().notify_after_commit(
+            session, [model.tag], count=None
+        )
 
     if model.created >= pendulum.now():
         response.status_code = status.HTTP_201_CREATED
@@ -119,6 +126,7 @@ async def reset_concurrency_limit_by_tag(
         model = await models.concurrency_limits.reset_concurrency_limit_by_tag(
             session=session, tag=tag, slot_override=slot_override
         )
+        get_concurrency_slot_waiters().notify_after_commit(session, [tag], count=None)
     if not model:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Concurrency limit not found"
@@ -151,7 +159,47 @@ async def delete_concurrency_limit_by_tag(
         result = await models.concurrency_limits.delete_concurrency_limit_by_tag(
             session=session, tag=tag
         )
+        get_concurrency_slot_waiters().notify_after_commit(session, [tag], count=None)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Concurrency limit not found"
         )
+
+
+@router.post("/tag/{tag}/wait")
+async def wait_for_concurrency_slot(
+    tag: str = Path(..., description="The tag name"),
+    timeout_seconds: float = Body(
+        30,
+        embed=True,
+        ge=0,
+        le=60,
+        description="The maximum number of seconds to wait for a slot.",
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> bool:
+    """
+    Waits for a slot on the concurrency limit for a tag to be released.
+
+    Returns `true` as soon as a slot is available, or `false` if no slot was released
+    before the timeout. A slot is not reserved for the caller; the task run must still
+    secure a slot by entering a `Running` state.
+    """
+    waiters = get_concurrency_slot_waiters()
+
+    # register before checking for an available slot so that a slot released in
+    # between is not missed
+    waiter = waiters.register(tag)
+    try:
+        async with db.session_context() as session:
+            if await models.concurrency_limits.concurrency_limit_has_available_slots(
+                session=session, tag=tag
+            ):
+                return True
+
+        # waiting requests must not hold a slot in the request limit, or they could
+        # prevent the requests that release concurrency slots from being handled
+        async with request_limit_released():
+            return await waiters.wait(waiter, timeout=timeout_seconds)
+    finally:
+        waiters.unregister(tag, waiter)
@@ -2,7 +2,9 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+import asyncio
+from typing import List, Tuple
+from weakref import WeakKeyDictionary
 
 from fastapi import Body, Depends, status
 
@@ -11,9 +13,79 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import GzipRequestAPIRoute, PrefectRouter
 
-router = PrefectRouter(prefix="/logs", tags=["Logs"])
+router = PrefectRouter(prefix="/logs", tags=["Logs"], route_class=GzipRequestAPIRoute)
+
+
+class LogIngestBuffer:
+    """
+    Coalesces logs from concurrent requests into shared transactions.
+
+    A request which arrives while no logs are being written writes its logs right away.
+    Requests which arrive during a write wait for it to finish and then have their logs
+    written together in the next transaction. Each request returns once its own logs
+    have been committed.
+
+    Buffers are bound to the event loop they are created in.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[List[schemas.actions.LogCreate], asyncio.Future]] = []
+        self._lock = asyncio.Lock()
+
+    async def write(
+        self, db: PrefectDBInterface, logs: List[schemas.actions.LogCreate]
+    ) -> None:
+        entry = (logs, asyncio.get_running_loop().create_future())
+        self._pending.append(entry)
+
+        try:
+            async with self._lock:
+                if not entry[1].done():
+                    # Shield the write so a cancelled request does not abandon the
+                    # logs of the other requests in the transaction
+                    await asyncio.shield(self._write_pending(db))
+        except asyncio.CancelledError:
+            if entry in self._pending:
+                self._pending.remove(entry)
+            # Nothing will wait for the result of this request
+            entry[1].cancel()
+            raise
+
+        await entry[1]
+
+    async def _write_pending(self, db: PrefectDBInterface) -> None:
+        batch, self._pending = self._pending, []
+
+        try:
+            async with db.session_context(begin_transaction=True) as session:
+                await models.logs.create_logs(
+                    session=session, logs=[log for logs, _ in batch for log in logs]
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
+_log_ingest_buffers: "WeakKeyDictionary[asyncio.AbstractEventLoop, LogIngestBuffer]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_log_ingest_buffer() -> LogIngestBuffer:
+    """
+    Get the log ingest buffer for the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _log_ingest_buffers:
+        _log_ingest_buffers[loop] = LogIngestBuffer()
+    return _log_ingest_buffers[loop]
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -22,9 +94,7 @@ async def create_logs(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ):
     """Create new logs from the provided schema."""
-    for batch in models.logs.split_logs_into_batches(logs):
-        async with db.session_context(begin_transaction=True) as session:
-            await models.logs.create_logs(session=session, logs=batch)
+    await get_log_ingest_buffer().write(db, logs)
 
 
 @router.post("/filter")
@@ -6,6 +6,7 @@ import datetime
 import json
 from typing import List
 
+import pendulum
 import pydantic
 import sqlalchemy as sa
 from typing_extensions import Literal
@@ -64,24 +65,68 @@ async def run_history(
     ).cte("intervals")
 
     # apply filters to the flow runs (and related states)
-    runs = (
-        await run_filter_function(
+    runs = await run_filter_function(
+        sa.select(
+            run_model.expected_start_time,
+            run_model.state_type,
+            run_model.state_name,
+            sa.literal(1).label("count_runs"),
+            # estimated run times only includes positive run times (to avoid any unexpected corner cases)
+            db.greatest(0, sa.extract("epoch", run_model.estimated_run_time)).label(
+                "sum_estimated_run_time"
+            ),
+            # estimated lateness is the sum of any positive start time deltas
+            db.greatest(
+                0, sa.extract("epoch", run_model.estimated_start_time_delta)
+            ).label("sum_estimated_lateness"),
+        ).select_from(run_model),
+        flow_filter=flows,
+        flow_run_filter=flow_runs,
+        task_run_filter=task_runs,
+        deployment_filter=deployments,
+        work_pool_filter=work_pools,
+        work_queue_filter=work_queues,
+    )
+
+    # runs in a final state are read from the run history rollups when they cover
+    # the requested intervals, and only the remaining runs are read from the runs
+    if _can_use_rollups(
+        db=db,
+        run_type=run_type,
+        history_start=history_start,
+        history_interval=history_interval,
+        flow_runs=flow_runs,
+        task_runs=task_runs,
+    ):
+        runs = runs.where(
+            sa.or_(
+                run_model.state_type.is_(None),
+                run_model.state_type.not_in(schemas.states.TERMINAL_STATES),
+            )
+        )
+        rollups = _filter_rollups(
             sa.select(
-                run_model.id,
-                run_model.expected_start_time,
-                run_model.estimated_run_time,
-                run_model.estimated_start_time_delta,
-                run_model.state_type,
-                run_model.state_name,
-            ).select_from(run_model),
-            flow_filter=flows,
-            flow_run_filter=flow_runs,
-            task_run_filter=task_runs,
-            deployment_filter=deployments,
-            work_pool_filter=work_pools,
-            work_queue_filter=work_queues,
+                db.RunHistoryRollup.interval_start,
+                db.RunHistoryRollup.state_type,
+                db.RunHistoryRollup.state_name,
+                db.RunHistoryRollup.count_runs,
+                db.RunHistoryRollup.sum_estimated_run_time,
+                db.RunHistoryRollup.sum_estimated_lateness,
+            ).where(
+                db.RunHistoryRollup.run_type == run_type,
+                db.RunHistoryRollup.interval_start >= history_start,
+                db.RunHistoryRollup.interval_start < history_end + history_interval,
+            ),
+            db=db,
+            flows=flows,
+            deployments=deployments,
+            work_pools=work_pools,
+            work_queues=work_queues,
         )
-    ).alias("runs")
+        runs = sa.union_all(runs, rollups)
+
+    runs = runs.alias("runs")
+
     # outer join intervals to the filtered runs to create a dataset composed of
     # every interval and the aggregate of all its runs. The runs aggregate is represented
     # by a descriptive JSON object
@@ -91,26 +136,18 @@ async def run_history(
             intervals.c.interval_end,
             # build a JSON object, ignoring the case where the count of runs is 0
             sa.case(
-                (sa.func.count(runs.c.id) == 0, None),
+                (sa.func.coalesce(sa.func.sum(runs.c.count_runs), 0) == 0, None),
                 else_=db.build_json_object(
                     "state_type",
                     runs.c.state_type,
                     "state_name",
                     runs.c.state_name,
                     "count_runs",
-                    sa.func.count(runs.c.id),
-                    # estimated run times only includes positive run times (to avoid any unexpected corner cases)
+                    sa.func.sum(runs.c.count_runs),
                     "sum_estimated_run_time",
-                    sa.func.sum(
-                        db.greatest(0, sa.extract("epoch", runs.c.estimated_run_time))
-                    ),
-                    # estimated lateness is the sum of any positive start time deltas
+                    sa.func.sum(runs.c.sum_estimated_run_time),
                     "sum_estimated_lateness",
-                    sa.func.sum(
-                        db.greatest(
-                            0, sa.extract("epoch", runs.c.estimated_start_time_delta)
-                        )
-                    ),
+                    sa.func.sum(runs.c.sum_estimated_lateness),
                 ),
             ).label("state_agg"),
         )
@@ -161,3 +198,82 @@ async def run_history(
             r["states"] = json.loads(r["states"])
 
     return pydantic.parse_obj_as(List[schemas.responses.HistoryResponse], records)
+
+
+def _can_use_rollups(
+    db: PrefectDBInterface,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTimeTZ,
+    history_interval: datetime.timedelta,
+    flow_runs: schemas.filters.FlowRunFilter = None,
+    task_runs: schemas.filters.TaskRunFilter = None,
+) -> bool:
+    """
+    Whether the run history of runs in a final state can be read from the run
+    history rollups.
+
+    Rollups can be used when every interval starts on a rollup bucket boundary and the
+    filters only select runs by their flow, deployment, work pool or work queue.
+    """
+    rollup_interval = models.run_history_rollups.ROLLUP_INTERVAL
+    history_start = pendulum.instance(history_start).in_timezone("UTC")
+    if history_interval % rollup_interval or history_start != history_start.start_of(
+        "minute"
+    ):
+        return False
+
+    # filters without criteria select every run, except that a task run filter
+    # selects flow runs that have task runs
+    if flow_runs is not None and flow_runs.as_sql_filter(db) is not True:
+        return False
+    if task_runs is not None and (
+        run_type == "flow_run" or task_runs.as_sql_filter(db) is not True
+    ):
+        return False
+
+    return True
+
+
+def _filter_rollups(
+    query,
+    db: PrefectDBInterface,
+    flows: schemas.filters.FlowFilter = None,
+    deployments: schemas.filters.DeploymentFilter = None,
+    work_pools: schemas.filters.WorkPoolFilter = None,
+    work_queues: schemas.filters.WorkQueueFilter = None,
+):
+    """
+    Applies filters to a run history rollup query, matching the rollups of the runs
+    the same filters select.
+    """
+    rollup = db.RunHistoryRollup
+
+    if flows:
+        query = query.where(
+            rollup.flow_id.in_(sa.select(db.Flow.id).where(flows.as_sql_filter(db)))
+        )
+
+    if deployments:
+        query = query.where(
+            rollup.deployment_id.in_(
+                sa.select(db.Deployment.id).where(deployments.as_sql_filter(db))
+            )
+        )
+
+    if work_queues:
+        query = query.where(
+            rollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id).where(work_queues.as_sql_filter(db))
+            )
+        )
+
+    if work_pools:
+        query = query.where(
+            rollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id)
+                .join(db.WorkPool, db.WorkPool.id == db.WorkQueue.work_pool_id)
+                .where(work_pools.as_sql_filter(db))
+            )
+        )
+
+    return query
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 from functools import partial, wraps
 from hashlib import sha256
 from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 import anyio
 import sqlalchemy as sa
@@ -29,10 +30,14 @@ import prefect.server.services as services
 import prefect.settings
 from prefect._internal.compatibility.experimental import enabled_experiments
 from prefect.logging import get_logger
+from prefect.server import SERVER_API_VERSION
 from prefect.server.api.dependencies import EnforceMinimumAPIVersion
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.utilities.database import get_dialect
-from prefect.server.utilities.server import method_paths_from_routes
+from prefect.server.utilities.server import (
+    hold_request_limit_slot,
+    method_paths_from_routes,
+)
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_DEBUG_MODE,
@@ -45,7 +50,6 @@ TITLE = "Prefect Server"
 API_TITLE = "Prefect Prefect REST API"
 UI_TITLE = "Prefect Prefect REST API UI"
 API_VERSION = prefect.__version__
-SERVER_API_VERSION = "0.8.4"
 ORION_API_VERSION = SERVER_API_VERSION  # Deprecated. Available for compatibility.
 
 logger = get_logger("server")
@@ -105,14 +109,28 @@ class RequestLimitMiddleware:
     This is a blunt tool for limiting SQLite concurrent writes which will cause failures
     at high volume. Ideally, we would only apply the limit to routes that perform
     writes.
+
+    Routes that wait for a long time release their slot while waiting with
+    `request_limit_released`, so waiting requests do not count towards the limit.
     """
 
     def __init__(self, app, limit: float):
         self.app = app
-        self._limiter = anyio.CapacityLimiter(limit)
+        self.limit = limit
+        self._limiters = WeakKeyDictionary()
+
+    def _get_limiter(self) -> anyio.CapacityLimiter:
+        # Limiters are bound to the event loop they are used in. The ephemeral
+        # application is shared by clients running in different threads, and waiters in
+        # one loop would never be woken by a release in another loop.
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = anyio.CapacityLimiter(self.limit)
+        return limiter
 
     async def __call__(self, scope, receive, send) -> None:
-        async with self._limiter:
+        async with hold_request_limit_slot(self._get_limiter()):
             await self.app(scope, receive, send)
 
 
@@ -444,6 +462,21 @@ def create_app(
                 services.cancellation_cleanup.CancellationCleanup()
             )
 
+        if prefect.settings.PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_ENABLED.value():
+            service_instances.append(
+                services.active_run_counts.ReconcileActiveRunCounts()
+            )
+
+        if prefect.settings.PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+            service_instances.append(
+                services.run_history_rollups.CompactRunHistoryRollups()
+            )
+
+        if prefect.settings.PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_ENABLED.value():
+            service_instances.append(
+                services.task_run_state_cache.PruneTaskRunStateCache()
+            )
+
         if prefect.settings.PREFECT_SERVER_ANALYTICS_ENABLED.value():
             service_instances.append(services.telemetry.Telemetry())
 
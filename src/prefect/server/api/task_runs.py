@@ -3,7 +3,7 @@ Routes for interacting with task run objects.
 """
 
 import datetime
-from typing import List
+from typing import Dict, List
 from uuid import UUID
 
 import pendulum
@@ -60,6 +60,37 @@ async def create_task_run(
     return model
 
 
+@router.post("/bulk")
+async def create_task_runs(
+    task_runs: List[schemas.actions.TaskRunCreate],
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[schemas.core.TaskRun]:
+    """
+    Create many task runs in a single request. Task runs are returned in the order
+    they were provided.
+
+    As with single task run creation, if a task run with the same flow_run_id,
+    task_key, and dynamic_key already exists, the existing task run will be returned.
+    Task runs without a state will be created in a PENDING state.
+    """
+    # hydrate the input models into full task run / state models
+    task_runs = [schemas.core.TaskRun(**task_run.dict()) for task_run in task_runs]
+
+    for task_run in task_runs:
+        if not task_run.state:
+            task_run.state = schemas.states.Pending()
+
+    async with db.session_context(begin_transaction=True) as session:
+        return await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=task_runs,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+
 @router.patch("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_task_run(
     task_run: schemas.actions.TaskRunUpdate,
@@ -98,6 +129,23 @@ async def count_task_runs(
         )
 
 
+@router.post("/cached_states")
+async def read_cached_task_run_states(
+    cache_keys: List[str] = Body(
+        ..., embed=True, description="The cache keys to look up."
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> Dict[str, schemas.states.State]:
+    """
+    Read the latest unexpired state cached with each of a list of cache keys. Keys
+    without a cached state are omitted from the response.
+    """
+    async with db.session_context(begin_transaction=True) as session:
+        return await models.task_run_state_cache.read_cached_states(
+            session=session, cache_keys=cache_keys
+        )
+
+
 @router.post("/history")
 async def task_run_history(
     history_start: DateTimeTZ = Body(..., description="The history's start time."),
@@ -242,3 +290,38 @@ async def set_task_run_state(
         response.status_code = status.HTTP_200_OK
 
     return orchestration_result
+
+
+@router.post("/set_state/batch")
+async def set_task_run_states(
+    transitions: List[schemas.actions.TaskRunSetState],
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    task_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_task_policy
+    ),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[OrchestrationResult]:
+    """
+    Set the states of many task runs in a single request, invoking any orchestration
+    rules for each transition. Results are returned in the order the transitions were
+    provided.
+
+    Each transition is orchestrated independently, as it would be by setting the state
+    of its task run alone, but all transitions are written in a single transaction. If
+    any transition cannot be orchestrated, none of the states are set.
+    """
+    async with db.session_context(begin_transaction=True) as session:
+        return [
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=transition.task_run_id,
+                state=schemas.states.State.parse_obj(transition.state),
+                force=transition.force,
+                task_policy=task_policy,
+                # rules may update the parameters of the transition they govern
+                orchestration_parameters=orchestration_parameters.copy(),
+            )
+            for transition in transitions
+        ]
@@ -14,14 +14,20 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.orchestration.scheduled_flow_run_waiters import (
+    get_scheduled_flow_run_waiters,
+)
 from prefect.server.utilities.schemas import DateTimeTZ
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectRouter, request_limit_released
 
 router = PrefectRouter(
     prefix="/work_pools",
     tags=["Work Pools"],
 )
 
+# the longest a request for scheduled flow runs waits for a run to be scheduled
+MAX_SCHEDULED_FLOW_RUN_WAIT_SECONDS = 60
+
 
 # -----------------------------------------------------
 # --
@@ -268,31 +274,112 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    wait_seconds: float = Body(
+        None,
+        ge=0,
+        description=(
+            "If no flow runs are found, the number of seconds to wait for a flow run"
+            " to be scheduled before returning. `scheduled_before` moves forward"
+            f" while waiting. At most {MAX_SCHEDULED_FLOW_RUN_WAIT_SECONDS} seconds."
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
-    Load scheduled runs for a worker
+    Load scheduled runs for a worker.
+
+    If `wait_seconds` is provided and no runs are found, the request waits until a run
+    is scheduled in one of the work queues, or becomes scheduled before
+    `scheduled_before` as time passes, and then loads runs again.
     """
-    async with db.session_context(begin_transaction=True) as session:
-        work_pool_id = await worker_lookups._get_work_pool_id_from_name(
-            session=session, work_pool_name=work_pool_name
-        )
+    waiters = get_scheduled_flow_run_waiters()
+    watched_work_queue_ids = []
+    waiter = None
+    started = pendulum.now("UTC")
+
+    try:
+        async with db.session_context(begin_transaction=True) as session:
+            work_pool_id = await worker_lookups._get_work_pool_id_from_name(
+                session=session, work_pool_name=work_pool_name
+            )
+
+            if work_queue_names is None:
+                work_queue_ids = None
+            else:
+                work_queue_ids = []
+                for qn in work_queue_names:
+                    work_queue_ids.append(
+                        await worker_lookups._get_work_queue_id_from_name(
+                            session=session,
+                            work_pool_name=work_pool_name,
+                            work_queue_name=qn,
+                        )
+                    )
+
+            if wait_seconds:
+                # start waiting before loading runs, so that runs scheduled while
+                # they are loaded wake the request
+                if not work_queue_ids:
+                    watched_work_queue_ids = [
+                        work_queue.id
+                        for work_queue in await models.workers.read_work_queues(
+                            session=session, work_pool_id=work_pool_id
+                        )
+                    ]
+                else:
+                    watched_work_queue_ids = work_queue_ids
+                waiter = waiters.register(watched_work_queue_ids)
+
+            queue_response = await models.workers.get_scheduled_flow_runs(
+                session=session,
+                db=db,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+            )
 
-        if work_queue_names is None:
-            work_queue_ids = None
-        else:
-            work_queue_ids = []
-            for qn in work_queue_names:
-                work_queue_ids.append(
-                    await worker_lookups._get_work_queue_id_from_name(
+            if not queue_response and waiter is not None:
+                timeout = min(wait_seconds, MAX_SCHEDULED_FLOW_RUN_WAIT_SECONDS)
+                if scheduled_before is not None and watched_work_queue_ids:
+                    # wait at most until the next run already scheduled in the work
+                    # queues becomes scheduled before `scheduled_before`
+                    next_start = await models.workers.read_next_scheduled_start_time(
                         session=session,
-                        work_pool_name=work_pool_name,
-                        work_queue_name=qn,
+                        work_queue_ids=watched_work_queue_ids,
+                        scheduled_after=scheduled_before,
                     )
-                )
+                    if next_start is not None:
+                        timeout = min(
+                            timeout, (next_start - scheduled_before).total_seconds()
+                        )
+
+        background_tasks.add_task(
+            _record_work_queue_polls,
+            db=db,
+            work_pool_id=work_pool_id,
+            work_queue_names=work_queue_names,
+        )
+
+        if queue_response or waiter is None:
+            return queue_response
+
+        # wait with the session closed and the request limit slot released, so that
+        # waiting requests do not hold database connections or prevent other
+        # requests from being handled
+        async with request_limit_released():
+            await waiters.wait(waiter, timeout)
+    finally:
+        if waiter is not None:
+            waiters.unregister(watched_work_queue_ids, waiter)
 
-        queue_response = await models.workers.get_scheduled_flow_runs(
+    if scheduled_before is not None:
+        scheduled_before = scheduled_before + (pendulum.now("UTC") - started)
+
+    async with db.session_context(begin_transaction=True) as session:
+        return await models.workers.get_scheduled_flow_runs(
             session=session,
             db=db,
             work_pool_ids=[work_pool_id],
@@ -302,15 +389,6 @@ async def get_scheduled_flow_runs(
             limit=limit,
         )
 
-        background_tasks.add_task(
-            _record_work_queue_polls,
-            db=db,
-            work_pool_id=work_pool_id,
-            work_queue_names=work_queue_names,
-        )
-
-        return queue_response
-
 
 async def _record_work_queue_polls(
     db: PrefectDBInterface,
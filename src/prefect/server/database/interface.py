@@ -1,5 +1,6 @@
 import datetime
 from contextlib import asynccontextmanager
+from typing import Dict, List
 
 import sqlalchemy as sa
 
@@ -178,6 +179,16 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A concurrency model"""
         return self.orm.ConcurrencyLimit
 
+    @property
+    def ConcurrencyLimitSlot(self):
+        """A concurrency limit slot model"""
+        return self.orm.ConcurrencyLimitSlot
+
+    @property
+    def RunHistoryRollup(self):
+        """A run history rollup model"""
+        return self.orm.RunHistoryRollup
+
     @property
     def WorkQueue(self):
         """A work queue model"""
@@ -325,6 +336,10 @@ class PrefectDBInterface(metaclass=DBSingleton):
             session=session, db=self, limit=limit
         )
 
+    async def insert_logs(self, session: sa.orm.Session, logs: List[Dict]):
+        """Insert many logs at once"""
+        return await self.queries.insert_logs(session=session, db=self, logs=logs)
+
     async def read_configuration_value(self, session: sa.orm.Session, key: str):
         """Read a configuration value"""
         return await self.queries.read_configuration_value(
@@ -0,0 +1,145 @@
+"""Add concurrency_limit_slot table
+
+Revision ID: a09cf9275134
+Revises: 3bf47e3ce2dd
+Create Date: 2023-04-05 10:22:41.640215
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "a09cf9275134"
+down_revision = "3bf47e3ce2dd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "concurrency_limit_slot",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "concurrency_limit_id",
+            prefect.server.utilities.database.UUID(),
+            nullable=False,
+        ),
+        sa.Column("slot_number", sa.Integer(), nullable=False),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "expires",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["concurrency_limit_id"],
+            ["concurrency_limit.id"],
+            name=op.f(
+                "fk_concurrency_limit_slot__concurrency_limit_id__concurrency_limit"
+            ),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_concurrency_limit_slot")),
+    )
+    op.create_index(
+        "uq_concurrency_limit_slot__concurrency_limit_id_slot_number",
+        "concurrency_limit_slot",
+        ["concurrency_limit_id", "slot_number"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_concurrency_limit_slot__task_run_id",
+        "concurrency_limit_slot",
+        ["task_run_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_concurrency_limit_slot__updated"),
+        "concurrency_limit_slot",
+        ["updated"],
+        unique=False,
+    )
+
+    # Move the task runs in `active_slots` into slots, numbering the slots of each
+    # limit from zero up to the larger of the limit and the number of active slots
+    op.execute(
+        """
+        INSERT INTO concurrency_limit_slot (concurrency_limit_id, slot_number, task_run_id)
+        SELECT
+            concurrency_limit.id,
+            slot_number,
+            CAST(concurrency_limit.active_slots ->> slot_number AS UUID)
+        FROM concurrency_limit
+        CROSS JOIN LATERAL generate_series(
+            0,
+            GREATEST(
+                concurrency_limit.concurrency_limit,
+                jsonb_array_length(concurrency_limit.active_slots)
+            ) - 1
+        ) AS slot_number
+        """
+    )
+
+    op.drop_column("concurrency_limit", "active_slots")
+
+
+def downgrade():
+    op.add_column(
+        "concurrency_limit",
+        sa.Column(
+            "active_slots",
+            prefect.server.utilities.database.JSON(astext_type=sa.Text()),
+            server_default="[]",
+            nullable=False,
+        ),
+    )
+
+    # Move the task runs holding slots into `active_slots`
+    op.execute(
+        """
+        UPDATE concurrency_limit
+        SET active_slots = slots.task_run_ids
+        FROM (
+            SELECT
+                concurrency_limit_id,
+                jsonb_agg(CAST(task_run_id AS TEXT) ORDER BY slot_number) AS task_run_ids
+            FROM concurrency_limit_slot
+            WHERE task_run_id IS NOT NULL
+            GROUP BY concurrency_limit_id
+        ) AS slots
+        WHERE concurrency_limit.id = slots.concurrency_limit_id
+        """
+    )
+
+    op.drop_index(
+        op.f("ix_concurrency_limit_slot__updated"), table_name="concurrency_limit_slot"
+    )
+    op.drop_index(
+        "ix_concurrency_limit_slot__task_run_id", table_name="concurrency_limit_slot"
+    )
+    op.drop_index(
+        "uq_concurrency_limit_slot__concurrency_limit_id_slot_number",
+        table_name="concurrency_limit_slot",
+    )
+    op.drop_table("concurrency_limit_slot")
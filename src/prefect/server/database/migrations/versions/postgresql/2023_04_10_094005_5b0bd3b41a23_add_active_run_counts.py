@@ -0,0 +1,63 @@
+"""Add active run counts to work queue and work pool tables
+
+Revision ID: 5b0bd3b41a23
+Revises: a09cf9275134
+Create Date: 2023-04-10 09:40:05.240377
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b0bd3b41a23"
+down_revision = "a09cf9275134"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("work_queue", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_run_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+    with op.batch_alter_table("work_pool", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_run_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE work_queue SET active_run_count = (
+            SELECT COUNT(*) FROM flow_run
+            WHERE flow_run.state_type IN ('PENDING', 'RUNNING', 'CANCELLING')
+            AND (
+                flow_run.work_queue_id = work_queue.id
+                OR (
+                    flow_run.work_queue_id IS NULL
+                    AND flow_run.work_queue_name = work_queue.name
+                )
+            )
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE work_pool SET active_run_count = (
+            SELECT COALESCE(SUM(work_queue.active_run_count), 0) FROM work_queue
+            WHERE work_queue.work_pool_id = work_pool.id
+        )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("work_pool", schema=None) as batch_op:
+        batch_op.drop_column("active_run_count")
+
+    with op.batch_alter_table("work_queue", schema=None) as batch_op:
+        batch_op.drop_column("active_run_count")
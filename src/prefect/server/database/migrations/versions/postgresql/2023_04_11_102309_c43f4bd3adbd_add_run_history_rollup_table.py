@@ -0,0 +1,158 @@
+"""Add run_history_rollup table
+
+Revision ID: c43f4bd3adbd
+Revises: 5b0bd3b41a23
+Create Date: 2023-04-11 10:23:09.214578
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "c43f4bd3adbd"
+down_revision = "5b0bd3b41a23"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            # the `state_type` enum already exists
+            postgresql.ENUM(name="state_type", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("count_runs", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "sum_estimated_run_time", sa.Float(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "sum_estimated_lateness", sa.Float(), server_default="0", nullable=False
+        ),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=False),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "work_queue_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.ForeignKeyConstraint(
+            ["flow_id"],
+            ["flow.id"],
+            name=op.f("fk_run_history_rollup__flow_id__flow"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["work_queue_id"],
+            ["work_queue.id"],
+            name=op.f("fk_run_history_rollup__work_queue_id__work_queue"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    op.create_index(
+        "ix_run_history_rollup__run_type_interval_start",
+        "run_history_rollup",
+        ["run_type", "interval_start"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__flow_id"),
+        "run_history_rollup",
+        ["flow_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__updated"),
+        "run_history_rollup",
+        ["updated"],
+        unique=False,
+    )
+
+    # Roll up the runs already in a final state by the minute they were expected to
+    # start
+    for run_type, runs, join in [
+        ("flow_run", "flow_run", ""),
+        ("task_run", "task_run", "JOIN flow_run ON flow_run.id = task_run.flow_run_id"),
+    ]:
+        op.execute(
+            f"""
+            INSERT INTO run_history_rollup (
+                run_type,
+                interval_start,
+                flow_id,
+                deployment_id,
+                work_queue_id,
+                state_type,
+                state_name,
+                count_runs,
+                sum_estimated_run_time,
+                sum_estimated_lateness
+            )
+            SELECT
+                '{run_type}',
+                date_trunc('minute', {runs}.expected_start_time),
+                flow_run.flow_id,
+                flow_run.deployment_id,
+                flow_run.work_queue_id,
+                {runs}.state_type,
+                {runs}.state_name,
+                COUNT(*),
+                SUM(GREATEST(0, EXTRACT(EPOCH FROM {runs}.total_run_time))),
+                SUM(
+                    CASE WHEN {runs}.start_time > {runs}.expected_start_time
+                    THEN EXTRACT(
+                        EPOCH FROM {runs}.start_time - {runs}.expected_start_time
+                    )
+                    ELSE 0 END
+                )
+            FROM {runs} {join}
+            WHERE {runs}.state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+            AND {runs}.expected_start_time IS NOT NULL
+            GROUP BY 2, 3, 4, 5, 6, 7
+            """
+        )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_run_history_rollup__updated"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        op.f("ix_run_history_rollup__flow_id"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        "ix_run_history_rollup__run_type_interval_start",
+        table_name="run_history_rollup",
+    )
+    op.drop_table("run_history_rollup")
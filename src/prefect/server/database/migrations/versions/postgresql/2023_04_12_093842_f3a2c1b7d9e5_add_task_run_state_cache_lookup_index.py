@@ -0,0 +1,50 @@
+"""Add covering and expiration indexes to the task run state cache
+
+Revision ID: f3a2c1b7d9e5
+Revises: c43f4bd3adbd
+Create Date: 2023-04-12 09:38:42.671390
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3a2c1b7d9e5"
+down_revision = "c43f4bd3adbd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        table_name="task_run_state_cache",
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_lookup",
+        "task_run_state_cache",
+        ["cache_key", sa.text("created DESC"), "cache_expiration", "task_run_state_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_expiration",
+        "task_run_state_cache",
+        ["cache_expiration"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_task_run_state_cache__cache_expiration",
+        table_name="task_run_state_cache",
+    )
+    op.drop_index(
+        "ix_task_run_state_cache__cache_lookup", table_name="task_run_state_cache"
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        "task_run_state_cache",
+        ["cache_key", sa.text("created DESC")],
+        unique=False,
+    )
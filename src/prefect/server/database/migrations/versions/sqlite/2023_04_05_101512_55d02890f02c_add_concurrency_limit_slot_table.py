@@ -0,0 +1,175 @@
+"""Add concurrency_limit_slot table
+
+Revision ID: 55d02890f02c
+Revises: 553920ec20e9
+Create Date: 2023-04-05 10:15:12.291843
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "55d02890f02c"
+down_revision = "553920ec20e9"
+branch_labels = None
+depends_on = None
+
+
+concurrency_limit_table = sa.table(
+    "concurrency_limit",
+    sa.column("id", prefect.server.utilities.database.UUID()),
+    sa.column("concurrency_limit", sa.Integer()),
+    sa.column("active_slots", prefect.server.utilities.database.JSON()),
+)
+
+concurrency_limit_slot_table = sa.table(
+    "concurrency_limit_slot",
+    sa.column("concurrency_limit_id", prefect.server.utilities.database.UUID()),
+    sa.column("slot_number", sa.Integer()),
+    sa.column("task_run_id", prefect.server.utilities.database.UUID()),
+)
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    op.create_table(
+        "concurrency_limit_slot",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "concurrency_limit_id",
+            prefect.server.utilities.database.UUID(),
+            nullable=False,
+        ),
+        sa.Column("slot_number", sa.Integer(), nullable=False),
+        sa.Column(
+            "task_run_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "expires",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["concurrency_limit_id"],
+            ["concurrency_limit.id"],
+            name=op.f(
+                "fk_concurrency_limit_slot__concurrency_limit_id__concurrency_limit"
+            ),
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_concurrency_limit_slot")),
+    )
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.create_index(
+            "uq_concurrency_limit_slot__concurrency_limit_id_slot_number",
+            ["concurrency_limit_id", "slot_number"],
+            unique=True,
+        )
+        batch_op.create_index(
+            "ix_concurrency_limit_slot__task_run_id", ["task_run_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_concurrency_limit_slot__updated"),
+            ["updated"],
+            unique=False,
+        )
+
+    # Move the task runs in `active_slots` into slots
+    connection = op.get_bind()
+    concurrency_limits = connection.execute(
+        sa.select(
+            concurrency_limit_table.c.id,
+            concurrency_limit_table.c.concurrency_limit,
+            concurrency_limit_table.c.active_slots,
+        )
+    ).fetchall()
+    for id, limit, active_slots in concurrency_limits:
+        active_slots = list(dict.fromkeys(active_slots or []))
+        slots = [
+            dict(concurrency_limit_id=id, slot_number=slot_number, task_run_id=None)
+            for slot_number in range(max(limit, len(active_slots)))
+        ]
+        for slot, task_run_id in zip(slots, active_slots):
+            slot["task_run_id"] = task_run_id
+        if slots:
+            connection.execute(sa.insert(concurrency_limit_slot_table), slots)
+
+    with op.batch_alter_table("concurrency_limit", schema=None) as batch_op:
+        batch_op.drop_column("active_slots")
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("concurrency_limit", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_slots",
+                prefect.server.utilities.database.JSON(astext_type=sa.Text()),
+                server_default="[]",
+                nullable=False,
+            )
+        )
+
+    # Move the task runs holding slots into `active_slots`
+    connection = op.get_bind()
+    slots = connection.execute(
+        sa.select(
+            concurrency_limit_slot_table.c.concurrency_limit_id,
+            concurrency_limit_slot_table.c.task_run_id,
+        )
+        .where(concurrency_limit_slot_table.c.task_run_id.is_not(None))
+        .order_by(
+            concurrency_limit_slot_table.c.concurrency_limit_id,
+            concurrency_limit_slot_table.c.slot_number,
+        )
+    ).fetchall()
+    active_slots = {}
+    for concurrency_limit_id, task_run_id in slots:
+        active_slots.setdefault(concurrency_limit_id, []).append(str(task_run_id))
+    for concurrency_limit_id, task_run_ids in active_slots.items():
+        connection.execute(
+            sa.update(concurrency_limit_table)
+            .where(concurrency_limit_table.c.id == concurrency_limit_id)
+            .values(active_slots=task_run_ids)
+        )
+
+    with op.batch_alter_table("concurrency_limit_slot", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_concurrency_limit_slot__updated"))
+        batch_op.drop_index("ix_concurrency_limit_slot__task_run_id")
+        batch_op.drop_index(
+            "uq_concurrency_limit_slot__concurrency_limit_id_slot_number"
+        )
+
+    op.drop_table("concurrency_limit_slot")
+
+    op.execute("PRAGMA foreign_keys=ON")
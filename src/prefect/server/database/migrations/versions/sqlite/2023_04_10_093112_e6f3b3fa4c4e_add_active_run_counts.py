@@ -0,0 +1,71 @@
+"""Add active run counts to work queue and work pool tables
+
+Revision ID: e6f3b3fa4c4e
+Revises: 55d02890f02c
+Create Date: 2023-04-10 09:31:12.518235
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6f3b3fa4c4e"
+down_revision = "55d02890f02c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("work_queue", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_run_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+    with op.batch_alter_table("work_pool", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "active_run_count", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+    op.execute(
+        """
+        UPDATE work_queue SET active_run_count = (
+            SELECT COUNT(*) FROM flow_run
+            WHERE flow_run.state_type IN ('PENDING', 'RUNNING', 'CANCELLING')
+            AND (
+                flow_run.work_queue_id = work_queue.id
+                OR (
+                    flow_run.work_queue_id IS NULL
+                    AND flow_run.work_queue_name = work_queue.name
+                )
+            )
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE work_pool SET active_run_count = (
+            SELECT COALESCE(SUM(work_queue.active_run_count), 0) FROM work_queue
+            WHERE work_queue.work_pool_id = work_pool.id
+        )
+        """
+    )
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("work_pool", schema=None) as batch_op:
+        batch_op.drop_column("active_run_count")
+
+    with op.batch_alter_table("work_queue", schema=None) as batch_op:
+        batch_op.drop_column("active_run_count")
+
+    op.execute("PRAGMA foreign_keys=ON")
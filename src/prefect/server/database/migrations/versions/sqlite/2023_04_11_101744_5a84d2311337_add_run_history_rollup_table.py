@@ -0,0 +1,177 @@
+"""Add run_history_rollup table
+
+Revision ID: 5a84d2311337
+Revises: e6f3b3fa4c4e
+Create Date: 2023-04-11 10:17:44.806162
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "5a84d2311337"
+down_revision = "e6f3b3fa4c4e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    op.create_table(
+        "run_history_rollup",
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            sa.Enum(
+                "SCHEDULED",
+                "PENDING",
+                "RUNNING",
+                "COMPLETED",
+                "FAILED",
+                "CANCELLED",
+                "CRASHED",
+                "PAUSED",
+                "CANCELLING",
+                name="state_type",
+            ),
+            nullable=True,
+        ),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("count_runs", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "sum_estimated_run_time", sa.Float(), server_default="0", nullable=False
+        ),
+        sa.Column(
+            "sum_estimated_lateness", sa.Float(), server_default="0", nullable=False
+        ),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=False),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "work_queue_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.ForeignKeyConstraint(
+            ["flow_id"],
+            ["flow.id"],
+            name=op.f("fk_run_history_rollup__flow_id__flow"),
+            ondelete="cascade",
+        ),
+        sa.ForeignKeyConstraint(
+            ["work_queue_id"],
+            ["work_queue.id"],
+            name=op.f("fk_run_history_rollup__work_queue_id__work_queue"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_run_history_rollup__run_type_interval_start",
+            ["run_type", "interval_start"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_run_history_rollup__flow_id"), ["flow_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_run_history_rollup__updated"), ["updated"], unique=False
+        )
+
+    # Roll up the runs already in a final state by the minute they were expected to
+    # start. Intervals are stored as datetimes relative to the epoch.
+    for run_type, runs, join in [
+        ("flow_run", "flow_run", ""),
+        ("task_run", "task_run", "JOIN flow_run ON flow_run.id = task_run.flow_run_id"),
+    ]:
+        op.execute(
+            f"""
+            INSERT INTO run_history_rollup (
+                run_type,
+                interval_start,
+                flow_id,
+                deployment_id,
+                work_queue_id,
+                state_type,
+                state_name,
+                count_runs,
+                sum_estimated_run_time,
+                sum_estimated_lateness
+            )
+            SELECT
+                '{run_type}',
+                strftime('%Y-%m-%d %H:%M:00.000000', {runs}.expected_start_time),
+                flow_run.flow_id,
+                flow_run.deployment_id,
+                flow_run.work_queue_id,
+                {runs}.state_type,
+                {runs}.state_name,
+                COUNT(*),
+                SUM(
+                    MAX(
+                        0,
+                        (julianday({runs}.total_run_time) - 2440587.5) * 86400.0
+                    )
+                ),
+                SUM(
+                    CASE WHEN {runs}.start_time > {runs}.expected_start_time
+                    THEN (
+                        julianday({runs}.start_time)
+                        - julianday({runs}.expected_start_time)
+                    ) * 86400.0
+                    ELSE 0 END
+                )
+            FROM {runs} {join}
+            WHERE {runs}.state_type IN ('COMPLETED', 'FAILED', 'CANCELLED', 'CRASHED')
+            AND {runs}.expected_start_time IS NOT NULL
+            GROUP BY 2, 3, 4, 5, 6, 7
+            """
+        )
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_run_history_rollup__updated"))
+        batch_op.drop_index(batch_op.f("ix_run_history_rollup__flow_id"))
+        batch_op.drop_index("ix_run_history_rollup__run_type_interval_start")
+
+    op.drop_table("run_history_rollup")
+
+    op.execute("PRAGMA foreign_keys=ON")
@@ -0,0 +1,58 @@
+"""Add covering and expiration indexes to the task run state cache
+
+Revision ID: 8e1f0c6d2b4a
+Revises: 5a84d2311337
+Create Date: 2023-04-12 09:33:11.204815
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8e1f0c6d2b4a"
+down_revision = "5a84d2311337"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    op.drop_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        table_name="task_run_state_cache",
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_lookup",
+        "task_run_state_cache",
+        ["cache_key", sa.text("created DESC"), "cache_expiration", "task_run_state_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_expiration",
+        "task_run_state_cache",
+        ["cache_expiration"],
+        unique=False,
+    )
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    op.drop_index(
+        "ix_task_run_state_cache__cache_expiration",
+        table_name="task_run_state_cache",
+    )
+    op.drop_index(
+        "ix_task_run_state_cache__cache_lookup", table_name="task_run_state_cache"
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        "task_run_state_cache",
+        ["cache_key", sa.text("created DESC")],
+        unique=False,
+    )
+
+    op.execute("PRAGMA foreign_keys=ON")
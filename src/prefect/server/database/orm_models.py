@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -354,10 +355,17 @@ class ORMTaskRunStateCache:
     @declared_attr
     def __table_args__(cls):
         return (
+            # covers the lookup of the latest unexpired state for a cache key
             sa.Index(
-                "ix_task_run_state_cache__cache_key_created_desc",
+                "ix_task_run_state_cache__cache_lookup",
                 "cache_key",
                 sa.desc("created"),
+                "cache_expiration",
+                "task_run_state_id",
+            ),
+            sa.Index(
+                "ix_task_run_state_cache__cache_expiration",
+                "cache_expiration",
             ),
         )
 
@@ -939,13 +947,141 @@ class ORMLog:
 class ORMConcurrencyLimit:
     tag = sa.Column(sa.String, nullable=False)
     concurrency_limit = sa.Column(sa.Integer, nullable=False)
-    active_slots = sa.Column(JSON, server_default="[]", default=list, nullable=False)
+
+    @declared_attr
+    def slots(cls):
+        return sa.orm.relationship(
+            "ConcurrencyLimitSlot",
+            lazy="selectin",
+            order_by="ConcurrencyLimitSlot.slot_number",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+        )
+
+    @property
+    def active_slots(self) -> List[uuid.UUID]:
+        """
+        The ids of the task runs holding an unexpired slot on this limit.
+        """
+        now = pendulum.now("UTC")
+        return [
+            slot.task_run_id
+            for slot in self.slots
+            if slot.task_run_id is not None
+            and (slot.expires is None or slot.expires > now)
+        ]
+
+    @active_slots.setter
+    def active_slots(self, task_run_ids: List[Union[str, uuid.UUID]]):
+        """
+        Replaces the holders of this limit's slots, adding slots if there are more
+        holders than slots.
+        """
+        task_run_ids = list(dict.fromkeys(uuid.UUID(str(id)) for id in task_run_ids))
+        slots = list(self.slots)
+        slot_class = sa.inspect(type(self)).relationships["slots"].mapper.class_
+        next_slot_number = max((slot.slot_number for slot in slots), default=-1) + 1
+        for _ in range(len(slots), len(task_run_ids)):
+            slot = slot_class(slot_number=next_slot_number)
+            next_slot_number += 1
+            self.slots.append(slot)
+            slots.append(slot)
+
+        for slot, task_run_id in itertools.zip_longest(slots, task_run_ids):
+            slot.task_run_id = task_run_id
+            slot.expires = None
 
     @declared_attr
     def __table_args__(cls):
         return (sa.Index("uq_concurrency_limit__tag", "tag", unique=True),)
 
 
+@declarative_mixin
+class ORMConcurrencyLimitSlot:
+    """
+    A slot on a concurrency limit, held by the task run whose id it records until it
+    is released or its lease expires. Slots are numbered from `0` as they are created
+    and only slots numbered below the limit can be secured.
+    """
+
+    @declared_attr
+    def concurrency_limit_id(cls):
+        return sa.Column(
+            UUID(),
+            sa.ForeignKey("concurrency_limit.id", ondelete="cascade"),
+            nullable=False,
+        )
+
+    slot_number = sa.Column(sa.Integer, nullable=False)
+    task_run_id = sa.Column(UUID(), nullable=True)
+    expires = sa.Column(Timestamp(), nullable=True)
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            sa.Index(
+                "uq_concurrency_limit_slot__concurrency_limit_id_slot_number",
+                "concurrency_limit_id",
+                "slot_number",
+                unique=True,
+            ),
+            sa.Index("ix_concurrency_limit_slot__task_run_id", "task_run_id"),
+        )
+
+
+@declarative_mixin
+class ORMRunHistoryRollup:
+    """
+    SQLAlchemy model of a change to the run history of flow or task runs in a final
+    state, aggregated by the minute their runs were expected to start.
+
+    A row is added whenever a run enters or leaves a final state; rows with the same
+    dimensions are periodically merged.
+    """
+
+    run_type = sa.Column(sa.String, nullable=False)
+    interval_start = sa.Column(Timestamp(), nullable=False)
+    state_type = sa.Column(sa.Enum(schemas.states.StateType, name="state_type"))
+    state_name = sa.Column(sa.String)
+    count_runs = sa.Column(sa.Integer, nullable=False, server_default="0", default=0)
+    sum_estimated_run_time = sa.Column(
+        sa.Float, nullable=False, server_default="0", default=0
+    )
+    sum_estimated_lateness = sa.Column(
+        sa.Float, nullable=False, server_default="0", default=0
+    )
+
+    # the flow, deployment and work queue of the flow run (or the task run's flow run)
+    @declared_attr
+    def flow_id(cls):
+        return sa.Column(
+            UUID(),
+            sa.ForeignKey("flow.id", ondelete="cascade"),
+            nullable=False,
+            index=True,
+        )
+
+    deployment_id = sa.Column(UUID(), nullable=True)
+
+    @declared_attr
+    def work_queue_id(cls):
+        return sa.Column(
+            UUID,
+            sa.ForeignKey("work_queue.id", ondelete="SET NULL"),
+            nullable=True,
+        )
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            sa.Index(
+                "ix_run_history_rollup__run_type_interval_start",
+                "run_type",
+                "interval_start",
+            ),
+        )
+
+
 @declarative_mixin
 class ORMBlockType:
     name = sa.Column(sa.String, nullable=False)
@@ -1156,6 +1292,11 @@ class ORMWorkQueue:
         Timestamp(),
         nullable=True,
     )
+    # the number of flow runs in the queue that are pending, running or cancelling;
+    # maintained on each flow run state transition and periodically recounted
+    active_run_count = sa.Column(
+        sa.Integer, nullable=False, server_default="0", default=0
+    )
 
     @declared_attr
     def __table_args__(cls):
@@ -1193,6 +1334,10 @@ class ORMWorkPool:
         sa.Integer,
         nullable=True,
     )
+    # the total number of active flow runs in the pool's queues
+    active_run_count = sa.Column(
+        sa.Integer, nullable=False, server_default="0", default=0
+    )
 
     @declared_attr
     def __table_args__(cls):
@@ -1308,6 +1453,8 @@ class BaseORMConfiguration(ABC):
         work_pool_mixin: work pool orm mixin, combined with Base orm class
         worker_mixin: worker orm mixin, combined with Base orm class
         concurrency_limit_mixin: concurrency limit orm mixin, combined with Base orm class
+        concurrency_limit_slot_mixin: concurrency limit slot orm mixin, combined with Base orm class
+        run_history_rollup_mixin: run history rollup orm mixin, combined with Base orm class
         block_type_mixin: block_type orm mixin, combined with Base orm class
         block_schema_mixin: block_schema orm mixin, combined with Base orm class
         block_schema_reference_mixin: block_schema_reference orm mixin, combined with Base orm class
@@ -1333,6 +1480,8 @@ class BaseORMConfiguration(ABC):
         saved_search_mixin=ORMSavedSearch,
         log_mixin=ORMLog,
         concurrency_limit_mixin=ORMConcurrencyLimit,
+        concurrency_limit_slot_mixin=ORMConcurrencyLimitSlot,
+        run_history_rollup_mixin=ORMRunHistoryRollup,
         work_pool_mixin=ORMWorkPool,
         worker_mixin=ORMWorker,
         block_type_mixin=ORMBlockType,
@@ -1384,6 +1533,8 @@ class BaseORMConfiguration(ABC):
             saved_search_mixin=saved_search_mixin,
             log_mixin=log_mixin,
             concurrency_limit_mixin=concurrency_limit_mixin,
+            concurrency_limit_slot_mixin=concurrency_limit_slot_mixin,
+            run_history_rollup_mixin=run_history_rollup_mixin,
             work_pool_mixin=work_pool_mixin,
             worker_mixin=worker_mixin,
             work_queue_mixin=work_queue_mixin,
@@ -1429,6 +1580,8 @@ class BaseORMConfiguration(ABC):
         saved_search_mixin=ORMSavedSearch,
         log_mixin=ORMLog,
         concurrency_limit_mixin=ORMConcurrencyLimit,
+        concurrency_limit_slot_mixin=ORMConcurrencyLimitSlot,
+        run_history_rollup_mixin=ORMRunHistoryRollup,
         work_pool_mixin=ORMWorkPool,
         worker_mixin=ORMWorker,
         block_type_mixin=ORMBlockType,
@@ -1483,6 +1636,12 @@ class BaseORMConfiguration(ABC):
         class ConcurrencyLimit(concurrency_limit_mixin, self.Base):
             pass
 
+        class ConcurrencyLimitSlot(concurrency_limit_slot_mixin, self.Base):
+            pass
+
+        class RunHistoryRollup(run_history_rollup_mixin, self.Base):
+            pass
+
         class WorkPool(work_pool_mixin, self.Base):
             pass
 
@@ -1531,6 +1690,8 @@ class BaseORMConfiguration(ABC):
         self.SavedSearch = SavedSearch
         self.Log = Log
         self.ConcurrencyLimit = ConcurrencyLimit
+        self.ConcurrencyLimitSlot = ConcurrencyLimitSlot
+        self.RunHistoryRollup = RunHistoryRollup
         self.WorkPool = WorkPool
         self.Worker = Worker
         self.WorkQueue = WorkQueue
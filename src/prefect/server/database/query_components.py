@@ -99,6 +99,22 @@ class BaseQueryComponents(ABC):
     ):
         """Database-specific implementation of reading notifications from the queue and deleting them"""
 
+    async def insert_logs(
+        self, session: AsyncSession, db: "PrefectDBInterface", logs: List[Dict]
+    ) -> None:
+        """
+        Inserts many logs at once. Each log must provide a value for every column of
+        the log table.
+
+        By default, the logs are inserted with `executemany`, preparing a single
+        statement rather than compiling a `VALUES` clause for every log. Dialects may
+        override this with a more efficient bulk insert.
+        """
+        if not logs:
+            return
+
+        await session.execute(sa.insert(db.Log), logs)
+
     async def queue_flow_run_notifications(
         self,
         session: sa.orm.session,
@@ -161,25 +177,15 @@ class BaseQueryComponents(ABC):
         """
 
         # get any work queues that have a concurrency limit, and compute available
-        # slots as their limit less the number of running flows
+        # slots as their limit less the number of active runs they are counting
         concurrency_queues = (
             sa.select(
                 db.WorkQueue.id,
                 self.greatest(
-                    0, db.WorkQueue.concurrency_limit - sa.func.count(db.FlowRun.id)
+                    0, db.WorkQueue.concurrency_limit - db.WorkQueue.active_run_count
                 ).label("available_slots"),
             )
-            .select_from(db.WorkQueue)
-            .join(
-                db.FlowRun,
-                sa.and_(
-                    self._flow_run_work_queue_join_clause(db.FlowRun, db.WorkQueue),
-                    db.FlowRun.state_type.in_(["RUNNING", "PENDING", "CANCELLING"]),
-                ),
-                isouter=True,
-            )
             .where(db.WorkQueue.concurrency_limit.is_not(None))
-            .group_by(db.WorkQueue.id)
             .cte("concurrency_queues")
         )
 
@@ -664,6 +670,40 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
         result = await session.execute(notification_details_stmt)
         return result.fetchall()
 
+    async def insert_logs(
+        self, session: AsyncSession, db: "PrefectDBInterface", logs: List[Dict]
+    ) -> None:
+        """
+        Inserts all of the logs with a single statement that unnests one array
+        parameter per column, i.e. `INSERT INTO log SELECT * FROM unnest(...)`.
+
+        Unlike a multi-row `VALUES` clause, the statement does not grow with the number
+        of logs so it is compiled once and is not subject to the parameter limit.
+        """
+        if not logs:
+            return
+
+        columns = list(db.Log.__table__.columns)
+        arrays = [
+            sa.cast(
+                sa.bindparam(
+                    column.name,
+                    value=[log[column.name] for log in logs],
+                    type_=postgresql.ARRAY(column.type),
+                ),
+                postgresql.ARRAY(column.type),
+            )
+            for column in columns
+        ]
+        unnested = sa.func.unnest(*arrays).table_valued(
+            *[column.name for column in columns]
+        )
+        await session.execute(
+            sa.insert(db.Log).from_select(
+                [column.name for column in columns], sa.select(unnested)
+            )
+        )
+
     @property
     def _get_scheduled_flow_runs_from_work_pool_template_path(self):
         """
@@ -1,21 +1,23 @@
 from . import (
+    agents,
+    artifacts,
     block_documents,
     block_registration,
     block_schemas,
     block_types,
+    concurrency_limits,
     configuration,
     deployments,
-    concurrency_limits,
     flow_run_notification_policies,
     flow_run_states,
     flow_runs,
     flows,
+    logs,
+    run_history_rollups,
+    saved_searches,
+    task_run_state_cache,
     task_run_states,
     task_runs,
-    saved_searches,
-    logs,
-    workers,
     work_queues,
-    agents,
-    artifacts,
+    workers,
 )
@@ -12,6 +12,9 @@ import sqlalchemy as sa
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.database.orm_models import ORMConcurrencyLimit
+from prefect.server.utilities.database import UUID as UUIDType
+from prefect.server.utilities.database import Timestamp
 
 
 @inject_db
@@ -23,6 +26,7 @@ async def create_concurrency_limit(
     insert_values = concurrency_limit.dict(shallow=True, exclude_unset=False)
     insert_values.pop("created")
     insert_values.pop("updated")
+    insert_values.pop("active_slots")
     concurrency_tag = insert_values["tag"]
 
     # set `updated` manually
@@ -64,8 +68,10 @@ async def read_concurrency_limit(
     conditions might allow the concurrency limit to be temporarily exceeded.
     """
 
-    query = sa.select(db.ConcurrencyLimit).where(
-        db.ConcurrencyLimit.id == concurrency_limit_id
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .where(db.ConcurrencyLimit.id == concurrency_limit_id)
+        .execution_options(populate_existing=True)
     )
 
     result = await session.execute(query)
@@ -83,7 +89,11 @@ async def read_concurrency_limit_by_tag(
     conditions might allow the concurrency limit to be temporarily exceeded.
     """
 
-    query = sa.select(db.ConcurrencyLimit).where(db.ConcurrencyLimit.tag == tag)
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .where(db.ConcurrencyLimit.tag == tag)
+        .execution_options(populate_existing=True)
+    )
 
     result = await session.execute(query)
     return result.scalar()
@@ -99,7 +109,11 @@ async def reset_concurrency_limit_by_tag(
     """
     Resets a concurrency limit by tag.
     """
-    query = sa.select(db.ConcurrencyLimit).where(db.ConcurrencyLimit.tag == tag)
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .where(db.ConcurrencyLimit.tag == tag)
+        .execution_options(populate_existing=True)
+    )
     result = await session.execute(query)
     concurrency_limit = result.scalar()
     if concurrency_limit:
@@ -117,21 +131,217 @@ async def filter_concurrency_limits_for_orchestration(
     db: PrefectDBInterface,
 ):
     """
-    Filters concurrency limits by tag. This will apply a "select for update" lock on
-    these rows to prevent simultaneous read race conditions from enabling the
-    the concurrency limit on these tags from being temporarily exceeded.
+    Filters concurrency limits by tag. The slots of these limits are not loaded;
+    slots must be secured with `acquire_concurrency_limit_slot`, which prevents
+    simultaneous transitions from temporarily exceeding the concurrency limit on
+    these tags without locking the limit rows themselves.
     """
 
     query = (
         sa.select(db.ConcurrencyLimit)
         .filter(db.ConcurrencyLimit.tag.in_(tags))
         .order_by(db.ConcurrencyLimit.tag)
-        .with_for_update()
+        .options(sa.orm.raiseload(db.ConcurrencyLimit.slots))
     )
     result = await session.execute(query)
     return result.scalars().all()
 
 
+@inject_db
+async def acquire_concurrency_limit_slot(
+    session: sa.orm.Session,
+    concurrency_limit: ORMConcurrencyLimit,
+    task_run_id: UUID,
+    db: PrefectDBInterface,
+    lease_seconds: Optional[float] = None,
+) -> bool:
+    """
+    Secures a slot on a concurrency limit for a task run.
+
+    A free slot, or a slot whose lease has expired, is claimed with a single update.
+    On Postgres the slot is selected with `FOR UPDATE SKIP LOCKED` so that concurrent
+    transitions claim different slots instead of waiting on each other. Slots are
+    created as they are first needed, so a limit has no more slots than the most
+    task runs that have held them at once. If the task run already holds a slot on
+    the limit, its lease is renewed instead.
+
+    Args:
+        session: A database session
+        concurrency_limit: the concurrency limit to secure a slot on
+        task_run_id: the task run id to secure a slot for
+        lease_seconds: if provided, the slot is reclaimed this many seconds after
+            it is secured, even if it has not been released
+
+    Returns:
+        bool: whether or not a slot was secured
+    """
+    now = pendulum.now("UTC")
+    expires = now.add(seconds=lease_seconds) if lease_seconds is not None else None
+
+    slot = db.ConcurrencyLimitSlot
+    candidate_slot = sa.orm.aliased(db.ConcurrencyLimitSlot)
+    held_slot = sa.orm.aliased(db.ConcurrencyLimitSlot)
+
+    # slots held at or above a lowered limit must be released before new slots are
+    # secured
+    over_limit = (
+        sa.select(held_slot.id)
+        .where(
+            held_slot.concurrency_limit_id == concurrency_limit.id,
+            held_slot.slot_number >= concurrency_limit.concurrency_limit,
+            held_slot.task_run_id != task_run_id,
+            sa.or_(held_slot.expires.is_(None), held_slot.expires > now),
+        )
+        .exists()
+    )
+
+    available_slot = (
+        sa.select(candidate_slot.id)
+        .where(
+            candidate_slot.concurrency_limit_id == concurrency_limit.id,
+            sa.or_(
+                candidate_slot.task_run_id == task_run_id,
+                sa.and_(
+                    candidate_slot.slot_number < concurrency_limit.concurrency_limit,
+                    sa.or_(
+                        candidate_slot.task_run_id.is_(None),
+                        candidate_slot.expires <= now,
+                    ),
+                    sa.not_(over_limit),
+                ),
+            ),
+        )
+        # prefer a slot the task run already holds
+        .order_by(
+            sa.case((candidate_slot.task_run_id == task_run_id, 0), else_=1),
+            candidate_slot.slot_number,
+        )
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    next_slot_number = (
+        sa.select(
+            sa.func.coalesce(sa.func.max(slot.slot_number) + 1, 0).label("slot_number")
+        )
+        .where(slot.concurrency_limit_id == concurrency_limit.id)
+        .subquery()
+    )
+    new_slot = (
+        (await db.insert(slot))
+        .from_select(
+            ["concurrency_limit_id", "slot_number", "task_run_id", "expires"],
+            sa.select(
+                sa.literal(concurrency_limit.id, UUIDType),
+                next_slot_number.c.slot_number,
+                sa.literal(task_run_id, UUIDType),
+                sa.literal(expires, Timestamp),
+            ).where(
+                next_slot_number.c.slot_number < concurrency_limit.concurrency_limit
+            ),
+        )
+        .on_conflict_do_nothing()
+    )
+
+    can_add_slot = sa.select(
+        sa.and_(
+            next_slot_number.c.slot_number < concurrency_limit.concurrency_limit,
+            sa.not_(over_limit),
+        )
+    )
+
+    while True:
+        result = await session.execute(
+            sa.update(slot)
+            .where(slot.id == available_slot)
+            .values(task_run_id=task_run_id, expires=expires)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount > 0:
+            return True
+
+        # every slot is held, so add a slot if the limit allows it; if another
+        # transition adds the same slot first, look for an available slot again
+        if not (await session.execute(can_add_slot)).scalar():
+            return False
+
+        result = await session.execute(new_slot)
+        if result.rowcount > 0:
+            return True
+
+
+@inject_db
+async def concurrency_limit_has_available_slots(
+    session: sa.orm.Session,
+    tag: str,
+    db: PrefectDBInterface,
+) -> bool:
+    """
+    Checks whether a task run with the given tag could secure a slot on its
+    concurrency limit. Tags without a concurrency limit always have available slots.
+    """
+    now = pendulum.now("UTC")
+    slot = db.ConcurrencyLimitSlot
+    held_slots = (
+        sa.select(sa.func.count(slot.id))
+        .where(
+            slot.concurrency_limit_id == db.ConcurrencyLimit.id,
+            slot.task_run_id.is_not(None),
+            sa.or_(slot.expires.is_(None), slot.expires > now),
+        )
+        .scalar_subquery()
+    )
+    query = sa.select(db.ConcurrencyLimit.concurrency_limit, held_slots).where(
+        db.ConcurrencyLimit.tag == tag
+    )
+
+    result = (await session.execute(query)).first()
+    if result is None:
+        return True
+    concurrency_limit, held = result
+    return held < concurrency_limit
+
+
+@inject_db
+async def release_concurrency_limit_slots(
+    session: sa.orm.Session,
+    task_run_id: UUID,
+    db: PrefectDBInterface,
+    tags: Optional[List[str]] = None,
+) -> int:
+    """
+    Releases the concurrency slots held by a task run.
+
+    Args:
+        session: A database session
+        task_run_id: the task run id to release slots for
+        tags: if provided, only slots on the concurrency limits for these tags are
+            released
+
+    Returns:
+        int: the number of slots released
+    """
+    slot = db.ConcurrencyLimitSlot
+    query = (
+        sa.update(slot)
+        .where(slot.task_run_id == task_run_id)
+        .values(task_run_id=None, expires=None)
+        .execution_options(synchronize_session=False)
+    )
+    if tags is not None:
+        query = query.where(
+            slot.concurrency_limit_id.in_(
+                sa.select(db.ConcurrencyLimit.id).where(
+                    db.ConcurrencyLimit.tag.in_(tags)
+                )
+            )
+        )
+
+    result = await session.execute(query)
+    return result.rowcount
+
+
 @inject_db
 async def delete_concurrency_limit(
     session: sa.orm.Session,
@@ -178,7 +388,11 @@ async def read_concurrency_limits(
         List[db.ConcurrencyLimit]: concurrency limits
     """
 
-    query = sa.select(db.ConcurrencyLimit).order_by(db.ConcurrencyLimit.tag)
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .order_by(db.ConcurrencyLimit.tag)
+        .execution_options(populate_existing=True)
+    )
 
     if offset is not None:
         query = query.offset(offset)
@@ -16,6 +16,9 @@ from prefect.server.api.workers import WorkerLookups
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
+from prefect.server.orchestration.scheduled_flow_run_waiters import (
+    get_scheduled_flow_run_waiters,
+)
 from prefect.server.utilities.database import json_contains
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
@@ -649,6 +652,12 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+        # wake workers waiting for runs in the work queues of the new runs
+        get_scheduled_flow_run_waiters().notify_after_commit(
+            session,
+            (r["work_queue_id"] for r in runs if r["id"] in inserted_flow_run_ids),
+        )
+
     return inserted_flow_run_ids
 
 
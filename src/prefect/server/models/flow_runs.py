@@ -413,6 +413,24 @@ async def delete_flow_run(
     Returns:
         bool: whether or not the flow run was deleted
     """
+    await models.run_history_rollups.remove_flow_run_from_run_history_rollups(
+        session=session, flow_run_id=flow_run_id
+    )
+
+    # stop counting an active flow run against its work queue and work pool
+    result = await session.execute(
+        sa.select(
+            db.FlowRun.work_queue_id, db.FlowRun.work_queue_name, db.FlowRun.state_type
+        ).where(db.FlowRun.id == flow_run_id)
+    )
+    flow_run = result.first()
+    if (
+        flow_run is not None
+        and flow_run.state_type in models.work_queues.ACTIVE_FLOW_RUN_STATE_TYPES
+    ):
+        await models.work_queues.update_active_run_counts(
+            session=session, flow_run=flow_run, delta=-1
+        )
 
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
@@ -3,29 +3,19 @@ Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 from typing import List
+from uuid import uuid4
 
+import pendulum
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.utilities.collections import batched_iterable
 
-# We have a limit of 32,767 parameters at a time for a single query...
+# We have a limit of 32,767 parameters at a time for a single query
 MAXIMUM_QUERY_PARAMETERS = 32_767
 
-# ...and logs have a certain number of fields...
-NUMBER_OF_LOG_FIELDS = len(schemas.core.Log.schema()["properties"])
-
-# ...so we can only INSERT batches of a certain size at a time
-LOG_BATCH_SIZE = MAXIMUM_QUERY_PARAMETERS // NUMBER_OF_LOG_FIELDS
-
-
-def split_logs_into_batches(logs):
-    for batch in batched_iterable(logs, LOG_BATCH_SIZE):
-        yield batch
-
 
 @inject_db
 async def create_logs(
@@ -34,6 +24,9 @@ async def create_logs(
     """
     Creates new logs
 
+    The logs are inserted with a single database-specific bulk statement, so they do
+    not need to be split into batches.
+
     Args:
         session: a database session
         logs: a list of log schemas
@@ -41,8 +34,17 @@ async def create_logs(
     Returns:
         None
     """
-    log_insert = await db.insert(db.Log)
-    await session.execute(log_insert.values([log.dict() for log in logs]))
+    now = pendulum.now("UTC")
+    rows = []
+    for log in logs:
+        row = log.dict(shallow=True)
+        # Bulk inserts must provide every column so defaults are populated here
+        row["id"] = row.get("id") or uuid4()
+        row["created"] = row.get("created") or now
+        row["updated"] = row.get("updated") or now
+        rows.append(row)
+
+    await db.insert_logs(session=session, logs=rows)
 
 
 @inject_db
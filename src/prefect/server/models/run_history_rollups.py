@@ -0,0 +1,246 @@
+"""
+Functions for interacting with run history rollup ORM objects.
+Intended for internal use by the Prefect REST API.
+
+Run history rollups record the contribution of flow and task runs in a final state to
+the run history, aggregated by the minute each run was expected to start. Only final
+states are rolled up, because the estimated run time and lateness of other runs change
+as time passes.
+"""
+
+import datetime
+import itertools
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import Literal
+
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas.states import TERMINAL_STATES
+
+# the size of the buckets runs are rolled up into
+ROLLUP_INTERVAL = datetime.timedelta(minutes=1)
+
+# the columns rows are rolled up by
+ROLLUP_DIMENSIONS = (
+    "run_type",
+    "interval_start",
+    "flow_id",
+    "deployment_id",
+    "work_queue_id",
+    "state_type",
+    "state_name",
+)
+
+# the columns summed when rows are rolled up
+ROLLUP_VALUES = ("count_runs", "sum_estimated_run_time", "sum_estimated_lateness")
+
+
+def run_history_rollup_values(run) -> Optional[Dict]:
+    """
+    Returns the contribution of a run in a final state to the run history, or `None`
+    if the run does not contribute to the run history rollups.
+
+    Args:
+        run: a flow run or task run ORM model
+
+    Returns:
+        Optional[Dict]: the run's rollup bucket, state, and estimated run time and
+            lateness in seconds
+    """
+    if run.state_type not in TERMINAL_STATES or run.expected_start_time is None:
+        return None
+
+    expected_start_time = pendulum.instance(run.expected_start_time).in_timezone("UTC")
+    if run.start_time and run.start_time > run.expected_start_time:
+        lateness = (run.start_time - run.expected_start_time).total_seconds()
+    else:
+        lateness = 0
+
+    return dict(
+        interval_start=expected_start_time.start_of("minute"),
+        state_type=run.state_type,
+        state_name=run.state_name,
+        count_runs=1,
+        sum_estimated_run_time=max(0, run.total_run_time.total_seconds()),
+        sum_estimated_lateness=lateness,
+    )
+
+
+@inject_db
+async def add_to_run_history_rollups(
+    session: AsyncSession,
+    run_type: Literal["flow_run", "task_run"],
+    flow_run_id: UUID,
+    values: Dict,
+    db: PrefectDBInterface,
+    sign: int = 1,
+) -> None:
+    """
+    Records a run entering (or, with a `sign` of `-1`, leaving) a final state in the
+    run history rollups.
+
+    Args:
+        session: a database session
+        run_type: the type of run
+        flow_run_id: the id of the flow run, or the task run's flow run, whose flow,
+            deployment and work queue the run is rolled up by
+        values: the run's contribution, from `run_history_rollup_values`
+        sign: `1` if the run is entering a final state, `-1` if it is leaving one
+    """
+    rollup = db.RunHistoryRollup
+    columns = {
+        "run_type": run_type,
+        "interval_start": values["interval_start"],
+        "state_type": values["state_type"],
+        "state_name": values["state_name"],
+        **{name: sign * values[name] for name in ROLLUP_VALUES},
+    }
+
+    # read the flow, deployment and work queue from the flow run in the same statement
+    select = sa.select(
+        *[
+            sa.literal(value, type_=rollup.__table__.c[name].type)
+            for name, value in columns.items()
+        ],
+        db.FlowRun.flow_id,
+        db.FlowRun.deployment_id,
+        db.FlowRun.work_queue_id,
+    ).where(db.FlowRun.id == flow_run_id)
+
+    await session.execute(
+        sa.insert(rollup).from_select(
+            [*columns, "flow_id", "deployment_id", "work_queue_id"],
+            select,
+            include_defaults=False,
+        )
+    )
+
+
+@inject_db
+async def remove_flow_run_from_run_history_rollups(
+    session: AsyncSession, flow_run_id: UUID, db: PrefectDBInterface
+) -> None:
+    """
+    Removes a flow run and its task runs from the run history rollups, before they
+    are deleted.
+
+    Args:
+        session: a database session
+        flow_run_id: the id of the flow run
+    """
+    flow_run = await session.get(db.FlowRun, flow_run_id)
+    if flow_run is None:
+        return
+
+    rows = []
+    values = run_history_rollup_values(flow_run)
+    if values:
+        rows.append(dict(run_type="flow_run", **values))
+
+    task_runs = await session.execute(
+        sa.select(
+            db.TaskRun.state_type,
+            db.TaskRun.state_name,
+            db.TaskRun.expected_start_time,
+            db.TaskRun.start_time,
+            db.TaskRun.total_run_time,
+        ).where(
+            db.TaskRun.flow_run_id == flow_run_id,
+            db.TaskRun.state_type.in_(TERMINAL_STATES),
+        )
+    )
+    for task_run in task_runs:
+        values = run_history_rollup_values(task_run)
+        if values:
+            rows.append(dict(run_type="task_run", **values))
+
+    rows = _merge_rollup_rows(
+        dict(
+            flow_id=flow_run.flow_id,
+            deployment_id=flow_run.deployment_id,
+            work_queue_id=flow_run.work_queue_id,
+            **row,
+        )
+        for row in rows
+    )
+    if rows:
+        await session.execute(
+            sa.insert(db.RunHistoryRollup),
+            [{**row, **{name: -row[name] for name in ROLLUP_VALUES}} for row in rows],
+        )
+
+
+@inject_db
+async def compact_run_history_rollups(
+    session: AsyncSession, db: PrefectDBInterface, limit: int = 10000
+) -> int:
+    """
+    Merges run history rollup rows with the same dimensions into a single row.
+
+    Args:
+        session: a database session
+        limit: the maximum number of rows to merge
+
+    Returns:
+        int: the number of rows removed by merging
+    """
+    rollup = db.RunHistoryRollup
+    dimensions = [getattr(rollup, name) for name in ROLLUP_DIMENSIONS]
+
+    # find rows that share their dimensions with another row
+    rows = (
+        sa.select(
+            rollup,
+            sa.func.count().over(partition_by=dimensions).label("rows_with_dimensions"),
+        )
+    ).subquery()
+    query = (
+        sa.select(rows)
+        .where(rows.c.rows_with_dimensions > 1)
+        .order_by(*[rows.c[name] for name in ROLLUP_DIMENSIONS])
+        .limit(limit)
+    )
+    result = await session.execute(query)
+    rows = [row._mapping for row in result]
+    if not rows:
+        return 0
+
+    merged = _merge_rollup_rows(rows)
+
+    # rows are only ever inserted or merged, so if any of the rows cannot be
+    # deleted, they have been merged concurrently and this merge must not be applied
+    ids = [row["id"] for row in rows]
+    result = await session.execute(sa.delete(rollup).where(rollup.id.in_(ids)))
+    if result.rowcount != len(ids):
+        raise RuntimeError("Run history rollups were merged concurrently.")
+
+    # runs that have left a final state cancel out, leaving nothing to record
+    merged = [row for row in merged if row["count_runs"] != 0]
+    if merged:
+        await session.execute(sa.insert(rollup), merged)
+
+    return len(rows) - len(merged)
+
+
+def _merge_rollup_rows(rows) -> List[Dict]:
+    """
+    Sums the values of rollup rows with the same dimensions.
+    """
+    key = lambda row: tuple(
+        (row[name] is None, str(row[name])) for name in ROLLUP_DIMENSIONS
+    )
+    merged = []
+    for _, group in itertools.groupby(sorted(rows, key=key), key=key):
+        group = list(group)
+        merged.append(
+            {
+                **{name: group[0][name] for name in ROLLUP_DIMENSIONS},
+                **{name: sum(row[name] for row in group) for name in ROLLUP_VALUES},
+            }
+        )
+    return merged
@@ -0,0 +1,253 @@
+"""
+Functions for interacting with task run state cache ORM objects.
+Intended for internal use by the Prefect REST API.
+
+Completed task run states with a cache key are recorded in the task run state cache.
+When a task run with the same cache key proposes a `Running` state, the latest
+unexpired state recorded for the key is returned instead.
+
+If `PREFECT_API_TASK_CACHE_SIZE` is set, recently used entries are also kept in
+memory, so that most cached task runs are resolved without reading the database.
+Entries are remembered once the transaction that records or reads them commits.
+Because the memory is per process, a state cached by another server process is only
+seen here once the entry remembered by this process expires or is evicted, and a state
+remembered here is still returned after its task run is deleted. It is therefore off
+by default and unsafe for multiple server replicas sharing a database.
+"""
+
+import datetime
+import threading
+from typing import Dict, List, Optional
+
+import pendulum
+import sqlalchemy as sa
+from cachetools import LRUCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import schemas
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.settings import PREFECT_API_TASK_CACHE_SIZE
+
+# recently used cache entries, by cache key, as (cache expiration, cached state)
+# the cache is replaced when `PREFECT_API_TASK_CACHE_SIZE` changes
+_RECENT_ENTRIES = LRUCache(maxsize=PREFECT_API_TASK_CACHE_SIZE.value() or 1)
+_RECENT_ENTRIES_LOCK = threading.Lock()
+
+
+@inject_db
+async def cache_state(
+    session: AsyncSession,
+    cache_key: str,
+    cache_expiration: Optional[datetime.datetime],
+    state: schemas.states.State,
+    db: PrefectDBInterface,
+) -> None:
+    """
+    Records a completed task run state in the task run state cache.
+
+    Args:
+        session: a database session
+        cache_key: the cache key of the state
+        cache_expiration: the time the cache entry expires, if any
+        state: the validated task run state to cache
+    """
+    session.add(
+        db.TaskRunStateCache(
+            cache_key=cache_key,
+            cache_expiration=cache_expiration,
+            task_run_state_id=state.id,
+        )
+    )
+    _remember_after_commit(session, cache_key, cache_expiration, state)
+
+
+async def read_cached_state(
+    session: AsyncSession,
+    cache_key: str,
+) -> Optional[schemas.states.State]:
+    """
+    Reads the latest unexpired state cached with a cache key.
+
+    Args:
+        session: a database session
+        cache_key: the cache key
+
+    Returns:
+        Optional[schemas.states.State]: the cached state, or `None` if there is no
+            unexpired state cached with the key
+    """
+    cached_states = await read_cached_states(session=session, cache_keys=[cache_key])
+    return cached_states.get(cache_key)
+
+
+@inject_db
+async def read_cached_states(
+    session: AsyncSession,
+    cache_keys: List[str],
+    db: PrefectDBInterface,
+) -> Dict[str, schemas.states.State]:
+    """
+    Reads the latest unexpired state cached with each of a list of cache keys.
+
+    Args:
+        session: a database session
+        cache_keys: the cache keys
+
+    Returns:
+        Dict[str, schemas.states.State]: the cached states by cache key; keys with
+            no unexpired cached state are omitted
+    """
+    now = pendulum.now("utc")
+    cached_states = {}
+
+    if PREFECT_API_TASK_CACHE_SIZE.value() > 0:
+        with _RECENT_ENTRIES_LOCK:
+            for cache_key in cache_keys:
+                entry = _RECENT_ENTRIES.get(cache_key)
+                if entry is None:
+                    continue
+                if _is_expired(entry[0], now):
+                    del _RECENT_ENTRIES[cache_key]
+                else:
+                    cached_states[cache_key] = entry[1]
+
+    missing_keys = {key for key in cache_keys if key not in cached_states}
+    if not missing_keys:
+        return cached_states
+
+    # read the entries and their states in one statement; the cache key index covers
+    # the columns of the cache table that are read
+    unexpired = sa.or_(
+        db.TaskRunStateCache.cache_expiration.is_(None),
+        db.TaskRunStateCache.cache_expiration > now,
+    )
+    if len(missing_keys) == 1:
+        query = (
+            sa.select(
+                db.TaskRunState,
+                db.TaskRunStateCache.cache_key,
+                db.TaskRunStateCache.cache_expiration,
+            )
+            .join(
+                db.TaskRunStateCache,
+                db.TaskRunStateCache.task_run_state_id == db.TaskRunState.id,
+            )
+            .where(db.TaskRunStateCache.cache_key.in_(missing_keys), unexpired)
+            .order_by(db.TaskRunStateCache.created.desc())
+            .limit(1)
+        )
+    else:
+        # rank the entries of each key so only the latest entry per key, and its
+        # state, is read
+        latest_entries = (
+            sa.select(
+                db.TaskRunStateCache.task_run_state_id,
+                db.TaskRunStateCache.cache_key,
+                db.TaskRunStateCache.cache_expiration,
+                sa.func.row_number()
+                .over(
+                    partition_by=db.TaskRunStateCache.cache_key,
+                    order_by=db.TaskRunStateCache.created.desc(),
+                )
+                .label("rank"),
+            )
+            .where(db.TaskRunStateCache.cache_key.in_(missing_keys), unexpired)
+            .subquery()
+        )
+        query = (
+            sa.select(
+                db.TaskRunState,
+                latest_entries.c.cache_key,
+                latest_entries.c.cache_expiration,
+            )
+            .join(
+                latest_entries,
+                latest_entries.c.task_run_state_id == db.TaskRunState.id,
+            )
+            .where(latest_entries.c.rank == 1)
+        )
+
+    for orm_state, cache_key, cache_expiration in await session.execute(query):
+        state = orm_state.as_state()
+        cached_states[cache_key] = state
+        _remember_after_commit(session, cache_key, cache_expiration, state)
+
+    return cached_states
+
+
+@inject_db
+async def delete_expired_cache_entries(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    limit: int = 10000,
+) -> int:
+    """
+    Deletes expired entries from the task run state cache.
+
+    Args:
+        session: a database session
+        limit: the maximum number of entries to delete
+
+    Returns:
+        int: the number of entries deleted
+    """
+    expired = (
+        sa.select(db.TaskRunStateCache.id)
+        .where(db.TaskRunStateCache.cache_expiration <= pendulum.now("utc"))
+        .limit(limit)
+    )
+    result = await session.execute(
+        sa.delete(db.TaskRunStateCache)
+        .where(db.TaskRunStateCache.id.in_(expired))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def clear_recent_cache_entries() -> None:
+    """
+    Forgets the task run state cache entries held in memory.
+    """
+    with _RECENT_ENTRIES_LOCK:
+        _RECENT_ENTRIES.clear()
+
+
+def _remember_after_commit(
+    session: AsyncSession,
+    cache_key: str,
+    cache_expiration: Optional[datetime.datetime],
+    state: schemas.states.State,
+) -> None:
+    """
+    Keeps a cache entry in memory once the session's transaction commits.
+    """
+    size = PREFECT_API_TASK_CACHE_SIZE.value()
+    if size <= 0:
+        return
+
+    pending = True
+
+    def remember(_):
+        global _RECENT_ENTRIES
+
+        if not pending:
+            return
+
+        with _RECENT_ENTRIES_LOCK:
+            if _RECENT_ENTRIES.maxsize != size:
+                _RECENT_ENTRIES = LRUCache(maxsize=size)
+            _RECENT_ENTRIES[cache_key] = (cache_expiration, state)
+
+    def discard(*_):
+        nonlocal pending
+        pending = False
+
+    sa.event.listen(session.sync_session, "after_commit", remember, once=True)
+    sa.event.listen(session.sync_session, "after_soft_rollback", discard, once=True)
+
+
+def _is_expired(
+    cache_expiration: Optional[datetime.datetime], now: datetime.datetime
+) -> bool:
+    return cache_expiration is not None and cache_expiration <= now
@@ -4,6 +4,8 @@ Intended for internal use by the Prefect REST API.
 """
 
 import contextlib
+from collections import defaultdict
+from typing import List
 from uuid import UUID
 
 import pendulum
@@ -21,6 +23,7 @@ from prefect.server.orchestration.global_policy import GlobalTaskPolicy
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import TaskOrchestrationContext
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.utilities.collections import batched_iterable
 
 
 @inject_db
@@ -88,6 +91,99 @@ async def create_task_run(
     return model
 
 
+@inject_db
+async def create_task_runs(
+    session: sa.orm.Session,
+    task_runs: List[schemas.core.TaskRun],
+    db: PrefectDBInterface,
+    orchestration_parameters: dict = None,
+):
+    """
+    Creates many task runs at once.
+
+    Behaves like `create_task_run` for each task run, but inserts all of the task runs
+    with as few statements as possible. If a task run with the same flow_run_id,
+    task_key, and dynamic_key already exists, the existing task run will be returned
+    in its place.
+
+    Args:
+        session: a database session
+        task_runs: a list of task run models
+
+    Returns:
+        List[db.TaskRun]: the newly-created or existing task runs, in the order of
+            the provided task run models
+    """
+    if not task_runs:
+        return []
+
+    now = pendulum.now("UTC")
+
+    # A multi-row insert requires every row to provide the same columns; task runs
+    # created by the same client will generally all fall into a single group
+    rows_by_columns = defaultdict(list)
+    for task_run in task_runs:
+        row = dict(
+            created=now,
+            **task_run.dict(
+                shallow=True, exclude={"state", "created"}, exclude_unset=True
+            ),
+        )
+        rows_by_columns[frozenset(row)].append(row)
+
+    for columns, rows in rows_by_columns.items():
+        batch_size = models.logs.MAXIMUM_QUERY_PARAMETERS // len(columns)
+        for batch in batched_iterable(rows, batch_size):
+            insert_stmt = (
+                (await db.insert(db.TaskRun))
+                .values(list(batch))
+                .on_conflict_do_nothing(
+                    index_elements=db.task_run_unique_upsert_columns,
+                )
+            )
+            await session.execute(insert_stmt)
+
+    # Deduplicate the unique keys while retaining the order they were provided in
+    task_runs_by_key = {}
+    for task_run in task_runs:
+        key = (task_run.flow_run_id, task_run.task_key, task_run.dynamic_key)
+        task_runs_by_key.setdefault(key, task_run)
+
+    models_by_key = {}
+    unique_columns = sa.tuple_(
+        db.TaskRun.flow_run_id, db.TaskRun.task_key, db.TaskRun.dynamic_key
+    )
+    for batch in batched_iterable(
+        task_runs_by_key, models.logs.MAXIMUM_QUERY_PARAMETERS // 3
+    ):
+        query = (
+            sa.select(db.TaskRun)
+            .where(unique_columns.in_(batch))
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(query)
+        for model in result.scalars():
+            models_by_key[(model.flow_run_id, model.task_key, model.dynamic_key)] = (
+                model
+            )
+
+    for key, task_run in task_runs_by_key.items():
+        model = models_by_key[key]
+        if model.created == now and task_run.state:
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=model.id,
+                state=task_run.state,
+                force=True,
+                orchestration_parameters=orchestration_parameters,
+            )
+
+    return [
+        models_by_key[(task_run.flow_run_id, task_run.task_key, task_run.dynamic_key)]
+        for task_run in task_runs
+    ]
+
+
 @inject_db
 async def update_task_run(
     session: AsyncSession,
@@ -298,6 +394,18 @@ async def delete_task_run(
     Returns:
         bool: whether or not the task run was deleted
     """
+    # remove a task run in a final state from the run history
+    task_run = await session.get(db.TaskRun, task_run_id)
+    if task_run is not None:
+        values = models.run_history_rollups.run_history_rollup_values(task_run)
+        if values:
+            await models.run_history_rollups.add_to_run_history_rollups(
+                session=session,
+                run_type="task_run",
+                flow_run_id=task_run.flow_run_id,
+                values=values,
+                sign=-1,
+            )
 
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
@@ -19,6 +19,13 @@ from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.workers import DEFAULT_AGENT_WORK_POOL_NAME
 from prefect.server.schemas.states import StateType
 
+# flow runs in these states occupy a slot on their work queue and work pool
+ACTIVE_FLOW_RUN_STATE_TYPES = (
+    StateType.PENDING,
+    StateType.RUNNING,
+    StateType.CANCELLING,
+)
+
 
 @inject_db
 async def create_work_queue(
@@ -414,3 +421,112 @@ async def read_work_queue_status(
         last_polled=work_queue.last_polled,
         health_check_policy=health_check_policy,
     )
+
+
+def _work_queues_of_flow_run_clause(flow_run, db: PrefectDBInterface):
+    """
+    Where clause selecting the work queues a flow run is counted against: the queue
+    with its work queue id, or every queue with its work queue name if it has no work
+    queue id.
+    """
+    if flow_run.work_queue_id is not None:
+        return db.WorkQueue.id == flow_run.work_queue_id
+    if flow_run.work_queue_name is not None:
+        return db.WorkQueue.name == flow_run.work_queue_name
+    return None
+
+
+@inject_db
+async def update_active_run_counts(
+    session: AsyncSession,
+    flow_run: "PrefectDBInterface.FlowRun",
+    delta: int,
+    db: PrefectDBInterface,
+) -> None:
+    """
+    Adjusts the number of active runs counted against a flow run's work queue and
+    work pool.
+
+    Args:
+        session (AsyncSession): A database session
+        flow_run: the flow run entering or leaving an active state
+        delta (int): the change in the number of active runs
+    """
+    work_queue_clause = _work_queues_of_flow_run_clause(flow_run, db=db)
+    if work_queue_clause is None:
+        return
+
+    await session.execute(
+        sa.update(db.WorkQueue)
+        .where(work_queue_clause)
+        .values(
+            active_run_count=db.WorkQueue.active_run_count + delta,
+            # counting runs is not an update to the work queue itself
+            updated=db.WorkQueue.updated,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(
+        sa.update(db.WorkPool)
+        .where(
+            db.WorkPool.id.in_(
+                sa.select(db.WorkQueue.work_pool_id).where(work_queue_clause)
+            )
+        )
+        .values(
+            active_run_count=db.WorkPool.active_run_count + delta,
+            updated=db.WorkPool.updated,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+@inject_db
+async def reconcile_active_run_counts(
+    session: AsyncSession, db: PrefectDBInterface
+) -> int:
+    """
+    Recounts the active runs in every work queue and work pool, correcting counts
+    that have drifted from the flow runs they count, for example because a flow run
+    was moved between work queues while active.
+
+    Args:
+        session (AsyncSession): A database session
+
+    Returns:
+        int: the number of work queues and work pools whose counts were corrected
+    """
+    active_runs = (
+        sa.select(sa.func.count(db.FlowRun.id))
+        .where(
+            db.FlowRun.state_type.in_(ACTIVE_FLOW_RUN_STATE_TYPES),
+            sa.or_(
+                db.FlowRun.work_queue_id == db.WorkQueue.id,
+                sa.and_(
+                    db.FlowRun.work_queue_id.is_(None),
+                    db.FlowRun.work_queue_name == db.WorkQueue.name,
+                ),
+            ),
+        )
+        .scalar_subquery()
+    )
+    work_queues_result = await session.execute(
+        sa.update(db.WorkQueue)
+        .where(db.WorkQueue.active_run_count != active_runs)
+        .values(active_run_count=active_runs, updated=db.WorkQueue.updated)
+        .execution_options(synchronize_session=False)
+    )
+
+    pool_active_runs = (
+        sa.select(sa.func.coalesce(sa.func.sum(db.WorkQueue.active_run_count), 0))
+        .where(db.WorkQueue.work_pool_id == db.WorkPool.id)
+        .scalar_subquery()
+    )
+    work_pools_result = await session.execute(
+        sa.update(db.WorkPool)
+        .where(db.WorkPool.active_run_count != pool_active_runs)
+        .values(active_run_count=pool_active_runs, updated=db.WorkPool.updated)
+        .execution_options(synchronize_session=False)
+    )
+
+    return work_queues_result.rowcount + work_pools_result.rowcount
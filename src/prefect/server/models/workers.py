@@ -16,7 +16,8 @@ from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.database.orm_models import ORMWorker, ORMWorkPool, ORMWorkQueue
 
-DEFAULT_AGENT_WORK_POOL_NAME = "default-agent-pool"
+# Re-exported for compatibility; the name is defined with the core schemas
+from prefect.server.schemas.core import DEFAULT_AGENT_WORK_POOL_NAME  # noqa: F401
 
 # -----------------------------------------------------
 # --
@@ -231,6 +232,35 @@ async def get_scheduled_flow_runs(
     )
 
 
+@inject_db
+async def read_next_scheduled_start_time(
+    session: AsyncSession,
+    work_queue_ids: List[UUID],
+    scheduled_after: datetime.datetime,
+    db: PrefectDBInterface,
+) -> Optional[datetime.datetime]:
+    """
+    Get the earliest time a run in the given work queues is scheduled to start after
+    a given time.
+
+    Args:
+        session (AsyncSession): a database session
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_after (datetime.datetime): the time after which to look for runs
+
+    Returns:
+        Optional[datetime.datetime]: the earliest scheduled start time, or `None` if no
+            runs are scheduled after the given time
+    """
+    query = sa.select(sa.func.min(db.FlowRun.next_scheduled_start_time)).where(
+        db.FlowRun.work_queue_id.in_(work_queue_ids),
+        db.FlowRun.state_type == schemas.states.StateType.SCHEDULED,
+        db.FlowRun.next_scheduled_start_time > scheduled_after,
+    )
+    result = await session.execute(query)
+    return result.scalar()
+
+
 # -----------------------------------------------------
 # --
 # --
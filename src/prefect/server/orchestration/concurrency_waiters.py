@@ -0,0 +1,141 @@
+"""
+Wakes task runs waiting for a slot on a tag concurrency limit when slots are released.
+
+When a tag concurrency limit is full, `SecureTaskConcurrencySlots` instructs the client
+to wait. Clients wait by long-polling `POST /concurrency_limits/tag/{tag}/wait`, which
+returns as soon as a slot on the tag is released by this server instead of after the
+full delay. Waiters are woken in the order they began waiting, one per released slot.
+
+Waiters are held in memory, so only releases made by the same server process wake
+them; otherwise the wait lasts until its timeout, as if the client had slept.
+"""
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+import sqlalchemy as sa
+
+
+class ConcurrencySlotWaiters:
+    """
+    Task runs waiting for a slot on a tag concurrency limit, grouped by tag in the
+    order they began waiting.
+
+    Waiters may wait from any event loop; they are woken on the loop they are waiting
+    on.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tag: str) -> asyncio.Future:
+        """
+        Adds a waiter for a tag, returning a future that is resolved when it is woken.
+        """
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._waiters.setdefault(tag, deque()).append(future)
+        return future
+
+    def unregister(self, tag: str, future: asyncio.Future) -> None:
+        """
+        Removes a waiter for a tag that has not been woken.
+        """
+        with self._lock:
+            waiters = self._waiters.get(tag)
+            if waiters is None:
+                return
+            try:
+                waiters.remove(future)
+            except ValueError:
+                pass
+            if not waiters:
+                del self._waiters[tag]
+
+    async def wait(self, future: asyncio.Future, timeout: float) -> bool:
+        """
+        Waits for a registered waiter to be woken.
+
+        Returns:
+            bool: whether or not the waiter was woken before the timeout
+        """
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def notify(self, tag: str, count: Optional[int] = 1) -> int:
+        """
+        Wakes the longest waiting waiters for a tag.
+
+        Args:
+            tag: the tag with released slots
+            count: the number of waiters to wake; if `None`, all waiters are woken
+
+        Returns:
+            int: the number of waiters woken
+        """
+        woken = 0
+        with self._lock:
+            waiters = self._waiters.get(tag)
+            while waiters and (count is None or woken < count):
+                future = waiters.popleft()
+                if future.done():
+                    # the waiter has already timed out or been cancelled
+                    continue
+                future.get_loop().call_soon_threadsafe(_resolve, future)
+                woken += 1
+            if waiters is not None and not waiters:
+                del self._waiters[tag]
+        return woken
+
+    def notify_after_commit(
+        self,
+        session: sa.orm.Session,
+        tags: Iterable[str],
+        count: Optional[int] = 1,
+    ) -> None:
+        """
+        Wakes waiters for the given tags once the session's transaction commits, so
+        that woken waiters see the released slots. Nothing is woken if the
+        transaction is rolled back.
+        """
+        tags = list(tags)
+        if not tags:
+            return
+
+        pending = True
+
+        def wake_waiters(_):
+            if pending:
+                for tag in tags:
+                    self.notify(tag, count=count)
+
+        def discard(*_):
+            nonlocal pending
+            pending = False
+
+        sa.event.listen(session.sync_session, "after_commit", wake_waiters, once=True)
+        sa.event.listen(session.sync_session, "after_soft_rollback", discard, once=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
+_CONCURRENCY_SLOT_WAITERS = ConcurrencySlotWaiters()
+
+
+def get_concurrency_slot_waiters() -> ConcurrencySlotWaiters:
+    """
+    Returns the waiters for tag concurrency slots in this server process.
+    """
+    return _CONCURRENCY_SLOT_WAITERS
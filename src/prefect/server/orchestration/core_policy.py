@@ -9,15 +9,14 @@ from typing import Optional
 from uuid import uuid4
 
 import pendulum
-import sqlalchemy as sa
 from packaging.version import Version
-from sqlalchemy import select
 
 from prefect.server import models
-from prefect.server.database.dependencies import inject_db
-from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models import concurrency_limits
+from prefect.server.orchestration.concurrency_waiters import (
+    get_concurrency_slot_waiters,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
@@ -30,6 +29,7 @@ from prefect.server.orchestration.rules import (
 )
 from prefect.server.schemas import core, filters, states
 from prefect.server.schemas.states import StateType
+from prefect.settings import PREFECT_API_TASK_RUN_TAG_CONCURRENCY_SLOT_LEASE_SECONDS
 from prefect.utilities.math import clamped_poisson_interval
 
 
@@ -91,9 +91,10 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
     This rule checks if concurrency limits have been set on the tags associated with a
     TaskRun. If so, a concurrency slot will be secured against each concurrency limit
     before being allowed to transition into a running state. If a concurrency limit has
-    been reached, the client will be instructed to delay the transition for 30 seconds
-    before trying again. If the concurrency limit set on a tag is 0, the transition will
-    be aborted to prevent deadlocks.
+    been reached, the client will be instructed to delay the transition for up to 30
+    seconds before trying again; clients may retry as soon as a slot on the tag is
+    released. If the concurrency limit set on a tag is 0, the transition will be aborted
+    to prevent deadlocks.
     """
 
     FROM_STATES = ALL_ORCHESTRATION_STATES
@@ -111,41 +112,36 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
                 context.session, tags=context.run.tags
             )
         )
-        run_limits = {limit.tag: limit for limit in filtered_limits}
-        for tag, cl in run_limits.items():
-            limit = cl.concurrency_limit
-            if limit == 0:
+        lease_seconds = PREFECT_API_TASK_RUN_TAG_CONCURRENCY_SLOT_LEASE_SECONDS.value()
+        for cl in filtered_limits:
+            if cl.concurrency_limit == 0:
                 # limits of 0 will deadlock, and the transition needs to abort
-                for stale_tag in self._applied_limits:
-                    stale_limit = run_limits.get(stale_tag, None)
-                    active_slots = set(stale_limit.active_slots)
-                    active_slots.discard(str(context.run.id))
-                    stale_limit.active_slots = list(active_slots)
-
+                await self._release_applied_limits(context)
                 await self.abort_transition(
                     reason=(
-                        f'The concurrency limit on tag "{tag}" is 0 and will deadlock'
-                        " if the task tries to run again."
+                        f'The concurrency limit on tag "{cl.tag}" is 0 and will'
+                        " deadlock if the task tries to run again."
                     ),
                 )
-            elif len(cl.active_slots) >= limit:
+                return
+            elif await concurrency_limits.acquire_concurrency_limit_slot(
+                context.session,
+                concurrency_limit=cl,
+                task_run_id=context.run.id,
+                lease_seconds=lease_seconds,
+            ):
+                self._applied_limits.append(cl.tag)
+            else:
                 # if the limit has already been reached, delay the transition
-                for stale_tag in self._applied_limits:
-                    stale_limit = run_limits.get(stale_tag, None)
-                    active_slots = set(stale_limit.active_slots)
-                    active_slots.discard(str(context.run.id))
-                    stale_limit.active_slots = list(active_slots)
-
+                await self._release_applied_limits(context)
                 await self.delay_transition(
                     30,
-                    f"Concurrency limit for the {tag} tag has been reached",
+                    f"Concurrency limit for the {cl.tag} tag has been reached",
                 )
-            else:
-                # log the TaskRun ID to active_slots
-                self._applied_limits.append(tag)
-                active_slots = set(cl.active_slots)
-                active_slots.add(str(context.run.id))
-                cl.active_slots = list(active_slots)
+                # allow the client to wait for a slot on the tag to be released
+                # instead of waiting for the full delay
+                self.context.response_details.concurrency_limit_tag = cl.tag
+                return
 
     async def cleanup(
         self,
@@ -153,13 +149,17 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
         validated_state: Optional[states.State],
         context: OrchestrationContext,
     ) -> None:
-        for tag in self._applied_limits:
-            cl = await concurrency_limits.read_concurrency_limit_by_tag(
-                context.session, tag
+        await self._release_applied_limits(context)
+
+    async def _release_applied_limits(self, context: OrchestrationContext) -> None:
+        if self._applied_limits:
+            await concurrency_limits.release_concurrency_limit_slots(
+                context.session, task_run_id=context.run.id, tags=self._applied_limits
+            )
+            get_concurrency_slot_waiters().notify_after_commit(
+                context.session, self._applied_limits
             )
-            active_slots = set(cl.active_slots)
-            active_slots.discard(str(context.run.id))
-            cl.active_slots = list(active_slots)
+            self._applied_limits = []
 
 
 class ReleaseTaskConcurrencySlots(BaseUniversalTransform):
@@ -175,20 +175,18 @@ class ReleaseTaskConcurrencySlots(BaseUniversalTransform):
         if self.nullified_transition():
             return
 
-        if context.validated_state.type not in [
+        if context.run.tags and context.validated_state.type not in [
             states.StateType.RUNNING,
             states.StateType.CANCELLING,
         ]:
-            filtered_limits = (
-                await concurrency_limits.filter_concurrency_limits_for_orchestration(
-                    context.session, tags=context.run.tags
-                )
+            released = await concurrency_limits.release_concurrency_limit_slots(
+                context.session, task_run_id=context.run.id, tags=context.run.tags
             )
-            run_limits = {limit.tag: limit for limit in filtered_limits}
-            for tag, cl in run_limits.items():
-                active_slots = set(cl.active_slots)
-                active_slots.discard(str(context.run.id))
-                cl.active_slots = list(active_slots)
+            if released:
+                # hand the released slots to the task runs waiting on these tags
+                get_concurrency_slot_waiters().notify_after_commit(
+                    context.session, context.run.tags
+                )
 
 
 class CacheInsertion(BaseOrchestrationRule):
@@ -199,25 +197,23 @@ class CacheInsertion(BaseOrchestrationRule):
     FROM_STATES = ALL_ORCHESTRATION_STATES
     TO_STATES = [StateType.COMPLETED]
 
-    @inject_db
     async def after_transition(
         self,
         initial_state: Optional[states.State],
         validated_state: Optional[states.State],
         context: TaskOrchestrationContext,
-        db: PrefectDBInterface,
     ) -> None:
         if not validated_state or not context.session:
             return
 
         cache_key = validated_state.state_details.cache_key
         if cache_key:
-            new_cache_item = db.TaskRunStateCache(
+            await models.task_run_state_cache.cache_state(
+                session=context.session,
                 cache_key=cache_key,
                 cache_expiration=validated_state.state_details.cache_expiration,
-                task_run_state_id=validated_state.id,
+                state=validated_state,
             )
-            context.session.add(new_cache_item)
 
 
 class CacheRetrieval(BaseOrchestrationRule):
@@ -232,35 +228,19 @@ class CacheRetrieval(BaseOrchestrationRule):
     FROM_STATES = ALL_ORCHESTRATION_STATES
     TO_STATES = [StateType.RUNNING]
 
-    @inject_db
     async def before_transition(
         self,
         initial_state: Optional[states.State],
         proposed_state: Optional[states.State],
         context: TaskOrchestrationContext,
-        db: PrefectDBInterface,
     ) -> None:
         cache_key = proposed_state.state_details.cache_key
         if cache_key and not proposed_state.state_details.refresh_cache:
-            # Check for cached states matching the cache key
-            cached_state_id = (
-                select(db.TaskRunStateCache.task_run_state_id)
-                .where(
-                    sa.and_(
-                        db.TaskRunStateCache.cache_key == cache_key,
-                        sa.or_(
-                            db.TaskRunStateCache.cache_expiration.is_(None),
-                            db.TaskRunStateCache.cache_expiration > pendulum.now("utc"),
-                        ),
-                    ),
-                )
-                .order_by(db.TaskRunStateCache.created.desc())
-                .limit(1)
-            ).scalar_subquery()
-            query = select(db.TaskRunState).where(db.TaskRunState.id == cached_state_id)
-            cached_state = (await context.session.execute(query)).scalar()
+            cached_state = await models.task_run_state_cache.read_cached_state(
+                session=context.session, cache_key=cache_key
+            )
             if cached_state:
-                new_state = cached_state.as_state().copy(reset_fields=True)
+                new_state = cached_state.copy(reset_fields=True)
                 new_state.name = "Cached"
                 await self.reject_transition(
                     state=new_state, reason="Retrieved state from cache"
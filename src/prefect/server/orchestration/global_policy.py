@@ -19,9 +19,13 @@ from prefect.server.orchestration.rules import (
     OrchestrationContext,
     TaskOrchestrationContext,
 )
+from prefect.server.orchestration.scheduled_flow_run_waiters import (
+    get_scheduled_flow_run_waiters,
+)
 from prefect.server.schemas.core import FlowRunPolicy
 
 COMMON_GLOBAL_TRANSFORMS = lambda: [
+    UpdateRunHistoryRollups,
     SetRunStateType,
     SetRunStateName,
     SetRunStateTimestamp,
@@ -48,6 +52,8 @@ class GlobalFlowPolicy(BaseOrchestrationPolicy):
             UpdateSubflowStateDetails,
             IncrementFlowRunCount,
             RemoveResumingIndicator,
+            UpdateActiveRunCounts,
+            NotifyScheduledFlowRunWaiters,
         ]
 
 
@@ -65,6 +71,50 @@ class GlobalTaskPolicy(BaseOrchestrationPolicy):
         ]
 
 
+class UpdateRunHistoryRollups(BaseUniversalTransform):
+    """
+    Records runs entering and leaving final states in the run history rollups.
+
+    This transform runs first, so that the run is recorded leaving its final state
+    before the other transforms modify it, and recorded entering a final state after
+    they have.
+    """
+
+    async def before_transition(self, context: OrchestrationContext) -> None:
+        self._leaving_values = None
+        if self.nullified_transition():
+            return
+
+        self._leaving_values = models.run_history_rollups.run_history_rollup_values(
+            context.run
+        )
+
+    async def after_transition(self, context: OrchestrationContext) -> None:
+        if self.nullified_transition() or context.validated_state is None:
+            return
+
+        if isinstance(context, FlowOrchestrationContext):
+            run_type, flow_run_id = "flow_run", context.run.id
+        else:
+            run_type, flow_run_id = "task_run", context.run.flow_run_id
+
+        entering_values = models.run_history_rollups.run_history_rollup_values(
+            context.run
+        )
+        if entering_values == self._leaving_values:
+            return
+
+        for values, sign in [(self._leaving_values, -1), (entering_values, 1)]:
+            if values:
+                await models.run_history_rollups.add_to_run_history_rollups(
+                    session=context.session,
+                    run_type=run_type,
+                    flow_run_id=flow_run_id,
+                    values=values,
+                    sign=sign,
+                )
+
+
 class SetRunStateType(BaseUniversalTransform):
     """
     Updates the state type of a run on a state transition.
@@ -206,6 +256,51 @@ class RemoveResumingIndicator(BaseUniversalTransform):
                     context.run.empirical_policy = FlowRunPolicy(**updated_policy)
 
 
+class UpdateActiveRunCounts(BaseUniversalTransform):
+    """
+    Counts a flow run against its work queue and work pool while it is pending,
+    running, or cancelling, so that their concurrency limits can be enforced without
+    counting their runs on every poll.
+    """
+
+    async def before_transition(self, context: OrchestrationContext) -> None:
+        if self.nullified_transition():
+            return
+
+        was_active = (
+            context.initial_state is not None
+            and context.initial_state.type
+            in models.work_queues.ACTIVE_FLOW_RUN_STATE_TYPES
+        )
+        is_active = (
+            context.proposed_state.type
+            in models.work_queues.ACTIVE_FLOW_RUN_STATE_TYPES
+        )
+
+        if was_active != is_active:
+            await models.work_queues.update_active_run_counts(
+                session=context.session,
+                flow_run=context.run,
+                delta=1 if is_active else -1,
+            )
+
+
+class NotifyScheduledFlowRunWaiters(BaseUniversalTransform):
+    """
+    Wakes workers waiting for runs in a flow run's work queue when the flow run enters
+    a scheduled state.
+    """
+
+    async def after_transition(self, context: OrchestrationContext) -> None:
+        if self.nullified_transition() or context.validated_state is None:
+            return
+
+        if context.validated_state.is_scheduled() and context.run.work_queue_id:
+            get_scheduled_flow_run_waiters().notify_after_commit(
+                context.session, [context.run.work_queue_id]
+            )
+
+
 class IncrementTaskRunCount(BaseUniversalTransform):
     """
     Records the number of times a run enters a running state. For use with retries.
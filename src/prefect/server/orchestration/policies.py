@@ -13,6 +13,7 @@ mechanism to configure and observe exactly what logic will fire against a transi
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 
 class BaseOrchestrationPolicy(ABC):
@@ -39,8 +40,18 @@ class BaseOrchestrationPolicy(ABC):
         Returns rules in policy that are valid for the specified state transition.
         """
 
-        transition_rules = []
-        for rule in cls.priority():
-            if from_state in rule.FROM_STATES and to_state in rule.TO_STATES:
-                transition_rules.append(rule)
-        return transition_rules
+        return list(cls._compile_transition_rules(from_state, to_state))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _compile_transition_rules(cls, from_state=None, to_state=None):
+        """
+        Compiles the rules valid for a state transition once per policy and transition,
+        as policies and the states their rules govern do not change.
+        """
+
+        return tuple(
+            rule
+            for rule in cls.priority()
+            if from_state in rule.FROM_STATES and to_state in rule.TO_STATES
+        )
@@ -18,6 +18,7 @@ single line of user code.
 """
 
 import contextlib
+import datetime
 from types import TracebackType
 from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
@@ -50,6 +51,27 @@ TERMINAL_STATES = states.TERMINAL_STATES
 logger = get_logger("server")
 
 
+def _shallow_copy(model: PrefectBaseModel, **update: Any) -> PrefectBaseModel:
+    """
+    Returns a shallow copy of a model with some values replaced.
+
+    This is equivalent to `model.copy(update=update)` but avoids the overhead of
+    iterating over the fields of the model, as contexts are copied for every rule that
+    governs a transition.
+    """
+    cls = model.__class__
+    copied = cls.__new__(cls)
+    object.__setattr__(copied, "__dict__", {**model.__dict__, **update})
+    object.__setattr__(copied, "__fields_set__", model.__fields_set__ | update.keys())
+    return copied
+
+
+def _copy_state(
+    state: Optional[states.State], timestamp: datetime.datetime
+) -> Optional[states.State]:
+    return _shallow_copy(state, timestamp=timestamp) if state is not None else None
+
+
 class OrchestrationContext(PrefectBaseModel):
     """
     A container for a state transition, governed by orchestration rules.
@@ -134,19 +156,15 @@ class OrchestrationContext(PrefectBaseModel):
             A mutation-safe copy of the `OrchestrationContext`
         """
 
-        safe_copy = self.copy()
-
-        safe_copy.initial_state = (
-            self.initial_state.copy() if self.initial_state else None
-        )
-        safe_copy.proposed_state = (
-            self.proposed_state.copy() if self.proposed_state else None
+        # states are copied as `State.copy` would, resetting their timestamps
+        timestamp = states.State.__fields__["timestamp"].get_default()
+        return _shallow_copy(
+            self,
+            initial_state=_copy_state(self.initial_state, timestamp),
+            proposed_state=_copy_state(self.proposed_state, timestamp),
+            validated_state=_copy_state(self.validated_state, timestamp),
+            parameters=self.parameters.copy(),
         )
-        safe_copy.validated_state = (
-            self.validated_state.copy() if self.validated_state else None
-        )
-        safe_copy.parameters = self.parameters.copy()
-        return safe_copy
 
     def entry_context(self):
         """
@@ -559,8 +577,10 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
             pass
         else:
             try:
-                entry_context = self.context.entry_context()
-                await self.before_transition(*entry_context)
+                # copying the context is skipped when the hook would do nothing
+                if self._overrides_hook("before_transition"):
+                    entry_context = self.context.entry_context()
+                    await self.before_transition(*entry_context)
                 self.context.rule_signature.append(str(self.__class__))
             except Exception as before_transition_error:
                 reason = (
@@ -596,15 +616,26 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
         any side-effects produced by `self.before_transition`.
         """
 
-        exit_context = self.context.exit_context()
         if await self.invalid():
             pass
         elif await self.fizzled():
-            await self.cleanup(*exit_context)
+            if self._overrides_hook("cleanup"):
+                await self.cleanup(*self.context.exit_context())
         else:
-            await self.after_transition(*exit_context)
+            if self._overrides_hook("after_transition"):
+                await self.after_transition(*self.context.exit_context())
             self.context.finalization_signature.append(str(self.__class__))
 
+    def _overrides_hook(self, name: str) -> bool:
+        """
+        Determines if a hook is implemented by this rule rather than inherited from
+        `BaseOrchestrationRule`, where it does nothing.
+        """
+        hook = getattr(self, name)
+        return getattr(hook, "__func__", hook) is not getattr(
+            BaseOrchestrationRule, name
+        )
+
     async def before_transition(
         self,
         initial_state: Optional[states.State],
@@ -0,0 +1,136 @@
+"""
+Wakes workers waiting for flow runs to be scheduled in their work queues.
+
+Workers poll `POST /work_pools/{name}/get_scheduled_flow_runs` for runs to submit. When
+a poll includes `wait_seconds` and no runs are found, the request is held until a run
+is scheduled in one of the polled work queues, either by the scheduler or by a flow
+run entering a `SCHEDULED` state, and then returns the newly scheduled runs instead of
+returning an empty list.
+
+Waiters are held in memory, so only runs scheduled by the same server process wake
+them; otherwise the wait lasts until its timeout, as if the worker had slept between
+polls.
+"""
+import asyncio
+import threading
+from typing import Dict, Iterable, List, Set
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from prefect.server.orchestration.concurrency_waiters import _resolve
+
+
+class ScheduledFlowRunWaiters:
+    """
+    Polls waiting for flow runs to be scheduled, grouped by the work queues they are
+    waiting on.
+
+    Waiters may wait from any event loop; they are woken on the loop they are waiting
+    on.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[UUID, Set[asyncio.Future]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, work_queue_ids: Iterable[UUID]) -> asyncio.Future:
+        """
+        Adds a waiter for runs scheduled in any of the given work queues, returning a
+        future that is resolved when it is woken.
+        """
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            for work_queue_id in work_queue_ids:
+                self._waiters.setdefault(work_queue_id, set()).add(future)
+        return future
+
+    def unregister(
+        self, work_queue_ids: Iterable[UUID], future: asyncio.Future
+    ) -> None:
+        """
+        Removes a waiter from the given work queues.
+        """
+        with self._lock:
+            for work_queue_id in work_queue_ids:
+                waiters = self._waiters.get(work_queue_id)
+                if waiters is None:
+                    continue
+                waiters.discard(future)
+                if not waiters:
+                    del self._waiters[work_queue_id]
+
+    async def wait(self, future: asyncio.Future, timeout: float) -> bool:
+        """
+        Waits for a registered waiter to be woken.
+
+        Returns:
+            bool: whether or not the waiter was woken before the timeout
+        """
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def notify(self, work_queue_ids: Iterable[UUID]) -> int:
+        """
+        Wakes all waiters for the given work queues.
+
+        Returns:
+            int: the number of waiters woken
+        """
+        woken: List[asyncio.Future] = []
+        with self._lock:
+            for work_queue_id in set(work_queue_ids):
+                for future in self._waiters.pop(work_queue_id, ()):
+                    if future.done() or future in woken:
+                        # the waiter has timed out, been cancelled or been woken by
+                        # another of its work queues
+                        continue
+                    future.get_loop().call_soon_threadsafe(_resolve, future)
+                    woken.append(future)
+        return len(woken)
+
+    def notify_after_commit(
+        self, session: sa.orm.Session, work_queue_ids: Iterable[UUID]
+    ) -> None:
+        """
+        Wakes waiters for the given work queues once the session's transaction
+        commits, so that woken waiters see the scheduled runs. Nothing is woken if the
+        transaction is rolled back.
+        """
+        work_queue_ids = {
+            work_queue_id
+            for work_queue_id in work_queue_ids
+            if work_queue_id is not None
+        }
+        if not work_queue_ids:
+            return
+
+        pending = True
+
+        def wake_waiters(_):
+            if pending:
+                self.notify(work_queue_ids)
+
+        def discard(*_):
+            nonlocal pending
+            pending = False
+
+        sa.event.listen(session.sync_session, "after_commit", wake_waiters, once=True)
+        sa.event.listen(session.sync_session, "after_soft_rollback", discard, once=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(set().union(*self._waiters.values()))
+
+
+_SCHEDULED_FLOW_RUN_WAITERS = ScheduledFlowRunWaiters()
+
+
+def get_scheduled_flow_run_waiters() -> ScheduledFlowRunWaiters:
+    """
+    Returns the waiters for scheduled flow runs in this server process.
+    """
+    return _SCHEDULED_FLOW_RUN_WAITERS
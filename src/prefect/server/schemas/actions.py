@@ -309,6 +309,20 @@ class TaskRunUpdate(ActionBaseModel):
     name: str = FieldFrom(schemas.core.TaskRun)
 
 
+class TaskRunSetState(ActionBaseModel):
+    """Data used by the Prefect REST API to set the state of a task run in a batch."""
+
+    task_run_id: UUID = Field(default=..., description="The task run id")
+    state: StateCreate = Field(default=..., description="The intended state.")
+    force: bool = Field(
+        default=False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transition. If True, orchestration rules are not applied."
+        ),
+    )
+
+
 @copy_model_fields
 class FlowRunCreate(ActionBaseModel):
     """Data used by the Prefect REST API to create a flow run."""
@@ -36,6 +36,7 @@ FLOW_RUN_NOTIFICATION_TEMPLATE_KWARGS = [
 ]
 
 DEFAULT_BLOCK_SCHEMA_VERSION = "non-versioned"
+DEFAULT_AGENT_WORK_POOL_NAME = "default-agent-pool"
 
 
 def raise_on_invalid_name(name: str) -> None:
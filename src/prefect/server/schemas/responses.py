@@ -95,6 +95,14 @@ class StateWaitDetails(PrefectBaseModel):
     reason: Optional[str] = Field(
         default=None, description="The reason why the state transition should wait."
     )
+    concurrency_limit_tag: Optional[str] = Field(
+        default=None,
+        description=(
+            "The tag whose concurrency limit is full, if the state transition should"
+            " wait for a concurrency slot. The client may wait for a slot on this tag"
+            " to be released instead of waiting for the full delay."
+        ),
+    )
 
 
 class HistoryResponseState(PrefectBaseModel):
@@ -1,6 +1,9 @@
+import prefect.server.services.active_run_counts
 import prefect.server.services.cancellation_cleanup
 import prefect.server.services.flow_run_notifications
 import prefect.server.services.late_runs
 import prefect.server.services.pause_expirations
+import prefect.server.services.run_history_rollups
 import prefect.server.services.scheduler
+import prefect.server.services.task_run_state_cache
 import prefect.server.services.telemetry
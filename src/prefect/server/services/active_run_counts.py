@@ -0,0 +1,50 @@
+"""
+The ReconcileActiveRunCounts service. Responsible for correcting the counts of active
+flow runs used to enforce work queue and work pool concurrency limits.
+"""
+
+import asyncio
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_LOOP_SECONDS
+
+
+class ReconcileActiveRunCounts(LoopService):
+    """
+    A simple loop service responsible for recounting the active flow runs in each
+    work queue and work pool.
+
+    Active run counts are kept up to date as flow runs change state, but can drift
+    when flow runs are moved between work queues or work queues are deleted while
+    their runs are active.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Recount the active flow runs in each work queue and work pool, correcting any
+        counts that have drifted.
+        """
+        async with db.session_context(begin_transaction=True) as session:
+            corrected = await models.work_queues.reconcile_active_run_counts(
+                session=session
+            )
+
+        self.logger.info(
+            "Finished reconciling active run counts. Corrected the counts of"
+            f" {corrected} work queues and work pools."
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(ReconcileActiveRunCounts().start())
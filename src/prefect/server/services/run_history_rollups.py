@@ -0,0 +1,60 @@
+"""
+The CompactRunHistoryRollups service. Responsible for merging the run history rollups
+of runs in a final state.
+"""
+
+import asyncio
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS
+
+
+class CompactRunHistoryRollups(LoopService):
+    """
+    A simple loop service responsible for merging run history rollups.
+
+    Every state transition into or out of a final state appends a row to the run
+    history rollups; this service merges rows for the same minute, flow, deployment,
+    work queue and state so that reading run history stays fast.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # query for this many rows at a time
+        self.batch_size: int = 10000
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Merge run history rollups with the same dimensions, in batches, until no rows
+        remain to be merged.
+        """
+        total_removed = 0
+
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                removed = await models.run_history_rollups.compact_run_history_rollups(
+                    session=session, limit=self.batch_size
+                )
+            total_removed += removed
+
+            # rows are read in order of their dimensions, so every batch removes at
+            # least one row until there are no more rows to merge
+            if removed == 0:
+                break
+
+        self.logger.info(
+            f"Finished compacting run history rollups. Removed {total_removed} rows."
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(CompactRunHistoryRollups().start())
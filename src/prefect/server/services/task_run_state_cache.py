@@ -0,0 +1,60 @@
+"""
+The PruneTaskRunStateCache service. Responsible for deleting expired task run cache
+entries.
+"""
+
+import asyncio
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_LOOP_SECONDS
+
+
+class PruneTaskRunStateCache(LoopService):
+    """
+    A simple loop service responsible for deleting expired task run cache entries.
+
+    Every completed task run with a cache key adds an entry to the task run state
+    cache; entries that have expired can never be used again, so this service deletes
+    them to keep the cache table from growing without bound.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # delete this many entries at a time
+        self.batch_size: int = 10000
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Delete expired task run cache entries, in batches, until none remain.
+        """
+        total_deleted = 0
+
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                deleted = (
+                    await models.task_run_state_cache.delete_expired_cache_entries(
+                        session=session, limit=self.batch_size
+                    )
+                )
+            total_deleted += deleted
+
+            if deleted < self.batch_size:
+                break
+
+        self.logger.info(
+            "Finished pruning the task run state cache. Deleted"
+            f" {total_deleted} expired entries."
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(PruneTaskRunStateCache().start())
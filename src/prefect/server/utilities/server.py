@@ -3,13 +3,17 @@ Utilities for the Prefect REST API server.
 """
 import functools
 import inspect
+import zlib
 from contextlib import AsyncExitStack, asynccontextmanager
-from typing import Any, Callable, Coroutine, Iterable, Set, get_type_hints
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Iterable, Optional, Set, get_type_hints
 
-from fastapi import APIRouter, Request, Response, status
+import anyio
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.routing import APIRoute
 
 from prefect._internal.compatibility.deprecated import deprecated_callable
+from prefect.settings import PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE
 
 
 def method_paths_from_routes(routes: Iterable[APIRoute]) -> Set[str]:
@@ -81,6 +85,70 @@ def response_scoped_dependency(dependency: Callable):
     return wrapper
 
 
+class RequestLimitSlot:
+    """
+    A slot held by a request in a limiter on the number of concurrent requests.
+    """
+
+    def __init__(self, limiter: anyio.CapacityLimiter) -> None:
+        self.limiter = limiter
+        self.held = False
+
+    async def acquire(self) -> None:
+        await self.limiter.acquire_on_behalf_of(self)
+        self.held = True
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self.limiter.release_on_behalf_of(self)
+
+
+# The slot held by the request being handled, if requests are limited
+_request_limit_slot: ContextVar[Optional[RequestLimitSlot]] = ContextVar(
+    "request_limit_slot", default=None
+)
+
+
+@asynccontextmanager
+async def hold_request_limit_slot(limiter: anyio.CapacityLimiter):
+    """
+    Hold a slot in the given limiter while handling a request.
+
+    The slot can be released while the request waits with `request_limit_released`.
+    """
+    slot = RequestLimitSlot(limiter)
+    await slot.acquire()
+    token = _request_limit_slot.set(slot)
+    try:
+        yield slot
+    finally:
+        _request_limit_slot.reset(token)
+        slot.release()
+
+
+@asynccontextmanager
+async def request_limit_released():
+    """
+    Release the slot held by the current request in the request limiter, if any,
+    while the context is entered. The slot is acquired again on exit.
+
+    Requests that wait for a long time, such as long-polls, should wait in this context
+    so that waiting requests cannot prevent the requests they are waiting for from
+    being handled.
+    """
+    slot = _request_limit_slot.get()
+    if slot is None:
+        yield
+        return
+
+    slot.release()
+    try:
+        yield
+    finally:
+        await slot.acquire()
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
@@ -107,6 +175,86 @@ class PrefectAPIRoute(APIRoute):
         return handle_response_scoped_depends
 
 
+class GzipRequest(Request):
+    """
+    A request which decompresses gzip encoded bodies.
+
+    Bodies larger than `PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE` once decompressed
+    are rejected with a `413` response, and bodies that are not valid gzip data are
+    rejected with a `400` response.
+    """
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                body = decompress_gzip(
+                    body, max_size=PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE.value()
+                )
+            self._body = body
+        return self._body
+
+
+def decompress_gzip(data: bytes, max_size: int) -> bytes:
+    """
+    Decompress gzip data incrementally, stopping once more than `max_size` bytes are
+    produced rather than allocating the full output.
+
+    Raises:
+        HTTPException: with status `413` if the decompressed data is larger than
+            `max_size`, or `400` if the data is not valid gzip data
+    """
+    chunks = []
+    size = 0
+    # gzip data may contain several members, each decompressed in turn
+    while data:
+        # the window bits select the gzip header and trailer
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            chunk = decompressor.decompress(data, max_size - size + 1)
+        except zlib.error as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid gzip encoded request body: {exc}",
+            ) from exc
+
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=(
+                    "Decompressed request body exceeds the maximum size of"
+                    f" {max_size} bytes."
+                ),
+            )
+        if not decompressor.eof:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid gzip encoded request body: data is truncated.",
+            )
+
+        chunks.append(chunk)
+        data = decompressor.unused_data
+
+    return b"".join(chunks)
+
+
+class GzipRequestAPIRoute(PrefectAPIRoute):
+    """
+    A `PrefectAPIRoute` which accepts gzip encoded request bodies.
+
+    Useful for routes which receive large payloads, such as batches of logs.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        default_handler = super().get_route_handler()
+
+        async def handle_gzip_request(request: Request) -> Response:
+            return await default_handler(GzipRequest(request.scope, request.receive))
+
+        return handle_gzip_request
+
+
 class PrefectRouter(APIRouter):
     """
     A base class for Prefect REST API routers.
@@ -64,7 +64,14 @@ from typing import (
 
 import pydantic
 import toml
-from pydantic import BaseSettings, Field, create_model, root_validator, validator
+from pydantic import (
+    BaseSettings,
+    Field,
+    PrivateAttr,
+    create_model,
+    root_validator,
+    validator,
+)
 from typing_extensions import Literal
 
 from prefect._internal.compatibility.deprecated import generate_deprecation_message
@@ -525,6 +532,13 @@ Set to 0 to disable jitter. See `clamped_poisson_interval` for details on the ho
 can affect retry lengths.
 """
 
+PREFECT_CLIENT_EPHEMERAL_IN_PROCESS = Setting(bool, default=False)
+"""
+If true, clients of an ephemeral API call the API's orchestration functions directly
+for the requests made for every flow and task run, instead of sending HTTP requests to
+the ephemeral application. Defaults to `False`.
+"""
+
 PREFECT_CLOUD_API_URL = Setting(
     str,
     default="https://api.prefect.cloud/api",
@@ -603,6 +617,38 @@ The default setting for persisting results when not otherwise specified. If enab
 flow and task results will be persisted unless they opt out.
 """
 
+PREFECT_RESULTS_BINARY_FORMAT_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+Toggles writing persisted results in a binary format, which stores the serialized data
+after a small header instead of embedding it in a JSON document. Results in either
+format can be read, but older versions of Prefect can only read the JSON format, so this
+should only be enabled once every process reading results has been upgraded.
+"""
+
+PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES = Setting(
+    int,
+    default=0,
+)
+"""
+The maximum total size, in bytes, of persisted result content kept in a local
+in-memory cache by each process. When enabled, persisted results that are read or
+written repeatedly in the same process are served from the cache instead of their
+storage block. Defaults to `0`, which disables the cache.
+"""
+
+PREFECT_RESULTS_LOCAL_CACHE_SPILL_PATH = Setting(
+    Path,
+    default=None,
+)
+"""
+An optional directory to write persisted result content to when it is evicted from the
+local in-memory result cache. Content in this directory is read before falling back to
+the result's storage block. Only used if `PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES` is set.
+"""
+
 PREFECT_TASKS_REFRESH_CACHE = Setting(
     bool,
     default=False,
@@ -612,6 +658,75 @@ If `True`, enables a refresh of cached results: re-executing the
 task will refresh the cached results. Defaults to `False`.
 """
 
+PREFECT_TASKS_INPUT_HASH_ALGORITHM = Setting(
+    str,
+    default="md5",
+)
+"""
+The `hashlib` algorithm used by `task_input_hash` to hash the inputs of tasks, e.g.
+`"blake2b"`, which is faster than the default on 64-bit platforms. Changing the
+algorithm changes the cache keys of existing tasks. Defaults to `"md5"`.
+"""
+
+PREFECT_TASKS_CACHE_LOOKUP_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+If `True`, task runs with a cache key are resolved to their cached state before they
+are submitted to the task runner, skipping task execution entirely when a cached state
+is found. Cached states are looked up in the states remembered by this process first,
+then from the API in batched requests. The inputs of the task are resolved by the flow
+run to compute the cache key. Defaults to `False`.
+"""
+
+PREFECT_TASKS_LOCAL_CACHE_SIZE = Setting(
+    int,
+    default=1000,
+)
+"""
+The maximum number of cached task run states remembered by each process when task
+cache lookups are enabled. Set to `0` to always look up cached states from the API.
+Defaults to `1000`.
+"""
+
+PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+If `True`, task runs submitted by a flow run with a concurrent task runner are
+created in bulk API requests instead of one request per task run. Defaults to `False`.
+"""
+
+PREFECT_TASK_RUN_CREATION_BATCH_SIZE = Setting(
+    int,
+    default=200,
+)
+"""
+The maximum number of task runs to create in a single request when task run creation
+batching is enabled. Defaults to `200`.
+"""
+
+PREFECT_TASK_RUN_CREATION_BATCH_INTERVAL = Setting(
+    float,
+    default=0.05,
+)
+"""
+The maximum number of seconds to wait for a batch of task runs to fill before
+creating it when task run creation batching is enabled. Defaults to `0.05`.
+"""
+
+PREFECT_TASK_RUN_STATE_BATCHING_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+If `True`, states proposed concurrently for the task runs of a flow run with a
+concurrent task runner are set in batched API requests instead of one request per
+state. Batches use the task run creation batch size and interval. Defaults to `False`.
+"""
+
 PREFECT_LOCAL_STORAGE_PATH = Setting(
     Path,
     default=Path("${PREFECT_HOME}") / "storage",
@@ -719,6 +834,30 @@ PREFECT_LOGGING_TO_API_MAX_LOG_SIZE = Setting(
 )
 """The maximum size in bytes for a single log."""
 
+PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS = Setting(
+    int,
+    default=5_000,
+)
+"""The maximum number of logs in a batch."""
+
+PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE = Setting(
+    int,
+    default=100_000,
+)
+"""
+The maximum number of logs waiting to be sent to the API. When the queue is full, the
+oldest logs are dropped so that logging never blocks.
+"""
+
+PREFECT_LOGGING_TO_API_COMPRESSION_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+Toggles gzip compression of log batches sent to the API. The API must support gzip
+encoded request bodies.
+"""
+
 PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW = Setting(
     Literal["warn", "error", "ignore"],
     default="warn",
@@ -779,6 +918,16 @@ flow runs will not start before their scheduled time, even if they are
 prefetched. Defaults to `10`.
 """
 
+PREFECT_KUBERNETES_JOB_WATCHER_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""
+If `True`, `KubernetesJob` infrastructure waits for jobs to finish with a single
+watch of the jobs in each namespace shared by the process, instead of a thread and
+watch per job. Output streaming still uses a thread per job. Defaults to `False`.
+"""
+
 PREFECT_ASYNC_FETCH_STATE_RESULT = Setting(bool, default=False)
 """
 Determines whether `State.result()` fetches results automatically or not.
@@ -978,6 +1127,30 @@ PREFECT_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS = Setting(
 this often. Defaults to `20`.
 """
 
+PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_LOOP_SECONDS = Setting(
+    float,
+    default=30,
+)
+"""The active run counts service will recount the active flow runs in each work
+queue and work pool this often. Defaults to `30`.
+"""
+
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS = Setting(
+    float,
+    default=60,
+)
+"""The run history rollups service will merge the rollups of runs in a final state
+this often. Defaults to `60`.
+"""
+
+PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_LOOP_SECONDS = Setting(
+    float,
+    default=3600,
+)
+"""The task run state cache service will delete expired task run cache entries this
+often. Defaults to `3600`.
+"""
+
 PREFECT_API_DEFAULT_LIMIT = Setting(
     int,
     default=200,
@@ -986,6 +1159,24 @@ PREFECT_API_DEFAULT_LIMIT = Setting(
 multiple objects, such as `POST /flow_runs/filter`.
 """
 
+PREFECT_API_TASK_RUN_TAG_CONCURRENCY_SLOT_LEASE_SECONDS = Setting(
+    Optional[float],
+    default=None,
+)
+"""The number of seconds a task run holds a tag concurrency slot after entering a
+`Running` state. Slots held by runs that crash without leaving a `Running` state are
+reclaimed once their lease expires. Leases should be longer than the longest running
+task. Defaults to `None`, in which case slots are held until they are released.
+"""
+
+PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE = Setting(
+    int,
+    default=100_000_000,
+)
+"""The maximum size in bytes of a gzip encoded request body once decompressed, such as
+a compressed batch of logs. Larger request bodies are rejected with a `413` response.
+"""
+
 PREFECT_SERVER_API_HOST = Setting(
     str,
     default="127.0.0.1",
@@ -1073,12 +1264,48 @@ application. If disabled, paused flows that have timed out will remain in a Paus
 until a resume attempt.
 """
 
+PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the active run counts service in the server application.
+If disabled, the active flow run counts used to enforce work queue and work pool
+concurrency limits will not be corrected if they drift.
+"""
+
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the run history rollups service in the server application.
+If disabled, run history rollups will not be merged and reading run history will slow
+down as runs finish.
+"""
+
+PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the task run state cache service in the server
+application. If disabled, expired task run cache entries will not be deleted.
+"""
+
 PREFECT_API_TASK_CACHE_KEY_MAX_LENGTH = Setting(int, default=2000)
 """
 The maximum number of characters allowed for a task run cache key.
 This setting cannot be changed client-side, it must be set on the server.
 """
 
+PREFECT_API_TASK_CACHE_SIZE = Setting(int, default=0)
+"""
+The number of recently used task run cache entries the server keeps in memory, so
+that cached task runs can be resolved without reading the database. Defaults to `0`,
+always reading the database. Entries kept in memory are still returned after their
+task run is deleted and hide newer entries recorded by other server processes, so this
+should not be enabled when multiple server replicas share a database. This setting
+cannot be changed client-side, it must be set on the server.
+"""
+
 PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED = Setting(
     bool,
     default=True,
@@ -1643,16 +1870,27 @@ class Settings(SettingsFieldsMixin):
     from prefect.settings import Settings
     Settings().PREFECT_PROFILES_PATH  # PosixPath('${PREFECT_HOME}/profiles.toml')
     ```
+
+    Settings objects are immutable, so they can be shared freely. The results of value
+    callbacks and the hash of the settings are computed once per object.
     """
 
+    _callback_values: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _hash: Optional[int] = PrivateAttr(None)
+
     def value_of(self, setting: Setting[T], bypass_callback: bool = False) -> T:
         """
         Retrieve a setting's value.
         """
-        value = getattr(self, setting.name)
-        if setting.value_callback and not bypass_callback:
-            value = setting.value_callback(self, value)
-        return value
+        if not setting.value_callback or bypass_callback:
+            return getattr(self, setting.name)
+
+        try:
+            return self._callback_values[setting.name]
+        except KeyError:
+            value = setting.value_callback(self, getattr(self, setting.name))
+            self._callback_values[setting.name] = value
+            return value
 
     @validator(PREFECT_LOGGING_LEVEL.name, PREFECT_LOGGING_SERVER_LEVEL.name)
     def check_valid_log_level(cls, value):
@@ -1769,6 +2007,29 @@ class Settings(SettingsFieldsMixin):
         # Cast to strings and drop null values
         return {key: str(value) for key, value in env.items() if value is not None}
 
+    def copy(self, **kwargs) -> "Settings":
+        """
+        Duplicate the settings model. Values computed by value callbacks are not shared
+        with the copy, since its values may differ.
+        """
+        new = super().copy(**kwargs)
+        new._callback_values = {}
+        new._hash = None
+        return new
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Settings):
+            # Compare values directly instead of converting both objects to dicts
+            return self.__dict__ == other.__dict__
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.__class__, tuple(self.__dict__.values())))
+        return self._hash
+
     class Config:
         frozen = True
 
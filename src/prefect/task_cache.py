@@ -0,0 +1,97 @@
+"""
+A process-wide cache of the completed states of task runs by cache key.
+
+When `PREFECT_TASKS_CACHE_LOOKUP_ENABLED` is set, completed task runs with a cache key
+are remembered here so that later task runs in the same process with the same cache key
+can be resolved to the cached state without being submitted for execution.
+"""
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import pendulum
+
+from prefect.settings import PREFECT_TASKS_LOCAL_CACHE_SIZE
+from prefect.states import State
+
+
+class LocalTaskCache:
+    """
+    Completed task run states by cache key, in least-recently-used order.
+
+    States are dropped once their cache expiration has passed or when more than
+    `max_size` states are held. States are held with their results, so results that
+    are cached in memory are kept alive until the state is dropped.
+
+    This cache is thread-safe.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._states: "OrderedDict[str, State]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str) -> Optional[State]:
+        """
+        Retrieve the state cached with a key, returning `None` if there is no
+        unexpired state cached with the key.
+        """
+        with self._lock:
+            state = self._states.get(cache_key)
+            if state is None:
+                return None
+            if _is_expired(state):
+                del self._states[cache_key]
+                return None
+            self._states.move_to_end(cache_key)
+            return state
+
+    def put(self, cache_key: str, state: State) -> None:
+        """
+        Remember a completed state for a cache key. Other states are ignored.
+        """
+        if not state.is_completed() or _is_expired(state):
+            return
+
+        with self._lock:
+            self._states[cache_key] = state
+            self._states.move_to_end(cache_key)
+            while len(self._states) > self.max_size:
+                self._states.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Forget all cached states.
+        """
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+def _is_expired(state: State) -> bool:
+    cache_expiration = state.state_details.cache_expiration
+    return cache_expiration is not None and cache_expiration <= pendulum.now("utc")
+
+
+_LOCAL_TASK_CACHE: Optional[LocalTaskCache] = None
+
+
+def get_local_task_cache() -> Optional[LocalTaskCache]:
+    """
+    Get the process-wide task cache configured by the current settings.
+
+    Returns `None` if the cache is disabled.
+    """
+    global _LOCAL_TASK_CACHE
+
+    max_size = PREFECT_TASKS_LOCAL_CACHE_SIZE.value()
+    if max_size <= 0:
+        return None
+
+    cache = _LOCAL_TASK_CACHE
+    if cache is None or cache.max_size != max_size:
+        cache = _LOCAL_TASK_CACHE = LocalTaskCache(max_size=max_size)
+
+    return cache
@@ -53,7 +53,10 @@ For usage details, see the [Task Runners](/concepts/task-runners/) documentation
 """
 import abc
 import asyncio
+import concurrent.futures
+import multiprocessing
 from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -68,16 +71,22 @@ from typing import (
 from uuid import UUID
 
 import anyio
+import cloudpickle
 
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
     import anyio.abc
 
+from prefect._internal.concurrency.primitives import Event
 from prefect.logging import get_logger
+from prefect.logging.configuration import setup_logging
 from prefect.server.schemas.states import State
 from prefect.states import exception_to_crashed_state
-from prefect.utilities.collections import AutoEnum
+from prefect.utilities.annotations import quote
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
+from prefect.utilities.callables import cloudpickle_wrapped_call
+from prefect.utilities.collections import AutoEnum, StopVisiting, visit_collection
 
 T = TypeVar("T", bound="BaseTaskRunner")
 R = TypeVar("R")
@@ -143,6 +152,31 @@ class BaseTaskRunner(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @property
+    def thread_limiter(self) -> Optional[anyio.CapacityLimiter]:
+        """
+        The limiter for the threads that run calls submitted to this task runner, or
+        `None` if the number of threads is not limited.
+        """
+        return None
+
+    async def _reserve(self, key: UUID) -> None:
+        """
+        Wait until the task runner can accept a call for the given key.
+
+        The reservation is used by the next `submit` for the key. Reserving before any
+        work is done for the call lets backpressure from the task runner reach the
+        caller. Reservations that will not be submitted must be released with
+        `_release_reservation`.
+        """
+        pass  # noqa
+
+    def _release_reservation(self, key: UUID) -> None:
+        """
+        Release the reservation for the given key if it was not used by `submit`.
+        """
+        pass  # noqa
+
     @asynccontextmanager
     async def start(
         self: T,
@@ -219,25 +253,63 @@ class ConcurrentTaskRunner(BaseTaskRunner):
     A concurrent task runner that allows tasks to switch when blocking on IO.
     Synchronous tasks will be submitted to a thread pool maintained by `anyio`.
 
-    Example:
-        ```
+    By default, every submitted call is started immediately. If `max_workers` is set,
+    at most `max_workers` calls will run at once and the rest will wait in a queue. Once
+    `max_queue_size` calls are queued, submission blocks until a worker is available.
+    The threads that run the calls are limited to `max_workers` by the task runner
+    instead of the limiter shared by the process.
+
+    Args:
+        max_workers: The maximum number of calls to run at once. Defaults to no limit.
+        max_queue_size: The maximum number of calls waiting for a worker before
+            submission blocks. Defaults to `max_workers`. Only valid if `max_workers`
+            is set.
+
+    Examples:
         Using a thread for concurrency:
+        ```
         >>> from prefect import flow
         >>> from prefect.task_runners import ConcurrentTaskRunner
         >>> @flow(task_runner=ConcurrentTaskRunner)
         >>> def my_flow():
         >>>     ...
         ```
+
+        Running at most ten tasks at a time:
+        ```
+        >>> @flow(task_runner=ConcurrentTaskRunner(max_workers=10))
+        >>> def my_flow():
+        >>>     ...
+        ```
     """
 
-    def __init__(self):
-        # TODO: Consider adding `max_workers` support using anyio capacity limiters
+    def __init__(
+        self, max_workers: Optional[int] = None, max_queue_size: Optional[int] = None
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1.")
+        if max_queue_size is not None and max_workers is None:
+            raise ValueError("`max_queue_size` requires `max_workers` to be set.")
+        if max_queue_size is not None and max_queue_size < 0:
+            raise ValueError("`max_queue_size` cannot be negative.")
+
+        self.max_workers = max_workers
+        self.max_queue_size = (
+            max_queue_size if max_queue_size is not None else max_workers
+        )
 
         # Runtime attributes
         self._task_group: anyio.abc.TaskGroup = None
-        self._result_events: Dict[UUID, anyio.abc.Event] = {}
+        self._limiter: anyio.CapacityLimiter = None
+        self._queue_slots: anyio.Semaphore = None
+        self._thread_limiter: anyio.CapacityLimiter = None
+        self._reserved: Set[UUID] = set()
+        self._result_events: Dict[UUID, Event] = {}
         self._results: Dict[UUID, Any] = {}
         self._keys: Set[UUID] = set()
+        self._queue_depth: int = 0
+        self._max_queue_depth: int = 0
+        self._running: int = 0
 
         super().__init__()
 
@@ -261,14 +333,82 @@ class ConcurrentTaskRunner(BaseTaskRunner):
                 "serialization."
             )
 
-        self._result_events[key] = anyio.Event()
-
-        # Rely on the event loop for concurrency
-        self._task_group.start_soon(self._run_and_store_result, key, call)
+        self._result_events.setdefault(key, Event())
 
         # Track the keys so we can ensure to gather them later
         self._keys.add(key)
 
+        if self._limiter is None:
+            # Rely on the event loop for concurrency
+            self._task_group.start_soon(self._run_and_store_result, key, call)
+        else:
+            if key in self._reserved:
+                # The queue slot was taken when the call was reserved
+                self._reserved.discard(key)
+            else:
+                await self._acquire_queue_slot()
+
+            self._task_group.start_soon(self._run_with_limiter, key, call)
+
+    @property
+    def thread_limiter(self) -> Optional[anyio.CapacityLimiter]:
+        """
+        Limits the threads that run submitted calls to `max_workers`.
+
+        `None` if `max_workers` is not set.
+        """
+        return self._thread_limiter
+
+    async def _reserve(self, key: UUID) -> None:
+        if self._limiter is not None:
+            await self._acquire_queue_slot()
+            self._reserved.add(key)
+
+    def _release_reservation(self, key: UUID) -> None:
+        if key in self._reserved:
+            self._reserved.discard(key)
+            self._queue_depth -= 1
+            self._queue_slots.release()
+
+    async def _acquire_queue_slot(self) -> None:
+        """
+        Wait for a slot in the queue; this applies backpressure to the caller instead
+        of accumulating an unbounded number of pending calls.
+        """
+        self._queue_depth += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        try:
+            await self._queue_slots.acquire()
+        except BaseException:
+            self._queue_depth -= 1
+            raise
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of submitted calls waiting for a worker, including calls whose
+        submission is blocked because the queue is full.
+
+        Always zero if `max_workers` is not set.
+        """
+        return self._queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        """
+        The largest `queue_depth` seen since the task runner was started.
+        """
+        return self._max_queue_depth
+
+    @property
+    def running(self) -> int:
+        """
+        The number of calls being run by workers.
+
+        Always zero if `max_workers` is not set.
+        """
+        return self._running
+
     async def wait(
         self,
         key: UUID,
@@ -305,47 +445,290 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         Block until the run result has been populated.
         """
         result = None  # Return value on timeout
-        result_event = self._result_events.get(key)
+
+        # The event may be awaited from an event loop in a different thread than the
+        # one the call is running in. It is created here if the call has not been
+        # submitted yet so waiting does not depend on the order of submission.
+        result_event = self._result_events.setdefault(key, Event())
 
         with anyio.move_on_after(timeout):
-            # Attempt to use the event to wait for the result. This is much more efficient
-            # than the spin-lock that follows but does not work if the wait call
-            # happens from an event loop in a different thread than the one from which
-            # the event was created
+            await result_event.wait()
+            result = self._results.get(key)
 
-            while not result_event:
-                await anyio.sleep(0)  # yield to other tasks
-                result_event = self._result_events.get(key)
+        return result
 
-            if result_event._event._loop == asyncio.get_running_loop():
-                await result_event.wait()
+    async def _run_with_limiter(
+        self, key: UUID, call: Callable[[], Awaitable[State[R]]]
+    ):
+        """
+        Wait for a worker to be available then run the call, releasing the queue slot
+        taken during submission on completion.
+        """
+        try:
+            async with self._limiter:
+                self._queue_depth -= 1
+                self._running += 1
+                try:
+                    await self._run_and_store_result(key, call)
+                finally:
+                    self._running -= 1
+        finally:
+            self._queue_slots.release()
+
+    async def _start(self, exit_stack: AsyncExitStack):
+        """
+        Start the process pool
+        """
+        if self.max_workers is not None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+            # Calls that are running hold a queue slot as well
+            self._queue_slots = anyio.Semaphore(self.max_workers + self.max_queue_size)
+            self._thread_limiter = anyio.CapacityLimiter(self.max_workers)
+            self._reserved = set()
+            self._queue_depth = self._max_queue_depth = self._running = 0
+            exit_stack.callback(self._log_queue_statistics)
+
+        self._task_group = await exit_stack.enter_async_context(
+            anyio.create_task_group()
+        )
+
+    def _log_queue_statistics(self):
+        self.logger.debug(
+            f"At most {self._max_queue_depth} submitted calls waited for one of "
+            f"{self.max_workers} workers."
+        )
+
+    def __getstate__(self):
+        """
+        Allow the `ConcurrentTaskRunner` to be serialized by dropping the task group.
+        """
+        data = self.__dict__.copy()
+        data.update(
+            {
+                k: None
+                for k in {"_task_group", "_limiter", "_queue_slots", "_thread_limiter"}
+            }
+        )
+        return data
+
+    def __setstate__(self, data: dict):
+        """
+        When deserialized, we will no longer have a reference to the task group.
+        """
+        self.__dict__.update(data)
+        self._task_group = None
+
+
+def _initialize_process_pool_worker(settings_payload: bytes) -> None:
+    """
+    Enter the settings context of the flow run once when a worker process starts so
+    that each task run executed by the worker does not need to enter it again.
 
+    Defined at the top-level so it can be pickled by the Python pickler.
+    """
+    settings = cloudpickle.loads(settings_payload)
+    if settings is not None:
+        settings.__enter__()
+        setup_logging()
+
+
+class ProcessPoolTaskRunner(BaseTaskRunner):
+    """
+    A parallel task runner that executes task runs in a pool of local worker processes.
+
+    Task runs are not limited by the global interpreter lock, which makes this task
+    runner a good fit for CPU-bound tasks. The worker processes are started with the
+    task runner and are reused across task runs.
+
+    Calls and their results are serialized with `cloudpickle`, so task functions,
+    parameters, and return values must be serializable. Upstream futures are resolved
+    to their final states before a call is sent to a worker.
+
+    Args:
+        max_workers: The number of worker processes. Defaults to the number of CPUs on
+            the machine.
+        start_method: The `multiprocessing` start method used to create worker
+            processes. Defaults to "spawn", since forking a process with running
+            threads is not safe.
+
+    Examples:
+        Using a pool of four processes for parallelism:
+        ```
+        >>> from prefect import flow
+        >>> from prefect.task_runners import ProcessPoolTaskRunner
+        >>> @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        >>> def my_flow():
+        >>>     ...
+        ```
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = "spawn"):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1.")
+
+        self.max_workers = max_workers
+        self.start_method = start_method
+
+        # Runtime attributes
+        self._executor: concurrent.futures.ProcessPoolExecutor = None
+        self._task_group: anyio.abc.TaskGroup = None
+        self._result_events: Dict[UUID, Event] = {}
+        self._results: Dict[UUID, Any] = {}
+
+        super().__init__()
+
+    @property
+    def concurrency_type(self) -> TaskConcurrencyType:
+        return TaskConcurrencyType.PARALLEL
+
+    async def submit(
+        self,
+        key: UUID,
+        call: Callable[[], Awaitable[State[R]]],
+    ) -> None:
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+
+        if not self._executor:
+            raise RuntimeError(
+                "The process pool task runner cannot be used to submit work after "
+                "serialization."
+            )
+
+        self._result_events.setdefault(key, Event())
+
+        # Upstream futures are waited for in the background so submission does not block
+        self._task_group.start_soon(self._run_in_worker_and_store_result, key, call)
+
+    async def wait(
+        self,
+        key: UUID,
+        timeout: float = None,
+    ) -> Optional[State]:
+        if not self._executor:
+            raise RuntimeError(
+                "The process pool task runner cannot be used to wait for work after "
+                "serialization."
+            )
+
+        result = None  # Return value on timeout
+        result_event = self._result_events.setdefault(key, Event())
+
+        with anyio.move_on_after(timeout):
+            await result_event.wait()
             result = self._results.get(key)
-            while not result:
-                await anyio.sleep(0)  # yield to other tasks
-                result = self._results.get(key)
 
         return result
 
+    async def _run_in_worker_and_store_result(
+        self, key: UUID, call: Callable[[], Awaitable[State[R]]]
+    ):
+        """
+        Send the call to a worker process and store the returned state on completion.
+
+        Exceptions are captured as crashed states to prevent task crashes from crashing
+        the flow run.
+        """
+        try:
+            call = await self._resolve_futures(call)
+            payload = await asyncio.wrap_future(
+                self._executor.submit(cloudpickle_wrapped_call(anyio.run, call))
+            )
+            self._results[key] = cloudpickle.loads(payload)
+        except BaseException as exc:
+            self._results[key] = await exception_to_crashed_state(exc)
+
+        self._result_events[key].set()
+
+    async def _resolve_futures(self, call: Callable) -> Callable:
+        """
+        Replace futures in the keyword arguments of the call with their final states.
+
+        Futures are bound to the task runner in this process and cannot be waited for
+        by a worker.
+        """
+        from prefect.futures import PrefectFuture
+
+        if not isinstance(call, partial):
+            return call
+
+        futures = set()
+
+        def collect_futures(expr, context):
+            # Expressions inside quotes should not be traversed
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+
+            if isinstance(expr, PrefectFuture):
+                futures.add(expr)
+
+            return expr
+
+        visit_collection(
+            call.keywords, visit_fn=collect_futures, return_data=False, context={}
+        )
+
+        if not futures:
+            return call
+
+        for future in futures:
+            await future._wait()
+
+        def replace_future(expr, context):
+            # Expressions inside quotes should not be modified
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+
+            if isinstance(expr, PrefectFuture):
+                return expr._final_state
+
+            return expr
+
+        keywords = visit_collection(
+            call.keywords, visit_fn=replace_future, return_data=True, context={}
+        )
+        return partial(call.func, *call.args, **keywords)
+
     async def _start(self, exit_stack: AsyncExitStack):
         """
         Start the process pool
         """
+        # Imported here to avoid a circular import
+        from prefect.context import SettingsContext
+
+        settings = SettingsContext.get()
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_initialize_process_pool_worker,
+            initargs=(cloudpickle.dumps(settings.copy() if settings else None),),
+        )
+        exit_stack.push_async_callback(self._shutdown_executor)
+
         self._task_group = await exit_stack.enter_async_context(
             anyio.create_task_group()
         )
 
+    async def _shutdown_executor(self):
+        # Shutting down waits for the worker processes to exit
+        await run_sync_in_worker_thread(self._executor.shutdown, wait=True)
+
     def __getstate__(self):
         """
-        Allow the `ConcurrentTaskRunner` to be serialized by dropping the task group.
+        Allow the `ProcessPoolTaskRunner` to be serialized by dropping the process pool
+        and task group.
         """
         data = self.__dict__.copy()
-        data.update({k: None for k in {"_task_group"}})
+        data.update({k: None for k in {"_executor", "_task_group"}})
         return data
 
     def __setstate__(self, data: dict):
         """
-        When deserialized, we will no longer have a reference to the task group.
+        When deserialized, we will no longer have a reference to the process pool or
+        task group.
         """
         self.__dict__.update(data)
+        self._executor = None
         self._task_group = None
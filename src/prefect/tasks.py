@@ -33,6 +33,7 @@ from prefect.client.schemas import TaskRun
 from prefect.context import PrefectObjectRegistry
 from prefect.futures import PrefectFuture
 from prefect.results import ResultSerializer, ResultStorage
+from prefect.settings import PREFECT_TASKS_INPUT_HASH_ALGORITHM
 from prefect.states import State
 from prefect.utilities.annotations import NotSet
 from prefect.utilities.asyncutils import Async, Sync
@@ -40,7 +41,7 @@ from prefect.utilities.callables import (
     get_call_parameters,
     raise_for_reserved_arguments,
 )
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import fingerprint_objects, get_hash_algorithm
 from prefect.utilities.importtools import to_qualified_name
 
 if TYPE_CHECKING:
@@ -56,10 +57,14 @@ def task_input_hash(
     context: "TaskRunContext", arguments: Dict[str, Any]
 ) -> Optional[str]:
     """
-    A task cache key implementation which hashes all inputs to the task using a JSON or
-    cloudpickle serializer. If any arguments are not JSON serializable, the pickle
-    serializer is used as a fallback. If cloudpickle fails, this will return a null key
-    indicating that a cache key could not be generated for the given inputs.
+    A task cache key implementation which hashes all inputs to the task. Inputs are
+    fingerprinted by type: containers are traversed and buffers such as bytes and NumPy
+    or Arrow arrays are hashed in place, while other arguments are serialized with JSON
+    or, if they are not JSON serializable, cloudpickle. If cloudpickle fails, this will
+    return a null key indicating that a cache key could not be generated for the given
+    inputs.
+
+    The hash algorithm is configured with `PREFECT_TASKS_INPUT_HASH_ALGORITHM`.
 
     Arguments:
         context: the active `TaskRunContext`
@@ -68,13 +73,14 @@ def task_input_hash(
     Returns:
         a string hash if hashing succeeded, else `None`
     """
-    return hash_objects(
+    return fingerprint_objects(
         # We use the task key to get the qualified name for the task and include the
         # task functions `co_code` bytes to avoid caching when the underlying function
         # changes
         context.task.task_key,
         context.task.fn.__code__.co_code.hex(),
         arguments,
+        hash_algo=get_hash_algorithm(PREFECT_TASKS_INPUT_HASH_ALGORITHM.value()),
     )
 
 
@@ -3,6 +3,7 @@ Utilities for extensions of and operations on Python collections.
 """
 import io
 import itertools
+import weakref
 from collections import OrderedDict, defaultdict
 from collections.abc import Iterator as IteratorABC
 from collections.abc import Sequence
@@ -208,6 +209,60 @@ def batched_iterable(iterable: Iterable[T], size: int) -> Iterator[Tuple[T, ...]
         yield batch
 
 
+# The kinds of objects traversed by `visit_collection` and `iter_collection`
+_LEAF = 0
+_MOCK = 1
+_ANNOTATION = 2
+_SEQUENCE = 3
+_ITERATOR = 4
+_MAPPING = 5
+_DATACLASS = 6
+_PYDANTIC = 7
+
+# Caches the kind of each type so the checks are only made once per type; types are
+# held weakly so classes created at runtime can still be garbage collected
+_COLLECTION_KINDS: "weakref.WeakKeyDictionary[type, int]" = weakref.WeakKeyDictionary()
+
+
+def _get_collection_kind(typ: type) -> int:
+    try:
+        return _COLLECTION_KINDS[typ]
+    except KeyError:
+        pass
+
+    if issubclass(typ, Mock):
+        # Do not attempt to recurse into mock objects
+        kind = _MOCK
+    elif issubclass(typ, BaseAnnotation):
+        kind = _ANNOTATION
+    elif typ in (list, tuple, set):
+        kind = _SEQUENCE
+    elif issubclass(typ, IteratorABC) and not issubclass(typ, (str, bytes, io.IOBase)):
+        kind = _ITERATOR
+    elif typ in (dict, OrderedDict):
+        kind = _MAPPING
+    elif is_dataclass(typ):
+        # Dataclass types themselves have the type `type` and are not traversed
+        kind = _DATACLASS
+    elif issubclass(typ, pydantic.BaseModel):
+        kind = _PYDANTIC
+    else:
+        kind = _LEAF
+
+    _COLLECTION_KINDS[typ] = kind
+    return kind
+
+
+def _get_pydantic_fields(model: pydantic.BaseModel) -> Set[str]:
+    # NOTE: This implementation *does not* traverse private attributes
+    # Pydantic does not expose extras in `__fields__` so we use `__fields_set__`
+    # as well to get all of the relevant attributes
+    # Check for presence of attrs even if they're in the field set due to pydantic#4916
+    return {
+        f for f in model.__fields_set__.union(model.__fields__) if hasattr(model, f)
+    }
+
+
 class StopVisiting(BaseException):
     """
     A special exception used to stop recursive visits in `visit_collection`.
@@ -304,15 +359,19 @@ def visit_collection(
         return result if return_data else None
 
     # Get the expression type; treat iterators like lists
-    typ = list if isinstance(expr, IteratorABC) and isiterable(expr) else type(expr)
-    typ = cast(type, typ)  # mypy treats this as 'object' otherwise and complains
+    kind = _get_collection_kind(type(expr))
+    if kind == _ITERATOR and isiterable(expr):
+        kind = _SEQUENCE
+        typ = list
+    else:
+        typ = type(expr)
 
     # Then visit every item in the expression if it is a collection
-    if isinstance(expr, Mock):
+    if kind == _MOCK:
         # Do not attempt to recurse into mock objects
         result = expr
 
-    elif isinstance(expr, BaseAnnotation):
+    elif kind == _ANNOTATION:
         if context is not None:
             context["annotation"] = expr
         value = visit_nested(expr.unwrap())
@@ -322,28 +381,22 @@ def visit_collection(
         else:
             result = expr.rewrap(value) if return_data else None
 
-    elif typ in (list, tuple, set):
+    elif kind == _SEQUENCE:
         items = [visit_nested(o) for o in expr]
         result = typ(items) if return_data else None
 
-    elif typ in (dict, OrderedDict):
+    elif kind == _MAPPING:
         assert isinstance(expr, (dict, OrderedDict))  # typecheck assertion
         items = [(visit_nested(k), visit_nested(v)) for k, v in expr.items()]
         result = typ(items) if return_data else None
 
-    elif is_dataclass(expr) and not isinstance(expr, type):
+    elif kind == _DATACLASS:
         values = [visit_nested(getattr(expr, f.name)) for f in fields(expr)]
         items = {field.name: value for field, value in zip(fields(expr), values)}
         result = typ(**items) if return_data else None
 
-    elif isinstance(expr, pydantic.BaseModel):
-        # NOTE: This implementation *does not* traverse private attributes
-        # Pydantic does not expose extras in `__fields__` so we use `__fields_set__`
-        # as well to get all of the relevant attributes
-        # Check for presence of attrs even if they're in the field set due to pydantic#4916
-        model_fields = {
-            f for f in expr.__fields_set__.union(expr.__fields__) if hasattr(expr, f)
-        }
+    elif kind == _PYDANTIC:
+        model_fields = _get_pydantic_fields(expr)
         items = [visit_nested(getattr(expr, key)) for key in model_fields]
 
         if return_data:
@@ -378,6 +431,70 @@ def visit_collection(
     return result
 
 
+def iter_collection(
+    expr: Any,
+    max_depth: int = -1,
+    skip_annotations: Tuple[Type[BaseAnnotation], ...] = (),
+) -> Iterator[Tuple[Any, Optional[BaseAnnotation]]]:
+    """
+    Iterate over every element of an arbitrary Python collection, including the
+    collection itself and every nested collection. The same types are traversed as in
+    `visit_collection`.
+
+    Unlike `visit_collection`, the collection is traversed iteratively without calling
+    a function for each element, so this is faster when the data does not need to be
+    transformed. Elements that cannot contain other elements are yielded as soon as
+    their collection is traversed, so collections of scalars or arrays are never
+    placed on the stack. Elements are not yielded in any particular order.
+
+    Args:
+        expr: a Python object or expression
+        max_depth: Controls the depth of traversal, as in `visit_collection`.
+        skip_annotations: Annotation types whose contents should not be traversed.
+            The annotations themselves are still yielded.
+
+    Yields:
+        Tuples of each element and the innermost annotation containing it, if any.
+    """
+    stack = [(expr, None, max_depth)]
+
+    while stack:
+        expr, annotation, depth = stack.pop()
+        yield expr, annotation
+
+        if depth == 0:
+            continue
+
+        kind = _get_collection_kind(type(expr))
+        if kind == _SEQUENCE:
+            children = expr
+        elif kind == _MAPPING:
+            children = itertools.chain.from_iterable(expr.items())
+        elif kind == _ANNOTATION:
+            if isinstance(expr, skip_annotations):
+                continue
+            annotation = expr
+            children = (expr.unwrap(),)
+        elif kind == _ITERATOR and isiterable(expr):
+            children = expr
+        elif kind == _DATACLASS:
+            children = [getattr(expr, f.name) for f in fields(expr)]
+        elif kind == _PYDANTIC:
+            children = [getattr(expr, key) for key in _get_pydantic_fields(expr)]
+        else:
+            continue
+
+        nested = []
+        for child in children:
+            if _get_collection_kind(type(child)) == _LEAF:
+                yield child, annotation
+            else:
+                nested.append((child, annotation, depth - 1))
+
+        # Reverse nested collections so they are traversed in order
+        stack.extend(reversed(nested))
+
+
 def remove_nested_keys(keys_to_remove: List[Hashable], obj):
     """
     Recurses a dictionary returns a copy without all keys that match an entry in
@@ -18,16 +18,61 @@ class Foo(Base):
 key = get_dispatch_key(Foo)  # 'foo'
 lookup_type(Base, key) # Foo
 ```
+
+Modules that register types can be imported on demand instead of up front with
+`register_deferred_import`; they are imported before the first lookup in any registry.
+
+```python
+register_deferred_import("my_package.foo")
+
+lookup_type(Base, "foo")  # imports `my_package.foo`, then returns Foo
+```
 """
 import abc
+import importlib
 import inspect
+import threading
 import warnings
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 
 T = TypeVar("T", bound=Type)
 
 _TYPE_REGISTRIES: Dict[Type, Dict[str, Type]] = {}
 
+_DEFERRED_IMPORTS: List[Union[str, Callable[[], Any]]] = []
+_DEFERRED_IMPORTS_LOCK = threading.RLock()
+
+
+def register_deferred_import(module: Union[str, Callable[[], Any]]) -> None:
+    """
+    Register a module that registers types, to be imported before the first lookup in
+    any registry.
+
+    Args:
+        module: The name of a module to import, or a callable that imports modules
+    """
+    with _DEFERRED_IMPORTS_LOCK:
+        _DEFERRED_IMPORTS.append(module)
+
+
+def load_deferred_imports() -> None:
+    """
+    Import all modules registered with `register_deferred_import` that have not been
+    imported yet, so that the types they define are registered.
+    """
+    if not _DEFERRED_IMPORTS:
+        return
+
+    # Hold the lock for the duration of the imports so that lookups from other threads
+    # do not see a partially loaded registry
+    with _DEFERRED_IMPORTS_LOCK:
+        while _DEFERRED_IMPORTS:
+            module = _DEFERRED_IMPORTS.pop(0)
+            if callable(module):
+                module()
+            else:
+                importlib.import_module(module)
+
 
 def get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
     """
@@ -35,6 +80,11 @@ def get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
 
     If not found, `None` is returned.
     """
+    load_deferred_imports()
+    return _get_registry_for_type(cls)
+
+
+def _get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
     return next(
         filter(
             lambda registry: registry is not None,
@@ -127,8 +177,9 @@ def register_type(cls: T) -> T:
 
     One of the classes base types must be registered using `register_base_type`.
     """
-    # Lookup the registry for this type
-    registry = get_registry_for_type(cls)
+    # Lookup the registry for this type; deferred imports are not loaded since types
+    # are registered while they are imported
+    registry = _get_registry_for_type(cls)
 
     # Check if a base type is registered
     if registry is None:
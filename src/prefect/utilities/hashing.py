@@ -1,18 +1,28 @@
 import hashlib
+import json
+import struct
 import sys
+import threading
 from functools import partial
-from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import cloudpickle
 
 from prefect.serializers import JSONSerializer
+from prefect.utilities.importtools import to_qualified_name
 
 if sys.version_info[:2] >= (3, 9):
     _md5 = partial(hashlib.md5, usedforsecurity=False)
 else:
     _md5 = hashlib.md5
 
+# The size of the chunks read from files and fed to the hash object
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# The maximum depth of lists and dictionaries that are fingerprinted by serializing them
+# with JSON instead of traversing them
+MAX_JSON_DEPTH = 32
+
 
 def stable_hash(*args: Union[str, bytes], hash_algo=_md5) -> str:
     """Given some arguments, produces a stable 64-bit hash of their contents.
@@ -44,8 +54,17 @@ def file_hash(path: str, hash_algo=_md5) -> str:
     Returns:
         str: a hash of the file contents
     """
-    contents = Path(path).read_bytes()
-    return stable_hash(contents, hash_algo=hash_algo)
+    h = hash_algo()
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb") as file:
+        # Read into a single reusable buffer so large files are never held in memory
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            h.update(view[:size])
+    return h.hexdigest()
 
 
 def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
@@ -65,3 +84,415 @@ def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
         pass
 
     return None
+
+
+def get_hash_algorithm(name: str) -> Callable:
+    """
+    Retrieve a hash algorithm from `hashlib` by name, e.g. `"md5"`, `"sha256"` or
+    `"blake2b"`.
+
+    Args:
+        name: The name of an algorithm available in `hashlib`.
+
+    Returns:
+        A callable that creates a new hash object.
+
+    Raises:
+        ValueError: If the algorithm is not available.
+    """
+    name = name.lower()
+    if name == "md5":
+        return _md5
+    if name not in hashlib.algorithms_available:
+        raise ValueError(
+            f"Unknown hash algorithm {name!r}. Expected one of:"
+            f" {', '.join(sorted(hashlib.algorithms_available))}."
+        )
+    return getattr(hashlib, name, partial(hashlib.new, name))
+
+
+FingerprintFunction = Callable[[Any, "Fingerprint"], None]
+
+_FINGERPRINTERS: Dict[Union[type, str], FingerprintFunction] = {}
+_FINGERPRINTER_CACHE: Dict[type, Optional[FingerprintFunction]] = {}
+_FINGERPRINTERS_LOCK = threading.Lock()
+
+
+def register_fingerprinter(*types: Union[type, str]):
+    """
+    Register a function that streams the fingerprint of objects of the given types
+    into a `Fingerprint`.
+
+    Types may be given by their fully qualified name, e.g. `"numpy.ndarray"`, so
+    fingerprinters can be registered for libraries without importing them. Subclasses
+    of a registered type use its fingerprinter unless they have their own.
+
+    The function is called with the object and the `Fingerprint` to update. Objects
+    without a registered fingerprinter are serialized with JSON, falling back to
+    cloudpickle.
+
+    Example:
+        >>> @register_fingerprinter(MyDataset)
+        >>> def fingerprint_dataset(dataset, fingerprint):
+        >>>     fingerprint.update_tag("my_package.MyDataset")
+        >>>     fingerprint.update(dataset.checksum)
+    """
+
+    def decorator(fn: FingerprintFunction) -> FingerprintFunction:
+        with _FINGERPRINTERS_LOCK:
+            for type_ in types:
+                _FINGERPRINTERS[type_] = fn
+            _FINGERPRINTER_CACHE.clear()
+        return fn
+
+    return decorator
+
+
+def _get_fingerprinter(cls: type) -> Optional[FingerprintFunction]:
+    try:
+        return _FINGERPRINTER_CACHE[cls]
+    except KeyError:
+        pass
+
+    fingerprinter = None
+    for base in cls.__mro__:
+        fingerprinter = _FINGERPRINTERS.get(base) or _FINGERPRINTERS.get(
+            to_qualified_name(base)
+        )
+        if fingerprinter is not None:
+            break
+
+    _FINGERPRINTER_CACHE[cls] = fingerprinter
+    return fingerprinter
+
+
+class Fingerprint:
+    """
+    Streams a stable, type-aware fingerprint of objects into a hash object.
+
+    Objects are dispatched by type to the functions registered with
+    `register_fingerprinter`. Containers are traversed and buffers are fed to the hash
+    object directly, so large inputs are never serialized or copied in full.
+    """
+
+    def __init__(self, hash_algo=_md5):
+        self._hash_algo = hash_algo
+        self._hash = hash_algo()
+        self._active_containers = set()
+
+    def update(self, obj: Any) -> None:
+        """
+        Add an object to the fingerprint.
+        """
+        fingerprinter = _get_fingerprinter(type(obj))
+        if fingerprinter is None:
+            self.update_serialized(obj)
+        else:
+            fingerprinter(obj, self)
+
+    def update_tag(self, tag: str, size: Optional[int] = None) -> None:
+        """
+        Add a tag identifying the kind of the next value, with an optional size, to
+        the fingerprint. Tags keep values of different kinds or lengths from producing
+        the same stream of bytes.
+        """
+        self._hash.update(b"\x00" + tag.encode())
+        if size is not None:
+            self._hash.update(struct.pack("<Q", size))
+
+    def update_bytes(self, data: Any) -> None:
+        """
+        Add an object supporting the buffer protocol to the fingerprint without
+        copying it.
+        """
+        view = memoryview(data)
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        self.update_tag("bytes", view.nbytes)
+        self._hash.update(view)
+
+    def update_items(self, tag: str, container: Any, items: Any = None) -> None:
+        """
+        Add an ordered container of objects to the fingerprint. The items of the
+        container are used unless others are given.
+        """
+        with self._visiting(container):
+            self.update_tag(tag, len(container))
+            for item in container if items is None else items:
+                self.update(item)
+
+    def update_unordered_items(
+        self, tag: str, container: Any, items: Any = None
+    ) -> None:
+        """
+        Add an unordered container of objects to the fingerprint. Each item is
+        fingerprinted separately and the results are sorted so the fingerprint does
+        not depend on iteration order.
+        """
+        with self._visiting(container):
+            digests = sorted(
+                self._digest(item) for item in (container if items is None else items)
+            )
+        self.update_tag(tag, len(container))
+        for digest in digests:
+            self._hash.update(digest)
+
+    def update_json(self, obj: Any) -> bool:
+        """
+        Add a list or dictionary made up only of JSON values to the fingerprint with a
+        single serialization, which is much faster than traversing it.
+
+        Returns `False` without changing the fingerprint if the object contains other
+        values, such as buffers or arrays, that need to be traversed.
+        """
+        if not _is_json_value(obj):
+            return False
+
+        data = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+        self.update_tag("json_value")
+        self.update_bytes(data.encode())
+        return True
+
+    def update_serialized(self, obj: Any) -> None:
+        """
+        Add an object without a registered fingerprinter to the fingerprint by
+        serializing it with JSON, falling back to cloudpickle.
+        """
+        try:
+            data = JSONSerializer(dumps_kwargs={"sort_keys": True}).dumps(obj)
+            tag = "json"
+        except Exception:
+            data = cloudpickle.dumps(obj)
+            tag = "pickle"
+        self.update_tag(tag)
+        self.update_bytes(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _digest(self, obj: Any) -> bytes:
+        fingerprint = Fingerprint(hash_algo=self._hash_algo)
+        fingerprint._active_containers = self._active_containers
+        fingerprint.update(obj)
+        return fingerprint._hash.digest()
+
+    def _visiting(self, container: Any) -> "_VisitingContainer":
+        return _VisitingContainer(self._active_containers, container)
+
+
+class _VisitingContainer:
+    """
+    Tracks the containers being fingerprinted to detect circular references.
+    """
+
+    def __init__(self, active_containers: set, container: Any):
+        self._active_containers = active_containers
+        self._id = id(container)
+
+    def __enter__(self):
+        if self._id in self._active_containers:
+            raise ValueError("Cannot fingerprint objects with circular references.")
+        self._active_containers.add(self._id)
+
+    def __exit__(self, *_):
+        self._active_containers.discard(self._id)
+
+
+# Types that are checked before looking up their fingerprinter since they make up most
+# JSON values
+_JSON_SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+
+def _is_json_value(obj: Any, depth: int = 0) -> bool:
+    """
+    Check if an object is made up only of strings, numbers, `None`, lists and
+    dictionaries with string keys, which are serialized by JSON without losing
+    information.
+
+    Objects are checked by their fingerprinter so subclasses and types with their own
+    fingerprinter are treated the same as when they are traversed.
+    """
+    cls = type(obj)
+    if cls in _JSON_SCALAR_TYPES:
+        return True
+
+    fingerprinter = _get_fingerprinter(cls)
+    if fingerprinter is _fingerprint_list:
+        items = obj
+    elif fingerprinter is _fingerprint_dict:
+        for key_type in set(map(type, obj)):
+            if _get_fingerprinter(key_type) is not _fingerprint_str:
+                return False
+        items = obj.values()
+    elif fingerprinter is _fingerprint_number:
+        return not isinstance(obj, complex)
+    else:
+        return fingerprinter is _fingerprint_str or fingerprinter is _fingerprint_none
+
+    if depth >= MAX_JSON_DEPTH:
+        # Deeply nested and circular objects are traversed instead
+        return False
+
+    for item in items:
+        if type(item) not in _JSON_SCALAR_TYPES and not _is_json_value(item, depth + 1):
+            return False
+
+    return True
+
+
+def fingerprint_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
+    """
+    Attempt to hash objects by streaming a type-aware fingerprint of them into the
+    hash object. Unlike `hash_objects`, large buffers such as bytes and NumPy or Arrow
+    arrays are hashed in place instead of being serialized first.
+
+    If the objects cannot be fingerprinted, this falls back to `hash_objects` and
+    `None` is returned if that fails as well.
+    """
+    try:
+        fingerprint = Fingerprint(hash_algo=hash_algo)
+        fingerprint.update((args, kwargs))
+        return fingerprint.hexdigest()
+    except Exception:
+        pass
+
+    return hash_objects(*args, hash_algo=hash_algo, **kwargs)
+
+
+@register_fingerprinter(type(None))
+def _fingerprint_none(obj: None, fingerprint: Fingerprint) -> None:
+    fingerprint.update_tag("none")
+
+
+@register_fingerprinter(bool, int, float, complex)
+def _fingerprint_number(obj: Union[int, float, complex], fingerprint: Fingerprint):
+    # Subclasses such as integer enums are fingerprinted by their value, and the tag
+    # keeps `1`, `1.0` and `True` distinct
+    for number_type in (bool, int, float, complex):
+        if isinstance(obj, number_type):
+            fingerprint.update_tag(number_type.__name__)
+            fingerprint.update_bytes(number_type.__repr__(obj).encode())
+            return
+
+
+@register_fingerprinter(str)
+def _fingerprint_str(obj: str, fingerprint: Fingerprint) -> None:
+    fingerprint.update_tag("str")
+    fingerprint.update_bytes(obj.encode())
+
+
+@register_fingerprinter(bytes, bytearray, memoryview)
+def _fingerprint_bytes(obj: Union[bytes, bytearray, memoryview], fingerprint):
+    fingerprint.update_bytes(obj)
+
+
+@register_fingerprinter(list)
+def _fingerprint_list(obj: list, fingerprint: Fingerprint) -> None:
+    if not fingerprint.update_json(obj):
+        fingerprint.update_items("list", obj)
+
+
+@register_fingerprinter(tuple)
+def _fingerprint_tuple(obj: tuple, fingerprint: Fingerprint) -> None:
+    fingerprint.update_items("tuple", obj)
+
+
+@register_fingerprinter(dict)
+def _fingerprint_dict(obj: dict, fingerprint: Fingerprint) -> None:
+    if not fingerprint.update_json(obj):
+        fingerprint.update_unordered_items("dict", obj, obj.items())
+
+
+@register_fingerprinter(set, frozenset)
+def _fingerprint_set(obj: Union[set, frozenset], fingerprint: Fingerprint) -> None:
+    fingerprint.update_unordered_items("set", obj)
+
+
+@register_fingerprinter("numpy.ndarray")
+def _fingerprint_numpy_array(obj: Any, fingerprint: Fingerprint) -> None:
+    import numpy
+
+    if type(obj) is not numpy.ndarray or obj.dtype.hasobject:
+        # Subclasses such as masked arrays carry more than their buffer and arrays of
+        # Python objects do not have a meaningful buffer
+        fingerprint.update_serialized(obj)
+        return
+
+    fingerprint.update_tag("numpy.ndarray", obj.ndim)
+    fingerprint.update_bytes(str(obj.dtype.descr).encode())
+    fingerprint.update_bytes(struct.pack(f"<{obj.ndim}Q", *obj.shape))
+    # Only arrays that are not already contiguous are copied
+    fingerprint.update_bytes(numpy.ascontiguousarray(obj).reshape(-1).view("uint8"))
+
+
+@register_fingerprinter("numpy.generic")
+def _fingerprint_numpy_scalar(obj: Any, fingerprint: Fingerprint) -> None:
+    if obj.dtype.hasobject:
+        fingerprint.update_serialized(obj)
+        return
+
+    fingerprint.update_tag("numpy.generic")
+    fingerprint.update_bytes(str(obj.dtype.descr).encode())
+    fingerprint.update_bytes(obj.tobytes())
+
+
+@register_fingerprinter("pyarrow.lib.Table", "pyarrow.lib.RecordBatch")
+def _fingerprint_arrow_table(obj: Any, fingerprint: Fingerprint) -> None:
+    fingerprint.update_tag("pyarrow.table", obj.num_columns)
+    fingerprint.update_bytes(obj.schema.serialize())
+    for column in obj.columns:
+        fingerprint.update(column)
+
+
+@register_fingerprinter("pyarrow.lib.ChunkedArray")
+def _fingerprint_arrow_chunked_array(obj: Any, fingerprint: Fingerprint) -> None:
+    fingerprint.update_tag("pyarrow.chunked_array", obj.num_chunks)
+    for chunk in obj.chunks:
+        fingerprint.update(chunk)
+
+
+@register_fingerprinter("pyarrow.lib.Array")
+def _fingerprint_arrow_array(obj: Any, fingerprint: Fingerprint) -> None:
+    import pyarrow
+
+    fingerprint.update_tag("pyarrow.array", len(obj))
+    fingerprint.update_bytes(str(obj.type).encode())
+    fingerprint.update_bytes(struct.pack("<QQ", obj.offset, obj.null_count))
+
+    if pyarrow.types.is_dictionary(obj.type):
+        # The dictionary of values is not included in the buffers of the array
+        fingerprint.update(obj.indices)
+        fingerprint.update(obj.dictionary)
+        return
+
+    if pyarrow.types.is_struct(obj.type):
+        # The fields are sliced to the offset and length of the array
+        children = [obj.field(i) for i in range(obj.type.num_fields)]
+    elif (
+        pyarrow.types.is_list(obj.type)
+        or pyarrow.types.is_large_list(obj.type)
+        or pyarrow.types.is_fixed_size_list(obj.type)
+        or pyarrow.types.is_map(obj.type)
+    ):
+        children = [obj.values]
+    elif obj.type.num_fields:
+        # The children of other nested arrays are not exposed by `pyarrow`
+        fingerprint.update_serialized(obj)
+        return
+    else:
+        children = []
+
+    buffers = obj.buffers()
+    if children:
+        # The buffers of nested arrays include the buffers of their children, which
+        # are fingerprinted separately so their own offsets and lengths are included
+        buffers = buffers[: obj.type.num_buffers]
+
+    for buffer in buffers:
+        if buffer is None:
+            fingerprint.update_tag("none")
+        else:
+            fingerprint.update_bytes(buffer)
+
+    for child in children:
+        fingerprint.update(child)
@@ -1,4 +1,5 @@
 import sys
+import time
 from collections import deque
 from traceback import format_exception
 from types import TracebackType
@@ -19,6 +20,7 @@ async def critical_service_loop(
     printer: Callable[..., None] = print,
     run_once: bool = False,
     jitter_range: float = None,
+    include_workload_time: bool = False,
 ):
     """
     Runs the given `workload` function on the specified `interval`, while being
@@ -36,12 +38,16 @@ async def critical_service_loop(
         jitter_range: if set, the interval will be a random variable (rv) drawn from
             a clamped Poisson distribution where lambda = interval and the rv is bound
             between `interval * (1 - range) < rv < interval * (1 + range)`
+        include_workload_time: if set, the time taken by the workload counts towards
+            the interval, so a workload that waits, such as a long-poll, is called
+            again as soon as it returns after waiting for the full interval
     """
 
     track_record: Deque[bool] = deque([True] * consecutive, maxlen=consecutive)
     failures: Deque[Tuple[Exception, TracebackType]] = deque(maxlen=memory)
 
     while True:
+        started = time.monotonic()
         try:
             await workload()
 
@@ -112,4 +118,7 @@ async def critical_service_loop(
         else:
             sleep = interval
 
+        if include_workload_time:
+            sleep = max(0, sleep - (time.monotonic() - started))
+
         await anyio.sleep(sleep)
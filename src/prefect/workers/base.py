@@ -368,8 +368,16 @@ class BaseWorker(abc.ABC):
         self._runs_task_group = None
         self._client = None
 
-    async def get_and_submit_flow_runs(self):
-        runs_response = await self._get_scheduled_flow_runs()
+    async def get_and_submit_flow_runs(self, wait_seconds: Optional[float] = None):
+        """
+        Retrieves scheduled flow runs from the work pool and submits them for
+        execution.
+
+        Args:
+            wait_seconds: If no flow runs are scheduled, the number of seconds to wait
+                for a flow run to be scheduled before returning.
+        """
+        runs_response = await self._get_scheduled_flow_runs(wait_seconds=wait_seconds)
         return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
 
     async def _update_local_work_pool_info(self):
@@ -426,10 +434,11 @@ class BaseWorker(abc.ABC):
         self._logger.debug("Worker synchronized with the Prefect API server.")
 
     async def _get_scheduled_flow_runs(
-        self,
+        self, wait_seconds: Optional[float] = None
     ) -> List["WorkerFlowRunResponse"]:
         """
-        Retrieve scheduled flow runs from the work pool's queues.
+        Retrieve scheduled flow runs from the work pool's queues, waiting up to
+        `wait_seconds` for a flow run to be scheduled if there are none.
         """
         scheduled_before = pendulum.now("utc").add(seconds=int(self._prefetch_seconds))
         self._logger.debug(
@@ -441,6 +450,7 @@ class BaseWorker(abc.ABC):
                     work_pool_name=self._work_pool_name,
                     scheduled_before=scheduled_before,
                     work_queue_names=list(self._work_queues),
+                    wait_seconds=wait_seconds,
                 )
             )
             self._logger.debug(
@@ -1,4 +1,5 @@
 import anyio
+import cloudpickle
 
 from prefect._internal.concurrency.primitives import Event
 
@@ -163,3 +164,18 @@ async def test_event_is_set():
     assert not event.is_set()
     event.set()
     assert event.is_set()
+
+
+async def test_event_is_pickleable():
+    event = Event()
+    event.set()
+    unpickled = cloudpickle.loads(cloudpickle.dumps(event))
+    assert unpickled.is_set()
+
+    with anyio.fail_after(1):
+        await unpickled.wait()
+
+    unset = cloudpickle.loads(cloudpickle.dumps(Event()))
+    assert not unset.is_set()
+    unset.set()
+    assert unset.is_set()
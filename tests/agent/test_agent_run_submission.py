@@ -1,8 +1,10 @@
 import datetime
 import inspect
+import time
 from typing import Generator
 from unittest.mock import MagicMock
 
+import anyio
 import pendulum
 import pytest
 
@@ -1049,6 +1051,28 @@ async def test_agent_with_work_pool(
     assert submitted_flow_run_ids == work_queue_flow_run_ids
 
 
+async def test_agent_with_work_pool_waits_for_runs_to_be_scheduled(
+    orion_client: PrefectClient,
+    deployment_in_non_default_work_pool: schemas.core.Deployment,
+    work_pool: schemas.core.WorkPool,
+):
+    async def schedule_run():
+        await anyio.sleep(0.5)
+        return await orion_client.create_flow_run_from_deployment(
+            deployment_in_non_default_work_pool.id, state=Scheduled()
+        )
+
+    async with PrefectAgent(work_pool_name=work_pool.name) as agent:
+        agent.submit_run = AsyncMock()  # do not actually run anything
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(schedule_run)
+            start = time.monotonic()
+            submitted_flow_runs = await agent.get_and_submit_flow_runs(wait_seconds=30)
+
+    assert len(submitted_flow_runs) == 1
+    assert time.monotonic() - start < 10
+
+
 async def test_agent_with_work_pool_and_work_queue_prefix(
     orion_client: PrefectClient,
     deployment_in_non_default_work_pool: schemas.core.Deployment,
@@ -21,7 +21,13 @@ import prefect.client.schemas as client_schemas
 import prefect.context
 import prefect.exceptions
 from prefect import flow, tags
-from prefect.client.orchestration import PrefectClient, ServerType, get_client
+from prefect.client.orchestration import (
+    PrefectClient,
+    ServerType,
+    get_client,
+    task_run_create_from_task,
+    task_run_set_state_from_state,
+)
 from prefect.client.schemas import OrchestrationResult
 from prefect.client.utilities import inject_client
 from prefect.deprecated.data_documents import DataDocument
@@ -35,12 +41,13 @@ from prefect.server.schemas.filters import (
     LogFilterFlowRunId,
 )
 from prefect.server.schemas.schedules import IntervalSchedule
-from prefect.server.schemas.states import StateType
+from prefect.server.schemas.states import StateDetails, StateType
 from prefect.settings import (
     PREFECT_API_DATABASE_MIGRATE_ON_START,
     PREFECT_API_KEY,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
+    PREFECT_CLIENT_EPHEMERAL_IN_PROCESS,
     PREFECT_CLOUD_API_URL,
     temporary_settings,
 )
@@ -1101,6 +1108,69 @@ async def test_create_then_read_task_run_with_state(orion_client):
     assert task_run.state.is_running()
 
 
+async def test_create_then_read_task_runs_in_bulk(orion_client):
+    @flow
+    def foo():
+        pass
+
+    @task(tags=["a", "b"], retries=3)
+    def bar(orion_client):
+        pass
+
+    flow_run = await orion_client.create_flow_run(foo)
+    task_runs = await orion_client.create_task_runs(
+        [
+            task_run_create_from_task(bar, flow_run_id=flow_run.id, dynamic_key=str(i))
+            for i in range(3)
+        ]
+    )
+    assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+
+    for task_run in task_runs:
+        lookup = await orion_client.read_task_run(task_run.id)
+        assert lookup.tags == task_run.tags
+        assert lookup.state.is_pending()
+
+
+async def test_create_task_runs_falls_back_when_bulk_endpoint_is_missing(
+    orion_client, monkeypatch
+):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(orion_client):
+        pass
+
+    flow_run = await orion_client.create_flow_run(foo)
+
+    original_post = orion_client._client.post
+    requested_paths = []
+
+    async def post(path, **kwargs):
+        requested_paths.append(path)
+        if path == "/task_runs/bulk":
+            request = httpx.Request("POST", path)
+            raise httpx.HTTPStatusError(
+                "Not found",
+                request=request,
+                response=httpx.Response(status.HTTP_404_NOT_FOUND, request=request),
+            )
+        return await original_post(path, **kwargs)
+
+    monkeypatch.setattr(orion_client._client, "post", post)
+
+    task_runs = await orion_client.create_task_runs(
+        [
+            task_run_create_from_task(bar, flow_run_id=flow_run.id, dynamic_key=str(i))
+            for i in range(2)
+        ]
+    )
+    assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1"]
+    assert requested_paths == ["/task_runs/bulk", "/task_runs/", "/task_runs/"]
+
+
 async def test_set_then_read_task_run_state(orion_client):
     @flow
     def foo():
@@ -1129,6 +1199,87 @@ async def test_set_then_read_task_run_state(orion_client):
     assert run.state.message == "Test!"
 
 
+async def test_set_task_run_states(orion_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(orion_client):
+        pass
+
+    flow_run = await orion_client.create_flow_run(foo)
+    task_runs = [
+        await orion_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        for i in range(2)
+    ]
+
+    results = await orion_client.set_task_run_states(
+        [
+            task_run_set_state_from_state(
+                task_run.id, Completed(message=f"Test {i}!"), force=True
+            )
+            for i, task_run in enumerate(task_runs)
+        ]
+    )
+    assert all(isinstance(result, OrchestrationResult) for result in results)
+    assert [result.status for result in results] == [
+        schemas.responses.SetStateStatus.ACCEPT,
+        schemas.responses.SetStateStatus.ACCEPT,
+    ]
+
+    for i, task_run in enumerate(task_runs):
+        run = await orion_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == f"Test {i}!"
+        assert run.state.state_details.task_run_id == task_run.id
+
+
+async def test_read_cached_task_run_states(orion_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(orion_client):
+        pass
+
+    flow_run = await orion_client.create_flow_run(foo)
+    task_run = await orion_client.create_task_run(
+        bar, flow_run_id=flow_run.id, dynamic_key="0"
+    )
+    await orion_client.set_task_run_state(
+        task_run.id,
+        Completed(state_details=StateDetails(cache_key="cached")),
+    )
+
+    cached_states = await orion_client.read_cached_task_run_states(
+        ["cached", "missing"]
+    )
+    assert list(cached_states) == ["cached"]
+    assert isinstance(cached_states["cached"], State)
+    assert cached_states["cached"].is_completed()
+    assert cached_states["cached"].state_details.task_run_id == task_run.id
+
+
+async def test_read_cached_task_run_states_when_endpoint_is_missing(
+    orion_client, monkeypatch
+):
+    async def post(path, **kwargs):
+        request = httpx.Request("POST", path)
+        raise httpx.HTTPStatusError(
+            "Not found",
+            request=request,
+            response=httpx.Response(status.HTTP_404_NOT_FOUND, request=request),
+        )
+
+    monkeypatch.setattr(orion_client._client, "post", post)
+
+    assert await orion_client.read_cached_task_run_states(["cached"]) == {}
+
+
 async def test_create_then_read_flow_run_notification_policy(
     orion_client, block_document
 ):
@@ -1711,3 +1862,218 @@ class TestArtifacts:
     async def test_delete_nonexistent_artifact_raises(self, orion_client):
         with pytest.raises(prefect.exceptions.ObjectNotFound):
             await orion_client.delete_artifact(uuid4())
+
+
+class TestInProcessClient:
+    @pytest.fixture
+    async def in_process_client(self, test_database_connection_url):
+        with temporary_settings({PREFECT_CLIENT_EPHEMERAL_IN_PROCESS: True}):
+            client = get_client()
+        async with client:
+            yield client
+
+    @pytest.fixture
+    def foo(self):
+        @flow
+        def foo(x=1):
+            pass
+
+        return foo
+
+    @pytest.fixture
+    def bar(self):
+        @task(tags=["a", "b"], retries=3)
+        def bar():
+            pass
+
+        return bar
+
+    def test_in_process_client_is_disabled_by_default(self, orion_client):
+        assert orion_client._in_process is None
+
+    def test_in_process_client_is_used_for_ephemeral_apis(self, in_process_client):
+        assert in_process_client._in_process is not None
+
+    async def test_in_process_client_is_not_used_for_hosted_apis(
+        self, hosted_api_server
+    ):
+        with temporary_settings({PREFECT_CLIENT_EPHEMERAL_IN_PROCESS: True}):
+            async with PrefectClient(hosted_api_server) as client:
+                assert client._in_process is None
+
+    async def test_create_then_read_flow_run(
+        self, in_process_client, orion_client, foo
+    ):
+        flow_run = await in_process_client.create_flow_run(
+            foo, parameters={"x": 2}, tags=["a"]
+        )
+        assert isinstance(flow_run, client_schemas.FlowRun)
+        assert flow_run.parameters == {"x": 2}
+        assert flow_run.state.is_pending()
+
+        lookup = await in_process_client.read_flow_run(flow_run.id)
+        http_lookup = await orion_client.read_flow_run(flow_run.id)
+        # Estimates will not be equal since time has passed
+        http_lookup.estimated_start_time_delta = lookup.estimated_start_time_delta
+        http_lookup.estimated_run_time = lookup.estimated_run_time
+        assert lookup == http_lookup
+        assert lookup.tags == ["a"]
+        assert lookup.flow_id == await orion_client.create_flow(foo)
+
+    async def test_set_then_read_flow_run_state(
+        self, in_process_client, orion_client, foo
+    ):
+        flow_run = await in_process_client.create_flow_run(foo)
+
+        response = await in_process_client.set_flow_run_state(
+            flow_run.id, Running(message="Test!")
+        )
+        assert isinstance(response, OrchestrationResult)
+        assert response.status == schemas.responses.SetStateStatus.ACCEPT
+        assert response.state.is_running()
+
+        run = await orion_client.read_flow_run(flow_run.id)
+        assert run.state.is_running()
+        assert run.state.message == "Test!"
+
+    async def test_set_flow_run_state_is_orchestrated(self, in_process_client, foo):
+        flow_run = await in_process_client.create_flow_run(foo, state=Completed())
+
+        response = await in_process_client.set_flow_run_state(flow_run.id, Running())
+        assert response.status == schemas.responses.SetStateStatus.ABORT
+
+        response = await in_process_client.set_flow_run_state(
+            flow_run.id, Running(), force=True
+        )
+        assert response.status == schemas.responses.SetStateStatus.ACCEPT
+
+    async def test_create_then_read_task_run(
+        self, in_process_client, orion_client, foo, bar
+    ):
+        flow_run = await in_process_client.create_flow_run(foo)
+        task_run = await in_process_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+        assert isinstance(task_run, client_schemas.TaskRun)
+        assert sorted(task_run.tags) == ["a", "b"]
+        assert task_run.empirical_policy.retries == 3
+
+        lookup = await in_process_client.read_task_run(task_run.id)
+        http_lookup = await orion_client.read_task_run(task_run.id)
+        # Estimates will not be equal since time has passed
+        http_lookup.estimated_start_time_delta = lookup.estimated_start_time_delta
+        http_lookup.estimated_run_time = lookup.estimated_run_time
+        assert lookup == http_lookup
+
+    async def test_create_task_runs_in_bulk(
+        self, in_process_client, orion_client, foo, bar
+    ):
+        flow_run = await in_process_client.create_flow_run(foo)
+        task_runs = await in_process_client.create_task_runs(
+            [
+                task_run_create_from_task(
+                    bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+                )
+                for i in range(3)
+            ]
+        )
+        assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+
+        for task_run in task_runs:
+            lookup = await orion_client.read_task_run(task_run.id)
+            assert lookup.state.is_pending()
+
+    async def test_set_then_read_task_run_state(
+        self, in_process_client, orion_client, foo, bar
+    ):
+        flow_run = await in_process_client.create_flow_run(foo)
+        task_run = await in_process_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        response = await in_process_client.set_task_run_state(
+            task_run.id, Completed(message="Test!")
+        )
+        assert isinstance(response, OrchestrationResult)
+        assert response.status == schemas.responses.SetStateStatus.ACCEPT
+
+        run = await orion_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == "Test!"
+
+    async def test_set_task_run_states(self, in_process_client, orion_client, foo, bar):
+        flow_run = await in_process_client.create_flow_run(foo, state=Running())
+        task_run = await in_process_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+
+        results = await in_process_client.set_task_run_states(
+            [
+                task_run_set_state_from_state(task_run.id, Running()),
+                task_run_set_state_from_state(task_run.id, Completed(message="Test!")),
+            ]
+        )
+        assert all(isinstance(result, OrchestrationResult) for result in results)
+        assert [result.state.type for result in results] == [
+            StateType.RUNNING,
+            StateType.COMPLETED,
+        ]
+
+        run = await orion_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == "Test!"
+
+    async def test_read_cached_task_run_states(self, in_process_client, foo, bar):
+        flow_run = await in_process_client.create_flow_run(foo)
+        task_run = await in_process_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key="0"
+        )
+        await in_process_client.set_task_run_state(
+            task_run.id,
+            Completed(state_details=StateDetails(cache_key="cached")),
+        )
+
+        cached_states = await in_process_client.read_cached_task_run_states(
+            ["cached", "missing"]
+        )
+        assert list(cached_states) == ["cached"]
+        assert isinstance(cached_states["cached"], State)
+        assert cached_states["cached"].state_details.task_run_id == task_run.id
+
+    async def test_read_missing_flow_run_raises_object_not_found(
+        self, in_process_client
+    ):
+        with pytest.raises(prefect.exceptions.ObjectNotFound):
+            await in_process_client.read_flow_run(uuid4())
+
+    async def test_set_missing_flow_run_state_raises_object_not_found(
+        self, in_process_client
+    ):
+        with pytest.raises(prefect.exceptions.ObjectNotFound):
+            await in_process_client.set_flow_run_state(uuid4(), Running())
+
+    async def test_read_missing_task_run_raises_status_error(self, in_process_client):
+        with pytest.raises(prefect.exceptions.PrefectHTTPStatusError) as exc:
+            await in_process_client.read_task_run(uuid4())
+        assert exc.value.response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_flow_runs_with_in_process_client(self, orion_client):
+        @task
+        def add(x, y):
+            return x + y
+
+        @flow
+        def add_all(n):
+            return sum(add.submit(i, i).result() for i in range(n))
+
+        with temporary_settings({PREFECT_CLIENT_EPHEMERAL_IN_PROCESS: True}):
+            state = add_all(3, return_state=True)
+
+        assert await state.result() == 6
+        task_runs = await orion_client.read_task_runs(
+            flow_run_filter=schemas.filters.FlowRunFilter(
+                id=dict(any_=[state.state_details.flow_run_id])
+            )
+        )
+        assert len(task_runs) == 3
+        assert all(task_run.state.is_completed() for task_run in task_runs)
@@ -39,11 +39,14 @@ from prefect.logging.configuration import setup_logging
 from prefect.settings import (
     PREFECT_API_BLOCKS_REGISTER_ON_START,
     PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_ENABLED,
     PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED,
     PREFECT_API_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED,
     PREFECT_API_SERVICES_LATE_RUNS_ENABLED,
     PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED,
+    PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
     PREFECT_API_SERVICES_SCHEDULER_ENABLED,
+    PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_ENABLED,
     PREFECT_API_URL,
     PREFECT_ASYNC_FETCH_STATE_RESULT,
     PREFECT_CLI_COLORS,
@@ -303,6 +306,9 @@ def pytest_sessionstart(session):
             PREFECT_API_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED: False,
             PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_ENABLED: False,
             PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED: False,
+            PREFECT_API_SERVICES_ACTIVE_RUN_COUNTS_ENABLED: False,
+            PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False,
+            PREFECT_API_SERVICES_TASK_RUN_STATE_CACHE_ENABLED: False,
             # Disable block auto-registration memoization
             PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION: False,
             # Disable auto-registration of block types as they can conflict
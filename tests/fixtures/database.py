@@ -71,6 +71,9 @@ async def clear_db(db):
         for table in reversed(db.Base.metadata.sorted_tables):
             await session.execute(table.delete())
 
+    # forget the task run cache entries held in memory for the deleted data
+    models.task_run_state_cache.clear_recent_cache_entries()
+
 
 @pytest.fixture
 async def session(db) -> AsyncSession:
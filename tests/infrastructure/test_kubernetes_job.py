@@ -22,8 +22,11 @@ from prefect.exceptions import InfrastructureNotAvailable, InfrastructureNotFoun
 from prefect.infrastructure.kubernetes import (
     KubernetesImagePullPolicy,
     KubernetesJob,
+    KubernetesJobWatcher,
     KubernetesManifest,
+    get_job_watcher,
 )
+from prefect.settings import PREFECT_KUBERNETES_JOB_WATCHER_ENABLED, temporary_settings
 
 FAKE_CLUSTER = "fake-cluster"
 MOCK_CLUSTER_UID = "1234"
@@ -1603,3 +1606,246 @@ def test_run_requires_command():
     job = KubernetesJob(command=[])
     with pytest.raises(ValueError, match="cannot be run with empty command"):
         job.run()
+
+
+def _mock_job(name, completion_time=None, succeeded=None, failed=False):
+    job = MagicMock(spec=kubernetes.client.V1Job)
+    job.metadata.name = name
+    job.metadata.labels = {}
+    job.status.completion_time = completion_time
+    job.status.succeeded = succeeded
+    job.status.conditions = [MagicMock(type="Failed", status="True")] if failed else []
+    return job
+
+
+class TestKubernetesJobWatcher:
+    @pytest.fixture
+    def mock_watcher_batch_client(self, monkeypatch, mock_cluster_config):
+        mock = MagicMock(spec=k8s.client.BatchV1Api)
+        mock.list_namespaced_job.return_value.items = []
+        mock.list_namespaced_job.return_value.metadata.resource_version = "1"
+
+        monkeypatch.setattr("kubernetes.client.ApiClient", MagicMock())
+        monkeypatch.setattr(
+            "kubernetes.client.BatchV1Api", MagicMock(return_value=mock)
+        )
+        return mock
+
+    def mock_events(self, mock_watch, *events):
+        def stream(*args, **kwargs):
+            sleep(0.01)
+            return list(events)
+
+        mock_watch.stream = MagicMock(side_effect=stream)
+
+    async def test_waiters_receive_finished_jobs(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        finished = _mock_job("a", completion_time=pendulum.now("utc"), succeeded=1)
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job("a")
+        ]
+        self.mock_events(
+            mock_watch,
+            {"type": "ADDED", "object": _mock_job("b")},
+            {"type": "MODIFIED", "object": finished},
+        )
+
+        watcher = KubernetesJobWatcher("default")
+        assert await watcher.wait_for_job("a", timeout=10) is finished
+
+        mock_watch.stream.assert_called_with(
+            func=mock_watcher_batch_client.list_namespaced_job,
+            namespace="default",
+            resource_version="1",
+            timeout_seconds=KubernetesJobWatcher.WATCH_TIMEOUT_SECONDS,
+        )
+
+    async def test_failed_jobs_are_finished(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        failed = _mock_job("a", failed=True)
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job("a")
+        ]
+        self.mock_events(mock_watch, {"type": "MODIFIED", "object": failed})
+
+        watcher = KubernetesJobWatcher("default")
+        assert await watcher.wait_for_job("a", timeout=10) is failed
+
+    async def test_jobs_finished_before_watching_are_listed(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        finished = _mock_job("a", completion_time=pendulum.now("utc"), succeeded=1)
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [finished]
+        self.mock_events(mock_watch)
+
+        watcher = KubernetesJobWatcher(
+            "default", label_selector="prefect.io/flow-run-id"
+        )
+        assert await watcher.wait_for_job("a", timeout=10) is finished
+
+        mock_watcher_batch_client.list_namespaced_job.assert_called_with(
+            "default", label_selector="prefect.io/flow-run-id"
+        )
+
+    async def test_removed_jobs_resolve_to_none(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job("a")
+        ]
+        self.mock_events(
+            mock_watch,
+            {"type": "DELETED", "object": _mock_job("a")},
+        )
+
+        watcher = KubernetesJobWatcher("default")
+        assert await watcher.wait_for_job("a", timeout=10) is None
+
+    async def test_jobs_removed_before_listing_resolve_to_none(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        self.mock_events(mock_watch)
+
+        watcher = KubernetesJobWatcher("default")
+        assert await watcher.wait_for_job("a", timeout=10) is None
+        mock_watch.stream.assert_not_called()
+
+    async def test_wait_times_out(self, mock_watcher_batch_client, mock_watch):
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job("a")
+        ]
+        self.mock_events(mock_watch)
+
+        watcher = KubernetesJobWatcher("default")
+        assert await watcher.wait_for_job("a", timeout=0.1) is None
+        assert not watcher._waiters
+
+    async def test_many_waiters_share_one_watch(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        jobs = [
+            _mock_job(str(i), completion_time=pendulum.now("utc"), succeeded=1)
+            for i in range(20)
+        ]
+        events = [{"type": "MODIFIED", "object": job} for job in jobs]
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job(job.metadata.name) for job in jobs
+        ]
+
+        def stream(*args, **kwargs):
+            # wait for every caller to start waiting before reporting any events
+            while len(watcher._waiters) < len(jobs):
+                sleep(0.01)
+            return events
+
+        mock_watch.stream = MagicMock(side_effect=stream)
+
+        watcher = KubernetesJobWatcher("default")
+        results = {}
+
+        async def wait(job):
+            results[job.metadata.name] = await watcher.wait_for_job(
+                job.metadata.name, timeout=10
+            )
+
+        async with anyio.create_task_group() as tg:
+            for job in jobs:
+                tg.start_soon(wait, job)
+
+        assert results == {job.metadata.name: job for job in jobs}
+        assert mock_watch.stream.call_count == 1
+
+    async def test_lists_jobs_with_the_configuration_it_was_created_with(
+        self, mock_watcher_batch_client, mock_watch
+    ):
+        mock_watcher_batch_client.list_namespaced_job.return_value.items = [
+            _mock_job("a", completion_time=pendulum.now("utc"), succeeded=1)
+        ]
+        self.mock_events(mock_watch)
+        configuration = k8s.client.Configuration(host="https://cluster-a")
+
+        watcher = KubernetesJobWatcher("default", configuration=configuration)
+        await watcher.wait_for_job("a", timeout=10)
+
+        k8s.client.ApiClient.assert_called_once_with(configuration)
+
+
+def test_get_job_watcher_is_keyed_on_the_cluster(monkeypatch):
+    monkeypatch.setattr("prefect.infrastructure.kubernetes._JOB_WATCHERS", {})
+    cluster_a = k8s.client.Configuration(host="https://cluster-a")
+    cluster_b = k8s.client.Configuration(host="https://cluster-b")
+
+    watcher_a = get_job_watcher("default", configuration=cluster_a)
+    watcher_b = get_job_watcher("default", configuration=cluster_b)
+
+    assert watcher_a is not watcher_b
+    assert watcher_a.configuration is cluster_a
+    assert watcher_b.configuration is cluster_b
+    assert get_job_watcher("default", configuration=cluster_a) is watcher_a
+
+
+def test_run_waits_with_the_shared_job_watcher(
+    mock_k8s_batch_client, mock_k8s_client, mock_watch, monkeypatch
+):
+    finished = _mock_job("mock-k8s-v1-job", pendulum.now("utc"), succeeded=1)
+    monkeypatch.setattr("kubernetes.client.ApiClient", MagicMock())
+    monkeypatch.setattr(
+        "kubernetes.client.BatchV1Api", MagicMock(return_value=mock_k8s_batch_client)
+    )
+    mock_k8s_batch_client.list_namespaced_job.return_value.items = [finished]
+
+    pod = MagicMock(spec=kubernetes.client.V1Pod)
+    pod.status.phase = "Running"
+    pod.status.container_statuses[0].state.terminated.exit_code = 3
+    mock_k8s_client.list_namespaced_pod.return_value.items = [pod]
+
+    def mock_stream(*args, **kwargs):
+        if kwargs["func"] == mock_k8s_client.list_namespaced_pod:
+            return [{"object": pod}]
+        return []
+
+    mock_watch.stream.side_effect = mock_stream
+
+    with temporary_settings({PREFECT_KUBERNETES_JOB_WATCHER_ENABLED: True}):
+        result = KubernetesJob(command=["echo", "hello"], stream_output=False).run()
+
+    assert result.status_code == 3
+    mock_k8s_client.list_namespaced_pod.assert_called_once_with(
+        namespace="default", label_selector="job-name=mock-k8s-v1-job"
+    )
+    # jobs are not watched individually
+    mock_k8s_batch_client.read_namespaced_job.assert_not_called()
+
+
+def test_run_with_the_shared_job_watcher_fails_if_pod_never_starts(
+    mock_k8s_batch_client, mock_k8s_client, mock_watch, monkeypatch
+):
+    watcher = MagicMock()
+    monkeypatch.setattr(
+        "prefect.infrastructure.kubernetes.get_job_watcher",
+        MagicMock(return_value=watcher),
+    )
+
+    def mock_stream(*args, **kwargs):
+        pod = MagicMock(spec=kubernetes.client.V1Pod)
+        pod.status.phase = "Pending"
+        return [{"object": pod}]
+
+    mock_watch.stream.side_effect = mock_stream
+
+    with temporary_settings({PREFECT_KUBERNETES_JOB_WATCHER_ENABLED: True}):
+        result = KubernetesJob(
+            command=["echo", "hello"], pod_watch_timeout_seconds=42
+        ).run()
+
+    assert result.status_code == -1
+    mock_watch.stream.assert_called_once_with(
+        func=mock_k8s_client.list_namespaced_pod,
+        namespace="default",
+        label_selector="job-name=mock-k8s-v1-job",
+        timeout_seconds=42,
+    )
+    # the job is not waited for
+    watcher.wait_for_job.assert_not_called()
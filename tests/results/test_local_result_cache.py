@@ -0,0 +1,217 @@
+import uuid
+from pathlib import Path
+
+import pytest
+
+from prefect.filesystems import LocalFileSystem
+from prefect.results import (
+    DEFAULT_STORAGE_KEY_FN,
+    LocalResultCache,
+    PersistedResult,
+    get_local_result_cache,
+)
+from prefect.serializers import JSONSerializer
+from prefect.settings import (
+    PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES,
+    PREFECT_RESULTS_LOCAL_CACHE_SPILL_PATH,
+    temporary_settings,
+)
+
+
+@pytest.fixture
+async def storage_block(tmp_path):
+    block = LocalFileSystem(basepath=tmp_path / "storage")
+    await block._save(is_anonymous=True)
+    return block
+
+
+@pytest.fixture
+def enable_cache():
+    with temporary_settings({PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 1024 * 1024}):
+        cache = get_local_result_cache()
+        cache.clear()
+        yield cache
+        cache.clear()
+
+
+class TestLocalResultCache:
+    def test_get_missing_content(self):
+        cache = LocalResultCache(max_bytes=10)
+        assert cache.get_content(uuid.uuid4(), "foo") is None
+
+    def test_put_and_get_content(self):
+        cache = LocalResultCache(max_bytes=10)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "foo", b"abc")
+
+        assert cache.get_content(block_id, "foo") == b"abc"
+        assert cache.get_content(uuid.uuid4(), "foo") is None
+        assert cache.size == 3
+
+    def test_replacing_content_updates_size(self):
+        cache = LocalResultCache(max_bytes=10)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "foo", b"abc")
+        cache.put_content(block_id, "foo", b"abcdef")
+
+        assert cache.get_content(block_id, "foo") == b"abcdef"
+        assert cache.size == 6
+
+    def test_evicts_least_recently_used_content(self):
+        cache = LocalResultCache(max_bytes=10)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "a", b"aaaa")
+        cache.put_content(block_id, "b", b"bbbb")
+
+        # Reading "a" makes "b" the least recently used entry
+        cache.get_content(block_id, "a")
+        cache.put_content(block_id, "c", b"cccc")
+
+        assert cache.get_content(block_id, "a") == b"aaaa"
+        assert cache.get_content(block_id, "b") is None
+        assert cache.get_content(block_id, "c") == b"cccc"
+        assert cache.size == 8
+
+    def test_does_not_keep_content_larger_than_max_bytes(self):
+        cache = LocalResultCache(max_bytes=2)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "foo", b"abc")
+
+        assert cache.get_content(block_id, "foo") is None
+        assert cache.size == 0
+
+    def test_spills_evicted_content_to_disk(self, tmp_path):
+        cache = LocalResultCache(max_bytes=4, spill_path=tmp_path)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "a/b", b"aaaa")
+        cache.put_content(block_id, "c", b"cccc")
+        assert cache.size == 4
+
+        # The evicted content is read back from disk
+        assert cache.get_content(block_id, "a/b") == b"aaaa"
+        assert len(list((tmp_path / str(block_id)).iterdir())) == 2
+
+    def test_spills_content_larger_than_max_bytes_to_disk(self, tmp_path):
+        cache = LocalResultCache(max_bytes=2, spill_path=tmp_path)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "foo", b"abc")
+
+        assert cache.size == 0
+        assert cache.get_content(block_id, "foo") == b"abc"
+
+    def test_storage_blocks_are_bounded(self):
+        cache = LocalResultCache(max_bytes=10, max_storage_blocks=2)
+        block_ids = [uuid.uuid4() for _ in range(3)]
+        for block_id in block_ids:
+            cache.put_storage_block(block_id, LocalFileSystem())
+
+        assert cache.get_storage_block(block_ids[0]) is None
+        assert cache.get_storage_block(block_ids[1]) is not None
+        assert cache.get_storage_block(block_ids[2]) is not None
+
+    def test_clear(self, tmp_path):
+        cache = LocalResultCache(max_bytes=10)
+        block_id = uuid.uuid4()
+        cache.put_content(block_id, "foo", b"abc")
+        cache.put_storage_block(block_id, LocalFileSystem())
+        cache.clear()
+
+        assert cache.get_content(block_id, "foo") is None
+        assert cache.get_storage_block(block_id) is None
+        assert cache.size == 0
+
+
+class TestGetLocalResultCache:
+    def test_disabled_by_default(self):
+        assert get_local_result_cache() is None
+
+    def test_enabled_with_max_bytes(self):
+        with temporary_settings({PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 100}):
+            cache = get_local_result_cache()
+            assert cache.max_bytes == 100
+            assert cache.spill_path is None
+            assert get_local_result_cache() is cache
+
+    def test_recreated_when_settings_change(self, tmp_path):
+        with temporary_settings({PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 100}):
+            cache = get_local_result_cache()
+
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_LOCAL_CACHE_MAX_BYTES: 100,
+                PREFECT_RESULTS_LOCAL_CACHE_SPILL_PATH: tmp_path,
+            }
+        ):
+            new_cache = get_local_result_cache()
+            assert new_cache is not cache
+            assert new_cache.spill_path == Path(tmp_path)
+
+
+class TestPersistedResultWithLocalCache:
+    async def create_result(self, storage_block, cache_object=True):
+        return await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+            cache_object=cache_object,
+        )
+
+    def copy_without_cached_object(self, result):
+        return PersistedResult(
+            serializer_type=result.serializer_type,
+            storage_block_id=result.storage_block_id,
+            storage_key=result.storage_key,
+        )
+
+    async def test_created_result_is_read_from_cache(
+        self, storage_block, enable_cache, orion_client, monkeypatch
+    ):
+        result = await self.create_result(storage_block)
+
+        # Remove the persisted content and prevent block document reads
+        (Path(storage_block.basepath) / result.storage_key).unlink()
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("The block document should not be read")
+
+        monkeypatch.setattr(orion_client, "read_block_document", fail)
+
+        copy = self.copy_without_cached_object(result)
+        assert await copy.get(client=orion_client) == "test"
+
+    async def test_read_result_is_cached(self, storage_block, enable_cache):
+        result = await self.create_result(storage_block)
+        enable_cache.clear()
+
+        copy = self.copy_without_cached_object(result)
+        assert await copy.get() == "test"
+        assert (
+            enable_cache.get_content(result.storage_block_id, result.storage_key)
+            is not None
+        )
+        assert enable_cache.get_storage_block(result.storage_block_id) is not None
+
+    async def test_content_is_not_cached_if_cache_object_is_false(
+        self, storage_block, enable_cache
+    ):
+        result = await self.create_result(storage_block, cache_object=False)
+
+        assert (
+            enable_cache.get_content(result.storage_block_id, result.storage_key)
+            is None
+        )
+        assert await result.get() == "test"
+        assert (
+            enable_cache.get_content(result.storage_block_id, result.storage_key)
+            is None
+        )
+
+    async def test_result_is_not_cached_when_disabled(self, storage_block):
+        result = await self.create_result(storage_block)
+        (Path(storage_block.basepath) / result.storage_key).unlink()
+
+        copy = self.copy_without_cached_object(result)
+        with pytest.raises(ValueError, match="does not exist"):
+            await copy.get()
@@ -1,10 +1,14 @@
-import json
-
 import pytest
 
 from prefect.filesystems import LocalFileSystem
-from prefect.results import DEFAULT_STORAGE_KEY_FN, PersistedResult, PersistedResultBlob
+from prefect.results import (
+    DEFAULT_STORAGE_KEY_FN,
+    RESULT_BLOB_MAGIC,
+    PersistedResult,
+    PersistedResultBlob,
+)
 from prefect.serializers import JSONSerializer, PickleSerializer
+from prefect.settings import PREFECT_RESULTS_BINARY_FORMAT_ENABLED, temporary_settings
 
 
 @pytest.fixture
@@ -14,6 +18,12 @@ async def storage_block(tmp_path):
     return block
 
 
+@pytest.fixture
+def binary_format():
+    with temporary_settings({PREFECT_RESULTS_BINARY_FORMAT_ENABLED: True}):
+        yield
+
+
 @pytest.mark.parametrize("cache_object", [True, False])
 async def test_result_reference_create_and_get(cache_object, storage_block):
     result = await PersistedResult.create(
@@ -78,12 +88,31 @@ async def test_result_reference_create_uses_serializer(storage_block):
 
     assert result.serializer_type == serializer.type
     contents = await storage_block.read_path(result.storage_key)
-    blob = PersistedResultBlob.parse_raw(contents)
+    blob = PersistedResultBlob.from_bytes(contents)
     assert blob.serializer == serializer
     assert serializer.loads(blob.data) == "test"
 
 
-async def test_result_reference_file_blob_is_json(storage_block):
+async def test_result_reference_file_blob_is_json_by_default(storage_block):
+    serializer = JSONSerializer()
+
+    result = await PersistedResult.create(
+        "test",
+        storage_block_id=storage_block._block_document_id,
+        storage_block=storage_block,
+        storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+        serializer=serializer,
+    )
+
+    # Should be readable by versions of Prefect that only read JSON blobs
+    contents = await storage_block.read_path(result.storage_key)
+    blob = PersistedResultBlob.parse_raw(contents)
+    assert blob.serializer == serializer
+    assert blob.data == serializer.dumps("test")
+
+
+@pytest.mark.usefixtures("binary_format")
+async def test_result_reference_file_blob_is_framed(storage_block):
     serializer = JSONSerializer(
         jsonlib="orjson", object_decoder=None, object_encoder=None
     )
@@ -98,14 +127,127 @@ async def test_result_reference_file_blob_is_json(storage_block):
 
     contents = await storage_block.read_path(result.storage_key)
 
-    # Should be readable by JSON
-    blob_dict = json.loads(contents)
+    # Should start with the framing and end with the raw serialized data
+    assert contents.startswith(RESULT_BLOB_MAGIC)
+    assert contents.endswith(serializer.dumps("test"))
 
     # Should conform to the PersistedResultBlob spec
-    blob = PersistedResultBlob.parse_obj(blob_dict)
+    blob = PersistedResultBlob.from_bytes(contents)
+
+    assert blob.serializer == serializer
+    assert blob.data == serializer.dumps("test")
+
+
+async def test_result_reference_reads_legacy_json_blob(storage_block):
+    serializer = PickleSerializer(picklelib="pickle")
+    blob = PersistedResultBlob(serializer=serializer, data=serializer.dumps("test"))
+    await storage_block.write_path("legacy", content=blob.json().encode())
+
+    result = PersistedResult(
+        serializer_type=serializer.type,
+        storage_block_id=storage_block._block_document_id,
+        storage_key="legacy",
+    )
+
+    assert await result.get() == "test"
+
+
+@pytest.mark.parametrize("binary_format_enabled", [True, False])
+async def test_result_reference_uses_overridden_storage_methods(
+    tmp_path, binary_format_enabled
+):
+    calls = []
+
+    class RecordingFileSystem(LocalFileSystem):
+        _block_type_slug = "recording-file-system"
+
+        async def read_path(self, path):
+            calls.append(("read", path))
+            return await super().read_path(path)
+
+        async def write_path(self, path, content):
+            calls.append(("write", path))
+            return await super().write_path(path, content)
+
+    storage_block = RecordingFileSystem(basepath=tmp_path)
+    await storage_block._save(is_anonymous=True)
+
+    with temporary_settings(
+        {PREFECT_RESULTS_BINARY_FORMAT_ENABLED: binary_format_enabled}
+    ):
+        result = await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=PickleSerializer(),
+            cache_object=False,
+        )
+        assert await result.get() == "test"
+
+    assert calls == [("write", result.storage_key), ("read", result.storage_key)]
+
+
+@pytest.mark.usefixtures("binary_format")
+@pytest.mark.parametrize("data", [b"", b"abc", bytes(range(256)) * 10])
+def test_result_blob_bytes_roundtrip(data):
+    blob = PersistedResultBlob(serializer=PickleSerializer(), data=data)
+    assert PersistedResultBlob.from_bytes(blob.to_bytes()) == blob
+
+
+@pytest.mark.usefixtures("binary_format")
+@pytest.mark.parametrize("serializer", [JSONSerializer(), PickleSerializer()])
+def test_result_blob_from_bytes_does_not_copy_data(serializer):
+    content = PersistedResultBlob(
+        serializer=serializer, data=serializer.dumps({"x": 1})
+    ).to_bytes()
+
+    blob = PersistedResultBlob.from_bytes(content)
+
+    assert isinstance(blob.data, memoryview)
+    assert blob.data.obj is content
+    assert blob.serializer.loads(blob.data) == {"x": 1}
+
+
+@pytest.mark.usefixtures("binary_format")
+@pytest.mark.parametrize("data", [b"", b"abc", bytes(range(256)) * 10])
+def test_result_blob_file_roundtrip(data, tmp_path):
+    blob = PersistedResultBlob(serializer=PickleSerializer(), data=data)
+    blob.write_file(tmp_path / "nested" / "blob")
+
+    assert (tmp_path / "nested" / "blob").read_bytes() == blob.to_bytes()
+    assert PersistedResultBlob.read_file(tmp_path / "nested" / "blob") == blob
+
+
+def test_result_blob_json_roundtrip(tmp_path):
+    blob = PersistedResultBlob(serializer=JSONSerializer(), data=b'{"x": 1}')
+    blob.write_file(tmp_path / "blob")
+
+    assert blob.to_bytes() == blob.json().encode()
+    assert (tmp_path / "blob").read_bytes() == blob.to_bytes()
+    assert PersistedResultBlob.from_bytes(blob.to_bytes()) == blob
+    assert PersistedResultBlob.read_file(tmp_path / "blob") == blob
+
+
+@pytest.mark.usefixtures("binary_format")
+def test_result_blob_read_in_binary_format_can_be_written_as_json():
+    blob = PersistedResultBlob(serializer=JSONSerializer(), data=b'{"x": 1}')
+    read_blob = PersistedResultBlob.from_bytes(blob.to_bytes())
+
+    with temporary_settings({PREFECT_RESULTS_BINARY_FORMAT_ENABLED: False}):
+        assert read_blob.to_bytes() == blob.to_bytes()
+
+
+def test_result_blob_read_file_legacy_json(tmp_path):
+    blob = PersistedResultBlob(serializer=JSONSerializer(), data=b"{}")
+    (tmp_path / "blob").write_bytes(blob.json().encode())
+
+    assert PersistedResultBlob.read_file(tmp_path / "blob") == blob
+
 
-    assert blob.serializer
-    assert blob.data
+def test_result_blob_read_file_missing(tmp_path):
+    with pytest.raises(ValueError, match="does not exist"):
+        PersistedResultBlob.read_file(tmp_path / "missing")
 
 
 async def test_result_reference_create_uses_storage_key_fn(storage_block):
@@ -1,8 +1,14 @@
+import time
 from uuid import uuid4
 
+import anyio
+import pytest
 from fastapi import status
 
-from prefect.server import schemas
+from prefect.server import models, schemas
+from prefect.server.orchestration.concurrency_waiters import (
+    get_concurrency_slot_waiters,
+)
 from prefect.server.schemas.actions import ConcurrencyLimitCreate
 
 
@@ -99,3 +105,101 @@ class TestConcurrencyLimits:
 
         post_reset = await client.get(f"/concurrency_limits/{cl_id}")
         assert len(post_reset.json()["active_slots"]) == 0
+
+
+class TestWaitingForConcurrencySlots:
+    @pytest.fixture
+    async def full_limit(self, session):
+        concurrency_limit = await models.concurrency_limits.create_concurrency_limit(
+            session=session,
+            concurrency_limit=schemas.core.ConcurrencyLimit(
+                tag="full", concurrency_limit=1
+            ),
+        )
+        task_run_id = uuid4()
+        assert await models.concurrency_limits.acquire_concurrency_limit_slot(
+            session, concurrency_limit=concurrency_limit, task_run_id=task_run_id
+        )
+        await session.commit()
+        return task_run_id
+
+    async def test_returns_immediately_without_a_limit(self, client):
+        response = await client.post(
+            "/concurrency_limits/tag/unlimited/wait", json=dict(timeout_seconds=10)
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() is True
+
+    async def test_times_out_if_limit_is_full(self, client, full_limit):
+        response = await client.post(
+            "/concurrency_limits/tag/full/wait", json=dict(timeout_seconds=0.1)
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() is False
+
+    async def test_returns_when_a_slot_is_released(self, client, full_limit, session):
+        async def release_slot():
+            await anyio.sleep(0.5)
+            async with session.begin():
+                await models.concurrency_limits.release_concurrency_limit_slots(
+                    session, task_run_id=full_limit
+                )
+                get_concurrency_slot_waiters().notify_after_commit(session, ["full"])
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(release_slot)
+            start = time.monotonic()
+            response = await client.post(
+                "/concurrency_limits/tag/full/wait", json=dict(timeout_seconds=30)
+            )
+
+        assert response.json() is True
+        assert time.monotonic() - start < 10
+
+    async def test_returns_when_limit_is_reset(self, client, full_limit):
+        async def reset_limit():
+            await anyio.sleep(0.5)
+            await client.post("/concurrency_limits/tag/full/reset")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(reset_limit)
+            start = time.monotonic()
+            response = await client.post(
+                "/concurrency_limits/tag/full/wait", json=dict(timeout_seconds=30)
+            )
+
+        assert response.json() is True
+        assert time.monotonic() - start < 10
+
+    async def test_waiting_requests_do_not_hold_request_limit_slots(
+        self, client, full_limit
+    ):
+        # more waiters than the number of concurrent requests allowed with SQLite
+        waiter_count = 110
+        results = []
+
+        async def wait():
+            response = await client.post(
+                "/concurrency_limits/tag/full/wait", json=dict(timeout_seconds=30)
+            )
+            results.append(response.json())
+
+        async def reset_limit():
+            while len(get_concurrency_slot_waiters()) < waiter_count:
+                await anyio.sleep(0.1)
+            await client.post("/concurrency_limits/tag/full/reset")
+
+        # the limit is reset well before the waiters time out
+        with anyio.fail_after(20):
+            async with anyio.create_task_group() as tg:
+                for _ in range(waiter_count):
+                    tg.start_soon(wait)
+                tg.start_soon(reset_limit)
+
+        assert results == [True] * waiter_count
+
+    async def test_timeout_is_bounded(self, client):
+        response = await client.post(
+            "/concurrency_limits/tag/full/wait", json=dict(timeout_seconds=600)
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -6,6 +6,9 @@ order. This is purely so that we can test sorting by flow run and
 task run ID with a stable order across test machines.
 """
 
+import asyncio
+import gzip
+import json
 from datetime import timedelta
 from unittest import mock
 from uuid import uuid1
@@ -18,6 +21,10 @@ from prefect.server import models
 from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
+from prefect.settings import (
+    PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE,
+    temporary_settings,
+)
 
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
@@ -91,6 +98,97 @@ class TestCreateLogs:
             == log_data[1]
         )
 
+    async def test_create_logs_with_gzip_encoded_body(
+        self, session, client, log_data, flow_run_id
+    ):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=gzip.compress(json.dumps(log_data).encode()),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+        assert response.status_code == 201
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 2
+
+    async def test_create_logs_with_oversized_gzip_encoded_body(
+        self, session, client, log_data, flow_run_id
+    ):
+        content = json.dumps(log_data).encode()
+        with temporary_settings(
+            {PREFECT_API_MAX_DECOMPRESSED_REQUEST_SIZE: len(content) - 1}
+        ):
+            response = await client.post(
+                CREATE_LOGS_URL,
+                content=gzip.compress(content),
+                headers={
+                    "Content-Encoding": "gzip",
+                    "Content-Type": "application/json",
+                },
+            )
+        assert response.status_code == 413
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        assert await models.logs.read_logs(session=session, log_filter=log_filter) == []
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"not gzip", gzip.compress(b"[]")[:-4]],
+        ids=["invalid", "truncated"],
+    )
+    async def test_create_logs_with_invalid_gzip_encoded_body(self, client, content):
+        response = await client.post(
+            CREATE_LOGS_URL,
+            content=content,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+        )
+        assert response.status_code == 400
+
+    async def test_concurrent_requests_are_coalesced(
+        self, session, client, log_data, flow_run_id, monkeypatch
+    ):
+        calls = []
+        create_logs = models.logs.create_logs
+
+        async def slow_create_logs(session, logs):
+            calls.append(len(logs))
+            await asyncio.sleep(0.1)
+            return await create_logs(session=session, logs=logs)
+
+        monkeypatch.setattr("prefect.server.models.logs.create_logs", slow_create_logs)
+
+        responses = await asyncio.gather(
+            *[client.post(CREATE_LOGS_URL, json=log_data) for _ in range(5)]
+        )
+        assert all(response.status_code == 201 for response in responses)
+
+        # The first request is written alone and the rest are written together
+        assert sum(calls) == 10
+        assert len(calls) < 5
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 10
+
+    async def test_database_failure_fails_all_coalesced_requests(
+        self, client_without_exceptions, log_data
+    ):
+        with mock.patch("prefect.server.models.logs.create_logs") as mock_create_logs:
+
+            async def raise_error(*args, **kwargs):
+                await asyncio.sleep(0.1)
+                raise FlushError
+
+            mock_create_logs.side_effect = raise_error
+            responses = await asyncio.gather(
+                *[
+                    client_without_exceptions.post(CREATE_LOGS_URL, json=log_data)
+                    for _ in range(3)
+                ]
+            )
+            assert all(response.status_code == 500 for response in responses)
+
     async def test_database_failure(
         self, client_without_exceptions, session, flow_run_id, task_run_id, log_data
     ):
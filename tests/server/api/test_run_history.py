@@ -4,6 +4,7 @@ from typing import List
 import pendulum
 import pydantic
 import pytest
+import sqlalchemy as sa
 from fastapi import Response, status
 
 from prefect.server import models
@@ -774,6 +775,43 @@ async def test_last_bin_contains_end_date(client, route):
     assert parsed[1].interval_end == dt.add(days=2)
 
 
+@pytest.mark.parametrize("route", ["flow_runs", "task_runs"])
+@pytest.mark.parametrize(
+    "interval", [timedelta(minutes=5), timedelta(hours=6), timedelta(days=1)]
+)
+async def test_history_from_rollups_matches_history_from_runs(
+    client, session, db, monkeypatch, route, interval
+):
+    rollups = await session.execute(
+        sa.select(sa.func.count()).select_from(db.RunHistoryRollup)
+    )
+    assert rollups.scalar() > 0
+
+    request = dict(
+        history_start=str(dt.subtract(days=5)),
+        history_end=str(dt.add(days=1)),
+        history_interval_seconds=interval.total_seconds(),
+    )
+    from_rollups = parse_response(await client.post(f"/{route}/history", json=request))
+
+    monkeypatch.setattr(
+        "prefect.server.api.run_history._can_use_rollups", lambda **kwargs: False
+    )
+    from_runs = parse_response(await client.post(f"/{route}/history", json=request))
+
+    # only the counts of runs that are not in a final state are compared, because
+    # their estimates change as time passes
+    for interval_from_rollups, interval_from_runs in zip(from_rollups, from_runs):
+        assert [
+            s if s.state_type in states.TERMINAL_STATES else s.count_runs
+            for s in interval_from_rollups.states
+        ] == [
+            s if s.state_type in states.TERMINAL_STATES else s.count_runs
+            for s in interval_from_runs.states
+        ]
+    assert len(from_rollups) == len(from_runs)
+
+
 @pytest.mark.flaky(max_runs=3)
 async def test_flow_run_lateness(client, session):
     await session.execute("delete from flow where true;")
@@ -123,6 +123,96 @@ class TestCreateTaskRun:
         )
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs(self, flow_run, client, session):
+        task_run_data = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "name": f"my-cool-task-run-name-{i}",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_run_data)
+        assert response.status_code == status.HTTP_200_OK
+        assert [task_run["name"] for task_run in response.json()] == [
+            "my-cool-task-run-name-0",
+            "my-cool-task-run-name-1",
+            "my-cool-task-run-name-2",
+        ]
+
+        for task_run_response in response.json():
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_response["id"]
+            )
+            assert task_run.flow_run_id == flow_run.id
+            assert task_run.state.type == states.StateType.PENDING
+
+    async def test_create_task_runs_gracefully_upserts(self, flow_run, client):
+        task_run_data = {
+            "flow_run_id": str(flow_run.id),
+            "task_key": "my-task-key",
+            "dynamic_key": "my-dynamic-key",
+        }
+        task_run_response = await client.post("/task_runs/", json=task_run_data)
+
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[task_run_data, {**task_run_data, "dynamic_key": "other-key"}],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] == task_run_response.json()["id"]
+        assert response.json()[1]["id"] != task_run_response.json()["id"]
+
+    async def test_create_task_runs_with_state(self, flow_run, client, session):
+        task_run_data = schemas.actions.TaskRunCreate(
+            flow_run_id=flow_run.id,
+            task_key="task-key",
+            state=schemas.actions.StateCreate(type=schemas.states.StateType.RUNNING),
+            dynamic_key="0",
+        )
+        response = await client.post(
+            "/task_runs/bulk", json=[task_run_data.dict(json_compatible=True)]
+        )
+        task_run = await models.task_runs.read_task_run(
+            session=session, task_run_id=response.json()[0]["id"]
+        )
+        assert task_run.state.type == schemas.states.StateType.RUNNING
+
+
+class TestReadCachedTaskRunStates:
+    async def test_read_cached_task_run_states(self, task_run, client, session):
+        result = await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=states.Completed(),
+            force=True,
+        )
+        await models.task_run_state_cache.cache_state(
+            session=session,
+            cache_key="cached",
+            cache_expiration=None,
+            state=result.state,
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/cached_states", json=dict(cache_keys=["cached", "missing"])
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert list(response.json()) == ["cached"]
+        assert response.json()["cached"]["id"] == str(result.state.id)
+        assert response.json()["cached"]["type"] == "COMPLETED"
+
+    async def test_read_cached_task_run_states_without_keys(self, client):
+        response = await client.post(
+            "/task_runs/cached_states", json=dict(cache_keys=[])
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {}
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, flow_run, task_run, client):
         # make sure we we can read the task run correctly
@@ -465,6 +555,101 @@ class TestSetTaskRunState:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestSetTaskRunStates:
+    async def test_set_task_run_states(self, flow_run, task_run, client, session):
+        other_task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.actions.TaskRunCreate(
+                flow_run_id=flow_run.id, task_key="my-key", dynamic_key="1"
+            ),
+        )
+        task_run_ids = [task_run.id, other_task_run.id]
+        await session.commit()
+
+        await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+
+        response = await client.post(
+            "/task_runs/set_state/batch",
+            json=[
+                dict(task_run_id=str(task_run_ids[0]), state=dict(type="RUNNING")),
+                dict(
+                    task_run_id=str(task_run_ids[1]),
+                    state=dict(type="RUNNING", name="Other State"),
+                ),
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        results = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert [result.status for result in results] == [
+            responses.SetStateStatus.ACCEPT,
+            responses.SetStateStatus.ACCEPT,
+        ]
+        assert results[1].state.name == "Other State"
+
+        session.expire_all()
+        for run_id, name in zip(task_run_ids, ["Running", "Other State"]):
+            run = await models.task_runs.read_task_run(
+                session=session, task_run_id=run_id
+            )
+            assert run.state.type == states.StateType.RUNNING
+            assert run.state.name == name
+            assert run.run_count == 1
+
+    async def test_set_task_run_states_orchestrates_each_transition(
+        self, task_run, client
+    ):
+        # the parent flow run is not running, so the task run cannot start
+        response = await client.post(
+            "/task_runs/set_state/batch",
+            json=[
+                dict(task_run_id=str(task_run.id), state=dict(type="RUNNING")),
+                dict(
+                    task_run_id=str(task_run.id),
+                    state=dict(type="RUNNING", name="Forced"),
+                    force=True,
+                ),
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        results = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert results[0].status == responses.SetStateStatus.ABORT
+        assert results[1].status == responses.SetStateStatus.ACCEPT
+        assert results[1].state.name == "Forced"
+
+    async def test_set_task_run_states_with_missing_task_run_sets_no_states(
+        self, task_run, client, session
+    ):
+        response = await client.post(
+            "/task_runs/set_state/batch",
+            json=[
+                dict(
+                    task_run_id=str(task_run.id),
+                    state=dict(type="RUNNING"),
+                    force=True,
+                ),
+                dict(task_run_id=str(uuid4()), state=dict(type="RUNNING")),
+            ],
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        task_run_id = task_run.id
+        session.expire_all()
+        run = await models.task_runs.read_task_run(
+            session=session, task_run_id=task_run_id
+        )
+        assert run.state is None
+
+    async def test_set_task_run_states_without_transitions(self, client):
+        response = await client.post("/task_runs/set_state/batch", json=[])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
@@ -1,5 +1,7 @@
+import time
 from typing import List
 
+import anyio
 import pendulum
 import pydantic
 import pytest
@@ -7,6 +9,9 @@ from fastapi import status
 
 import prefect
 from prefect.server import models, schemas
+from prefect.server.orchestration.scheduled_flow_run_waiters import (
+    get_scheduled_flow_run_waiters,
+)
 from prefect.server.schemas.actions import WorkPoolCreate
 from prefect.server.schemas.core import WorkPool, WorkQueue
 
@@ -892,3 +897,142 @@ class TestGetScheduledRuns:
         for work_queue in work_queues:
             assert work_queue.last_polled is not None
             assert work_queue.last_polled > now
+
+
+class TestWaitForScheduledRuns:
+    @pytest.fixture
+    def url(self, work_pool):
+        return f"/work_pools/{work_pool.name}/get_scheduled_flow_runs"
+
+    async def schedule_run(self, session, flow, work_queue, scheduled_time=None):
+        async with session.begin():
+            return await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=prefect.states.Scheduled(scheduled_time=scheduled_time),
+                    work_queue_id=work_queue.id,
+                ),
+            )
+
+    async def test_returns_immediately_if_runs_are_scheduled(
+        self, client, session, flow, work_queue_1, url
+    ):
+        flow_run = await self.schedule_run(session, flow, work_queue_1)
+
+        start = time.monotonic()
+        response = await client.post(url, json=dict(wait_seconds=30))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - start < 10
+
+    async def test_times_out_if_no_runs_are_scheduled(self, client, work_queue_1, url):
+        response = await client.post(url, json=dict(wait_seconds=0.1))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert len(get_scheduled_flow_run_waiters()) == 0
+
+    async def test_returns_when_a_run_is_scheduled(
+        self, client, session, flow, work_queue_1, url
+    ):
+        async def schedule_run():
+            await anyio.sleep(0.5)
+            await self.schedule_run(session, flow, work_queue_1)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(schedule_run)
+            start = time.monotonic()
+            response = await client.post(
+                url,
+                json=dict(
+                    wait_seconds=30,
+                    scheduled_before=str(pendulum.now("UTC").add(seconds=10)),
+                ),
+            )
+
+        assert len(response.json()) == 1
+        assert time.monotonic() - start < 10
+
+    async def test_does_not_return_when_a_run_is_scheduled_in_another_queue(
+        self, client, session, flow, work_queue_1, work_queue_2, url
+    ):
+        async def schedule_run():
+            await anyio.sleep(0.1)
+            await self.schedule_run(session, flow, work_queue_2)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(schedule_run)
+            response = await client.post(
+                url, json=dict(wait_seconds=1, work_queue_names=[work_queue_1.name])
+            )
+
+        assert response.json() == []
+
+    async def test_returns_when_the_scheduler_schedules_runs(
+        self, client, session, deployment, url
+    ):
+        async def schedule_runs():
+            await anyio.sleep(0.5)
+            async with session.begin():
+                await models.deployments.schedule_runs(
+                    session=session, deployment_id=deployment.id, max_runs=1
+                )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(schedule_runs)
+            start = time.monotonic()
+            response = await client.post(
+                url,
+                json=dict(
+                    wait_seconds=30,
+                    scheduled_before=str(pendulum.now("UTC").add(days=2)),
+                ),
+            )
+
+        assert len(response.json()) == 1
+        assert time.monotonic() - start < 10
+
+    async def test_waiting_requests_do_not_hold_request_limit_slots(
+        self, client, session, flow, work_queue_1, url
+    ):
+        # more waiting polls than the number of concurrent requests allowed with SQLite
+        poll_count = 110
+        results = []
+
+        async def poll():
+            response = await client.post(url, json=dict(wait_seconds=30))
+            results.append(len(response.json()))
+
+        with anyio.fail_after(20):
+            async with anyio.create_task_group() as tg:
+                for _ in range(poll_count):
+                    tg.start_soon(poll)
+
+                while len(get_scheduled_flow_run_waiters()) < poll_count:
+                    await anyio.sleep(0.1)
+
+                # other requests are handled while the polls wait
+                response = await client.get("/health")
+                assert response.status_code == status.HTTP_200_OK
+
+                await self.schedule_run(session, flow, work_queue_1)
+
+        assert results == [1] * poll_count
+
+    async def test_returns_when_a_scheduled_run_becomes_due(
+        self, client, session, flow, work_queue_1, url
+    ):
+        scheduled_before = pendulum.now("UTC")
+        await self.schedule_run(
+            session, flow, work_queue_1, scheduled_time=scheduled_before.add(seconds=1)
+        )
+
+        start = time.monotonic()
+        response = await client.post(
+            url, json=dict(wait_seconds=30, scheduled_before=str(scheduled_before))
+        )
+
+        assert len(response.json()) == 1
+        assert time.monotonic() - start < 10
@@ -1,3 +1,4 @@
+import json
 from uuid import uuid4
 
 import alembic.script
@@ -464,3 +465,85 @@ async def test_adding_default_agent_pool_without_existing_default_queue_migratio
 
     finally:
         await run_sync_in_worker_thread(alembic_upgrade)
+
+
+async def test_moving_active_slots_to_concurrency_limit_slots_migration(db):
+    connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
+    dialect = get_dialect(connection_url)
+
+    # get the proper migration revisions
+    if dialect.name == "postgresql":
+        revisions = ("3bf47e3ce2dd", "a09cf9275134")
+    else:
+        revisions = ("553920ec20e9", "55d02890f02c")
+
+    task_run_ids = [str(uuid4()) for _ in range(3)]
+
+    try:
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        session = await db.session()
+        async with session:
+            await session.execute(sa.text("DELETE FROM concurrency_limit;"))
+            await session.execute(
+                sa.text(
+                    "INSERT INTO concurrency_limit (tag, concurrency_limit,"
+                    " active_slots) values ('small', 2, :active_slots);"
+                ),
+                {"active_slots": f'["{task_run_ids[0]}", "{task_run_ids[1]}"]'},
+            )
+            await session.execute(
+                sa.text(
+                    "INSERT INTO concurrency_limit (tag, concurrency_limit,"
+                    " active_slots) values ('over', 1, :active_slots);"
+                ),
+                {"active_slots": f'["{task_run_ids[2]}", "{task_run_ids[0]}"]'},
+            )
+            await session.commit()
+
+        # run the migration
+        await run_sync_in_worker_thread(alembic_upgrade, revision=revisions[1])
+
+        session = await db.session()
+        async with session:
+            slots = (
+                await session.execute(
+                    sa.text(
+                        "SELECT concurrency_limit.tag, slot_number, task_run_id FROM"
+                        " concurrency_limit_slot JOIN concurrency_limit ON"
+                        " concurrency_limit.id = concurrency_limit_id ORDER BY"
+                        " concurrency_limit.tag, slot_number;"
+                    )
+                )
+            ).fetchall()
+
+            assert [(tag, number, str(id)) for tag, number, id in slots] == [
+                ("over", 0, task_run_ids[2]),
+                ("over", 1, task_run_ids[0]),
+                ("small", 0, task_run_ids[0]),
+                ("small", 1, task_run_ids[1]),
+            ]
+
+        # downgrade and confirm the slots are moved back into active_slots
+        await run_sync_in_worker_thread(alembic_downgrade, revision=revisions[0])
+
+        session = await db.session()
+        async with session:
+            active_slots = (
+                await session.execute(
+                    sa.text(
+                        "SELECT active_slots FROM concurrency_limit WHERE tag ="
+                        " 'small';"
+                    )
+                )
+            ).scalar()
+            if isinstance(active_slots, str):
+                active_slots = json.loads(active_slots)
+
+            assert active_slots == task_run_ids[:2]
+
+            await session.execute(sa.text("DELETE FROM concurrency_limit;"))
+            await session.commit()
+
+    finally:
+        await run_sync_in_worker_thread(alembic_upgrade)
@@ -1,10 +1,16 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
 import pendulum
 import pytest
 import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql.asyncpg
 
 import prefect
 from prefect.server import models, schemas
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.database.query_components import AsyncPostgresQueryComponents
+from prefect.testing.utilities import AsyncMock
 
 
 class TestGetRunsInQueueQuery:
@@ -766,3 +772,69 @@ class TestGetRunsFromWorkQueueQuery:
             scheduled_after=pendulum.now("UTC").add(hours=1),
         )
         assert len(runs) == 0
+
+
+class TestInsertLogs:
+    def log_rows(self, flow_run_id, count):
+        now = pendulum.now("UTC")
+        return [
+            {
+                "id": uuid4(),
+                "created": now,
+                "updated": now,
+                "name": "prefect.flow_runs",
+                "level": 20,
+                "flow_run_id": flow_run_id,
+                "task_run_id": None,
+                "message": f"log {i}",
+                "timestamp": now.add(seconds=i),
+            }
+            for i in range(count)
+        ]
+
+    async def test_inserts_logs(self, session, db: PrefectDBInterface, flow_run):
+        rows = self.log_rows(flow_run.id, 3)
+
+        await db.queries.insert_logs(session=session, db=db, logs=rows)
+
+        logs = await models.logs.read_logs(
+            session=session, log_filter=schemas.filters.LogFilter()
+        )
+        assert [(log.id, log.message, log.task_run_id) for log in logs] == [
+            (row["id"], row["message"], None) for row in rows
+        ]
+
+    async def test_insert_no_logs(self, session, db: PrefectDBInterface):
+        await db.queries.insert_logs(session=session, db=db, logs=[])
+
+        assert (
+            await models.logs.read_logs(
+                session=session, log_filter=schemas.filters.LogFilter()
+            )
+            == []
+        )
+
+    async def test_postgres_inserts_logs_from_one_array_per_column(
+        self, db: PrefectDBInterface
+    ):
+        session = MagicMock()
+        session.execute = AsyncMock()
+        rows = self.log_rows(uuid4(), 3)
+
+        await AsyncPostgresQueryComponents().insert_logs(
+            session=session, db=db, logs=rows
+        )
+
+        dialect = sa.dialects.postgresql.asyncpg.dialect()
+        statement = session.execute.call_args.args[0].compile(dialect=dialect)
+        assert str(statement).startswith("INSERT INTO log")
+        assert "unnest(" in str(statement)
+
+        params = statement.construct_params()
+        columns = [column.name for column in db.Log.__table__.columns]
+        assert set(params) == set(columns)
+        for name in columns:
+            # the array of each column is processed by the column's type
+            processor = statement.binds[name].type._cached_bind_processor(dialect)
+            values = processor(params[name]) if processor else params[name]
+            assert values == [row[name] for row in rows]
@@ -1,6 +1,8 @@
 import time
 from uuid import uuid4
 
+import sqlalchemy as sa
+
 from prefect.server import models, schemas
 
 
@@ -197,3 +199,130 @@ class TestReadingMultipleConcurrencyLimits:
         assert len(limits) == 2
         for cl in limits:
             assert cl.concurrency_limit == cl_data[cl.tag]
+
+
+class TestConcurrencyLimitSlots:
+    async def create_concurrency_limit(self, session, limit, tag="slots"):
+        return await models.concurrency_limits.create_concurrency_limit(
+            session=session,
+            concurrency_limit=schemas.core.ConcurrencyLimit(
+                tag=tag, concurrency_limit=limit
+            ),
+        )
+
+    async def acquire(self, session, concurrency_limit, task_run_id, **kwargs):
+        return await models.concurrency_limits.acquire_concurrency_limit_slot(
+            session,
+            concurrency_limit=concurrency_limit,
+            task_run_id=task_run_id,
+            **kwargs,
+        )
+
+    async def read_active_slots(self, session, tag="slots"):
+        concurrency_limit = (
+            await models.concurrency_limits.read_concurrency_limit_by_tag(session, tag)
+        )
+        return concurrency_limit.active_slots
+
+    async def test_acquiring_slots_up_to_the_limit(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 2)
+        task_run_ids = [uuid4() for _ in range(3)]
+
+        assert await self.acquire(session, concurrency_limit, task_run_ids[0])
+        assert await self.acquire(session, concurrency_limit, task_run_ids[1])
+        assert not await self.acquire(session, concurrency_limit, task_run_ids[2])
+
+        assert await self.read_active_slots(session) == task_run_ids[:2]
+
+    async def test_acquiring_a_held_slot_does_not_use_another_slot(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 2)
+        task_run_id = uuid4()
+
+        assert await self.acquire(session, concurrency_limit, task_run_id)
+        assert await self.acquire(session, concurrency_limit, task_run_id)
+
+        assert await self.read_active_slots(session) == [task_run_id]
+
+    async def test_released_slots_are_reused(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 1)
+        first, second = uuid4(), uuid4()
+
+        assert await self.acquire(session, concurrency_limit, first)
+        assert (
+            await models.concurrency_limits.release_concurrency_limit_slots(
+                session, task_run_id=first
+            )
+            == 1
+        )
+        assert await self.acquire(session, concurrency_limit, second)
+
+        concurrency_limit = await models.concurrency_limits.read_concurrency_limit(
+            session, concurrency_limit.id
+        )
+        assert len(concurrency_limit.slots) == 1
+        assert concurrency_limit.active_slots == [second]
+
+    async def test_releasing_slots_by_tag(self, session):
+        first_limit = await self.create_concurrency_limit(session, 1, tag="first")
+        second_limit = await self.create_concurrency_limit(session, 1, tag="second")
+        task_run_id = uuid4()
+
+        assert await self.acquire(session, first_limit, task_run_id)
+        assert await self.acquire(session, second_limit, task_run_id)
+
+        await models.concurrency_limits.release_concurrency_limit_slots(
+            session, task_run_id=task_run_id, tags=["first"]
+        )
+
+        assert await self.read_active_slots(session, "first") == []
+        assert await self.read_active_slots(session, "second") == [task_run_id]
+
+    async def test_expired_slots_are_reclaimed(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 1)
+        crashed, waiting = uuid4(), uuid4()
+
+        assert await self.acquire(session, concurrency_limit, crashed, lease_seconds=-1)
+        assert await self.read_active_slots(session) == []
+
+        assert await self.acquire(session, concurrency_limit, waiting)
+        assert await self.read_active_slots(session) == [waiting]
+
+    async def test_unexpired_slots_are_not_reclaimed(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 1)
+        running = uuid4()
+
+        assert await self.acquire(
+            session, concurrency_limit, running, lease_seconds=3600
+        )
+        assert not await self.acquire(session, concurrency_limit, uuid4())
+        assert await self.read_active_slots(session) == [running]
+
+    async def test_slots_above_a_lowered_limit_are_released_first(self, session):
+        concurrency_limit = await self.create_concurrency_limit(session, 2)
+        first, second = uuid4(), uuid4()
+        assert await self.acquire(session, concurrency_limit, first)
+        assert await self.acquire(session, concurrency_limit, second)
+
+        concurrency_limit = await self.create_concurrency_limit(session, 1)
+        await models.concurrency_limits.release_concurrency_limit_slots(
+            session, task_run_id=first
+        )
+
+        # the second run still holds a slot, so the limit of 1 has been reached
+        assert not await self.acquire(session, concurrency_limit, uuid4())
+
+        await models.concurrency_limits.release_concurrency_limit_slots(
+            session, task_run_id=second
+        )
+        assert await self.acquire(session, concurrency_limit, uuid4())
+
+    async def test_deleting_a_limit_deletes_its_slots(self, session, db):
+        concurrency_limit = await self.create_concurrency_limit(session, 1)
+        assert await self.acquire(session, concurrency_limit, uuid4())
+
+        await models.concurrency_limits.delete_concurrency_limit_by_tag(
+            session, "slots"
+        )
+
+        result = await session.execute(sa.select(db.ConcurrencyLimitSlot))
+        assert result.scalars().all() == []
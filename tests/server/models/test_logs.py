@@ -74,6 +74,43 @@ class TestCreateLogs:
                 == log_data[i]
             )
 
+    async def test_create_logs_exceeding_the_parameter_limit(
+        self, session, flow_run_id, db
+    ):
+        # more logs than would fit in a single statement with a parameter per field
+        count = (
+            models.logs.MAXIMUM_QUERY_PARAMETERS
+            // len(LogCreate.schema()["properties"])
+            + 1
+        )
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                LogCreate(
+                    name="prefect.flow_run",
+                    level=20,
+                    message=str(i),
+                    timestamp=NOW,
+                    flow_run_id=flow_run_id,
+                )
+                for i in range(count)
+            ],
+        )
+
+        result = await session.execute(
+            select(db.Log.id, db.Log.message, db.Log.created).where(
+                db.Log.flow_run_id == flow_run_id
+            )
+        )
+        rows = result.all()
+        assert len(rows) == count
+        assert len({row.id for row in rows}) == count
+        assert {row.message for row in rows} == {str(i) for i in range(count)}
+        assert all(row.created is not None for row in rows)
+
+    async def test_create_logs_with_no_logs(self, session, db):
+        await models.logs.create_logs(session=session, logs=[])
+
 
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
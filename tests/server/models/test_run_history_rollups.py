@@ -0,0 +1,175 @@
+import pendulum
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+
+dt = pendulum.datetime(2021, 7, 1, 12, 30, 15)
+
+
+async def read_rollups(session, db):
+    result = await session.execute(
+        sa.select(db.RunHistoryRollup).order_by(db.RunHistoryRollup.created)
+    )
+    return result.scalars().all()
+
+
+async def create_completed_flow_run(session, flow, work_queue=None, **kwargs):
+    return await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow.id,
+            work_queue_id=work_queue.id if work_queue else None,
+            state=schemas.states.Completed(timestamp=dt, **kwargs),
+        ),
+    )
+
+
+class TestRunHistoryRollupValues:
+    async def test_runs_not_in_a_final_state_have_no_values(self, session, flow):
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, state=schemas.states.Running(timestamp=dt)
+            ),
+        )
+        assert models.run_history_rollups.run_history_rollup_values(flow_run) is None
+
+    async def test_values_of_a_run_in_a_final_state(self, session, flow):
+        flow_run = await create_completed_flow_run(session, flow)
+        values = models.run_history_rollups.run_history_rollup_values(flow_run)
+
+        assert values == dict(
+            interval_start=pendulum.datetime(2021, 7, 1, 12, 30),
+            state_type=schemas.states.StateType.COMPLETED,
+            state_name="Completed",
+            count_runs=1,
+            sum_estimated_run_time=0,
+            sum_estimated_lateness=0,
+        )
+
+
+class TestRunHistoryRollups:
+    async def test_run_entering_a_final_state_is_rolled_up(
+        self, session, db, flow, work_queue
+    ):
+        flow_run = await create_completed_flow_run(session, flow, work_queue)
+
+        rollups = await read_rollups(session, db)
+        assert len(rollups) == 1
+        assert rollups[0].run_type == "flow_run"
+        assert rollups[0].interval_start == pendulum.datetime(2021, 7, 1, 12, 30)
+        assert rollups[0].flow_id == flow.id
+        assert rollups[0].deployment_id == flow_run.deployment_id
+        assert rollups[0].work_queue_id == work_queue.id
+        assert rollups[0].state_type == schemas.states.StateType.COMPLETED
+        assert rollups[0].count_runs == 1
+
+    async def test_task_run_is_rolled_up_by_its_flow_run(
+        self, session, db, flow, work_queue
+    ):
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id, work_queue_id=work_queue.id),
+        )
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="my-key",
+                dynamic_key="0",
+                state=schemas.states.Failed(timestamp=dt),
+            ),
+        )
+
+        rollups = await read_rollups(session, db)
+        assert len(rollups) == 1
+        assert rollups[0].run_type == "task_run"
+        assert rollups[0].flow_id == flow.id
+        assert rollups[0].work_queue_id == work_queue.id
+        assert rollups[0].state_type == schemas.states.StateType.FAILED
+
+    async def test_run_leaving_a_final_state_is_removed(self, session, db, flow):
+        flow_run = await create_completed_flow_run(session, flow)
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=schemas.states.Running(),
+            force=True,
+        )
+
+        rollups = await read_rollups(session, db)
+        assert [rollup.count_runs for rollup in rollups] == [1, -1]
+
+        removed = await models.run_history_rollups.compact_run_history_rollups(
+            session=session
+        )
+        assert removed == 2
+        assert await read_rollups(session, db) == []
+
+    async def test_deleting_a_flow_run_removes_its_runs(self, session, db, flow):
+        flow_run = await create_completed_flow_run(session, flow)
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="my-key",
+                dynamic_key="0",
+                state=schemas.states.Completed(timestamp=dt),
+            ),
+        )
+        await models.flow_runs.delete_flow_run(session=session, flow_run_id=flow_run.id)
+
+        await models.run_history_rollups.compact_run_history_rollups(session=session)
+        assert await read_rollups(session, db) == []
+
+    async def test_deleting_a_task_run_removes_it(self, session, db, flow_run):
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="my-key",
+                dynamic_key="0",
+                state=schemas.states.Completed(timestamp=dt),
+            ),
+        )
+        await models.task_runs.delete_task_run(session=session, task_run_id=task_run.id)
+
+        await models.run_history_rollups.compact_run_history_rollups(session=session)
+        assert await read_rollups(session, db) == []
+
+
+class TestCompactRunHistoryRollups:
+    async def test_merges_rows_with_the_same_dimensions(self, session, db, flow):
+        for _ in range(3):
+            await create_completed_flow_run(session, flow)
+        await create_completed_flow_run(session, flow, name="Done")
+
+        removed = await models.run_history_rollups.compact_run_history_rollups(
+            session=session
+        )
+        assert removed == 2
+
+        rollups = await read_rollups(session, db)
+        assert sorted((r.state_name, r.count_runs) for r in rollups) == [
+            ("Completed", 3),
+            ("Done", 1),
+        ]
+
+    async def test_limits_the_rows_merged(self, session, db, flow):
+        for _ in range(3):
+            await create_completed_flow_run(session, flow)
+
+        removed = await models.run_history_rollups.compact_run_history_rollups(
+            session=session, limit=2
+        )
+        assert removed == 1
+        assert len(await read_rollups(session, db)) == 2
+
+    async def test_nothing_to_merge(self, session, db, flow):
+        await create_completed_flow_run(session, flow)
+
+        removed = await models.run_history_rollups.compact_run_history_rollups(
+            session=session
+        )
+        assert removed == 0
+        assert len(await read_rollups(session, db)) == 1
@@ -0,0 +1,262 @@
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.settings import PREFECT_API_TASK_CACHE_SIZE, temporary_settings
+
+
+async def complete_task_run(session, task_run, cache_key, cache_expiration=None):
+    """
+    Completes a task run and caches its completed state.
+    """
+    result = await models.task_runs.set_task_run_state(
+        session=session,
+        task_run_id=task_run.id,
+        state=schemas.states.Completed(),
+        force=True,
+    )
+    await models.task_run_state_cache.cache_state(
+        session=session,
+        cache_key=cache_key,
+        cache_expiration=cache_expiration,
+        state=result.state,
+    )
+    return result.state
+
+
+@pytest.fixture
+def remember_recent_entries():
+    with temporary_settings({PREFECT_API_TASK_CACHE_SIZE: 1000}):
+        yield
+
+
+@pytest.fixture
+async def other_task_run(session, flow_run):
+    model = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.actions.TaskRunCreate(
+            flow_run_id=flow_run.id, task_key="my-key", dynamic_key="1"
+        ),
+    )
+    await session.commit()
+    return model
+
+
+class TestReadCachedState:
+    async def test_reads_cached_state(self, session, task_run):
+        state = await complete_task_run(session, task_run, "key")
+
+        cached_state = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached_state.id == state.id
+        assert cached_state.is_completed()
+
+    async def test_returns_none_for_unknown_key(self, session, task_run):
+        await complete_task_run(session, task_run, "key")
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="other-key"
+            )
+            is None
+        )
+
+    async def test_does_not_read_expired_state(self, session, task_run):
+        await complete_task_run(
+            session, task_run, "key", pendulum.now("UTC").subtract(seconds=1)
+        )
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+    async def test_reads_latest_state(self, session, task_run, other_task_run):
+        await complete_task_run(session, task_run, "key")
+        latest = await complete_task_run(session, other_task_run, "key")
+
+        cached_state = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached_state.id == latest.id
+
+    @pytest.mark.usefixtures("remember_recent_entries")
+    async def test_reads_state_from_memory_once_committed(self, session, db, task_run):
+        state = await complete_task_run(session, task_run, "key")
+        await session.commit()
+
+        # remove the entry from the database; it is still remembered in memory
+        await session.execute(sa.delete(db.TaskRunStateCache))
+        await session.commit()
+
+        cached_state = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached_state.id == state.id
+
+    @pytest.mark.usefixtures("remember_recent_entries")
+    async def test_does_not_remember_rolled_back_state(self, session, task_run):
+        await complete_task_run(session, task_run, "key")
+        await session.rollback()
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+    @pytest.mark.usefixtures("remember_recent_entries")
+    async def test_remembered_state_expires(self, session, task_run, monkeypatch):
+        await complete_task_run(
+            session, task_run, "key", pendulum.now("UTC").add(minutes=1)
+        )
+        await session.commit()
+
+        later = pendulum.now("UTC").add(minutes=2)
+        monkeypatch.setattr("pendulum.now", lambda *args: later)
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+    async def test_reads_database_when_memory_is_disabled(self, session, db, task_run):
+        with temporary_settings({PREFECT_API_TASK_CACHE_SIZE: 0}):
+            await complete_task_run(session, task_run, "key")
+            await session.commit()
+
+            await session.execute(sa.delete(db.TaskRunStateCache))
+            await session.commit()
+
+            assert (
+                await models.task_run_state_cache.read_cached_state(
+                    session=session, cache_key="key"
+                )
+                is None
+            )
+
+    async def test_memory_is_disabled_by_default(self, session, db, task_run):
+        await complete_task_run(session, task_run, "key")
+        await session.commit()
+
+        await session.execute(sa.delete(db.TaskRunStateCache))
+        await session.commit()
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+
+class TestReadCachedStates:
+    async def test_reads_latest_state_for_each_key(
+        self, session, task_run, other_task_run
+    ):
+        await complete_task_run(session, task_run, "a")
+        latest_a = await complete_task_run(session, other_task_run, "a")
+        b = await complete_task_run(session, task_run, "b")
+
+        cached_states = await models.task_run_state_cache.read_cached_states(
+            session=session, cache_keys=["a", "b"]
+        )
+        assert {key: state.id for key, state in cached_states.items()} == {
+            "a": latest_a.id,
+            "b": b.id,
+        }
+
+    async def test_reads_only_the_latest_entry_for_each_key(
+        self, session, task_run, other_task_run, monkeypatch
+    ):
+        for _ in range(3):
+            await complete_task_run(session, task_run, "a")
+            await complete_task_run(session, other_task_run, "b")
+        latest_a = await complete_task_run(session, task_run, "a")
+        latest_b = await complete_task_run(session, other_task_run, "b")
+
+        rows = []
+        execute = session.execute
+
+        async def record_rows(*args, **kwargs):
+            result = (await execute(*args, **kwargs)).all()
+            rows.extend(result)
+            return result
+
+        monkeypatch.setattr(session, "execute", record_rows)
+
+        cached_states = await models.task_run_state_cache.read_cached_states(
+            session=session, cache_keys=["a", "b"]
+        )
+        assert {key: state.id for key, state in cached_states.items()} == {
+            "a": latest_a.id,
+            "b": latest_b.id,
+        }
+        assert len(rows) == 2
+
+    async def test_omits_unknown_and_expired_keys(self, session, task_run):
+        await complete_task_run(session, task_run, "a")
+        await complete_task_run(
+            session, task_run, "expired", pendulum.now("UTC").subtract(seconds=1)
+        )
+
+        cached_states = await models.task_run_state_cache.read_cached_states(
+            session=session, cache_keys=["a", "expired", "unknown"]
+        )
+        assert set(cached_states) == {"a"}
+
+    @pytest.mark.usefixtures("remember_recent_entries")
+    async def test_reads_remembered_and_stored_states(self, session, db, task_run):
+        remembered = await complete_task_run(session, task_run, "a")
+        await session.commit()
+        await session.execute(sa.delete(db.TaskRunStateCache))
+        await session.commit()
+        stored = await complete_task_run(session, task_run, "b")
+
+        cached_states = await models.task_run_state_cache.read_cached_states(
+            session=session, cache_keys=["a", "b"]
+        )
+        assert cached_states["a"].id == remembered.id
+        assert cached_states["b"].id == stored.id
+
+
+class TestDeleteExpiredCacheEntries:
+    async def test_deletes_only_expired_entries(
+        self, session, db, task_run, other_task_run
+    ):
+        await complete_task_run(
+            session, task_run, "expired", pendulum.now("UTC").subtract(seconds=1)
+        )
+        await complete_task_run(
+            session, other_task_run, "unexpired", pendulum.now("UTC").add(days=1)
+        )
+        await complete_task_run(session, other_task_run, "never-expires")
+
+        deleted = await models.task_run_state_cache.delete_expired_cache_entries(
+            session=session
+        )
+
+        assert deleted == 1
+        result = await session.execute(sa.select(db.TaskRunStateCache.cache_key))
+        assert set(result.scalars().all()) == {"unexpired", "never-expires"}
+
+    async def test_respects_limit(self, session, db, task_run):
+        for _ in range(3):
+            await complete_task_run(
+                session, task_run, "expired", pendulum.now("UTC").subtract(seconds=1)
+            )
+
+        deleted = await models.task_run_state_cache.delete_expired_cache_entries(
+            session=session, limit=2
+        )
+
+        assert deleted == 2
+        result = await session.execute(sa.select(db.TaskRunStateCache.id))
+        assert len(result.scalars().all()) == 1
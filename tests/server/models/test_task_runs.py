@@ -138,6 +138,80 @@ class TestCreateTaskRun:
         assert result.name == "My Scheduled State"
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs_succeeds(self, flow_run, session):
+        created = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                )
+                for i in range(3)
+            ],
+        )
+        assert [task_run.dynamic_key for task_run in created] == ["0", "1", "2"]
+        assert all(task_run.flow_run_id == flow_run.id for task_run in created)
+        assert len({task_run.id for task_run in created}) == 3
+
+    async def test_create_task_runs_with_no_task_runs(self, session):
+        assert (
+            await models.task_runs.create_task_runs(session=session, task_runs=[]) == []
+        )
+
+    async def test_create_task_runs_returns_existing_task_runs(self, flow_run, session):
+        existing = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key="my-key", dynamic_key="1"
+            ),
+        )
+
+        created = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                )
+                for i in range(3)
+            ],
+        )
+        assert created[1].id == existing.id
+        assert existing.id not in {created[0].id, created[2].id}
+
+    async def test_create_task_runs_deduplicates_task_runs(self, flow_run, session):
+        task_run = schemas.core.TaskRun(
+            flow_run_id=flow_run.id,
+            task_key="my-key",
+            dynamic_key="0",
+            state=Pending(),
+        )
+        created = await models.task_runs.create_task_runs(
+            session=session, task_runs=[task_run, task_run.copy()]
+        )
+        assert created[0].id == created[1].id
+
+        states = await models.task_run_states.read_task_run_states(
+            session=session, task_run_id=created[0].id
+        )
+        assert len(states) == 1
+
+    async def test_create_task_runs_with_states(self, flow_run, session):
+        state_ids = [uuid4(), uuid4()]
+        created = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-key",
+                    dynamic_key=str(i),
+                    state=schemas.states.State(id=state_id, type="PENDING"),
+                )
+                for i, state_id in enumerate(state_ids)
+            ],
+        )
+        assert [task_run.state.id for task_run in created] == state_ids
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, task_run, session):
         read_task_run = await models.task_runs.read_task_run(
@@ -2,6 +2,7 @@ from uuid import uuid4
 
 import pendulum
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.exc import IntegrityError
 
 from prefect.server import models, schemas
@@ -409,3 +410,142 @@ class TestGetRunsInWorkQueue:
         assert len(runs_wq1) == min(
             limit, concurrency_limit - len(self.running_flow_states)
         )
+
+
+class TestActiveRunCounts:
+    async def read_counts(self, session, work_queue):
+        await session.commit()
+        work_queue = await session.get(
+            type(work_queue),
+            work_queue.id,
+            populate_existing=True,
+        )
+        await session.refresh(work_queue.work_pool)
+        return work_queue.active_run_count, work_queue.work_pool.active_run_count
+
+    async def create_flow_run(self, session, deployment, work_queue, state):
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=deployment.flow_id,
+                deployment_id=deployment.id,
+                work_queue_id=work_queue.id,
+                work_queue_name=work_queue.name,
+                state=state,
+            ),
+        )
+        await session.commit()
+        return flow_run
+
+    async def test_active_runs_are_counted(self, session, deployment, work_queue):
+        assert await self.read_counts(session, work_queue) == (0, 0)
+
+        flow_run = await self.create_flow_run(
+            session, deployment, work_queue, schemas.states.Scheduled()
+        )
+        assert await self.read_counts(session, work_queue) == (0, 0)
+
+        for state, expected_count in [
+            (schemas.states.Pending(), 1),
+            (schemas.states.Running(), 1),
+            (schemas.states.Cancelling(), 1),
+            (schemas.states.Cancelled(), 0),
+        ]:
+            await models.flow_runs.set_flow_run_state(
+                session=session, flow_run_id=flow_run.id, state=state, force=True
+            )
+            assert await self.read_counts(session, work_queue) == (
+                expected_count,
+                expected_count,
+            )
+
+    async def test_runs_are_counted_by_work_queue_name_without_work_queue_id(
+        self, session, deployment, work_queue
+    ):
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=deployment.flow_id,
+                work_queue_name=work_queue.name,
+                state=schemas.states.Running(),
+            ),
+        )
+        assert await self.read_counts(session, work_queue) == (1, 1)
+
+    async def test_deleted_active_runs_are_not_counted(
+        self, session, deployment, work_queue
+    ):
+        flow_run = await self.create_flow_run(
+            session, deployment, work_queue, schemas.states.Running()
+        )
+        assert await self.read_counts(session, work_queue) == (1, 1)
+
+        await models.flow_runs.delete_flow_run(session=session, flow_run_id=flow_run.id)
+        assert await self.read_counts(session, work_queue) == (0, 0)
+
+    async def test_reconcile_active_run_counts(
+        self, session, db, deployment, work_queue
+    ):
+        for _ in range(2):
+            await self.create_flow_run(
+                session, deployment, work_queue, schemas.states.Running()
+            )
+        await self.create_flow_run(
+            session, deployment, work_queue, schemas.states.Scheduled()
+        )
+
+        # simulate counts that have drifted from the runs they count
+        await session.execute(
+            sa.update(db.WorkQueue)
+            .where(db.WorkQueue.id == work_queue.id)
+            .values(active_run_count=5)
+        )
+        await session.execute(
+            sa.update(db.WorkPool)
+            .where(db.WorkPool.id == work_queue.work_pool_id)
+            .values(active_run_count=7)
+        )
+        assert await self.read_counts(session, work_queue) == (5, 7)
+
+        corrected = await models.work_queues.reconcile_active_run_counts(
+            session=session
+        )
+        assert corrected == 2
+        assert await self.read_counts(session, work_queue) == (2, 2)
+
+        # counts that are correct are left alone
+        assert (
+            await models.work_queues.reconcile_active_run_counts(session=session) == 0
+        )
+
+    async def test_concurrency_limit_is_enforced_by_active_run_counts(
+        self, session, db, deployment, work_queue
+    ):
+        await models.work_queues.update_work_queue(
+            session=session,
+            work_queue_id=work_queue.id,
+            work_queue=schemas.actions.WorkQueueUpdate(concurrency_limit=2),
+        )
+        for _ in range(3):
+            await self.create_flow_run(
+                session, deployment, work_queue, schemas.states.Scheduled()
+            )
+        await self.create_flow_run(
+            session, deployment, work_queue, schemas.states.Running()
+        )
+
+        runs = await models.work_queues.get_runs_in_work_queue(
+            session=session, work_queue_id=work_queue.id
+        )
+        assert len(runs) == 1
+
+        # the available slots are computed from the count rather than the runs
+        await session.execute(
+            sa.update(db.WorkQueue)
+            .where(db.WorkQueue.id == work_queue.id)
+            .values(active_run_count=0)
+        )
+        runs = await models.work_queues.get_runs_in_work_queue(
+            session=session, work_queue_id=work_queue.id
+        )
+        assert len(runs) == 2
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server.orchestration.concurrency_waiters import ConcurrencySlotWaiters
+
+
+@pytest.fixture
+def waiters():
+    return ConcurrencySlotWaiters()
+
+
+class TestConcurrencySlotWaiters:
+    async def test_waiter_times_out_without_notification(self, waiters):
+        waiter = waiters.register("tag")
+        assert not await waiters.wait(waiter, timeout=0.01)
+
+    async def test_notify_wakes_waiter(self, waiters):
+        waiter = waiters.register("tag")
+        assert waiters.notify("tag") == 1
+        assert await waiters.wait(waiter, timeout=1)
+        assert len(waiters) == 0
+
+    async def test_notify_only_wakes_waiters_for_the_tag(self, waiters):
+        waiter = waiters.register("tag")
+        assert waiters.notify("other tag") == 0
+        assert not await waiters.wait(waiter, timeout=0.01)
+
+    async def test_notify_wakes_waiters_in_order(self, waiters):
+        first = waiters.register("tag")
+        second = waiters.register("tag")
+
+        assert waiters.notify("tag") == 1
+        assert await waiters.wait(first, timeout=1)
+        assert not second.done()
+        assert len(waiters) == 1
+
+    async def test_notify_all_waiters(self, waiters):
+        futures = [waiters.register("tag") for _ in range(3)]
+
+        assert waiters.notify("tag", count=None) == 3
+        for future in futures:
+            assert await waiters.wait(future, timeout=1)
+
+    async def test_notify_skips_waiters_that_timed_out(self, waiters):
+        timed_out = waiters.register("tag")
+        assert not await waiters.wait(timed_out, timeout=0.01)
+        waiting = waiters.register("tag")
+
+        assert waiters.notify("tag") == 1
+        assert await waiters.wait(waiting, timeout=1)
+
+    async def test_unregister(self, waiters):
+        waiter = waiters.register("tag")
+        waiters.unregister("tag", waiter)
+        waiters.unregister("tag", waiter)
+
+        assert len(waiters) == 0
+        assert waiters.notify("tag") == 0
+
+    async def test_notify_from_another_thread(self, waiters):
+        waiter = waiters.register("tag")
+        await asyncio.get_running_loop().run_in_executor(None, waiters.notify, "tag")
+        assert await waiters.wait(waiter, timeout=1)
+
+    async def test_notify_after_commit(self, waiters, session):
+        waiter = waiters.register("tag")
+        waiters.notify_after_commit(session, ["tag"])
+        assert not waiter.done()
+
+        await session.commit()
+        assert await waiters.wait(waiter, timeout=1)
+
+    async def test_notify_after_commit_does_not_notify_on_rollback(
+        self, waiters, session
+    ):
+        waiter = waiters.register("tag")
+        await session.execute(sa.text("SELECT 1"))
+        waiters.notify_after_commit(session, ["tag"])
+
+        await session.rollback()
+        await session.commit()
+        assert not await waiters.wait(waiter, timeout=0.01)
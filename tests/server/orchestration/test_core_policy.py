@@ -37,6 +37,10 @@ from prefect.server.orchestration.rules import (
 )
 from prefect.server.schemas import actions, states
 from prefect.server.schemas.responses import SetStateStatus
+from prefect.settings import (
+    PREFECT_API_TASK_RUN_TAG_CONCURRENCY_SLOT_LEASE_SECONDS,
+    temporary_settings,
+)
 from prefect.testing.utilities import AsyncMock
 
 # Convert constants from sets to lists for deterministic ordering of tests
@@ -1259,6 +1263,7 @@ class TestTaskConcurrencyLimits:
         # the first task hasn't completed, so the concurrently running second task is
         # told to wait
         assert task2_running_ctx.response_status == SetStateStatus.WAIT
+        assert task2_running_ctx.response_details.concurrency_limit_tag == "some tag"
 
         # the number of slots occupied by active runs is equal to the concurrency limit
         assert (await self.count_concurrency_slots(session, "some tag")) == 1
@@ -2195,6 +2200,43 @@ class TestTaskConcurrencyLimits:
         assert task1_pending_ctx.response_status == SetStateStatus.ABORT
         assert (await self.count_concurrency_slots(session, "small")) == 1
 
+    async def test_expired_concurrency_slots_are_reclaimed(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        async def run_task():
+            ctx = await initialize_orchestration(
+                session, "task", *running_transition, run_tags=["some tag"]
+            )
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(
+                        rule(ctx, *running_transition)
+                    )
+                await ctx.validate_proposed_state()
+            return ctx
+
+        # the first task run crashes without leaving a running state, but its lease
+        # has already expired
+        with temporary_settings(
+            {PREFECT_API_TASK_RUN_TAG_CONCURRENCY_SLOT_LEASE_SECONDS: -1}
+        ):
+            crashed_ctx = await run_task()
+        assert crashed_ctx.response_status == SetStateStatus.ACCEPT
+        assert (await self.count_concurrency_slots(session, "some tag")) == 0
+
+        task2_running_ctx = await run_task()
+        assert task2_running_ctx.response_status == SetStateStatus.ACCEPT
+        assert (await self.read_concurrency_slots(session, "some tag")) == [
+            task2_running_ctx.run.id
+        ]
+
 
 class TestPausingFlows:
     async def test_can_not_nonblocking_pause_subflows(
@@ -75,3 +75,38 @@ class TestPoliciesRespectOrdering:
 
         transition = (states.StateType.PENDING, states.StateType.RUNNING)
         assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+
+class TestCompiledTransitionRules:
+    def test_rules_are_compiled_once_per_transition(self):
+        class ValidRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        priority_calls = []
+
+        class Bureaucracy(BaseOrchestrationPolicy):
+            def priority():
+                priority_calls.append(True)
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+        assert len(priority_calls) == 1
+
+        Bureaucracy.compile_transition_rules(states.StateType.RUNNING, None)
+        assert len(priority_calls) == 2
+
+    def test_compiled_rules_cannot_be_mutated_by_callers(self):
+        class ValidRule(BaseOrchestrationRule):
+            TO_STATES = ALL_ORCHESTRATION_STATES
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+
+        class Bureaucracy(BaseOrchestrationPolicy):
+            def priority():
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        Bureaucracy.compile_transition_rules(*transition).clear()
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
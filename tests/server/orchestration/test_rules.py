@@ -1239,6 +1239,58 @@ class TestOrchestrationContext:
         assert ctx.proposed_state_type == states.StateType.RUNNING
         assert ctx.validated_state_type == states.StateType.RUNNING
 
+    async def test_safe_copies_share_state_details(
+        self, session, run_type, initialize_orchestration
+    ):
+        initial_state_type = states.StateType.PENDING
+        proposed_state_type = states.StateType.RUNNING
+        intended_transition = (initial_state_type, proposed_state_type)
+        ctx = await initialize_orchestration(session, run_type, *intended_transition)
+
+        safe_copy = ctx.safe_copy()
+        assert safe_copy.proposed_state is not ctx.proposed_state
+        assert safe_copy.proposed_state.id == ctx.proposed_state.id
+        assert safe_copy.parameters is not ctx.parameters
+
+        # as with shallow copies, nested details can be updated through the copy
+        assert safe_copy.proposed_state.state_details is (
+            ctx.proposed_state.state_details
+        )
+
+    async def test_contexts_are_only_copied_for_implemented_hooks(
+        self, session, run_type, initialize_orchestration, monkeypatch
+    ):
+        safe_copy = MagicMock(wraps=OrchestrationContext.safe_copy)
+        monkeypatch.setattr(
+            OrchestrationContext, "safe_copy", lambda self: safe_copy(self)
+        )
+
+        class QuietRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+        class ChattyRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                pass
+
+        initial_state_type = states.StateType.PENDING
+        proposed_state_type = states.StateType.RUNNING
+        intended_transition = (initial_state_type, proposed_state_type)
+        ctx = await initialize_orchestration(session, run_type, *intended_transition)
+
+        async with QuietRule(ctx, *intended_transition) as ctx:
+            await ctx.validate_proposed_state()
+        assert safe_copy.call_count == 0
+        assert ctx.rule_signature == [str(QuietRule)]
+        assert ctx.finalization_signature == [str(QuietRule)]
+
+        async with ChattyRule(ctx, *intended_transition) as ctx:
+            pass
+        assert safe_copy.call_count == 1
+
     async def test_context_will_mutate_if_asked_politely(
         self, session, run_type, initialize_orchestration
     ):
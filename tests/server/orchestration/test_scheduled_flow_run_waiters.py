@@ -0,0 +1,81 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server.orchestration.scheduled_flow_run_waiters import (
+    ScheduledFlowRunWaiters,
+)
+
+
+@pytest.fixture
+def waiters():
+    return ScheduledFlowRunWaiters()
+
+
+@pytest.fixture
+def work_queue_ids():
+    return [uuid4(), uuid4()]
+
+
+class TestScheduledFlowRunWaiters:
+    async def test_waiter_times_out_without_notification(self, waiters, work_queue_ids):
+        waiter = waiters.register(work_queue_ids)
+        assert not await waiters.wait(waiter, timeout=0.01)
+
+    async def test_notify_wakes_waiter_for_any_of_its_work_queues(
+        self, waiters, work_queue_ids
+    ):
+        waiter = waiters.register(work_queue_ids)
+        assert waiters.notify([work_queue_ids[1]]) == 1
+        assert await waiters.wait(waiter, timeout=1)
+
+    async def test_notify_only_wakes_waiters_for_the_work_queues(
+        self, waiters, work_queue_ids
+    ):
+        waiter = waiters.register(work_queue_ids)
+        assert waiters.notify([uuid4()]) == 0
+        assert not await waiters.wait(waiter, timeout=0.01)
+
+    async def test_notify_wakes_all_waiters_once(self, waiters, work_queue_ids):
+        futures = [waiters.register(work_queue_ids) for _ in range(3)]
+
+        assert waiters.notify(work_queue_ids) == 3
+        for future in futures:
+            assert await waiters.wait(future, timeout=1)
+        assert len(waiters) == 0
+
+    async def test_unregister(self, waiters, work_queue_ids):
+        waiter = waiters.register(work_queue_ids)
+        waiters.unregister(work_queue_ids, waiter)
+        waiters.unregister(work_queue_ids, waiter)
+
+        assert len(waiters) == 0
+        assert waiters.notify(work_queue_ids) == 0
+
+    async def test_notify_from_another_thread(self, waiters, work_queue_ids):
+        waiter = waiters.register(work_queue_ids)
+        await asyncio.get_running_loop().run_in_executor(
+            None, waiters.notify, work_queue_ids
+        )
+        assert await waiters.wait(waiter, timeout=1)
+
+    async def test_notify_after_commit(self, waiters, work_queue_ids, session):
+        waiter = waiters.register(work_queue_ids)
+        waiters.notify_after_commit(session, [work_queue_ids[0], None])
+        assert not waiter.done()
+
+        await session.commit()
+        assert await waiters.wait(waiter, timeout=1)
+
+    async def test_notify_after_commit_does_not_notify_on_rollback(
+        self, waiters, work_queue_ids, session
+    ):
+        waiter = waiters.register(work_queue_ids)
+        await session.execute(sa.text("SELECT 1"))
+        waiters.notify_after_commit(session, work_queue_ids)
+
+        await session.rollback()
+        await session.commit()
+        assert not await waiters.wait(waiter, timeout=0.01)
@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.active_run_counts import ReconcileActiveRunCounts
+
+
+async def test_reconciles_active_run_counts(session, db, deployment, work_queue_1):
+    async with session.begin():
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=deployment.flow_id,
+                work_queue_id=work_queue_1.id,
+                state=schemas.states.Running(),
+            ),
+        )
+        # simulate counts that have drifted from the runs they count
+        await session.execute(sa.update(db.WorkQueue).values(active_run_count=3))
+        await session.execute(sa.update(db.WorkPool).values(active_run_count=3))
+
+    await ReconcileActiveRunCounts(handle_signals=False).start(loops=1)
+
+    work_queue = await session.get(
+        db.WorkQueue, work_queue_1.id, populate_existing=True
+    )
+    work_pool = await session.get(
+        db.WorkPool, work_queue_1.work_pool_id, populate_existing=True
+    )
+    assert work_queue.active_run_count == 1
+    assert work_pool.active_run_count == 1
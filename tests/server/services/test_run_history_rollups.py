@@ -0,0 +1,27 @@
+import pendulum
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.run_history_rollups import CompactRunHistoryRollups
+
+
+async def test_compacts_run_history_rollups(session, db, flow):
+    async with session.begin():
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=schemas.states.Completed(
+                        timestamp=pendulum.datetime(2021, 7, 1)
+                    ),
+                ),
+            )
+
+    service = CompactRunHistoryRollups(handle_signals=False)
+    # merge across several batches
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    result = await session.execute(sa.select(db.RunHistoryRollup.count_runs))
+    assert result.scalars().all() == [3]
@@ -0,0 +1,36 @@
+import pendulum
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.task_run_state_cache import PruneTaskRunStateCache
+
+
+async def test_prunes_expired_cache_entries(session, db, task_run):
+    async with session.begin():
+        result = await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Completed(),
+            force=True,
+        )
+        for cache_key, cache_expiration in [
+            ("expired-1", pendulum.now("UTC").subtract(days=1)),
+            ("expired-2", pendulum.now("UTC").subtract(days=1)),
+            ("expired-3", pendulum.now("UTC").subtract(days=1)),
+            ("unexpired", pendulum.now("UTC").add(days=1)),
+            ("never-expires", None),
+        ]:
+            await models.task_run_state_cache.cache_state(
+                session=session,
+                cache_key=cache_key,
+                cache_expiration=cache_expiration,
+                state=result.state,
+            )
+
+    service = PruneTaskRunStateCache(handle_signals=False)
+    # delete across several batches
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    result = await session.execute(sa.select(db.TaskRunStateCache.cache_key))
+    assert set(result.scalars().all()) == {"unexpired", "never-expires"}
@@ -1,3 +1,4 @@
+import pickle
 import textwrap
 from contextvars import ContextVar
 from unittest.mock import MagicMock
@@ -65,6 +66,15 @@ def test_copied_context_object_can_be_reentered():
             assert ExampleContext.get().x == 1
 
 
+def test_entered_context_object_can_be_pickled_and_entered():
+    context = ExampleContext(x=1)
+    with context:
+        unpickled = pickle.loads(pickle.dumps(context))
+
+    with unpickled:
+        assert ExampleContext.get().x == 1
+
+
 def test_exiting_a_context_more_than_entering_raises():
     context = ExampleContext(x=1)
 
@@ -198,6 +208,47 @@ class TestSettingsContext:
         ):
             yield path
 
+    def test_settings_context_equality(self):
+        settings_context = SettingsContext.get()
+        assert settings_context == settings_context
+        assert settings_context == settings_context.copy()
+
+        with temporary_settings(updates={PREFECT_API_KEY: "test"}):
+            assert SettingsContext.get() != settings_context
+
+    def test_settings_context_is_shared_with_submitted_tasks(self, monkeypatch):
+        copies = []
+        original_copy = SettingsContext.copy
+
+        def copy(self, **kwargs):
+            copies.append(self)
+            return original_copy(self, **kwargs)
+
+        monkeypatch.setattr(SettingsContext, "copy", copy)
+
+        # Collect contexts without returning them, since results may be serialized
+        settings_contexts = []
+
+        @task
+        def record_settings_context():
+            settings_contexts.append(SettingsContext.get())
+
+        @flow
+        def test_flow():
+            settings_contexts.append(SettingsContext.get())
+            for future in [record_settings_context.submit() for _ in range(2)]:
+                future.wait()
+
+        with temporary_settings(updates={PREFECT_API_KEY: "test"}):
+            test_flow()
+
+        flow_settings_context, *task_settings_contexts = settings_contexts
+        assert len(task_settings_contexts) == 2
+        for task_settings_context in task_settings_contexts:
+            assert task_settings_context is flow_settings_context
+
+        assert not copies
+
     def test_settings_context_variable(self):
         with SettingsContext(
             profile=Profile(name="test", settings={}),
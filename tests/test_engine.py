@@ -10,18 +10,22 @@ from unittest.mock import MagicMock, Mock
 from uuid import uuid4
 
 import anyio
+import httpx
 import pendulum
 import pytest
 from pydantic import BaseModel
 
 import prefect.flows
 from prefect import engine, flow, task
+from prefect.client.batching import TaskRunStateBatcher
+from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas import OrchestrationResult
 from prefect.context import FlowRunContext, get_run_context
 from prefect.engine import (
     begin_flow_run,
     create_and_begin_subflow_run,
     create_then_begin_flow_run,
+    find_upstreams,
     link_state_to_result,
     orchestrate_flow_run,
     orchestrate_task_run,
@@ -44,6 +48,7 @@ from prefect.exceptions import (
 from prefect.futures import PrefectFuture
 from prefect.results import ResultFactory
 from prefect.server.schemas.actions import FlowRunCreate
+from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.filters import FlowRunFilter
 from prefect.server.schemas.responses import (
     SetStateStatus,
@@ -51,11 +56,20 @@ from prefect.server.schemas.responses import (
     StateWaitDetails,
 )
 from prefect.server.schemas.states import StateDetails, StateType
+from prefect.settings import (
+    PREFECT_TASK_RUN_CREATION_BATCH_SIZE,
+    PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED,
+    PREFECT_TASK_RUN_STATE_BATCHING_ENABLED,
+    PREFECT_TASKS_CACHE_LOOKUP_ENABLED,
+    PREFECT_TASKS_LOCAL_CACHE_SIZE,
+    temporary_settings,
+)
 from prefect.states import Cancelled, Failed, Pending, Running, State
+from prefect.task_cache import get_local_task_cache
 from prefect.task_runners import SequentialTaskRunner
 from prefect.tasks import exponential_backoff
 from prefect.testing.utilities import AsyncMock, exceptions_equal
-from prefect.utilities.annotations import quote
+from prefect.utilities.annotations import allow_failure, quote
 from prefect.utilities.pydantic import PartialModel
 
 
@@ -574,6 +588,90 @@ class TestOrchestrateTaskRun:
                 orion_client, State(type=StateType.RUNNING), task_run_id=task_run.id
             )
 
+    async def test_propose_state_waits_for_concurrency_slot(
+        self, orion_client, mock_anyio_sleep, flow_run
+    ):
+        @task
+        def foo():
+            return 1
+
+        task_run = await orion_client.create_task_run(
+            task=foo,
+            flow_run_id=flow_run.id,
+            dynamic_key="0",
+            state=State(type=StateType.PENDING),
+        )
+
+        orion_client.set_task_run_state = AsyncMock(
+            side_effect=[
+                OrchestrationResult(
+                    status=SetStateStatus.WAIT,
+                    details=StateWaitDetails(
+                        delay_seconds=30, concurrency_limit_tag="limited"
+                    ),
+                ),
+                OrchestrationResult(
+                    status=SetStateStatus.ACCEPT,
+                    details=StateAcceptDetails(),
+                    state=Running(),
+                ),
+            ]
+        )
+        orion_client.wait_for_concurrency_slot = AsyncMock(return_value=True)
+
+        # the client waits for a slot instead of sleeping
+        with mock_anyio_sleep.assert_sleeps_for(0):
+            await propose_state(
+                orion_client, State(type=StateType.RUNNING), task_run_id=task_run.id
+            )
+
+        orion_client.wait_for_concurrency_slot.assert_awaited_once_with(
+            "limited", timeout=30
+        )
+
+    async def test_propose_state_sleeps_if_api_cannot_wait_for_concurrency_slot(
+        self, orion_client, mock_anyio_sleep, flow_run
+    ):
+        @task
+        def foo():
+            return 1
+
+        task_run = await orion_client.create_task_run(
+            task=foo,
+            flow_run_id=flow_run.id,
+            dynamic_key="0",
+            state=State(type=StateType.PENDING),
+        )
+
+        orion_client.set_task_run_state = AsyncMock(
+            side_effect=[
+                OrchestrationResult(
+                    status=SetStateStatus.WAIT,
+                    details=StateWaitDetails(
+                        delay_seconds=30, concurrency_limit_tag="limited"
+                    ),
+                ),
+                OrchestrationResult(
+                    status=SetStateStatus.ACCEPT,
+                    details=StateAcceptDetails(),
+                    state=Running(),
+                ),
+            ]
+        )
+        request = httpx.Request("POST", "/concurrency_limits/tag/limited/wait")
+        orion_client.wait_for_concurrency_slot = AsyncMock(
+            side_effect=httpx.HTTPStatusError(
+                "Not Found",
+                request=request,
+                response=httpx.Response(404, request=request),
+            )
+        )
+
+        with mock_anyio_sleep.assert_sleeps_for(30):
+            await propose_state(
+                orion_client, State(type=StateType.RUNNING), task_run_id=task_run.id
+            )
+
     async def test_waits_until_scheduled_start_time(
         self,
         orion_client,
@@ -1628,6 +1726,335 @@ class TestDynamicKeyHandling:
         assert sorted([int(run.dynamic_key) for run in task_runs]) == [0, 0, 1, 1]
 
 
+class TestTaskRunCreationBatching:
+    @pytest.fixture(autouse=True)
+    def enable_batching(self):
+        with temporary_settings(
+            updates={
+                PREFECT_TASK_RUN_CREATION_BATCHING_ENABLED: True,
+                PREFECT_TASK_RUN_CREATION_BATCH_SIZE: 4,
+            }
+        ):
+            yield
+
+    @pytest.fixture
+    def spy_create_task_runs(self, monkeypatch):
+        spy = MagicMock()
+        original = PrefectClient.create_task_runs
+
+        async def create_task_runs(self, task_runs):
+            spy(task_runs)
+            return await original(self, task_runs)
+
+        monkeypatch.setattr(PrefectClient, "create_task_runs", create_task_runs)
+        return spy
+
+    async def test_task_runs_are_created_in_batches(
+        self, orion_client, spy_create_task_runs
+    ):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            return [future.result() for future in add_one.map(range(10))]
+
+        assert my_flow() == list(range(1, 11))
+
+        batch_sizes = [
+            len(call.args[0]) for call in spy_create_task_runs.call_args_list
+        ]
+        assert sum(batch_sizes) == 10
+        assert max(batch_sizes) <= 4
+        assert len(batch_sizes) < 10
+
+        task_runs = await orion_client.read_task_runs()
+        assert sorted(int(run.dynamic_key) for run in task_runs) == list(range(10))
+        assert all(run.state.is_completed() for run in task_runs)
+
+    async def test_task_runs_retain_upstream_relationships(self, orion_client):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            a = add_one.submit(1)
+            b = add_one.submit(a)
+            return b.result(), a.task_run.id
+
+        result, upstream_id = my_flow()
+        assert result == 3
+
+        task_runs = await orion_client.read_task_runs()
+        downstream = next(run for run in task_runs if run.id != upstream_id)
+        assert downstream.task_inputs["x"] == [TaskRunResult(id=upstream_id)]
+
+    def test_sequential_task_runner_does_not_batch(self, spy_create_task_runs):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow(task_runner=SequentialTaskRunner())
+        def my_flow():
+            return add_one(1)
+
+        assert my_flow() == 2
+        spy_create_task_runs.assert_not_called()
+
+
+class TestTaskCacheLookups:
+    @pytest.fixture(autouse=True)
+    def enable_cache_lookups(self):
+        with temporary_settings(updates={PREFECT_TASKS_CACHE_LOOKUP_ENABLED: True}):
+            get_local_task_cache().clear()
+            yield
+            get_local_task_cache().clear()
+
+    @pytest.fixture
+    def spy_submit_task_run(self, monkeypatch):
+        spy = MagicMock()
+        original = engine.submit_task_run
+
+        async def submit_task_run(*args, **kwargs):
+            spy(*args, **kwargs)
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(engine, "submit_task_run", submit_task_run)
+        return spy
+
+    @pytest.fixture
+    def spy_read_cached_task_run_states(self, monkeypatch):
+        spy = MagicMock()
+        original = PrefectClient.read_cached_task_run_states
+
+        async def read_cached_task_run_states(self, cache_keys):
+            spy(list(cache_keys))
+            return await original(self, cache_keys)
+
+        monkeypatch.setattr(
+            PrefectClient, "read_cached_task_run_states", read_cached_task_run_states
+        )
+        return spy
+
+    def test_cached_task_runs_are_not_submitted(self, spy_submit_task_run):
+        calls = []
+        cache_key = uuid4().hex
+
+        @task(cache_key_fn=lambda *_: cache_key)
+        def foo(x):
+            calls.append(x)
+            return x
+
+        @flow
+        def bar(x):
+            return foo._run(x)
+
+        first_state = bar(1)
+        second_state = bar(2)
+
+        assert first_state.name == "Completed"
+        assert second_state.name == "Cached"
+        assert second_state.result() == 1
+        assert calls == [1]
+        assert spy_submit_task_run.call_count == 1
+
+    async def test_cached_task_run_state_is_recorded(self, orion_client):
+        cache_key = uuid4().hex
+
+        @task(cache_key_fn=lambda *_: cache_key)
+        def foo(x):
+            return x
+
+        @flow
+        def bar(x):
+            return foo._run(x)
+
+        bar(1)
+        state = bar(2)
+
+        task_run = await orion_client.read_task_run(state.state_details.task_run_id)
+        assert task_run.state.name == "Cached"
+        assert task_run.state.is_completed()
+
+    def test_cached_states_are_looked_up_from_the_api_in_batches(
+        self, spy_submit_task_run, spy_read_cached_task_run_states
+    ):
+        prefix = uuid4().hex
+
+        @task(cache_key_fn=lambda context, parameters: f"{prefix}-{parameters['x']}")
+        def foo(x):
+            return x
+
+        @flow
+        def bar():
+            return [future.wait() for future in foo.map(range(4))]
+
+        with temporary_settings(updates={PREFECT_TASKS_LOCAL_CACHE_SIZE: 0}):
+            bar()
+            spy_submit_task_run.reset_mock()
+            spy_read_cached_task_run_states.reset_mock()
+
+            states = bar()
+
+        assert [state.name for state in states] == ["Cached"] * 4
+        assert [state.result() for state in states] == [0, 1, 2, 3]
+        spy_submit_task_run.assert_not_called()
+        looked_up = [
+            key
+            for call in spy_read_cached_task_run_states.call_args_list
+            for key in call.args[0]
+        ]
+        assert sorted(looked_up) == [f"{prefix}-{i}" for i in range(4)]
+        assert spy_read_cached_task_run_states.call_count < 4
+
+    def test_refresh_cache_submits_task_runs(self, spy_submit_task_run):
+        cache_key = uuid4().hex
+
+        @task(cache_key_fn=lambda *_: cache_key, refresh_cache=True)
+        def foo(x):
+            return x
+
+        @flow
+        def bar(x):
+            return foo._run(x)
+
+        bar(1)
+        state = bar(2)
+
+        assert state.name == "Completed"
+        assert state.result() == 2
+        assert spy_submit_task_run.call_count == 2
+
+    def test_task_runs_without_cache_key_fn_are_submitted(self, spy_submit_task_run):
+        @task
+        def foo(x):
+            return x
+
+        @flow
+        def bar(x):
+            return foo._run(x)
+
+        bar(1)
+        assert bar(1).name == "Completed"
+        assert spy_submit_task_run.call_count == 2
+
+
+class TestTaskRunStateBatching:
+    @pytest.fixture(autouse=True)
+    def enable_batching(self):
+        with temporary_settings(
+            updates={
+                PREFECT_TASK_RUN_STATE_BATCHING_ENABLED: True,
+                PREFECT_TASK_RUN_CREATION_BATCH_SIZE: 4,
+            }
+        ):
+            yield
+
+    @pytest.fixture
+    def spy_set_task_run_states(self, monkeypatch):
+        spy = MagicMock()
+        original = PrefectClient.set_task_run_states
+
+        async def set_task_run_states(self, transitions):
+            spy(transitions)
+            return await original(self, transitions)
+
+        monkeypatch.setattr(PrefectClient, "set_task_run_states", set_task_run_states)
+        return spy
+
+    async def test_task_run_states_are_set_in_batches(
+        self, orion_client, spy_set_task_run_states
+    ):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            return [future.result() for future in add_one.map(range(10))]
+
+        assert my_flow() == list(range(1, 11))
+
+        batch_sizes = [
+            len(call.args[0]) for call in spy_set_task_run_states.call_args_list
+        ]
+        # each task run proposes a running and a completed state
+        assert sum(batch_sizes) == 20
+        assert max(batch_sizes) <= 4
+        assert len(batch_sizes) < 20
+
+        task_runs = await orion_client.read_task_runs()
+        assert len(task_runs) == 10
+        assert all(run.state.is_completed() for run in task_runs)
+
+    async def test_failed_batches_set_states_individually(
+        self, orion_client, monkeypatch
+    ):
+        async def set_task_run_states(self, transitions):
+            raise httpx.HTTPStatusError(
+                "Not Found",
+                request=httpx.Request("POST", "http://test/task_runs/set_state/batch"),
+                response=httpx.Response(404),
+            )
+
+        monkeypatch.setattr(PrefectClient, "set_task_run_states", set_task_run_states)
+
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            return [future.result() for future in add_one.map(range(3))]
+
+        assert my_flow() == [1, 2, 3]
+
+        task_runs = await orion_client.read_task_runs()
+        assert all(run.state.is_completed() for run in task_runs)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ReadTimeout("timed out"),
+            httpx.HTTPStatusError(
+                "Bad Gateway",
+                request=httpx.Request("POST", "http://test/task_runs/set_state/batch"),
+                response=httpx.Response(502),
+            ),
+        ],
+    )
+    async def test_batches_that_may_have_been_applied_are_not_sent_again(self, error):
+        client = MagicMock()
+        client.set_task_run_states = AsyncMock(side_effect=error)
+        client.set_task_run_state = AsyncMock()
+
+        async with anyio.create_task_group() as tg:
+            batcher = TaskRunStateBatcher(client, tg, batch_size=2)
+            results = await asyncio.gather(
+                batcher.set_task_run_state(uuid4(), Running()),
+                batcher.set_task_run_state(uuid4(), Running()),
+                return_exceptions=True,
+            )
+
+        assert results == [error, error]
+        client.set_task_run_states.assert_awaited_once()
+        client.set_task_run_state.assert_not_called()
+
+    def test_sequential_task_runner_does_not_batch(self, spy_set_task_run_states):
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow(task_runner=SequentialTaskRunner())
+        def my_flow():
+            return add_one(1)
+
+        assert my_flow() == 2
+        spy_set_task_run_states.assert_not_called()
+
+
 class TestCreateThenBeginFlowRun:
     async def test_handles_bad_parameter_types(self, orion_client, parameterized_flow):
         state = await create_then_begin_flow_run(
@@ -2001,3 +2428,51 @@ class TestLinkStateToResult:
         with await get_flow_run_context():
             link_state_to_result(state=state, result=test_input)
             assert state.state_details.untrackable_result == expected_status
+
+
+class TestFindUpstreams:
+    @pytest.fixture
+    def state(self):
+        return State(id=uuid4(), type=StateType.COMPLETED)
+
+    @pytest.fixture
+    async def future(self):
+        return PrefectFuture(
+            name="foo", key=uuid4(), task_runner=SequentialTaskRunner()
+        )
+
+    async def test_find_upstreams_finds_futures_and_states(self, state, future):
+        upstreams = find_upstreams({"x": [1, {"y": future}], "z": (state,)})
+        assert len(upstreams) == 2
+        assert (future, None) in upstreams
+        assert (state, None) in upstreams
+
+    async def test_find_upstreams_respects_max_depth(self, state):
+        assert find_upstreams([state, [state]], max_depth=1) == [(state, None)]
+
+    async def test_find_upstreams_includes_innermost_annotation(self, state, future):
+        failure_allowed = allow_failure(future)
+        quoted = quote([state])
+
+        upstreams = find_upstreams([failure_allowed, quoted])
+        assert len(upstreams) == 2
+        assert (future, failure_allowed) in upstreams
+        assert (state, quoted) in upstreams
+
+    async def test_find_upstreams_skips_quoted_expressions(self, state, future):
+        failure_allowed = allow_failure(future)
+
+        upstreams = find_upstreams([failure_allowed, quote([state])], skip_quoted=True)
+        assert upstreams == [(future, failure_allowed)]
+
+    async def test_find_upstreams_includes_states_of_results(
+        self, get_flow_run_context, state
+    ):
+        result = ["Hello", 257]
+
+        with await get_flow_run_context():
+            link_state_to_result(state=state, result=result)
+
+            # The list and both of its items are linked to the state
+            assert find_upstreams({"x": result}) == [(state, None)] * 3
+            assert find_upstreams({"x": result}, include_results=False) == []
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+
+import pytest
+
+import prefect
+
+
+def modules_loaded_by(statement: str) -> set:
+    """
+    Returns the modules loaded by a statement in a new Python process.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    "statement", ["import prefect", "from prefect import flow, task"]
+)
+def test_importing_prefect_does_not_load_server_infrastructure_or_collections(
+    statement,
+):
+    modules = modules_loaded_by(statement)
+
+    for module in [
+        "prefect.server.api",
+        "prefect.server.models",
+        "prefect.server.orchestration",
+        "prefect.server.services",
+        "prefect.engine",
+        "prefect.infrastructure",
+        "prefect.packaging",
+        "prefect.blocks.notifications",
+        "fastapi",
+    ]:
+        assert module not in modules
+
+
+def test_importing_engine_does_not_load_server():
+    modules = modules_loaded_by("import prefect.engine")
+
+    assert "prefect.engine" in modules
+    assert "prefect.server.models" not in modules
+    assert "prefect.server.api" not in modules
+
+
+def test_client_for_hosted_api_does_not_load_server():
+    modules = modules_loaded_by(
+        "from prefect.client.orchestration import PrefectClient\n"
+        "PrefectClient('http://localhost:4200/api')"
+    )
+
+    assert "prefect.server.api" not in modules
+    assert "fastapi" not in modules
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "pause_flow_run",
+        "resume_flow_run",
+        "get_cloud_client",
+        "CloudClient",
+        "engine",
+        "infrastructure",
+        "server",
+    ],
+)
+def test_lazy_attributes_are_available(name):
+    assert getattr(prefect, name) is not None
+
+
+def test_lazy_server_submodules_are_available():
+    import prefect.server
+
+    assert prefect.server.models.flow_runs is not None
+    assert prefect.server.schemas.core is not None
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        prefect.foo
+
+
+def test_core_blocks_are_registered_on_first_lookup():
+    from prefect.blocks.core import Block
+    from prefect.infrastructure import DockerContainer
+    from prefect.utilities.dispatch import lookup_type
+
+    assert lookup_type(Block, "docker-container") is DockerContainer
+    assert lookup_type(Block, "slack-webhook").__name__ == "SlackWebhook"
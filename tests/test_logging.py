@@ -1,7 +1,6 @@
 import asyncio
 import json
 import logging
-import queue
 import sys
 import threading
 import time
@@ -50,9 +49,12 @@ from prefect.settings import (
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_SETTINGS_PATH,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
+    PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESSION_ENABLED,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
     temporary_settings,
 )
@@ -693,7 +695,31 @@ class TestAPILogWorker:
 
     def test_enqueue(self, log_dict, log_size, worker):
         worker.enqueue(log_dict, log_size)
-        assert worker._queue.get_nowait() == (log_dict, log_size)
+        assert worker._queue.popleft() == (log_dict, log_size)
+
+    def test_enqueue_drops_oldest_logs_when_queue_is_full(
+        self, log_dict, log_size, get_worker
+    ):
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE: 2}):
+            worker = get_worker()
+
+        logs = [dict(log_dict, message=str(i)) for i in range(3)]
+        for log in logs:
+            worker.enqueue(log, log_size)
+
+        assert list(worker._queue) == [(logs[1], log_size), (logs[2], log_size)]
+        assert worker.dropped_logs == 1
+        assert "Dropped logs: 1" in worker.worker_info()
+
+    def test_enqueue_sets_flush_event_when_batch_is_ready(
+        self, log_dict, log_size, get_worker
+    ):
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS: 2}):
+            worker = get_worker()
+            worker.enqueue(log_dict, log_size)
+            assert not worker._flush_event.is_set()
+            worker.enqueue(log_dict, log_size)
+            assert worker._flush_event.is_set()
 
     async def test_send_logs_single_record(
         self, log_dict, log_size, orion_client, worker
@@ -741,8 +767,7 @@ class TestAPILogWorker:
 
         # Log moved from queue to pending logs
         assert worker._pending_logs == [log_dict]
-        with pytest.raises(queue.Empty):
-            worker._queue.get_nowait()
+        assert not worker._queue
 
         # Restore client
         monkeypatch.setattr(
@@ -796,6 +821,81 @@ class TestAPILogWorker:
 
         assert mock_create_logs.call_count == 3
 
+    async def test_send_logs_batches_by_count(
+        self, log_dict, log_size, monkeypatch, get_worker
+    ):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.PrefectClient.create_logs", mock_create_logs
+        )
+
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_BATCH_MAX_LOGS: 2}):
+            worker = get_worker()
+            for _ in range(5):
+                worker.enqueue(log_dict, log_size)
+            await worker.send_logs()
+
+        assert [len(call.args[0]) for call in mock_create_logs.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert worker.sent_logs == 5
+
+    async def test_send_logs_drops_logs_after_max_retries(
+        self, log_dict, log_size, monkeypatch, worker
+    ):
+        monkeypatch.setattr(
+            "prefect.client.PrefectClient.create_logs",
+            MagicMock(side_effect=ValueError("Test")),
+        )
+
+        worker.enqueue(log_dict, log_size)
+        for _ in range(worker._max_retries + 1):
+            await worker.send_logs()
+
+        assert worker._pending_logs == []
+        assert worker.dropped_logs == 1
+        assert worker.sent_logs == 0
+
+    @pytest.mark.parametrize("compress", [True, False])
+    async def test_send_logs_with_compression(
+        self, log_dict, log_size, orion_client, get_worker, compress
+    ):
+        with temporary_settings(
+            updates={PREFECT_LOGGING_TO_API_COMPRESSION_ENABLED: compress}
+        ):
+            worker = get_worker()
+            worker.enqueue(log_dict, log_size)
+            await worker.send_logs()
+
+        logs = await orion_client.read_logs()
+        assert len(logs) == 1
+        assert logs[0].message == log_dict["message"]
+
+    async def test_background_thread_reuses_client(
+        self, log_dict, log_size, orion_client, get_worker, monkeypatch
+    ):
+        clients = set()
+        unpatched_create_logs = orion_client.create_logs
+
+        async def create_logs(self, *args, **kwargs):
+            clients.add(id(self))
+            return await unpatched_create_logs(*args, **kwargs)
+
+        monkeypatch.setattr("prefect.client.PrefectClient.create_logs", create_logs)
+
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_BATCH_INTERVAL: "10"}):
+            worker = get_worker()
+            worker.start()
+            worker.enqueue(log_dict, log_size)
+            worker.flush(block=True)
+            worker.enqueue(log_dict, log_size)
+            worker.flush(block=True)
+
+        assert len(clients) == 1
+        assert worker.sent_logs == 2
+
     @pytest.mark.flaky(max_runs=3)
     async def test_logs_are_sent_when_started(
         self, log_dict, log_size, orion_client, get_worker, monkeypatch
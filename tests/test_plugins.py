@@ -6,9 +6,12 @@ from unittest.mock import Mock
 import pytest
 
 import prefect
+import prefect.utilities.dispatch
+from prefect.blocks.core import Block
 from prefect.plugins import load_extra_entrypoints
 from prefect.settings import PREFECT_EXTRA_ENTRYPOINTS, temporary_settings
 from prefect.testing.utilities import exceptions_equal
+from prefect.utilities.dispatch import get_registry_for_type
 
 
 @pytest.fixture
@@ -258,8 +261,13 @@ def test_plugins_load_on_prefect_package_init(monkeypatch):
     monkeypatch.setattr(
         prefect.plugins, "load_extra_entrypoints", mock_load_extra_entrypoints
     )
+    monkeypatch.setattr(prefect.utilities.dispatch, "_DEFERRED_IMPORTS", [])
 
     importlib.reload(prefect)
 
-    mock_load_prefect_collections.assert_called_once()
     mock_load_extra_entrypoints.assert_called_once()
+
+    # Collections are loaded when a registry is first used
+    mock_load_prefect_collections.assert_not_called()
+    get_registry_for_type(Block)
+    mock_load_prefect_collections.assert_called_once()
@@ -7,7 +7,9 @@ from unittest.mock import MagicMock
 import pydantic
 import pytest
 
+from prefect import flow
 from prefect.serializers import (
+    ArrowSerializer,
     CompressedSerializer,
     JSONSerializer,
     PickleSerializer,
@@ -361,3 +363,71 @@ class TestCompressedSerializer:
         serializer = Serializer(type="compressed/json")
         assert isinstance(serializer, CompressedSerializer)
         assert isinstance(serializer.serializer, JSONSerializer)
+
+
+class TestArrowSerializer:
+    @pytest.fixture
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def table(self, pyarrow):
+        return pyarrow.table({"x": list(range(100)), "y": [str(i) for i in range(100)]})
+
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_non_tabular_roundtrip_uses_fallback(self, data):
+        serializer = ArrowSerializer()
+        serialized = serializer.dumps(data)
+        assert serialized == b"F" + PickleSerializer().dumps(data)
+        assert serializer.loads(serialized) == data
+
+    def test_uses_given_fallback_serializer(self):
+        serializer = ArrowSerializer(fallback_serializer="json")
+        assert isinstance(serializer.fallback_serializer, JSONSerializer)
+        assert serializer.loads(serializer.dumps({"a": 1})) == {"a": 1}
+
+    def test_shorthand(self):
+        serializer = Serializer(type="arrow")
+        assert isinstance(serializer, ArrowSerializer)
+        assert isinstance(serializer.fallback_serializer, PickleSerializer)
+
+    def test_invalid_compression(self):
+        with pytest.raises(pydantic.ValidationError):
+            ArrowSerializer(compression="foo")
+
+    @pytest.mark.parametrize("compression", [None, "zstd", "lz4"])
+    def test_table_roundtrip(self, table, compression):
+        serializer = ArrowSerializer(compression=compression)
+        serialized = serializer.dumps(table)
+        assert serialized.startswith(b"T")
+        assert serializer.loads(serialized).equals(table)
+
+    def test_compression_reduces_size(self, pyarrow):
+        table = pyarrow.table({"x": [1] * 10000})
+        assert len(ArrowSerializer(compression="zstd").dumps(table)) < len(
+            ArrowSerializer().dumps(table)
+        )
+
+    def test_record_batch_roundtrip(self, table):
+        batch = table.to_batches()[0]
+        serializer = ArrowSerializer()
+        result = serializer.loads(serializer.dumps(batch))
+        assert isinstance(result, type(batch))
+        assert result.equals(batch)
+
+    def test_pandas_roundtrip(self, pyarrow):
+        pandas = pytest.importorskip("pandas")
+        df = pandas.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]}, index=[3, 4, 5])
+        serializer = ArrowSerializer()
+        serialized = serializer.dumps(df)
+        assert serialized.startswith(b"P")
+        pandas.testing.assert_frame_equal(serializer.loads(serialized), df)
+
+    def test_can_be_used_as_result_serializer(self, table):
+        @flow(result_serializer="arrow", persist_result=True)
+        def foo():
+            return table
+
+        state = foo(return_state=True)
+        assert state.data.serializer_type == "arrow"
+        assert state.result().equals(table)
@@ -2,6 +2,7 @@ import copy
 import os
 import textwrap
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
@@ -280,6 +281,41 @@ class TestSettingsClass:
             settings.copy_with_update(updates={PREFECT_TEST_SETTING: "foo"}) != settings
         )
 
+    def test_hash_of_equal_instances(self):
+        assert hash(Settings()) == hash(Settings())
+
+    def test_hash_with_different_values(self):
+        settings = Settings()
+        assert hash(
+            settings.copy_with_update(updates={PREFECT_TEST_SETTING: "foo"})
+        ) != hash(settings)
+
+    def test_value_callbacks_are_called_once(self, monkeypatch):
+        callback = MagicMock(return_value=Path("/foo"))
+        monkeypatch.setattr(PREFECT_HOME, "value_callback", callback)
+        settings = Settings()
+
+        assert PREFECT_HOME.value_from(settings) == Path("/foo")
+        assert PREFECT_HOME.value_from(settings) == Path("/foo")
+
+        callback.assert_called_once_with(settings, settings.PREFECT_HOME)
+
+    def test_value_callbacks_are_not_cached_when_bypassed(self):
+        settings = Settings(PREFECT_HOME="~/test")
+
+        assert PREFECT_HOME.value_from(settings, bypass_callback=True) == Path("~/test")
+        assert PREFECT_HOME.value_from(settings) == Path("~/test").expanduser()
+        assert PREFECT_HOME.value_from(settings, bypass_callback=True) == Path("~/test")
+
+    def test_copy_does_not_share_callback_values(self):
+        settings = Settings(PREFECT_HOME="~/test")
+        assert PREFECT_HOME.value_from(settings) == Path("~/test").expanduser()
+
+        updated = settings.copy(update={"PREFECT_HOME": Path("~/other")})
+
+        assert PREFECT_HOME.value_from(updated) == Path("~/other").expanduser()
+        assert PREFECT_HOME.value_from(settings) == Path("~/test").expanduser()
+
     def test_with_obfuscated_secrets(self):
         settings = get_current_settings()
         original = settings.copy()
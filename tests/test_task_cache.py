@@ -0,0 +1,74 @@
+import pendulum
+import pytest
+
+from prefect.server.schemas.states import StateDetails
+from prefect.settings import PREFECT_TASKS_LOCAL_CACHE_SIZE, temporary_settings
+from prefect.states import Completed, Failed
+from prefect.task_cache import LocalTaskCache, get_local_task_cache
+
+
+class TestLocalTaskCache:
+    def test_get_returns_put_state(self):
+        cache = LocalTaskCache(max_size=10)
+        state = Completed()
+        cache.put("key", state)
+
+        assert cache.get("key") is state
+        assert cache.get("other-key") is None
+
+    def test_only_completed_states_are_cached(self):
+        cache = LocalTaskCache(max_size=10)
+        cache.put("key", Failed())
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_expired_states_are_not_returned(self, monkeypatch):
+        cache = LocalTaskCache(max_size=10)
+        cache.put(
+            "key",
+            Completed(
+                state_details=StateDetails(
+                    cache_expiration=pendulum.now("UTC").add(minutes=1)
+                )
+            ),
+        )
+        assert cache.get("key") is not None
+
+        later = pendulum.now("UTC").add(minutes=2)
+        monkeypatch.setattr("pendulum.now", lambda *args: later)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_states_are_evicted(self):
+        cache = LocalTaskCache(max_size=2)
+        cache.put("a", Completed())
+        cache.put("b", Completed())
+        cache.get("a")
+        cache.put("c", Completed())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_clear(self):
+        cache = LocalTaskCache(max_size=10)
+        cache.put("key", Completed())
+        cache.clear()
+
+        assert cache.get("key") is None
+
+
+class TestGetLocalTaskCache:
+    def test_returns_same_cache(self):
+        assert get_local_task_cache() is get_local_task_cache()
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_disabled_by_size(self, size):
+        with temporary_settings({PREFECT_TASKS_LOCAL_CACHE_SIZE: size}):
+            assert get_local_task_cache() is None
+
+    def test_follows_size_setting(self):
+        with temporary_settings({PREFECT_TASKS_LOCAL_CACHE_SIZE: 5}):
+            assert get_local_task_cache().max_size == 5
@@ -1,7 +1,21 @@
+import os
+import threading
+from functools import partial
+from uuid import uuid4
+
+import anyio
+import cloudpickle
 import pytest
 
+from prefect import flow, task
+from prefect.states import Completed
+
 # Import the local 'tests' module to pickle to ray workers
-from prefect.task_runners import ConcurrentTaskRunner, SequentialTaskRunner
+from prefect.task_runners import (
+    ConcurrentTaskRunner,
+    ProcessPoolTaskRunner,
+    SequentialTaskRunner,
+)
 from prefect.testing.standard_test_suites import TaskRunnerStandardTestSuite
 
 
@@ -32,3 +46,249 @@ class TestConcurrentTaskRunner(TaskRunnerStandardTestSuite):
     @pytest.fixture
     def task_runner(self):
         yield ConcurrentTaskRunner()
+
+
+class TestBoundedConcurrentTaskRunner(TaskRunnerStandardTestSuite):
+    @pytest.fixture
+    def task_runner(self):
+        yield ConcurrentTaskRunner(max_workers=4)
+
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"max_workers": 0}, "`max_workers` must be at least 1"),
+            ({"max_queue_size": 1}, "`max_queue_size` requires `max_workers`"),
+            ({"max_workers": 1, "max_queue_size": -1}, "cannot be negative"),
+        ],
+    )
+    def test_invalid_configuration(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            ConcurrentTaskRunner(**kwargs)
+
+    def test_max_queue_size_defaults_to_max_workers(self):
+        assert ConcurrentTaskRunner(max_workers=3).max_queue_size == 3
+
+    async def test_limits_running_calls(self):
+        task_runner = ConcurrentTaskRunner(max_workers=2, max_queue_size=10)
+        running = 0
+        max_running = 0
+
+        async def call():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await anyio.sleep(0.05)
+            running -= 1
+            return Completed()
+
+        keys = [uuid4() for _ in range(6)]
+        async with task_runner.start():
+            for key in keys:
+                await task_runner.submit(key=key, call=call)
+
+            for key in keys:
+                state = await task_runner.wait(key, 5)
+                assert state is not None, "wait timed out"
+                assert state.is_completed()
+
+        assert max_running == 2
+
+    async def test_submit_blocks_when_queue_is_full(self):
+        task_runner = ConcurrentTaskRunner(max_workers=1, max_queue_size=1)
+        release = anyio.Event()
+
+        async def call():
+            await release.wait()
+            return Completed()
+
+        async with task_runner.start():
+            # Occupy the worker, then fill the queue
+            await task_runner.submit(key=uuid4(), call=call)
+            await anyio.sleep(0.1)
+            assert task_runner.running == 1
+            await task_runner.submit(key=uuid4(), call=call)
+            assert task_runner.queue_depth == 1
+
+            with anyio.move_on_after(0.1) as scope:
+                await task_runner.submit(key=uuid4(), call=call)
+            assert scope.cancel_called, "submission should block on a full queue"
+            assert task_runner.queue_depth == 1
+
+            release.set()
+
+        assert task_runner.queue_depth == 0
+        assert task_runner.running == 0
+        assert task_runner.max_queue_depth == 2
+
+    async def test_task_submission_blocks_when_queue_is_full(self):
+        release = threading.Event()
+
+        @task
+        async def wait_for_release():
+            while not release.is_set():
+                await anyio.sleep(0.01)
+
+        @flow(task_runner=ConcurrentTaskRunner(max_workers=1, max_queue_size=1))
+        async def my_flow():
+            # Occupy the worker, then fill the queue
+            await wait_for_release.submit()
+            await wait_for_release.submit()
+
+            submitted = anyio.Event()
+
+            async def submit():
+                await wait_for_release.submit()
+                submitted.set()
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(submit)
+                with anyio.move_on_after(1):
+                    await submitted.wait()
+                blocked = not submitted.is_set()
+                release.set()
+
+            return blocked
+
+        assert await my_flow(), "`.submit()` should block on a full queue"
+
+    def test_task_runs_wait_for_a_thread_from_the_task_runner(self):
+        task_runner = ConcurrentTaskRunner(max_workers=2)
+
+        @task
+        def count_borrowed_threads():
+            return task_runner.thread_limiter.borrowed_tokens
+
+        @flow(task_runner=task_runner)
+        def my_flow():
+            return count_borrowed_threads.submit().result()
+
+        assert my_flow() == 1
+
+    async def test_queued_calls_finish_before_shutdown(self):
+        task_runner = ConcurrentTaskRunner(max_workers=1, max_queue_size=5)
+
+        async def call(i):
+            await anyio.sleep(0.01)
+            return Completed(data=i)
+
+        keys = [uuid4() for _ in range(5)]
+        async with task_runner.start():
+            for i, key in enumerate(keys):
+                await task_runner.submit(key=key, call=partial(call, i))
+
+        assert [await task_runner._results[key].result() for key in keys] == [
+            0,
+            1,
+            2,
+            3,
+            4,
+        ]
+
+    async def test_is_pickleable_with_queue(self):
+        task_runner = ConcurrentTaskRunner(max_workers=2)
+        async with task_runner.start():
+            unpickled = cloudpickle.loads(cloudpickle.dumps(task_runner))
+
+        assert unpickled.max_workers == 2
+        assert unpickled._limiter is None
+        assert unpickled._thread_limiter is None
+
+
+class TestConcurrentTaskRunnerWait:
+    async def test_wait_from_another_event_loop(self):
+        task_runner = ConcurrentTaskRunner()
+        release = anyio.Event()
+        key = uuid4()
+
+        async def call():
+            await release.wait()
+            return Completed(data=1)
+
+        results = []
+
+        async def wait_in_new_loop():
+            results.append(
+                await anyio.to_thread.run_sync(anyio.run, task_runner.wait, key, 5)
+            )
+
+        async with task_runner.start():
+            await task_runner.submit(key=key, call=call)
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(wait_in_new_loop)
+                await anyio.sleep(0.1)
+                release.set()
+
+        assert await results[0].result() == 1
+
+    async def test_wait_before_submission(self):
+        task_runner = ConcurrentTaskRunner()
+        key = uuid4()
+
+        async def call():
+            return Completed(data=1)
+
+        async with task_runner.start():
+            async with anyio.create_task_group() as tg:
+                results = []
+
+                async def wait():
+                    results.append(await task_runner.wait(key, 5))
+
+                tg.start_soon(wait)
+                await anyio.sleep(0.1)
+                await task_runner.submit(key=key, call=call)
+
+        assert await results[0].result() == 1
+
+    async def test_wait_timeout(self):
+        task_runner = ConcurrentTaskRunner()
+        release = anyio.Event()
+        key = uuid4()
+
+        async def call():
+            await release.wait()
+            return Completed()
+
+        async with task_runner.start():
+            await task_runner.submit(key=key, call=call)
+            assert await task_runner.wait(key, 0.1) is None
+            release.set()
+
+
+class TestProcessPoolTaskRunner(TaskRunnerStandardTestSuite):
+    @pytest.fixture
+    def task_runner(self):
+        yield ProcessPoolTaskRunner(max_workers=2)
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError, match="`max_workers` must be at least 1"):
+            ProcessPoolTaskRunner(max_workers=0)
+
+    def test_upstream_futures_are_resolved_before_submission(self, task_runner):
+        @task
+        def double(x):
+            return x * 2
+
+        @task
+        def add(x, y):
+            return x + y
+
+        @flow(task_runner=task_runner)
+        def test_flow():
+            return add.submit(double.submit(1), y=[double.submit(2)][0]).result()
+
+        assert test_flow() == 6
+
+    async def test_reuses_worker_processes(self, task_runner):
+        async def get_pid():
+            return Completed(data=os.getpid())
+
+        keys = [uuid4() for _ in range(6)]
+        async with task_runner.start():
+            for key in keys:
+                await task_runner.submit(key=key, call=get_pid)
+
+            pids = {await (await task_runner.wait(key, 30)).result() for key in keys}
+
+        assert os.getpid() not in pids
+        assert len(pids) <= 2
@@ -12,6 +12,7 @@ import pytest
 
 from prefect import flow, get_run_logger, tags
 from prefect.blocks.core import Block
+from prefect.client.orchestration import PrefectClient
 from prefect.context import PrefectObjectRegistry, TaskRunContext, get_run_context
 from prefect.engine import get_state_for_result
 from prefect.exceptions import (
@@ -24,7 +25,12 @@ from prefect.futures import PrefectFuture
 from prefect.server import models
 from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.states import StateType
-from prefect.settings import PREFECT_TASKS_REFRESH_CACHE, temporary_settings
+from prefect.settings import (
+    PREFECT_TASK_RUN_CREATION_BATCH_SIZE,
+    PREFECT_TASKS_INPUT_HASH_ALGORITHM,
+    PREFECT_TASKS_REFRESH_CACHE,
+    temporary_settings,
+)
 from prefect.states import State
 from prefect.tasks import Task, task, task_input_hash
 from prefect.testing.utilities import exceptions_equal, flaky_on_windows
@@ -1354,6 +1360,41 @@ class TestCacheFunctionBuiltins:
             first_state.result() == third_state.result() == fourth_state.result() == 1
         )
 
+    def test_task_input_hash_works_with_numpy_arrays(self):
+        import numpy as np
+
+        @task(cache_key_fn=task_input_hash)
+        def foo(array):
+            return int(array.sum())
+
+        @flow
+        def bar():
+            return (
+                foo._run(np.arange(10)),
+                foo._run(np.arange(10) * 2),
+                foo._run(np.arange(10)),
+            )
+
+        first_state, second_state, third_state = bar()
+        assert first_state.name == "Completed"
+        assert second_state.name == "Completed"
+        assert third_state.name == "Cached"
+        assert first_state.result() == third_state.result() == 45
+
+    def test_task_input_hash_uses_configured_hash_algorithm(self):
+        @task(cache_key_fn=task_input_hash)
+        def foo(x):
+            return x
+
+        @flow
+        def bar():
+            return foo._run(1)
+
+        with temporary_settings({PREFECT_TASKS_INPUT_HASH_ALGORITHM: "blake2b"}):
+            state = bar()
+
+        assert len(state.state_details.cache_key) == 128
+
 
 class TestTaskTimeouts:
     async def test_task_timeouts_actually_timeout(self, timeout_test_flow):
@@ -2960,6 +3001,48 @@ class TestTaskMap:
         task_states = my_flow()
         assert [state.result() for state in task_states] == ["atest", "btest", "ctest"]
 
+    @pytest.fixture
+    def spy_create_task_runs(self, monkeypatch):
+        spy = MagicMock()
+        original = PrefectClient.create_task_runs
+
+        async def create_task_runs(self, task_runs):
+            spy(task_runs)
+            return await original(self, task_runs)
+
+        monkeypatch.setattr(PrefectClient, "create_task_runs", create_task_runs)
+        return spy
+
+    def test_map_creates_task_runs_in_bulk(self, spy_create_task_runs, monkeypatch):
+        create_task_run = MagicMock(side_effect=RuntimeError("Should not be called"))
+        monkeypatch.setattr(PrefectClient, "create_task_run", create_task_run)
+
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map([1, 2, 3], y=1)
+
+        task_states = my_flow()
+        assert [state.result() for state in task_states] == [2, 3, 4]
+
+        spy_create_task_runs.assert_called_once()
+        (task_run_data,) = spy_create_task_runs.call_args.args
+        assert [task_run.dynamic_key for task_run in task_run_data] == ["0", "1", "2"]
+
+    def test_map_creates_task_runs_in_batches(self, spy_create_task_runs):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map([1, 2, 3, 4, 5], y=1)
+
+        with temporary_settings({PREFECT_TASK_RUN_CREATION_BATCH_SIZE: 2}):
+            task_states = my_flow()
+
+        assert [state.result() for state in task_states] == [2, 3, 4, 5, 6]
+        assert [len(call.args[0]) for call in spy_create_task_runs.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+
     def test_unmapped_iterable(self):
         @flow
         def my_flow():
@@ -1,8 +1,11 @@
+import gc
 import io
 import json
 import uuid
+import weakref
 from dataclasses import dataclass
 from typing import Any
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
@@ -14,6 +17,7 @@ from prefect.utilities.collections import (
     dict_to_flatdict,
     flatdict_to_dict,
     isiterable,
+    iter_collection,
     remove_nested_keys,
     visit_collection,
 )
@@ -471,6 +475,103 @@ class TestVisitCollection:
         # Only the first two items should be visited
         assert result == [2, 3, [3, [4, 5, 6]]]
 
+    def test_visit_collection_does_not_keep_visited_types_alive(self):
+        @dataclass
+        class Runtime:
+            x: int
+
+        visit_collection([Runtime(x=1)], visit_fn=lambda x: x, return_data=True)
+
+        ref = weakref.ref(Runtime)
+        del Runtime
+        gc.collect()
+        assert ref() is None
+
+
+class TestIterCollection:
+    @pytest.mark.parametrize(
+        "inp",
+        [
+            3,
+            [3, 4],
+            (3, 4),
+            [3, 4, [5, [6]]],
+            {3: 4, 6: 7},
+            {3: [4, {6: 7}]},
+            {3, 4, 5},
+            SimpleDataclass(x=1, y=2),
+            SimplePydantic(x=1, y=2),
+            ExtraPydantic(x=1, y=2, z=4),
+            ExampleAnnotation(4),
+            [ExampleAnnotation([1, (2, {3: SimpleDataclass(x=4, y=5)})])],
+        ],
+    )
+    def test_iter_collection_yields_every_visited_node(self, inp):
+        visit_collection(inp, visit_fn=add_to_visited_list, return_data=False)
+        elements = [element for element, _ in iter_collection(inp)]
+
+        assert len(elements) == len(VISITED)
+        for element in elements:
+            assert element in VISITED
+
+    @pytest.mark.parametrize(
+        "inp,depth,expected",
+        [
+            (1, 0, [1]),
+            ([1, [2, [3, [4]]]], 0, [[1, [2, [3, [4]]]]]),
+            ([1, [2, [3, [4]]]], 1, [[1, [2, [3, [4]]]], 1, [2, [3, [4]]]]),
+            (
+                [1, [2, [3, [4]]]],
+                2,
+                [[1, [2, [3, [4]]]], 1, [2, [3, [4]]], 2, [3, [4]]],
+            ),
+        ],
+    )
+    def test_iter_collection_max_depth(self, inp, depth, expected):
+        assert [
+            element for element, _ in iter_collection(inp, max_depth=depth)
+        ] == expected
+
+    def test_iter_collection_yields_innermost_annotations(self):
+        outer = ExampleAnnotation([1, quote([2])])
+        inner = outer.unwrap()[1]
+
+        annotations = {
+            repr(element): annotation for element, annotation in iter_collection(outer)
+        }
+        assert annotations[repr(outer)] is None
+        assert annotations["1"] is outer
+        assert annotations[repr(inner)] is outer
+        assert annotations["2"] is inner
+
+    def test_iter_collection_skip_annotations(self):
+        inp = [1, quote([2, [3]]), ExampleAnnotation(4)]
+
+        elements = [
+            element for element, _ in iter_collection(inp, skip_annotations=(quote,))
+        ]
+        assert 1 in elements and 4 in elements
+        assert quote([2, [3]]) in elements
+        assert 2 not in elements
+        assert [3] not in elements
+
+    def test_iter_collection_consumes_iterators(self):
+        elements = [element for element, _ in iter_collection(iter([1, [2]]))]
+        assert elements[1:] == [1, [2], 2]
+
+    @pytest.mark.parametrize(
+        "inp", ["test", b"test", io.StringIO("test"), MagicMock(), uuid.uuid4()]
+    )
+    def test_iter_collection_does_not_traverse_leaves(self, inp):
+        assert list(iter_collection(inp)) == [(inp, None)]
+
+    def test_iter_collection_does_not_recurse(self):
+        inp = 1
+        for _ in range(5000):
+            inp = [inp]
+
+        assert len(list(iter_collection(inp))) == 5001
+
 
 class TestRemoveKeys:
     def test_remove_single_key(self):
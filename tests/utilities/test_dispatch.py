@@ -1,13 +1,18 @@
 import abc
+import sys
+from unittest.mock import MagicMock
 
 import pytest
 
 from prefect.utilities.dispatch import (
+    _DEFERRED_IMPORTS,
     _TYPE_REGISTRIES,
     get_dispatch_key,
     get_registry_for_type,
+    load_deferred_imports,
     lookup_type,
     register_base_type,
+    register_deferred_import,
     register_type,
 )
 
@@ -15,12 +20,15 @@ from prefect.utilities.dispatch import (
 @pytest.fixture(autouse=True)
 def reset_dispatch_registry():
     before = _TYPE_REGISTRIES.copy()
+    deferred_before = _DEFERRED_IMPORTS.copy()
 
     _TYPE_REGISTRIES.clear()
+    _DEFERRED_IMPORTS.clear()
 
     yield
 
     _TYPE_REGISTRIES.update(before)
+    _DEFERRED_IMPORTS[:] = deferred_before
 
 
 def test_register_base_type():
@@ -296,3 +304,78 @@ def test_get_dispatch_key_not_a_string_from_callable():
         ),
     ):
         get_dispatch_key(Foo)
+
+
+@pytest.fixture
+def deferred_module(tmp_path, monkeypatch):
+    """
+    The name of a module, not yet imported, that registers a `Child` type for the
+    `Parent` base type defined in the `deferred_dispatch_base` module.
+    """
+    (tmp_path / "deferred_dispatch_base.py").write_text(
+        "from prefect.utilities.dispatch import register_base_type\n"
+        "@register_base_type\n"
+        "class Parent:\n"
+        "    pass\n"
+    )
+    (tmp_path / "deferred_dispatch_module.py").write_text(
+        "from deferred_dispatch_base import Parent\n"
+        "class Child(Parent):\n"
+        "    __dispatch_key__ = 'child'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "deferred_dispatch_module"
+    sys.modules.pop("deferred_dispatch_base", None)
+    sys.modules.pop("deferred_dispatch_module", None)
+
+
+def test_lookup_type_loads_deferred_imports(deferred_module):
+    from deferred_dispatch_base import Parent
+
+    register_deferred_import(deferred_module)
+    assert deferred_module not in sys.modules
+
+    child = lookup_type(Parent, "child")
+
+    assert child is sys.modules[deferred_module].Child
+    assert not _DEFERRED_IMPORTS
+
+
+def test_get_registry_for_type_loads_deferred_imports(deferred_module):
+    from deferred_dispatch_base import Parent
+
+    register_deferred_import(deferred_module)
+
+    registry = get_registry_for_type(Parent)
+
+    assert registry == {"child": sys.modules[deferred_module].Child}
+
+
+def test_register_type_does_not_load_deferred_imports():
+    loader = MagicMock()
+    register_deferred_import(loader)
+
+    @register_base_type
+    class Parent:
+        pass
+
+    class Child(Parent):
+        __dispatch_key__ = "child"
+
+    loader.assert_not_called()
+    assert _DEFERRED_IMPORTS == [loader]
+
+
+def test_deferred_import_callables_are_called_once():
+    loader = MagicMock()
+    register_deferred_import(loader)
+
+    @register_base_type
+    class Parent:
+        __dispatch_key__ = "parent"
+
+    lookup_type(Parent, "parent")
+    lookup_type(Parent, "parent")
+    load_deferred_imports()
+
+    loader.assert_called_once_with()
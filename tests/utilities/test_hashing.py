@@ -1,8 +1,19 @@
 import hashlib
+from enum import IntEnum
 
+import numpy as np
 import pytest
 
-from prefect.utilities.hashing import file_hash, stable_hash
+from prefect.utilities.hashing import (
+    HASH_CHUNK_SIZE,
+    Fingerprint,
+    file_hash,
+    fingerprint_objects,
+    get_hash_algorithm,
+    hash_objects,
+    register_fingerprinter,
+    stable_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -55,3 +66,205 @@ class TestFileHash:
         assert val == hashlib.md5(b"0").hexdigest()
         # Check if the hash is stable
         assert val == "cfcd208495d565ef66e7dff9f98764da"
+
+    def test_file_hash_hashes_files_larger_than_a_chunk(self, tmp_path):
+        contents = b"0123456789" * (HASH_CHUNK_SIZE // 4)
+        path = tmp_path.joinpath("large.bin")
+        path.write_bytes(contents)
+
+        assert file_hash(path) == hashlib.md5(contents).hexdigest()
+        assert (
+            file_hash(path, hash_algo=hashlib.sha256)
+            == hashlib.sha256(contents).hexdigest()
+        )
+
+
+class TestGetHashAlgorithm:
+    @pytest.mark.parametrize("name", ["md5", "MD5", "sha256", "blake2b"])
+    def test_get_hash_algorithm(self, name):
+        assert (
+            get_hash_algorithm(name)(b"hello").hexdigest()
+            == hashlib.new(name.lower(), b"hello").hexdigest()
+        )
+
+    def test_get_hash_algorithm_raises_for_unknown_algorithm(self):
+        with pytest.raises(ValueError, match="Unknown hash algorithm 'foo'"):
+            get_hash_algorithm("foo")
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+class Unserializable:
+    def __init__(self, x):
+        self.x = x
+
+
+class TestFingerprintObjects:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            None,
+            1,
+            "hello",
+            b"hello",
+            {"a": 1, "b": [1, 2.5, None]},
+            {1, 2, 3},
+            (1, (2, 3)),
+            Unserializable(1),
+            np.arange(10),
+        ],
+    )
+    def test_fingerprint_is_stable(self, obj):
+        assert fingerprint_objects(obj) == fingerprint_objects(obj)
+        assert isinstance(fingerprint_objects(obj), str)
+
+    @pytest.mark.parametrize(
+        "a,b",
+        [
+            (1, 1.0),
+            (1, True),
+            (1, "1"),
+            ("hello", b"hello"),
+            ([1, 2], (1, 2)),
+            ([1, 2], [2, 1]),
+            (["ab", "c"], ["a", "bc"]),
+            ({"a": 1}, {"a": 2}),
+            ({"a": 1}, [("a", 1)]),
+            ({1, 2}, [1, 2]),
+            (np.arange(4), np.arange(4).astype("float64")),
+            (np.arange(4), np.arange(4).reshape(2, 2)),
+            (np.arange(4), np.arange(4).tolist()),
+            ({"a": [1, 2]}, {"a": (1, 2)}),
+            ({"1": "a"}, {1: "a"}),
+            ([1, "x"], [1, b"x"]),
+            ([1.0], [np.float64(1.0)]),
+        ],
+    )
+    def test_fingerprint_distinguishes_values(self, a, b):
+        assert fingerprint_objects(a) != fingerprint_objects(b)
+
+    def test_fingerprint_does_not_depend_on_dict_or_set_order(self):
+        assert fingerprint_objects({"a": 1, "b": 2}) == fingerprint_objects(
+            {"b": 2, "a": 1}
+        )
+        assert fingerprint_objects({1: "a", "b": 2}) == fingerprint_objects(
+            {"b": 2, 1: "a"}
+        )
+        assert fingerprint_objects({"x", 1, None}) == fingerprint_objects(
+            {None, 1, "x"}
+        )
+
+    def test_fingerprint_of_subclasses_uses_their_values(self):
+        assert fingerprint_objects(Color.RED) == fingerprint_objects(1)
+
+    def test_fingerprint_of_json_values_is_serialized_once(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("JSON values should not be traversed.")
+
+        monkeypatch.setattr(Fingerprint, "update_items", fail)
+        monkeypatch.setattr(Fingerprint, "update_unordered_items", fail)
+
+        fingerprint = Fingerprint()
+        fingerprint.update({"a": [1, 2.5, True, None, {"b": "c"}], "d": Color.RED})
+        assert fingerprint.hexdigest()
+
+    def test_fingerprint_of_json_values_uses_the_values_of_subclasses(self):
+        assert fingerprint_objects({"a": [Color.RED]}) == fingerprint_objects(
+            {"a": [1]}
+        )
+
+    def test_fingerprint_of_arrow_arrays_includes_child_offsets(self):
+        pa = pytest.importorskip("pyarrow")
+
+        values = pa.array([1, 2, 3])
+        a = pa.StructArray.from_arrays([values.slice(1)], names=["x"])
+        b = pa.StructArray.from_arrays([values.slice(0, 2)], names=["x"])
+
+        # The arrays share their buffers and only the offsets of the children differ
+        assert a.to_pylist() != b.to_pylist()
+        assert fingerprint_objects(a) != fingerprint_objects(b)
+        assert fingerprint_objects(a) == fingerprint_objects(
+            pa.StructArray.from_arrays([values.slice(1)], names=["x"])
+        )
+
+    def test_fingerprint_of_args_and_kwargs(self):
+        assert fingerprint_objects(1, x=2) == fingerprint_objects(1, x=2)
+        assert fingerprint_objects(1, x=2) != fingerprint_objects(1, 2)
+        assert fingerprint_objects(1, x=2) != fingerprint_objects(1, y=2)
+
+    def test_fingerprint_of_numpy_arrays_depends_on_contents(self):
+        array = np.arange(100)
+        assert fingerprint_objects(array) == fingerprint_objects(array.copy())
+        assert fingerprint_objects(array[::2]) == fingerprint_objects(
+            np.arange(0, 100, 2)
+        )
+
+        changed = array.copy()
+        changed[50] = -1
+        assert fingerprint_objects(array) != fingerprint_objects(changed)
+
+    def test_fingerprint_hashes_buffers_without_serializing(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("Buffers should not be serialized.")
+
+        monkeypatch.setattr(Fingerprint, "update_serialized", fail)
+
+        assert fingerprint_objects(
+            b"data", bytearray(b"data"), memoryview(b"data"), np.zeros((3, 3))
+        )
+
+    def test_fingerprint_falls_back_to_serialization(self):
+        assert fingerprint_objects(Unserializable(1)) != fingerprint_objects(
+            Unserializable(2)
+        )
+
+    def test_fingerprint_of_circular_references_falls_back_to_hash_objects(self):
+        obj = []
+        obj.append(obj)
+        assert fingerprint_objects(obj) == hash_objects(obj)
+
+    def test_fingerprint_with_hash_algorithm(self):
+        assert len(fingerprint_objects("hello", hash_algo=hashlib.sha256)) == 64
+
+    def test_fingerprint_returns_none_for_unhashable_objects(self):
+        class Unpicklable:
+            def __reduce__(self):
+                raise TypeError("Cannot pickle")
+
+        assert fingerprint_objects(Unpicklable()) is None
+
+    def test_register_fingerprinter(self):
+        class Dataset:
+            def __init__(self, checksum, data):
+                self.checksum = checksum
+                self.data = data
+
+        @register_fingerprinter(Dataset)
+        def fingerprint_dataset(dataset, fingerprint):
+            fingerprint.update_tag("dataset")
+            fingerprint.update(dataset.checksum)
+
+        assert fingerprint_objects(Dataset("a", 1)) == fingerprint_objects(
+            Dataset("a", 2)
+        )
+        assert fingerprint_objects(Dataset("a", 1)) != fingerprint_objects(
+            Dataset("b", 1)
+        )
+
+    def test_register_fingerprinter_by_qualified_name(self):
+        class Dataset:
+            def __init__(self, checksum):
+                self.checksum = checksum
+
+        calls = []
+
+        @register_fingerprinter(f"{Dataset.__module__}.{Dataset.__qualname__}")
+        def fingerprint_dataset(dataset, fingerprint):
+            calls.append(dataset)
+            fingerprint.update(dataset.checksum)
+
+        dataset = Dataset("a")
+        fingerprint_objects([dataset])
+        assert calls == [dataset]
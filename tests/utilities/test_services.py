@@ -1,4 +1,5 @@
 import statistics
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
@@ -146,3 +147,20 @@ async def test_jittered_sleeps_between_loops(monkeypatch):
     assert statistics.variance(sleep_times) > 0
     assert min(sleep_times) > 42 * (1 - 0.3)
     assert max(sleep_times) < 42 * (1 + 0.3)
+
+
+async def test_sleeps_for_the_rest_of_the_interval_after_workload(monkeypatch):
+    # the workload takes 30 seconds and then 5 seconds
+    monkeypatch.setattr(
+        "prefect.utilities.services.time",
+        MagicMock(monotonic=MagicMock(side_effect=[0, 30, 100, 105, 200])),
+    )
+    workload = AsyncMock(side_effect=[None, None, KeyboardInterrupt])
+    sleeper = AsyncMock()
+
+    monkeypatch.setattr("prefect.utilities.services.anyio.sleep", sleeper)
+    await critical_service_loop(workload, 20, include_workload_time=True)
+    assert workload.await_count == 3
+
+    sleep_times = [call.args[0] for call in sleeper.await_args_list]
+    assert sleep_times == [0, 15]
@@ -1,5 +1,7 @@
+import time
 from typing import Optional
 
+import anyio
 import pendulum
 import pydantic
 import pytest
@@ -223,6 +225,25 @@ async def test_worker_with_work_pool(
     assert {flow_run.id for flow_run in submitted_flow_runs} == set(flow_run_ids[1:4])
 
 
+async def test_worker_waits_for_runs_to_be_scheduled(
+    orion_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    async def schedule_run():
+        await anyio.sleep(0.5)
+        return await orion_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id, state=Scheduled()
+        )
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(schedule_run)
+            start = time.monotonic()
+            submitted_flow_runs = await worker.get_and_submit_flow_runs(wait_seconds=30)
+
+    assert len(submitted_flow_runs) == 1
+    assert time.monotonic() - start < 10
+
+
 async def test_worker_with_work_pool_and_work_queue(
     orion_client: PrefectClient,
     worker_deployment_wq1,